@@ -396,6 +396,31 @@ def import_config(
             typer.echo(" - {}".format(item))
 
 
+@app.command("backfill-raw-sidecars")
+def backfill_raw_sidecars(
+    repository: str = typer.Argument(
+        ...,
+        help="Path to a local DVC data repository.",
+    ),
+    overwrite: bool = typer.Option(
+        False,
+        "--overwrite/--no-overwrite",
+        help="Rewrite sidecars that are already up to date.",
+    ),
+):
+    from pychron.dvc.raw_sidecar import backfill_sidecars
+
+    repository = os.path.expanduser(repository)
+    if not os.path.isdir(repository):
+        typer.echo("Not a directory: {}".format(repository))
+        raise typer.Exit(code=1)
+
+    written, skipped = backfill_sidecars(repository, overwrite=overwrite)
+    typer.echo("Wrote {} raw data sidecars".format(written))
+    if skipped:
+        typer.echo("Skipped {} up to date sidecars".format(skipped))
+
+
 def main():
     app()
 
@@ -16,45 +16,295 @@
 
 # ============= enthought library imports =======================
 from __future__ import absolute_import
+import ast
+import builtins
 import re
+from functools import lru_cache
 
-from numpy import ma
-
+from numpy import (
+    absolute,
+    add,
+    asarray,
+    broadcast_to,
+    equal,
+    errstate,
+    greater,
+    greater_equal,
+    less,
+    less_equal,
+    logical_and,
+    logical_not,
+    logical_or,
+    ma,
+    mod,
+    multiply,
+    negative,
+    nonzero,
+    not_equal,
+    ones,
+    positive,
+    power,
+    subtract,
+    true_divide,
+    where,
+)
 
 # ============= standard library imports ========================
 # ============= local library imports  ==========================
 
+# error and percent_error refer to the error of an item, any other name to its value
+ERROR_NAMES = ("error", "percent_error")
+
+# names of a predicate evaluated item by item
+NAME_REGEX = re.compile(r"error|percent_error|(?! and| or)[A-Za-z]+")
+
+_COMPARE_OPS = {
+    ast.Lt: less,
+    ast.LtE: less_equal,
+    ast.Gt: greater,
+    ast.GtE: greater_equal,
+    ast.Eq: equal,
+    ast.NotEq: not_equal,
+}
+_BIN_OPS = {
+    ast.Add: add,
+    ast.Sub: subtract,
+    ast.Mult: multiply,
+    ast.Div: true_divide,
+    ast.Mod: mod,
+    ast.Pow: power,
+}
+_UNARY_OPS = {ast.USub: negative, ast.UAdd: positive}
+_FUNCS = {"abs": absolute}
+
+
+def _truth(v):
+    return asarray(v) != 0
+
+
+class CompiledPredicate(object):
+    """
+    a filter predicate parsed once into numpy operations.
+
+    evaluated with arrays of item values (``value``) and, for ufloat
+    predicates, errors (``error``) and percent errors (``percent_error``)
+    """
+
+    def __init__(self, predicate, func, names):
+        self.predicate = predicate
+        self.names = names
+        self._func = func
+
+    def __call__(self, env, n):
+        """
+        boolean array of the ``n`` items the predicate is true for
+        """
+        with errstate(divide="ignore", invalid="ignore", over="ignore"):
+            r = _truth(self._func(env))
+        return broadcast_to(r, (n,))
+
+
+class _Compiler(object):
+    def __init__(self, resolve):
+        self.resolve = resolve
+        self.names = set()
+
+    def compile(self, node):
+        func = getattr(self, "_{}".format(type(node).__name__), None)
+        if func is None:
+            raise ValueError("unsupported expression: {}".format(ast.unparse(node)))
+        return func(node)
+
+    def _Expression(self, node):
+        return self.compile(node.body)
+
+    def _BoolOp(self, node):
+        values = [self.compile(v) for v in node.values]
+        op = logical_and if isinstance(node.op, ast.And) else logical_or
+
+        def f(env):
+            r = _truth(values[0](env))
+            for v in values[1:]:
+                r = op(r, _truth(v(env)))
+            return r
+
+        return f
+
+    def _Compare(self, node):
+        operands = [self.compile(node.left)] + [
+            self.compile(c) for c in node.comparators
+        ]
+        ops = []
+        for o in node.ops:
+            try:
+                ops.append(_COMPARE_OPS[type(o)])
+            except KeyError:
+                raise ValueError("unsupported comparison: {}".format(ast.unparse(node)))
+
+        def f(env):
+            # a < b < c is a < b and b < c
+            left = operands[0](env)
+            r = None
+            for op, operand in zip(ops, operands[1:]):
+                right = operand(env)
+                c = op(left, right)
+                r = c if r is None else logical_and(r, c)
+                left = right
+            return r
+
+        return f
+
+    def _BinOp(self, node):
+        try:
+            op = _BIN_OPS[type(node.op)]
+        except KeyError:
+            raise ValueError("unsupported operator: {}".format(ast.unparse(node)))
+
+        left, right = self.compile(node.left), self.compile(node.right)
+        return lambda env: op(left(env), right(env))
+
+    def _UnaryOp(self, node):
+        operand = self.compile(node.operand)
+        if isinstance(node.op, ast.Not):
+            return lambda env: logical_not(_truth(operand(env)))
+
+        try:
+            op = _UNARY_OPS[type(node.op)]
+        except KeyError:
+            raise ValueError("unsupported operator: {}".format(ast.unparse(node)))
+        return lambda env: op(operand(env))
+
+    def _Call(self, node):
+        func = node.func.id if isinstance(node.func, ast.Name) else None
+        if func not in _FUNCS or len(node.args) != 1 or node.keywords:
+            raise ValueError("unsupported call: {}".format(ast.unparse(node)))
+
+        op = _FUNCS[func]
+        arg = self.compile(node.args[0])
+        return lambda env: op(arg(env))
+
+    def _Name(self, node):
+        name = self.resolve(node.id)
+        self.names.add(name)
+        return lambda env: env[name]
+
+    def _Constant(self, node):
+        v = node.value
+        if isinstance(v, str) or not isinstance(v, (bool, int, float)):
+            raise ValueError("unsupported constant: {}".format(ast.unparse(node)))
+
+        # numpy refuses negative powers of ints e.g. 10**-3
+        v = float(v)
+        return lambda env: v
+
+
+def _resolve_ufloat_name(name):
+    return name if name in ERROR_NAMES else "value"
+
+
+@lru_cache(maxsize=128)
+def compile_predicate(predicate_str, variable_name=None):
+    """
+    parse ``predicate_str`` into a CompiledPredicate.
+
+    the grammar is restricted to numbers, names, comparisons, ``and``, ``or``,
+    ``not``, arithmetic and ``abs``. numbers are floats. if ``variable_name`` is None names are
+    resolved as by ``filter_ufloats`` otherwise ``variable_name`` is the only
+    name and refers to the item value
+
+    raises SyntaxError, ValueError for anything outside the grammar or NameError
+    for an undefined name. The filters evaluate predicates outside the grammar,
+    e.g. ``max(x, 5) > 6`` or ``x.real > 1``, item by item with ``eval``
+    """
+    if variable_name is None:
+        resolve = _resolve_ufloat_name
+    else:
+
+        def resolve(name):
+            if name != variable_name:
+                raise NameError("name '{}' is not defined".format(name))
+            return "value"
+
+    compiler = _Compiler(resolve)
+    func = compiler.compile(ast.parse(predicate_str.strip(), mode="eval"))
+    return CompiledPredicate(predicate_str, func, frozenset(compiler.names))
+
+
+def _omits(items, mask, return_indices):
+    omits = nonzero(mask)[0].tolist()
+    if not return_indices:
+        omits = [items[i] for i in omits]
+    return omits
+
+
+def _check_eval(predicate_str):
+    """
+    raise ValueError for a predicate that should not be passed to ``eval``
+    """
+    if "__" in predicate_str:
+        raise ValueError("unsupported expression: {}".format(predicate_str))
+
+
+def _ufloat_context(predicate_str):
+    """
+    return a function (value, error) -> ``eval`` namespace of ``predicate_str``.
+    builtins e.g. ``max`` are not shadowed by the item
+    """
+    attrs = [a for a in NAME_REGEX.findall(predicate_str) if not hasattr(builtins, a)]
+
+    def make_ctx(v, e):
+        ctx = {}
+        for ai in attrs:
+            if ai == "error":
+                ctx[ai] = e
+            elif ai == "percent_error":
+                ctx[ai] = e / v * 100 if v else 0
+            else:
+                ctx[ai] = v
+        return ctx
+
+    return make_ctx
+
 
 def filter_items(items, predicate_str, return_indices=True):
     omits = []
-    if predicate_str:
-        match = re.search(r"(?P<name>[A-Za-z])", predicate_str)
+    if predicate_str and len(items):
+        # first letter that is not part of a function name
+        match = re.search(r"(?P<name>[A-Za-z])(?![A-Za-z]*\s*\()", predicate_str)
         if match:
             variable_name = match.group("name")
-            omits = [
-                (eval(predicate_str, {variable_name: yi}), i)
-                for i, yi in enumerate(items)
-            ]
-            omits = [idx for ti, idx in omits if ti]
-            if not return_indices:
-                omits = [items[i] for i in omits]
+            try:
+                predicate = compile_predicate(predicate_str, variable_name)
+            except ValueError:
+                # outside the compiled grammar
+                _check_eval(predicate_str)
+                mask = [bool(eval(predicate_str, {variable_name: yi})) for yi in items]
+            else:
+                vs = asarray(items, dtype=float)
+                mask = predicate({"value": vs}, len(vs))
+            omits = _omits(items, mask, return_indices)
 
     return omits
 
 
-regex = re.compile(r"error|percent_error|(?! and| or)[A-Za-z]+")
-
-
 def validate_filter_predicate(predicate):
-    attr = regex.findall(predicate)
-    ctx = {}
-    for ai in attr:
-        ctx[ai] = 1
+    try:
+        p = compile_predicate(predicate)
+    except ValueError:
+        # outside the compiled grammar. valid if it evaluates for an item
+        try:
+            _check_eval(predicate)
+            eval(predicate, _ufloat_context(predicate)(1, 1))
+            return True
+        except BaseException:
+            return
+    except SyntaxError:
+        return
 
     try:
-        eval(predicate, ctx)
+        p({"value": ones(1), "error": ones(1), "percent_error": ones(1)}, 1)
         return True
-    except BaseException:
+    except (ValueError, NameError, TypeError):
         pass
 
 
@@ -68,25 +318,27 @@ def filter_ufloats(items, predicate_str, return_indices=True):
     :param return_indices:
     :return: a list of omitted indices if return_indices is True or a list of omitted items
     """
-    attrs = regex.findall(predicate_str)
+    n = len(items)
+    if not n:
+        return []
 
-    def make_ctx(v, e):
-        ctx = {}
-        for ai in attrs:
-            if ai == "error":
-                ctx[ai] = e
-            elif ai == "percent_error":
-                ctx[ai] = e / v * 100 if v else 0
-            else:
-                ctx[ai] = v
-        return ctx
+    try:
+        predicate = compile_predicate(predicate_str)
+    except ValueError:
+        # outside the compiled grammar
+        _check_eval(predicate_str)
+        make_ctx = _ufloat_context(predicate_str)
+        mask = [bool(eval(predicate_str, make_ctx(*uf))) for uf in items]
+        return _omits(items, mask, return_indices)
 
-    omits = [(i, eval(predicate_str, make_ctx(*uf))) for i, uf in enumerate(items)]
-    omits = [idx for idx, ti in omits if ti]
-    if not return_indices:
-        omits = [items[i] for i in omits]
+    a = asarray(items, dtype=float)
+    vs, es = a[:, 0], a[:, 1]
+    env = {"value": vs, "error": es}
+    if "percent_error" in predicate.names:
+        nonzero_vs = vs != 0
+        env["percent_error"] = where(nonzero_vs, es / where(nonzero_vs, vs, 1) * 100, 0)
 
-    return omits
+    return _omits(items, predicate(env, n), return_indices)
 
 
 def sigma_filter(vs, nsigma):
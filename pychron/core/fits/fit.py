@@ -89,6 +89,8 @@ class FilterFit(Fit):
 class IsoFilterFit(FilterFit):
     use_sniff = Bool
     time_zero_offset = Int(0)
+    # regress linear/parabolic/cubic fits with ClosedFormOLS
+    use_closed_form = Bool(True)
 
 
 # ============= EOF =============================================
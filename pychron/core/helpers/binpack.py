@@ -20,6 +20,25 @@
 import base64
 import struct
 
+from numpy import ascontiguousarray, asarray, dtype, empty, errstate, frombuffer, isfinite
+
+# struct format characters that map one-to-one onto numpy scalar types
+STRUCT_TO_NUMPY = {
+    "b": "i1",
+    "B": "u1",
+    "h": "i2",
+    "H": "u2",
+    "i": "i4",
+    "I": "u4",
+    "q": "i8",
+    "Q": "u8",
+    "e": "f2",
+    "f": "f4",
+    "d": "f8",
+}
+
+BYTE_ORDERS = {"<": "<", ">": ">", "!": ">", "=": "=", "@": "="}
+
 
 def format_blob(blob):
     return base64.b64decode(blob)
@@ -33,6 +52,70 @@ def encode_blob(blob):
         return base64.b64encode(blob).decode("utf-8")
 
 
+def record_dtype(fmt):
+    """
+    convert a struct format e.g. ">ff" into an equivalent numpy structured dtype.
+
+    returns None if the format cannot be represented exactly (repeat counts,
+    padding, native alignment of mixed types, etc.). In that case callers should
+    fall back to ``struct``
+
+    @param fmt:
+    @return: numpy.dtype or None
+    """
+    order = "="
+    codes = fmt
+    if fmt and fmt[0] in BYTE_ORDERS:
+        order = BYTE_ORDERS[fmt[0]]
+        codes = fmt[1:]
+
+    if not codes:
+        return
+
+    try:
+        fields = [
+            ("f{}".format(i), "{}{}".format(order, STRUCT_TO_NUMPY[c]))
+            for i, c in enumerate(codes)
+        ]
+    except KeyError:
+        return
+
+    dt = dtype(fields)
+    if dt.itemsize != struct.calcsize(fmt):
+        return
+
+    return dt
+
+
+def pack_columns(fmt, *columns):
+    """
+    pack parallel columns e.g. (xs, ys) into a blob using ``fmt``.
+
+    equivalent to ``pack(fmt, zip(*columns))`` but done with a single numpy copy.
+    like ``struct.pack`` raises OverflowError if a finite value is too large for
+    its field
+
+    @param fmt:
+    @param columns:
+    @return: bytes
+    """
+    dt = record_dtype(fmt)
+    if dt is None or not all(dt[i].kind == "f" for i in range(len(dt))):
+        return pack(fmt, zip(*columns))
+
+    n = min((len(c) for c in columns), default=0)
+    rec = empty(n, dtype=dt)
+    for name, c in zip(dt.names, columns):
+        col = rec[name]
+        c = asarray(c[:n], dtype=float)
+        with errstate(over="ignore"):
+            col[...] = c
+
+        if dt[name].itemsize < 8 and (isfinite(c) & ~isfinite(col)).any():
+            raise OverflowError("float too large to pack with {} format".format(fmt))
+    return rec.tobytes()
+
+
 def pack(fmt, data):
     """
     data should be something like [(x0,y0),(x1,y1), (xN,yN)]
@@ -40,13 +123,43 @@ def pack(fmt, data):
     @param data:
     @return:
     """
-    # if len(args) > 1:
-    #     args = zip(args)
-    # b = b''
+    dt = record_dtype(fmt)
+    if dt is not None and all(dt[i].kind == "f" for i in range(len(dt))):
+        data = list(data)
+        if not data:
+            return b""
+        if all(len(datum) == len(dt) for datum in data):
+            return pack_columns(fmt, *zip(*data))
 
     return b"".join([struct.pack(fmt, *datum) for datum in data])
 
 
+def unpack_arrays(blob, fmt=">ff", step=8, decode=False):
+    """
+    vectorized version of ``unpack``. returns a list of numpy float64 arrays,
+    one per field in ``fmt``. Trailing partial records are ignored, matching ``unpack``
+
+    @param blob:
+    @param fmt:
+    @param step:
+    @param decode:
+    @return:
+    """
+    if decode:
+        blob = format_blob(blob)
+
+    dt = record_dtype(fmt)
+    if dt is None or dt.itemsize != step:
+        return [ascontiguousarray(c, dtype=float) for c in unpack(blob, fmt, step)]
+
+    if not blob:
+        return [empty(0) for _ in dt.names]
+
+    n = len(blob) // step
+    rec = frombuffer(blob, dtype=dt, count=n)
+    return [rec[name].astype(float) for name in dt.names]
+
+
 def unpack(blob, fmt=">ff", step=8, decode=False):
     if decode:
         blob = format_blob(blob)
@@ -0,0 +1,97 @@
+import struct
+import unittest
+
+from numpy import array, float32, linspace
+
+from pychron.core.helpers.binpack import (
+    pack,
+    pack_columns,
+    record_dtype,
+    unpack,
+    unpack_arrays,
+)
+
+
+def _struct_pack(fmt, data):
+    return b"".join([struct.pack(fmt, *datum) for datum in data])
+
+
+class BinpackTestCase(unittest.TestCase):
+    def setUp(self):
+        self.xs = linspace(0, 100, 57)
+        self.ys = linspace(0.1, 1e4, 57) ** 1.5 - 3
+
+    def _assert_unpack_equal(self, blob, fmt):
+        x, y = unpack(blob, fmt)
+        ax, ay = unpack_arrays(blob, fmt)
+        self.assertListEqual(list(x), ax.tolist())
+        self.assertListEqual(list(y), ay.tolist())
+
+    def test_unpack_big_endian(self):
+        blob = _struct_pack(">ff", zip(self.xs, self.ys))
+        self._assert_unpack_equal(blob, ">ff")
+
+    def test_unpack_little_endian(self):
+        blob = _struct_pack("<ff", zip(self.xs, self.ys))
+        self._assert_unpack_equal(blob, "<ff")
+
+    def test_unpack_partial_record(self):
+        blob = _struct_pack(">ff", zip(self.xs, self.ys)) + b"\x00\x01\x02"
+        self._assert_unpack_equal(blob, ">ff")
+        ax, ay = unpack_arrays(blob, ">ff")
+        self.assertEqual(len(ax), 57)
+
+    def test_unpack_empty(self):
+        ax, ay = unpack_arrays(b"", ">ff")
+        self.assertEqual(len(ax), 0)
+        self.assertEqual(len(ay), 0)
+
+    def test_unpack_float64(self):
+        ax, ay = unpack_arrays(_struct_pack(">ff", zip(self.xs, self.ys)), ">ff")
+        self.assertEqual(ax.dtype, float)
+
+    def test_pack(self):
+        data = list(zip(self.xs, self.ys))
+        self.assertEqual(pack(">ff", data), _struct_pack(">ff", data))
+        self.assertEqual(pack("<ff", data), _struct_pack("<ff", data))
+
+    def test_pack_columns(self):
+        data = zip(self.xs, self.ys)
+        self.assertEqual(pack_columns(">ff", self.xs, self.ys), _struct_pack(">ff", data))
+
+    def test_pack_array(self):
+        data = array([self.xs, self.ys]).T
+        self.assertEqual(pack(">ff", data), _struct_pack(">ff", data))
+
+    def test_pack_integer_fallback(self):
+        data = [(1, 2), (3, 4)]
+        self.assertEqual(pack("HH", data), _struct_pack("HH", data))
+
+    def test_round_trip(self):
+        blob = pack_columns(">ff", self.xs, self.ys)
+        ax, ay = unpack_arrays(blob, ">ff")
+        self.assertListEqual(ax.tolist(), self.xs.astype(float32).tolist())
+        self.assertListEqual(ay.tolist(), self.ys.astype(float32).tolist())
+
+    def test_pack_overflow(self):
+        for fmt in (">ff", "<ee"):
+            with self.assertRaises(OverflowError):
+                _struct_pack(fmt, [(1, 1e40)])
+            with self.assertRaises(OverflowError):
+                pack(fmt, [(1, 2), (1, 1e40)])
+            with self.assertRaises(OverflowError):
+                pack_columns(fmt, [1, 1], array([2, 1e40]))
+
+        # infinities and nans are packed as is
+        blob = pack(">ff", [(float("inf"), float("nan"))])
+        self.assertEqual(blob, _struct_pack(">ff", [(float("inf"), float("nan"))]))
+
+    def test_record_dtype(self):
+        self.assertEqual(record_dtype(">ff").itemsize, 8)
+        self.assertEqual(record_dtype("<fd").itemsize, 12)
+        self.assertIsNone(record_dtype(">2f"))
+        self.assertIsNone(record_dtype("@fd"))
+
+
+if __name__ == "__main__":
+    unittest.main()
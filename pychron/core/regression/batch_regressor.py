@@ -0,0 +1,239 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+"""
+fit many series in one call.
+
+``batch_regress`` takes ragged (sequences of arrays) or padded (2D arrays, nan for
+missing points) xs and ys, a fit per series and optional exclusion masks. Series
+with the same fit are solved together with a stacked QR decomposition, the same
+least squares solution as ``OLSRegressor`` with ``ClosedFormOLS``.
+
+Supported fits are the polynomial fits (linear, parabolic, cubic, quartic or an
+int degree) and average, which is fit as a degree 0 polynomial i.e. the mean and
+its standard error. Fits without a closed form solution (exponential, custom,
+interpolation) are rejected and have to use the single series regressors.
+"""
+
+# ============= enthought library imports =======================
+# ============= standard library imports ========================
+from numpy import (
+    arange,
+    asarray,
+    einsum,
+    errstate,
+    finfo,
+    full,
+    isfinite,
+    linalg,
+    nan,
+    sqrt,
+    where,
+    zeros,
+)
+
+# ============= local library imports  ==========================
+from pychron.core.helpers.fits import FITS
+from pychron.pychron_constants import MSEM, SEM
+
+EPS = finfo(float).eps
+
+
+def fit_degree(fit):
+    """
+    polynomial degree of ``fit``. average is degree 0
+    """
+    if isinstance(fit, int):
+        return fit
+
+    lfit = fit.lower()
+    if "average" in lfit:
+        return 0
+    if lfit in FITS:
+        return FITS.index(lfit) + 1
+
+    raise ValueError("fit {} has no closed form batch solution".format(fit))
+
+
+def pad_series(series, fill=nan):
+    """
+    stack ``series`` into a 2D array padded with ``fill``. 2D arrays are returned
+    as is
+    """
+    if hasattr(series, "ndim") and series.ndim == 2:
+        return series
+
+    series = [asarray(s) for s in series]
+    n = max((s.shape[0] for s in series), default=0)
+    ret = full((len(series), n), fill, dtype=float)
+    for i, s in enumerate(series):
+        ret[i, : s.shape[0]] = s
+    return ret
+
+
+class BatchRegressionResult(object):
+    """
+    stacked results of ``batch_regress``. Arrays are indexed by series.
+
+    coefficients are ordered constant first, as ``OLSRegressor.coefficients``,
+    and zero padded to the highest degree in the batch. series that could not be
+    fit, e.g. fewer points than coefficients, are nan
+    """
+
+    def __init__(self, degrees, coefficients, covariances, n, ssr, mswd):
+        self.degrees = degrees
+        self.coefficients = coefficients
+        self.covariances = covariances
+        self.n = n
+        self.ssr = ssr
+        self.mswd = mswd
+
+        with errstate(invalid="ignore", divide="ignore"):
+            # standard error of the fit. see BaseRegressor.calculate_standard_error_fit
+            self.standard_error_fit = sqrt(ssr / (n - degrees - 1))
+
+    @property
+    def coefficient_errors(self):
+        return sqrt(einsum("sii->si", self.covariances))
+
+    def get_exog(self, x):
+        x = asarray(x, dtype=float)
+        k = self.coefficients.shape[1]
+        return x[..., None] ** arange(k)
+
+    def predict(self, x):
+        """
+        x: scalar, (npts,) shared by all series or (nseries, npts)
+
+        return (nseries,) for scalar x otherwise (nseries, npts)
+        """
+        X = self.get_exog(x)
+        if X.ndim == 1:
+            return self.coefficients.dot(X)
+        elif X.ndim == 2:
+            return einsum("pk,sk->sp", X, self.coefficients)
+        return einsum("spk,sk->sp", X, self.coefficients)
+
+    def predict_error(self, x, error_calc=SEM):
+        """
+        same as ``OLSRegressor.predict_error_matrix``. see ``predict`` for the
+        shapes of ``x`` and the return value
+        """
+        X = self.get_exog(x)
+        C = self.covariances
+        if X.ndim == 1:
+            var = einsum("k,skj,j->s", X, C, X)
+        elif X.ndim == 2:
+            var = einsum("pk,skj,pj->sp", X, C, X)
+        else:
+            var = einsum("spk,skj,spj->sp", X, C, X)
+
+        error_calc = error_calc.lower()
+        if error_calc == SEM.lower():
+            return sqrt(var)
+
+        sef = self.standard_error_fit
+        if X.ndim > 1:
+            sef = sef[:, None]
+
+        if error_calc == MSEM.lower():
+            m = where(self.mswd > 1, self.mswd, 1) ** 0.5
+            if X.ndim > 1:
+                m = m[:, None]
+            return sqrt(var) * m
+
+        return sqrt(sef**2 + var)
+
+
+def batch_regress(xs, ys, fits="linear", excluded=None, yserr=None):
+    """
+    fit every series in ``xs``, ``ys``.
+
+    xs, ys: sequences of 1D arrays or (nseries, npts) arrays. nan points are
+        ignored
+    fits: one fit for all series or one per series. see ``fit_degree``
+    excluded: optional boolean masks shaped like ``ys``, True excludes a point
+    yserr: optional errors shaped like ``ys``. only used for the MSWD, which has
+        the same definition as ``BaseRegressor.mswd``
+
+    return BatchRegressionResult
+    """
+    X = pad_series(xs)
+    Y = pad_series(ys)
+    ns = Y.shape[0]
+
+    if isinstance(fits, (str, int)):
+        fits = [fits] * ns
+    degrees = asarray([fit_degree(f) for f in fits], dtype=int)
+
+    use = isfinite(X) & isfinite(Y)
+    if excluded is not None:
+        use &= ~pad_series(excluded, fill=True).astype(bool)
+
+    X = where(use, X, 0)
+    Y = where(use, Y, 0)
+    n = use.sum(axis=1)
+
+    kmax = int(degrees.max()) + 1 if ns else 1
+    coefficients = full((ns, kmax), nan)
+    covariances = full((ns, kmax, kmax), nan)
+    ssr = full(ns, nan)
+
+    for d in set(degrees.tolist()):
+        k = d + 1
+        idx = where((degrees == d) & (n > k))[0]
+        if not idx.shape[0]:
+            continue
+
+        w = use[idx]
+        V = X[idx, :, None] ** arange(k) * w[..., None]
+        y = Y[idx]
+        q, r = linalg.qr(V)
+
+        rd = abs(einsum("sii->si", r))
+        ok = rd.min(axis=1) > rd.max(axis=1) * n[idx] * EPS
+        idx, q, r, V, y = idx[ok], q[ok], r[ok], V[ok], y[ok]
+        if not idx.shape[0]:
+            continue
+
+        rinv = linalg.inv(r)
+        beta = einsum("skj,snj,sn->sk", rinv, q, y)
+        resid = y - einsum("snk,sk->sn", V, beta)
+        s = einsum("sn,sn->s", resid, resid)
+        scale = s / (n[idx] - k)
+
+        c = zeros((idx.shape[0], kmax))
+        c[:, :k] = beta
+        coefficients[idx] = c
+
+        cov = zeros((idx.shape[0], kmax, kmax))
+        cov[:, :k, :k] = einsum("sij,skj->sik", rinv, rinv) * scale[:, None, None]
+        covariances[idx] = cov
+        ssr[idx] = s
+
+    mswd = full(ns, nan)
+    if yserr is not None:
+        E = pad_series(yserr)
+        with errstate(invalid="ignore", divide="ignore"):
+            w = where(use & (E != 0), 1 / E**2, 0)
+            wm = (w * Y).sum(axis=1) / w.sum(axis=1)
+            ssw = where(use, (Y - wm[:, None]) ** 2 / E**2, 0).sum(axis=1)
+            dof = n - (degrees + 1)
+            mswd = where(dof > 0, ssw / dof, 0)
+
+    return BatchRegressionResult(degrees, coefficients, covariances, n, ssr, mswd)
+
+
+# ============= EOF =============================================
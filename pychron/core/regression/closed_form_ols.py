@@ -0,0 +1,142 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+"""
+closed form ordinary least squares used in place of ``statsmodels.api.OLS``.
+
+``ClosedFormOLS`` solves the normal equations with a QR decomposition of the
+design matrix and exposes the subset of the statsmodels model/results interface
+used by ``OLSRegressor`` and the monte carlo estimators (``params``, ``bse``,
+``resid``, ``rsquared``, ``rsquared_adj``, ``normalized_cov_params``,
+``predict``, ``whiten``, ``wexog``, ``pinv_wexog``).
+
+Rank deficient designs and fits without residual degrees of freedom are handed
+to statsmodels so their results stay identical.
+"""
+
+# ============= enthought library imports =======================
+# ============= standard library imports ========================
+from numpy import asarray, diag, dot, finfo, linalg, sqrt
+from statsmodels.api import OLS
+
+EPS = finfo(float).eps
+
+
+class ClosedFormOLSResults(object):
+    def __init__(self, model, params, normalized_cov_params, rank):
+        self.model = model
+        self.params = params
+        self.normalized_cov_params = normalized_cov_params
+        self.rank = rank
+
+        self.nobs = float(model.wexog.shape[0])
+        self.df_resid = self.nobs - rank
+        self.df_model = float(rank - model.k_constant)
+
+        self.fittedvalues = dot(model.wexog, params)
+        self.resid = model.wendog - self.fittedvalues
+        self.wresid = self.resid
+        self.ssr = dot(self.resid, self.resid)
+        self.scale = self.ssr / self.df_resid
+
+        self._statsmodels_result = None
+
+    @property
+    def bse(self):
+        return sqrt(diag(self.cov_params()))
+
+    @property
+    def centered_tss(self):
+        c = self.model.wendog - self.model.wendog.mean()
+        return dot(c, c)
+
+    @property
+    def uncentered_tss(self):
+        w = self.model.wendog
+        return dot(w, w)
+
+    @property
+    def rsquared(self):
+        if self.model.k_constant:
+            return 1 - self.ssr / self.centered_tss
+        else:
+            return 1 - self.ssr / self.uncentered_tss
+
+    @property
+    def rsquared_adj(self):
+        return 1 - (self.nobs - self.model.k_constant) / self.df_resid * (1 - self.rsquared)
+
+    def cov_params(self):
+        return self.normalized_cov_params * self.scale
+
+    def predict(self, exog):
+        return dot(exog, self.params)
+
+    def summary(self):
+        return self.to_statsmodels().summary()
+
+    def to_statsmodels(self):
+        """
+        the equivalent statsmodels results, e.g. for prediction envelopes and
+        summaries
+        """
+        if self._statsmodels_result is None:
+            self._statsmodels_result = OLS(self.model.wendog, self.model.wexog).fit()
+        return self._statsmodels_result
+
+
+class ClosedFormOLS(object):
+    def __init__(self, endog, exog):
+        self.endog = self.wendog = asarray(endog, dtype=float)
+        self.exog = self.wexog = asarray(exog, dtype=float)
+        self._pinv_wexog = None
+
+    @property
+    def k_constant(self):
+        # same detection as statsmodels; a non zero column without spread
+        X = self.exog
+        if not X.shape[0]:
+            return 0
+        const = (X.max(axis=0) == X.min(axis=0)) & (X[0] != 0)
+        return int(const.any())
+
+    @property
+    def pinv_wexog(self):
+        if self._pinv_wexog is None:
+            self._pinv_wexog = linalg.pinv(self.wexog)
+        return self._pinv_wexog
+
+    @pinv_wexog.deleter
+    def pinv_wexog(self):
+        self._pinv_wexog = None
+
+    def whiten(self, x):
+        return asarray(x)
+
+    def fit(self):
+        X = self.wexog
+        n, k = X.shape
+        if n > k:
+            q, r = linalg.qr(X)
+            rd = abs(diag(r))
+            if rd.min() > rd.max() * n * EPS:
+                rinv = linalg.inv(r)
+                params = dot(rinv, dot(q.T, self.wendog))
+                return ClosedFormOLSResults(self, params, dot(rinv, rinv.T), k)
+
+        return OLS(self.wendog, X).fit()
+
+
+# ============= EOF =============================================
@@ -40,6 +40,7 @@ from pychron.core.geometry.geometry import calc_distances
 from pychron.core.regression.base_regressor import BaseRegressor
 from pychron.core.regression.ols_regressor import MultipleLinearRegressor
 from pychron.core.stats.idw import Invdisttree
+from pychron.core.stats.monte_carlo import loop_predict
 from pychron.pychron_constants import WEIGHTED_MEAN, AVERAGE, LINEAR
 
 
@@ -104,10 +105,21 @@ class RBFRegressor(InterpolationRegressor):
 
     def fast_predict2(self, endog, exog):
         x, y = exog.T
-        # print(x.shape, y.shape, endog.shape)
         fx, fy = self.clean_xs.T
-        self.rbf = Rbf(fx, fy, endog, function=self.rbf_kind)
-        return self.rbf(x, y)
+        # do not replace self.rbf. it is the fit used by predict
+        rbf = Rbf(fx, fy, endog, function=self.rbf_kind)
+        return rbf(x, y)
+
+    def fast_predict_batch(self, endogs, exog):
+        if exog.ndim == 3:
+            return loop_predict(self, endogs, exog)
+
+        # the interpolation weights are linear in the endog so all trials are
+        # solved at once as a vector valued rbf
+        x, y = exog.T
+        fx, fy = self.clean_xs.T
+        rbf = Rbf(fx, fy, endogs.T, function=self.rbf_kind, mode="N-D")
+        return rbf(x, y).T
 
 
 class GridDataRegressor(InterpolationRegressor):
@@ -128,6 +140,13 @@ class GridDataRegressor(InterpolationRegressor):
         # return self.rbf(x, y)
         return griddata(self.clean_xs, endog, (x, y), method=self.method)
 
+    def fast_predict_batch(self, endogs, exog):
+        if exog.ndim == 3:
+            return loop_predict(self, endogs, exog)
+
+        x, y = exog.T
+        return griddata(self.clean_xs, endogs.T, (x, y), method=self.method).T
+
 
 class IDWRegressor(InterpolationRegressor):
     def calculate(self):
@@ -21,6 +21,7 @@ from numpy import average, where, full
 
 from pychron.core.helpers.formatting import floatfmt
 from pychron.pychron_constants import SEM, MSEM, SE
+from pychron.core.stats.monte_carlo import constant_predict
 from .base_regressor import BaseRegressor
 
 
@@ -33,6 +34,9 @@ class MeanRegressor(BaseRegressor):
     def fast_predict2(self, endog, exog):
         return full(exog.shape[0], endog.mean())
 
+    def fast_predict_batch(self, endogs, exog):
+        return constant_predict(endogs.mean(axis=1), exog)
+
     def calculate(self, filtering=False, **kw):
         # cxs, cys = self.pre_clean_ys, self.pre_clean_ys
         if not filtering:
@@ -169,6 +173,10 @@ class WeightedMeanRegressor(MeanRegressor):
         mean = average(endog, weights=ws)
         return full(exog.shape[0], mean)
 
+    def fast_predict_batch(self, endogs, exog):
+        ws = self._get_weights()
+        return constant_predict(average(endogs, axis=1, weights=ws), exog)
+
     @property
     def se(self):
         """
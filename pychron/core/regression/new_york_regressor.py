@@ -14,7 +14,7 @@
 # limitations under the License.
 # ===============================================================================
 # ============= enthought library imports =======================
-from numpy import linspace, inf as Inf, zeros_like
+from numpy import array, linspace, zeros_like
 from scipy.optimize import fsolve
 from traits.api import Array, Property, Float
 
@@ -23,6 +23,13 @@ from traits.api import Array, Property, Float
 from uncertainties import std_dev, ufloat
 
 from pychron.core.regression.ols_regressor import OLSRegressor
+from pychron.core.regression.york_solver import (
+    MAX_ITERATIONS,
+    YorkData,
+    mahon_variances,
+    york_fit,
+    york_variances,
+)
 from pychron.core.stats import calculate_mswd2
 from pychron.core.stats.core import validate_mswd
 from pychron.pychron_constants import MSE, SE
@@ -31,17 +38,6 @@ from pychron.core.helpers.logger_setup import new_logger
 logger = new_logger("YorkRegressor")
 
 
-def kron(i, j):
-    """ "
-    # calculates Kronecker delta
-    if i == j:
-        return 1.
-    else:
-        return 0.
-    """
-    return int(i == j)
-
-
 class YorkRegressor(OLSRegressor):
     """York 1969, Mahon 1996"""
 
@@ -70,6 +66,9 @@ class YorkRegressor(OLSRegressor):
     mswd = Property
     error_calc_type = SE
 
+    # start the slope iteration from the last slope, e.g. when points are toggled
+    warm_start = True
+
     def calculate(self, *args, **kw):
         super(YorkRegressor, self).calculate(*args, **kw)
 
@@ -165,16 +164,7 @@ class YorkRegressor(OLSRegressor):
         return self._intercept_variance
 
     def get_slope_variance(self):
-        b = self._slope
-        W = self._calculate_W(b)
-        U, V = self._calculate_UV(W)
-
-        sigbsq = 1 / sum(W * U**2)
-
-        sigasq = sigbsq * sum(W * self.clean_xs**2) / sum(W)
-
-        self._intercept_variance = sigasq
-        return sigbsq
+        return self._get_variances(york_variances)
 
     def get_slope_error(self):
         return self.get_slope_variance() ** 0.5
@@ -232,54 +222,29 @@ class YorkRegressor(OLSRegressor):
         # print var_x.shape, var_y.shape, r.shape, b
         return (var_y + b**2 * var_x - 2 * b * r * sig_x * sig_y) ** -1
 
-    def _calculate(self):
-        b = 0
-        cnt = 0
-        b, a, cnt = self._calculate_slope_intercept(Inf, b, cnt)
-        if cnt >= 500:
-            logger.warning("York regression did not converge")
-            #             self.warning('regression did not converge')
-        #         else:
-        #             self.info('regression converged after {} iterations'.format(cnt))
-
-        self._slope = b
-        self._intercept = a
-
-    def _calculate_slope_intercept(self, pb, b, cnt, total=500, tol=1e-10):
-        """
-        recursively calculate slope
-        b=slope
-        a=intercept
-        """
-        a = 0
-        if abs(pb - b) < tol or cnt > total:
-            W = self._calculate_W(b)
-            XBar, YBar = self._calculate_xy_bar(W)
-            a = YBar - b * XBar
-            return b, a, cnt
-        else:
-            sig_x = self.clean_xserr
-            sig_y = self.clean_yserr
-
-            r = self.calculate_correlation_coefficients()
+    def _york_data(self):
+        return YorkData(
+            self.clean_xs,
+            self.clean_ys,
+            self.clean_xserr,
+            self.clean_yserr,
+            r=self.calculate_correlation_coefficients(),
+        )
 
-            var_x = sig_x**2
-            var_y = sig_y**2
-
-            W = self._calculate_W(b)
-            U, V = self._calculate_UV(W)
+    def _get_variances(self, func):
+        sigbsq, sigasq = func(array([self._slope]), self._york_data())
+        self._intercept_variance = sigasq[0]
+        return sigbsq[0]
 
-            sumA = sum(W**2 * V * (U * var_y + b * V * var_x - r * V * sig_x * sig_y))
-            sumB = sum(
-                W**2 * U * (U * var_y + b * V * var_x - b * r * U * sig_x * sig_y)
-            )
-            try:
-                nb = sumA / sumB
-                b, a, cnt = self._calculate_slope_intercept(b, nb, cnt + 1)
-            except ZeroDivisionError:
-                pass
+    def _calculate(self):
+        b0 = self._slope if self.warm_start else None
+        b, a, cnt = york_fit(None, None, None, None, b0=b0, data=self._york_data())
+        if cnt[0] >= MAX_ITERATIONS:
+            logger.warning("York regression did not converge")
 
-        return b, a, cnt
+        self._slope = b[0]
+        self._intercept = a[0]
+        self._intercept_variance = None
 
     def predict(self, x):
         m, b = self._slope, self._intercept
@@ -299,72 +264,7 @@ class NewYorkRegressor(YorkRegressor):
         :return:
         """
 
-        b = self._slope
-        W = self._calculate_W(b)
-        U, V = self._calculate_UV(W)
-
-        sx = self.clean_xserr
-        sy = self.clean_yserr
-
-        var_x = sx**2
-        var_y = sy**2
-
-        r = self.calculate_correlation_coefficients()
-        sxy = r * sx * sy
-
-        aa = 2 * b * (U * V * var_x - U**2 * sxy)
-        bb = U**2 * var_y - V**2 * var_x
-        cc = W**3 * (sxy - b * var_x)
-
-        da = b**2 * (U * V * var_x - U**2 * sxy)
-        db = b * (U**2 * var_y - V**2 * var_x)
-        dc = U * V * var_y - V**2 * sxy
-        dd = da + db - dc
-
-        # eq 19
-        dthdb = sum(W**2 * (aa + bb)) + 4 * sum(cc * dd)
-
-        xbar, _ = self._calculate_xy_bar(W)
-
-        # now calculate sigasq and sigbsq
-        wksum = sum(W)
-        sigasq = 0.0
-        sigbsq = 0.0
-
-        x = b**2 * (V * var_x - 2 * U * sxy) + 2 * b * U * var_y - V * var_y
-        xx = b**2 * U * var_x + 2 * V * sxy - 2 * b * V * var_x - U * var_y
-        for i, wi in enumerate(W):
-            var_xi = var_x[i]
-            var_yi = var_y[i]
-            sxyi = sxy[i]
-
-            # calculate dell theta / dell xi and dell theta / dell yi
-            dthdxi = 0.0
-            dthdyi = 0.0
-            ww = wi / wksum
-            for j, wj in enumerate(W):
-                # add to dthdxi and dthdyi
-                a = wj**2.0 * (kron(i, j) - ww)
-                dthdxi += a * x[j]
-                # correct equation! not equal to equation 21 in Mahon (1996)
-                dthdyi += a * xx[j]
-
-            # now calculate dell a / dell xi and dell a / dell yi
-            dadxi = -b * ww - xbar * dthdxi / dthdb
-            dadyi = ww - xbar * dthdyi / dthdb
-
-            # now finally add to sigasq and sigbsq
-            sigbsq += (
-                dthdxi**2.0 * var_xi + dthdyi**2.0 * var_yi + 2 * sxyi * dthdxi * dthdyi
-            )
-            sigasq += (
-                dadxi**2.0 * var_xi + dadyi**2.0 * var_yi + 2 * sxyi * dadxi * dadyi
-            )
-
-        # now divide sigbsq
-        sigbsq /= dthdb**2.0
-        self._intercept_variance = sigasq
-        return sigbsq
+        return self._get_variances(mahon_variances)
 
         # # this seems to be the issue. application of the kronecker delta not correct
         #
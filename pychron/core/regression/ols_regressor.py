@@ -21,6 +21,7 @@ from numpy import (
     column_stack,
     sqrt,
     dot,
+    einsum,
     linalg,
     zeros_like,
     hstack,
@@ -28,16 +29,20 @@ from numpy import (
     array,
 )
 from statsmodels.api import OLS
-from traits.api import Int, Property
+from traits.api import Int, Property, Bool
 
 # ============= local library imports  ==========================
 from pychron.core.helpers.fits import FITS, fit_to_degree
 from pychron.core.helpers.strtools import streq
 from pychron.core.regression.base_regressor import BaseRegressor
+from pychron.core.regression.closed_form_ols import ClosedFormOLS, ClosedFormOLSResults
 from pychron.pychron_constants import MSEM, SEM, AUTO_LINEAR_PARABOLIC
 
 logger = logging.getLogger("Regressor")
 
+# linear, parabolic, cubic
+CLOSED_FORM_DEGREES = (1, 2, 3)
+
 
 class OLSRegressor(BaseRegressor):
     degree = Property(depends_on="_degree")
@@ -45,6 +50,9 @@ class OLSRegressor(BaseRegressor):
     constant = None
     _ols = None
 
+    # fit with ClosedFormOLS instead of statsmodels OLS. see _engine_factory
+    use_closed_form = Bool(True)
+
     def set_degree(self, d, refresh=True):
         if isinstance(d, str):
             self._fit = d
@@ -88,10 +96,26 @@ class OLSRegressor(BaseRegressor):
         if not hasattr(self, "pinv_wexog"):
             self.pinv_wexog = linalg.pinv(self._ols.wexog)
 
-        beta = dot(self.pinv_wexog, endog)
+        beta = dot(self.pinv_wexog, self._ols.whiten(endog))
 
         return dot(exog, beta)
 
+    def fast_predict_batch(self, endogs, exog):
+        """
+        vectorized fast_predict2 for many endogs at once.
+
+        endogs: (ntrials, n)
+        exog: (npts, k) or (ntrials, npts, k)
+
+        return (ntrials, npts)
+        """
+        ols = self._ols
+        beta = dot(ols.whiten(asarray(endogs).T).T, linalg.pinv(ols.wexog).T)
+        if exog.ndim == 3:
+            return einsum("tpk,tk->tp", exog, beta)
+
+        return dot(beta, exog.T)
+
     def determine_fit(self, fit):
         if isinstance(fit, str) and streq(fit, AUTO_LINEAR_PARABOLIC):
             self.set_degree("linear", refresh=False)
@@ -166,8 +190,12 @@ class OLSRegressor(BaseRegressor):
     def calculate_prediction_envelope(self, fx, fy):
         from statsmodels.sandbox.regression.predstd import wls_prediction_std
 
-        prstd, iv_l, iv_u = wls_prediction_std(self._result)
-        return iv_l, iv_u, self._result.model.exog[::, 1]
+        res = self._result
+        if isinstance(res, ClosedFormOLSResults):
+            res = res.to_statsmodels()
+
+        prstd, iv_l, iv_u = wls_prediction_std(res)
+        return iv_l, iv_u, res.model.exog[::, 1]
 
     def predict(self, pos):
         return_single = False
@@ -356,6 +384,8 @@ class OLSRegressor(BaseRegressor):
             return [0, 0]
 
     def _engine_factory(self, fy, X, check_integrity=True):
+        if self.use_closed_form and self.degree in CLOSED_FORM_DEGREES:
+            return ClosedFormOLS(fy, X)
         return OLS(fy, X)
 
     def _get_degree(self):
@@ -0,0 +1,108 @@
+import unittest
+
+from numpy import array, linspace, isnan, nan, zeros
+from numpy.random import RandomState
+from numpy.testing import assert_allclose
+
+from pychron.core.regression.batch_regressor import batch_regress, pad_series
+from pychron.core.regression.mean_regressor import MeanRegressor
+from pychron.core.regression.ols_regressor import PolynomialRegressor
+
+RTOL = 1e-6
+
+
+def make_series(ns, seed=0):
+    rs = RandomState(seed)
+    fits = ["linear", "parabolic", "cubic", "average"]
+    xs, ys, es, exs, fs = [], [], [], [], []
+    for i in range(ns):
+        n = int(rs.randint(10, 80))
+        x = linspace(5, 300, n)
+        y = 1000 - 0.4 * x + 3e-4 * x**2 + rs.normal(0, 2, n)
+        ex = zeros(n, dtype=bool)
+        ex[rs.randint(0, n, 2)] = True
+        xs.append(x)
+        ys.append(y)
+        es.append(rs.uniform(1, 3, n))
+        exs.append(ex)
+        fs.append(fits[i % len(fits)])
+    return xs, ys, es, exs, fs
+
+
+def single(x, y, e, ex, fit):
+    reg = PolynomialRegressor(xs=x, ys=y, yserr=e, user_excluded=list(ex.nonzero()[0]))
+    if fit == "average":
+        reg.set_degree(0, refresh=False)
+    else:
+        reg.set_degree(fit, refresh=False)
+    reg.calculate()
+    return reg
+
+
+class BatchRegressTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.xs, cls.ys, cls.es, cls.exs, cls.fits = make_series(24)
+        cls.result = batch_regress(cls.xs, cls.ys, cls.fits, excluded=cls.exs, yserr=cls.es)
+        cls.singles = [single(*args) for args in zip(cls.xs, cls.ys, cls.es, cls.exs, cls.fits)]
+
+    def test_matches_single_series(self):
+        r = self.result
+        for i, reg in enumerate(self.singles):
+            with self.subTest(series=i, fit=self.fits[i]):
+                k = len(reg.coefficients)
+                assert_allclose(r.coefficients[i, :k], reg.coefficients, rtol=RTOL)
+                assert_allclose(r.coefficient_errors[i, :k], reg.coefficient_errors, rtol=RTOL)
+                assert_allclose(r.covariances[i, :k, :k], reg._result.cov_params())
+                assert_allclose(r.mswd[i], reg.mswd, rtol=RTOL)
+                self.assertEqual(r.n[i], reg.n)
+                assert_allclose(r.standard_error_fit[i], reg.calculate_standard_error_fit())
+
+    def test_predict(self):
+        r = self.result
+        px = array([0, 100.0])
+        pred = r.predict(px)
+        intercepts = r.predict(0)
+        self.assertEqual(pred.shape, (24, 2))
+        for i, reg in enumerate(self.singles):
+            assert_allclose(pred[i], reg.predict(px), rtol=RTOL)
+            assert_allclose(intercepts[i], reg.predict(0), rtol=RTOL)
+            for ec in ("SEM", "MSEM", "SD"):
+                assert_allclose(
+                    r.predict_error(px, error_calc=ec)[i],
+                    reg.predict_error(px, error_calc=ec),
+                    rtol=RTOL,
+                )
+
+    def test_average_matches_mean_regressor(self):
+        i = self.fits.index("average")
+        x, y, ex = self.xs[i], self.ys[i], self.exs[i]
+        reg = MeanRegressor(xs=x, ys=y, user_excluded=list(ex.nonzero()[0]))
+        reg.calculate()
+        assert_allclose(self.result.coefficients[i, 0], reg.mean)
+        assert_allclose(self.result.coefficient_errors[i, 0], reg.sem)
+
+    def test_padded_input(self):
+        X = pad_series(self.xs)
+        Y = pad_series(self.ys)
+        self.assertTrue(isnan(X).any())
+        r = batch_regress(X, Y, self.fits, excluded=self.exs)
+        assert_allclose(r.coefficients, self.result.coefficients)
+
+    def test_too_few_points(self):
+        r = batch_regress([[1, 2, 3, 4], [1, 2]], [[1, 2, 3.5, 5.5], [1, 2]], "parabolic")
+        self.assertFalse(isnan(r.coefficients[0]).any())
+        self.assertTrue(isnan(r.coefficients[1]).all())
+
+    def test_nan_points_ignored(self):
+        r = batch_regress([[1, 2, 3, 4]], [[1, 2, nan, 4.0]], "linear")
+        assert_allclose(r.coefficients[0], [0, 1], atol=1e-12)
+        self.assertEqual(r.n[0], 3)
+
+    def test_unsupported_fit(self):
+        with self.assertRaises(ValueError):
+            batch_regress([[1, 2, 3]], [[1, 2, 3]], "exponential")
+
+
+if __name__ == "__main__":
+    unittest.main()
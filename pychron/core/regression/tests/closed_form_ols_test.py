@@ -0,0 +1,148 @@
+import unittest
+
+from numpy import array, linspace, ones
+from numpy.random import RandomState
+from numpy.testing import assert_allclose
+from statsmodels.regression.linear_model import RegressionResultsWrapper
+
+from pychron.core.regression.closed_form_ols import ClosedFormOLS, ClosedFormOLSResults
+from pychron.core.regression.ols_regressor import PolynomialRegressor
+
+# cubic designs over a few hundred seconds have condition numbers ~1e9
+RTOL = 1e-6
+
+
+def make_data(n, degree, seed=0, xmax=400):
+    rs = RandomState(seed)
+    xs = linspace(5, xmax, n)
+    coeffs = [1000, -0.5, 2e-4, -3e-7][: degree + 1]
+    ys = sum(c * xs**i for i, c in enumerate(coeffs)) + rs.normal(0, 2, n)
+    # a few spikes for the outlier filter
+    ys[n // 3] += 40
+    ys[2 * n // 3] -= 35
+    yserr = rs.uniform(1, 3, n)
+    return xs, ys, yserr
+
+
+def make_pair(degree, xs, ys, yserr=None, **kw):
+    regs = []
+    for closed_form in (True, False):
+        reg = PolynomialRegressor(xs=xs, ys=ys, use_closed_form=closed_form, error_calc_type="SEM")
+        if yserr is not None:
+            reg.yserr = yserr
+        reg.set_degree(degree, refresh=False)
+        if "filter_outliers_dict" in kw:
+            reg.filter_outliers_dict = kw["filter_outliers_dict"]
+        if "truncate" in kw:
+            reg.set_truncate(kw["truncate"])
+        reg.calculate()
+        regs.append(reg)
+    return regs
+
+
+class ClosedFormEquivalenceTestCase(unittest.TestCase):
+    def _assert_equivalent(self, a, b):
+        self.assertIsInstance(a._result, ClosedFormOLSResults)
+        self.assertIsInstance(b._result, RegressionResultsWrapper)
+
+        assert_allclose(a.coefficients, b.coefficients, rtol=RTOL)
+        assert_allclose(a.coefficient_errors, b.coefficient_errors, rtol=RTOL)
+        assert_allclose(a.var_covar, b.var_covar, rtol=RTOL)
+        assert_allclose(a.rsquared, b.rsquared, rtol=RTOL)
+        assert_allclose(a.rsquared_adj, b.rsquared_adj, rtol=RTOL)
+        assert_allclose(a.calculate_residuals(), b.calculate_residuals(), atol=1e-6)
+        assert_allclose(a.calculate_standard_error_fit(), b.calculate_standard_error_fit())
+        self.assertListEqual(a.outlier_excluded, b.outlier_excluded)
+        self.assertEqual(a.n, b.n)
+
+        px = [0, 10.5, 200]
+        assert_allclose(a.predict(px), b.predict(px), rtol=RTOL)
+        for ec in ("SEM", "MSEM", "SD"):
+            assert_allclose(
+                a.predict_error(px, error_calc=ec),
+                b.predict_error(px, error_calc=ec),
+                rtol=RTOL,
+            )
+
+        if len(a.yserr):
+            assert_allclose(a.mswd, b.mswd, rtol=RTOL)
+
+    def test_degrees(self):
+        for degree in (1, 2, 3):
+            for n in (8, 50, 300):
+                with self.subTest(degree=degree, n=n):
+                    xs, ys, yserr = make_data(n, degree, seed=n + degree)
+                    self._assert_equivalent(*make_pair(degree, xs, ys, yserr))
+
+    def test_outlier_filter(self):
+        fod = dict(filter_outliers=True, iterations=3, std_devs=2)
+        for degree in (1, 2, 3):
+            with self.subTest(degree=degree):
+                xs, ys, _ = make_data(60, degree)
+                a, b = make_pair(degree, xs, ys, filter_outliers_dict=fod)
+                self.assertTrue(a.outlier_excluded)
+                self._assert_equivalent(a, b)
+
+    def test_truncate(self):
+        xs, ys, _ = make_data(60, 2)
+        fod = dict(filter_outliers=True, iterations=1, std_devs=2)
+        a, b = make_pair(2, xs, ys, filter_outliers_dict=fod, truncate="x<300")
+        self.assertTrue(a.truncate_excluded)
+        self._assert_equivalent(a, b)
+
+    def test_fast_predict(self):
+        xs, ys, _ = make_data(40, 2)
+        a, b = make_pair(2, xs, ys)
+        endogs = RandomState(1).normal(ys, 1, (20, len(ys)))
+        pexog = a.get_exog(array([0, 1.0]))
+
+        assert_allclose(a.fast_predict2(endogs[0], pexog), b.fast_predict2(endogs[0], pexog))
+        assert_allclose(
+            a.fast_predict_batch(endogs, pexog),
+            b.fast_predict_batch(endogs, pexog),
+            rtol=RTOL,
+        )
+        assert_allclose(
+            a.fast_predict(endogs[0], pexog, exog=a.get_exog(xs)),
+            b.fast_predict(endogs[0], pexog, exog=b.get_exog(xs)),
+            rtol=RTOL,
+        )
+
+    def test_prediction_envelope(self):
+        xs, ys, _ = make_data(30, 1)
+        a, b = make_pair(1, xs, ys)
+        for ea, eb in zip(
+            a.calculate_prediction_envelope(xs, ys),
+            b.calculate_prediction_envelope(xs, ys),
+        ):
+            assert_allclose(ea, eb, rtol=RTOL)
+
+    def test_statsmodels_fallback(self):
+        # no residual degrees of freedom
+        xs = array([1.0, 2.0])
+        res = ClosedFormOLS(xs * 2, array([ones(2), xs]).T).fit()
+        self.assertNotIsInstance(res, ClosedFormOLSResults)
+
+        # rank deficient
+        res = ClosedFormOLS(ones(5), array([ones(5), ones(5)]).T).fit()
+        self.assertNotIsInstance(res, ClosedFormOLSResults)
+
+    def test_selectable(self):
+        xs, ys, _ = make_data(20, 1)
+        reg = PolynomialRegressor(xs=xs, ys=ys, fit="linear")
+        reg.calculate()
+        self.assertIsInstance(reg._result, ClosedFormOLSResults)
+
+        reg.use_closed_form = False
+        reg.calculate()
+        self.assertNotIsInstance(reg._result, ClosedFormOLSResults)
+
+        # only linear, parabolic and cubic
+        reg = PolynomialRegressor(xs=xs, ys=ys)
+        reg.set_degree(4, refresh=False)
+        reg.calculate()
+        self.assertNotIsInstance(reg._result, ClosedFormOLSResults)
+
+
+if __name__ == "__main__":
+    unittest.main()
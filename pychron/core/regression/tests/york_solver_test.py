@@ -0,0 +1,155 @@
+import unittest
+
+from numpy import array, full, nan, vstack
+from numpy.random import RandomState
+from numpy.testing import assert_allclose
+
+from pychron.core.regression.new_york_regressor import NewYorkRegressor
+from pychron.core.regression.tests.standard_data import pearson
+from pychron.core.regression.york_solver import (
+    YorkData,
+    mahon_variances,
+    york_fit,
+    york_fit_batch,
+)
+
+
+def kron_mahon_variances(b, x, y, sx, sy, r):
+    """
+    the O(n**2) loop of Trappitsch et al. (2018) used as the reference
+    """
+    var_x, var_y = sx**2, sy**2
+    sxy = r * sx * sy
+    W = 1 / (var_y + b**2 * var_x - 2 * b * sxy)
+    xbar = sum(W * x) / sum(W)
+    ybar = sum(W * y) / sum(W)
+    U, V = x - xbar, y - ybar
+
+    aa = 2 * b * (U * V * var_x - U**2 * sxy)
+    bb = U**2 * var_y - V**2 * var_x
+    cc = W**3 * (sxy - b * var_x)
+    dd = (
+        b**2 * (U * V * var_x - U**2 * sxy)
+        + b * (U**2 * var_y - V**2 * var_x)
+        - (U * V * var_y - V**2 * sxy)
+    )
+    dthdb = sum(W**2 * (aa + bb)) + 4 * sum(cc * dd)
+
+    xa = b**2 * (V * var_x - 2 * U * sxy) + 2 * b * U * var_y - V * var_y
+    xb = b**2 * U * var_x + 2 * V * sxy - 2 * b * V * var_x - U * var_y
+    sigasq = sigbsq = 0
+    for i, wi in enumerate(W):
+        ww = wi / sum(W)
+        dx = dy = 0
+        for j, wj in enumerate(W):
+            a = wj**2 * (int(i == j) - ww)
+            dx += a * xa[j]
+            dy += a * xb[j]
+        dax = -b * ww - xbar * dx / dthdb
+        day = ww - xbar * dy / dthdb
+        sigbsq += dx**2 * var_x[i] + dy**2 * var_y[i] + 2 * sxy[i] * dx * dy
+        sigasq += dax**2 * var_x[i] + day**2 * var_y[i] + 2 * sxy[i] * dax * day
+    return sigbsq / dthdb**2, sigasq
+
+
+def make_isochron(rs, n, slope=-250.0, intercept=0.0033):
+    x = rs.uniform(0.01, 0.1, n)
+    sx = x * rs.uniform(0.001, 0.005, n)
+    sy = 1e-5 * rs.uniform(0.5, 2, n)
+    y = intercept + slope * 1e-5 * x + rs.normal(0, 1, n) * sy
+    r = rs.uniform(0, 0.6, n)
+    return x, y, sx, sy, r
+
+
+class YorkSolverTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        xs, ys, wxs, wys = pearson()
+        cls.pearson = array(xs), array(ys), 1 / wxs**0.5, 1 / wys**0.5
+        cls.expected = pearson("new_york")
+
+    def test_pearson(self):
+        data = YorkData(*self.pearson)
+        b, a, cnt = york_fit(None, None, None, None, data=data)
+        sigbsq, sigasq = mahon_variances(b, data)
+
+        self.assertAlmostEqual(b[0], self.expected["slope"], 4)
+        self.assertAlmostEqual(a[0], self.expected["intercept"], 4)
+        self.assertAlmostEqual(sigbsq[0] ** 0.5, self.expected["slope_err"], 6)
+        self.assertAlmostEqual(sigasq[0] ** 0.5, self.expected["intercept_err"], 6)
+        self.assertGreater(cnt[0], 5)
+
+    def test_regressor(self):
+        x, y, sx, sy = self.pearson
+        reg = NewYorkRegressor(xs=x, ys=y, xserr=sx, yserr=sy)
+        reg.calculate()
+        self.assertAlmostEqual(reg.slope, self.expected["slope"], 4)
+        self.assertAlmostEqual(reg.get_intercept_error(), self.expected["intercept_err"], 6)
+
+        # excluding a point resets the cached intercept variance
+        reg.user_excluded = [0]
+        reg.calculate()
+        b, a, _ = york_fit(x[1:], y[1:], sx[1:], sy[1:])
+        self.assertAlmostEqual(reg.slope, b[0], 9)
+        _, sigasq = mahon_variances(b, YorkData(x[1:], y[1:], sx[1:], sy[1:]))
+        self.assertAlmostEqual(reg.get_intercept_error(), sigasq[0] ** 0.5, 9)
+
+    def test_mahon_variances(self):
+        rs = RandomState(3)
+        for n in (3, 10, 40):
+            x, y, sx, sy, r = make_isochron(rs, n)
+            data = YorkData(x, y, sx, sy, r)
+            b, _, _ = york_fit(None, None, None, None, data=data)
+            expected = kron_mahon_variances(b[0], x, y, sx, sy, r)
+            assert_allclose(mahon_variances(b, data), [[e] for e in expected])
+
+    def test_warm_start(self):
+        x, y, sx, sy = self.pearson
+        b, a, cold = york_fit(x[1:], y[1:], sx[1:], sy[1:])
+
+        # start from the slope with every point
+        b0, _, _ = york_fit(x, y, sx, sy)
+        wb, wa, warm = york_fit(x[1:], y[1:], sx[1:], sy[1:], b0=b0)
+
+        assert_allclose(wb, b, rtol=1e-8)
+        assert_allclose(wa, a, rtol=1e-8)
+        self.assertLess(warm[0], cold[0])
+
+    def test_batch(self):
+        rs = RandomState(7)
+        fits = [make_isochron(rs, n) for n in (4, 12, 25)]
+
+        npts = 25
+        cols = []
+        for i in range(5):
+            c = full((len(fits), npts), nan)
+            for j, f in enumerate(fits):
+                c[j, : len(f[i])] = f[i]
+            cols.append(c)
+
+        b, a, sigbsq, sigasq, cnt = york_fit_batch(*cols)
+        for j, f in enumerate(fits):
+            data = YorkData(*f)
+            eb, ea, ecnt = york_fit(None, None, None, None, data=data)
+            esb, esa = mahon_variances(eb, data)
+            assert_allclose([b[j], a[j], sigbsq[j], sigasq[j]], [eb[0], ea[0], esb[0], esa[0]])
+            self.assertEqual(cnt[j], ecnt[0])
+
+    def test_mask(self):
+        x, y, sx, sy = self.pearson
+        mask = full(x.shape, True)
+        mask[[2, 5]] = False
+        b, a, _ = york_fit(x, y, sx, sy, mask=mask)
+        eb, ea, _ = york_fit(x[mask], y[mask], sx[mask], sy[mask])
+        assert_allclose((b, a), (eb, ea))
+
+        # a masked row and the full row solved together
+        stack = [vstack((v, v)) for v in (x, y, sx, sy)]
+        mask = vstack((mask, full(x.shape, True)))
+        b, _, _, _, _ = york_fit_batch(*stack, mask=mask)
+        assert_allclose(b[0], eb[0])
+        assert_allclose(b[1], york_fit(x, y, sx, sy)[0][0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -17,8 +17,10 @@
 # ============= enthought library imports =======================
 
 # ============= standard library imports ========================
+from collections import namedtuple
+from functools import lru_cache
 
-from numpy import asarray, average, vectorize
+from numpy import asarray, average, vectorize, ascontiguousarray, dot, errstate, nan
 
 # ============= local library imports  ==========================
 from scipy.stats import chi2
@@ -84,20 +86,67 @@ def validate_mswd(mswd, n, k=1):
     return bool(low <= mswd <= high)
 
 
-MSWD_LIMITS = {}
+def get_mswd_limits(n, k=1):
+    return _mswd_limits(int(n) - int(k))
 
 
-def get_mswd_limits(n, k=1):
-    dof = n - k
-    limits = MSWD_LIMITS.get(dof, None)
-    if not limits:
-        # calculate the reduced chi2 95% interval for given dof
-        # use scale parameter to calculate the chi2_reduced from chi2
-        rv = chi2(dof, scale=1 / float(dof))
-        limits = rv.interval(0.95)
-        MSWD_LIMITS[dof] = limits
-
-    return limits
+@lru_cache(maxsize=None)
+def _mswd_limits(dof):
+    # calculate the reduced chi2 95% interval for given dof
+    # use scale parameter to calculate the chi2_reduced from chi2
+    rv = chi2(dof, scale=1 / float(dof))
+    return rv.interval(0.95)
+
+
+WeightedMeanStats = namedtuple("WeightedMeanStats", "mean error mswd n valid_mswd mswd_limits")
+
+
+def weighted_mean_stats(x, errs, k=1):
+    """
+    weighted mean, its error, the mswd and the mswd validity in one call.
+
+    equivalent to::
+
+        mean, error = calculate_weighted_mean(x, errs)
+        mswd = calculate_mswd(x, errs, k, wm=mean)
+        valid_mswd = validate_mswd(mswd, len(x), k)
+
+    but works on a single contiguous float copy of the data and reuses the
+    weights for the mean and the mswd
+
+    return WeightedMeanStats
+    """
+    x = ascontiguousarray(x, dtype=float)
+    errs = ascontiguousarray(errs, dtype=float)
+    n = x.shape[0]
+
+    with errstate(divide="ignore"):
+        weights = 1 / errs**2
+
+    idx = errs.astype(bool)
+    if idx.all():
+        w, xi = weights, x
+    else:
+        w, xi = weights[idx], x[idx]
+
+    sw = w.sum()
+    if sw:
+        mean = dot(w, xi) / sw
+        error = sw**-0.5
+    else:
+        # matches calculate_weighted_mean, nan if all errors are zero
+        mean = xi.mean() if xi.shape[0] else nan
+        error = 0
+
+    mswd, limits, valid = 0, None, False
+    if n > k:
+        with errstate(invalid="ignore", divide="ignore"):
+            r = x - mean
+            mswd = dot(r * r, weights) / float(n - k)
+        limits = get_mswd_limits(n, k)
+        valid = bool(limits[0] <= mswd <= limits[1])
+
+    return WeightedMeanStats(mean, error, mswd, n, valid, limits)
 
 
 def chi_squared(x, y, sx, sy, a, b, corrcoeffs=None):
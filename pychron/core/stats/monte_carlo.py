@@ -16,40 +16,100 @@
 
 # ============= enthought library imports =======================
 # ============= standard library imports ========================
+from concurrent.futures import ThreadPoolExecutor
+
+from numpy import (
+    empty,
+    percentile,
+    random,
+    abs as nabs,
+    column_stack,
+    asarray,
+    atleast_2d,
+)
 
-from numpy import zeros, percentile, array, random, abs as nabs, column_stack
-from scipy.stats import norm
+# ============= local library imports  ==========================
 
+DEFAULT_CHUNK_SIZE = 1000
+
+
+def batch_predict(regressor, endogs, exog):
+    """
+    predict a batch of perturbed datasets with ``regressor``.
+
+    endogs: (ntrials, n) array of y values, one row per trial
+    exog: (npts, k) exog shared by all trials or (ntrials, npts, k), one per trial
+
+    return (ntrials, npts) array of predicted values
+    """
+    exog = asarray(exog)
+    func = getattr(regressor, "fast_predict_batch", None)
+    if func is not None:
+        return func(endogs, exog)
+
+    return loop_predict(regressor, endogs, exog)
+
+
+def loop_predict(regressor, endogs, exog):
+    """
+    predict a batch one trial at a time with ``regressor.fast_predict2``.
+    used by regressors that have no closed form batched solution
+    """
+    pred = regressor.fast_predict2
+    if exog.ndim == 3:
+        return asarray([pred(yi, ei) for yi, ei in zip(endogs, exog)])
+
+    return asarray([pred(yi, exog) for yi in endogs])
 
-# ============= local library imports  ==========================
+
+def constant_predict(values, exog):
+    """
+    broadcast one value per trial to every prediction point
+    """
+    npts = exog.shape[-2] if exog.ndim == 3 else exog.shape[0]
+    return asarray(values)[:, None].repeat(npts, axis=1)
 
 
 class MonteCarloEstimator(object):
-    def __init__(self, ntrials, regressor, seed=None):
+    """
+    estimate prediction errors by refitting ``regressor`` to ``ntrials`` datasets
+    perturbed by their errors.
+
+    trials are solved in chunks of ``chunk_size``, each chunk as one batched
+    least squares problem (see ``batch_predict``), which bounds the memory used
+    by the perturbed datasets. Each chunk draws from its own random generator
+    spawned from ``seed`` so a seeded estimate is reproducible regardless of
+    ``nworkers``. Chunks are solved on ``nworkers`` threads; numpy releases the
+    GIL for the linear algebra.
+    """
+
+    def __init__(self, ntrials, regressor, seed=None, chunk_size=None, nworkers=1):
         self.regressor = regressor
         self.ntrials = ntrials
         self.seed = seed
+        self.chunk_size = chunk_size or DEFAULT_CHUNK_SIZE
+        self.nworkers = nworkers
 
     def _calculate(self, nominal_ys, ps):
         res = nominal_ys - ps
         pct = (15.87, 84.13)
 
-        a, b = array([percentile(ri, pct) for ri in res.T]).T
+        a, b = percentile(res, pct, axis=0)
         a, b = nabs(a), nabs(b)
         return (a + b) * 0.5
 
-    def _get_dist(self, n, npts):
-        if self.seed:
-            random.seed(self.seed)
-
-        ndist = norm()
+    def _chunks(self):
         ntrials = self.ntrials
-
-        ga = ndist.rvs((ntrials, n))
-        ps = zeros((ntrials, npts))
-        return ndist, ga, ps
+        size = self.chunk_size
+        bounds = [(s, min(s + size, ntrials)) for s in range(0, ntrials, size)]
+        seeds = random.SeedSequence(self.seed).spawn(len(bounds))
+        return [(s, e, random.default_rng(ss)) for (s, e), ss in zip(bounds, seeds)]
 
     def _estimate(self, pts, pexog, ys=None, yserr=None):
+        """
+        pexog: exog of the prediction points or a callable ``pexog(rng, ntrials)``
+        returning a (ntrials, npts, k) exog, one per trial
+        """
         reg = self.regressor
         nominal_ys = reg.predict(pts)
 
@@ -58,19 +118,26 @@ class MonteCarloEstimator(object):
         if yserr is None:
             yserr = reg.yserr
 
+        ys = asarray(ys, dtype=float)
         n, npts = len(ys), len(pts)
 
-        ntrials = self.ntrials
-        ndist, ga, ps = self._get_dist(n, npts)
-        pred = reg.fast_predict2
-        yp = ys + yserr * ga
+        ps = empty((self.ntrials, npts))
+
+        def solve(chunk):
+            s, e, rng = chunk
+            m = e - s
+            yp = ys + yserr * rng.standard_normal((m, n))
+            ex = pexog(rng, m) if callable(pexog) else pexog
+            ps[s:e] = batch_predict(reg, yp, ex)
 
-        if hasattr(pexog, "__call__"):
-            for i in range(ntrials):
-                ps[i] = pred(yp[i], pexog(i))
+        chunks = self._chunks()
+        if self.nworkers > 1 and len(chunks) > 1:
+            with ThreadPoolExecutor(max_workers=self.nworkers) as pool:
+                # consume the iterator so exceptions are raised here
+                list(pool.map(solve, chunks))
         else:
-            for i in range(ntrials):
-                ps[i] = pred(yp[i], pexog)
+            for c in chunks:
+                solve(c)
 
         return nominal_ys, self._calculate(nominal_ys, ps)
 
@@ -85,29 +152,27 @@ class RegressionEstimator(MonteCarloEstimator):
 
 class FluxEstimator(MonteCarloEstimator):
     def estimate_position_err(self, pts, error):
+        """
+        estimate the error introduced by uncertainty in the positions ``pts``.
+        every trial perturbs the positions by ``error`` in x and y
+        """
         reg = self.regressor
         ox, oy = pts.T
+        npts = len(pts)
 
-        n, npts = len(reg.ys), len(pts)
-
-        ntrials = self.ntrials
-        ndist, ga, ps = self._get_dist(n, npts)
-
-        pgax = ndist.rvs((ntrials, npts))
-        pgay = ndist.rvs((ntrials, npts))
-
-        pgax *= error
-        pgay *= error
+        def get_pexog(rng, m):
+            pgax = rng.standard_normal((m, npts)) * error
+            pgay = rng.standard_normal((m, npts)) * error
 
-        def get_pexog(i):
-            return reg.get_exog(column_stack((ox + pgax[i], oy + pgay[i])))
+            xy = column_stack(((ox + pgax).ravel(), (oy + pgay).ravel()))
+            ex = atleast_2d(reg.get_exog(xy).T).T
+            return ex.reshape(m, npts, -1)
 
         return self._estimate(pts, get_pexog, yserr=0)
 
     def estimate(self, pts):
         reg = self.regressor
         pexog = reg.get_exog(pts)
-        print("asdf", len(pts), pexog.shape)
         return self._estimate(pts, pexog)
 
 
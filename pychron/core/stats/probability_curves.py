@@ -17,42 +17,196 @@
 # ============= enthought library imports =======================
 
 # ============= standard library imports ========================
-from numpy import linspace, zeros, exp, pi, full
-
+from numpy import (
+    linspace,
+    zeros,
+    exp,
+    pi,
+    asarray,
+    abs as nabs,
+    maximum,
+    full_like,
+    dot,
+    flatnonzero,
+    isfinite,
+)
+from scipy.stats import gaussian_kde
 
 # ============= local library imports  ==========================
 
+# max number of elements of an intermediate (analyses x bins) array
+CHUNK_SIZE = 2**20
 
-def cumulative_probability(ages, errors, xmi, xma, n=100):
-    x = linspace(xmi, xma, n)
-    probs = zeros(n)
+# incremental updates applied before the excluded sum is recalculated from scratch
+MAX_INCREMENTAL_UPDATES = 256
+
+
+def _valid_mask(ages, errors):
+    # written as a negation so NaN ages/errors are kept and propagate into the curve
+    return ~((nabs(ages) < 1e-10) | (nabs(errors) < 1e-10))
 
-    for ai, ei in zip(ages, errors):
-        if abs(ai) < 1e-10 or abs(ei) < 1e-10:
-            continue
 
-        # calculate probability curve for ai+/-ei
+def gaussian_sum(x, ages, errors, chunk_size=None):
+    """
+    sum of the normal distributions ``ages +/- errors`` evaluated at ``x``.
+
+    analyses are evaluated in chunks so the intermediate array has at most
+    ``chunk_size`` elements
+    """
+    x = asarray(x, dtype=float)
+    ages = asarray(ages, dtype=float)
+    errors = asarray(errors, dtype=float)
+
+    probs = zeros(x.shape[0])
+    n = max(1, x.shape[0])
+    step = max(1, (chunk_size or CHUNK_SIZE) // n)
+    for i in range(0, ages.shape[0], step):
+        ai = ages[i : i + step, None]
+        es2 = 2 * errors[i : i + step, None] ** 2
+
         # p=1/(2*pi*sigma2) *exp (-(x-u)**2)/(2*sigma2)
         # see http://en.wikipedia.org/wiki/Normal_distribution
-        ds = (x - full(n, ai)) ** 2
-        es2 = full(n, 2 * ei * ei)
-        gs = (es2 * pi) ** -0.5 * exp(-ds / es2)
+        # evaluated in place to avoid (analyses x bins) temporaries
+        gs = x - ai
+        gs *= gs
+        gs /= -es2
+        exp(gs, out=gs)
+        probs += dot((es2[:, 0] * pi) ** -0.5, gs)
 
-        # cumulate probabilities
-        # numpy element_wise addition
-        probs += gs
+    return probs
 
-    return x, probs
 
+def cumulative_probability(ages, errors, xmi, xma, n=100, chunk_size=None):
+    x = linspace(xmi, xma, n)
+
+    ages = asarray(ages, dtype=float)
+    errors = asarray(errors, dtype=float)
+    idx = _valid_mask(ages, errors)
+
+    probs = gaussian_sum(x, ages[idx], errors[idx], chunk_size)
+    return x, probs
 
-def kernel_density(ages, errors, xmi, xma, n=100):
-    from scipy.stats.kde import gaussian_kde
 
+def kernel_density(ages, errors, xmi, xma, n=100, chunk_size=None):
+    """
+    gaussian kernel density estimate of ``ages``. the bandwidth is chosen by
+    scipy's gaussian_kde (Scott's rule)
+    """
+    ages = asarray(ages, dtype=float)
     pdf = gaussian_kde(ages)
+
     x = linspace(xmi, xma, n)
-    y = pdf(x)
+    bw = pdf.covariance[0, 0] ** 0.5
+    y = gaussian_sum(x, ages, full_like(ages, bw), chunk_size) / ages.shape[0]
 
     return x, y
 
 
+class IncrementalProbabilityCurve(object):
+    """
+    cumulative probability curve of ``ages`` that is updated incrementally when
+    analyses are excluded or included.
+
+    ``full`` is the curve of all analyses. The gaussians of the excluded
+    analyses are summed separately and subtracted from ``full``, so toggling
+    one analysis costs one gaussian instead of a new curve. Non-finite
+    analyses are kept out of ``full`` and added while they are included, so
+    excluding a NaN age gives a finite curve again.
+    """
+
+    def __init__(self, ages, errors, xmi, xma, n=100, chunk_size=None):
+        self.ages = asarray(ages, dtype=float)
+        self.errors = asarray(errors, dtype=float)
+        self.limits = (xmi, xma, n)
+        self.chunk_size = chunk_size
+
+        valid = _valid_mask(self.ages, self.errors)
+        finite = isfinite(self.ages) & isfinite(self.errors)
+        self._valid = valid & finite
+        self._nonfinite = set(flatnonzero(valid & ~finite).tolist())
+
+        self.x = linspace(xmi, xma, n)
+        self.full = gaussian_sum(
+            self.x, self.ages[self._valid], self.errors[self._valid], chunk_size
+        )
+        self._excluded = set()
+        self._excluded_probs = zeros(n)
+        self._nupdates = 0
+
+    def matches(self, ages, errors, xmi, xma, n):
+        return (
+            self.limits == (xmi, xma, n)
+            and self.ages.shape == asarray(ages).shape
+            and (self.ages == ages).all()
+            and (self.errors == errors).all()
+        )
+
+    @property
+    def excluded(self):
+        return frozenset(self._excluded)
+
+    @property
+    def original(self):
+        """
+        curve of all analyses, including the non-finite ones, regardless of
+        the excluded analyses
+        """
+        return self.full + self._nonfinite_sum(self._nonfinite)
+
+    @property
+    def probs(self):
+        if not self._excluded:
+            probs = self.full.copy()
+        else:
+            # clip the rounding error left where the excluded analyses dominate
+            probs = maximum(self.full - self._excluded_probs, 0)
+
+        return probs + self._nonfinite_sum(self._nonfinite - self._excluded)
+
+    def set_excluded(self, excluded):
+        """
+        exclude the analyses at the indices ``excluded``, include all others
+        """
+        excluded = {i for i in excluded if 0 <= i < self.ages.shape[0]}
+        add = excluded - self._excluded
+        remove = self._excluded - excluded
+        nchanges = len(add) + len(remove)
+        if not nchanges:
+            return
+
+        self._excluded = excluded
+        self._nupdates += nchanges
+        if nchanges >= len(excluded) or self._nupdates > MAX_INCREMENTAL_UPDATES:
+            # cheaper, or more accurate, to sum the excluded analyses again
+            self._nupdates = 0
+            self._excluded_probs = self._sum(sorted(excluded))
+        else:
+            self._excluded_probs += self._sum(sorted(add))
+            self._excluded_probs -= self._sum(sorted(remove))
+
+    def exclude(self, idx):
+        self.set_excluded(self._excluded | {idx})
+
+    def include(self, idx):
+        self.set_excluded(self._excluded - {idx})
+
+    def toggle(self, idx):
+        if idx in self._excluded:
+            self.include(idx)
+        else:
+            self.exclude(idx)
+
+    def _nonfinite_sum(self, idxs):
+        idxs = sorted(idxs)
+        if not idxs:
+            return zeros(self.x.shape[0])
+        return gaussian_sum(self.x, self.ages[idxs], self.errors[idxs], self.chunk_size)
+
+    def _sum(self, idxs):
+        idxs = [i for i in idxs if self._valid[i]]
+        if not idxs:
+            return zeros(self.x.shape[0])
+        return gaussian_sum(self.x, self.ages[idxs], self.errors[idxs], self.chunk_size)
+
+
 # ============= EOF =============================================
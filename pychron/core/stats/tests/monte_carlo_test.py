@@ -0,0 +1,121 @@
+import unittest
+
+from numpy import linspace, random, column_stack, allclose, array, ones, dot, einsum
+from numpy.linalg import inv
+
+from pychron.core.regression.flux_regressor import PlaneFluxRegressor, RBFRegressor
+from pychron.core.regression.mean_regressor import (
+    MeanRegressor,
+    WeightedMeanRegressor,
+)
+from pychron.core.regression.ols_regressor import OLSRegressor
+from pychron.core.regression.wls_regressor import WeightedPolynomialRegressor
+from pychron.core.stats.monte_carlo import (
+    FluxEstimator,
+    RegressionEstimator,
+    loop_predict,
+)
+
+
+def linear_data(n=20):
+    rng = random.default_rng(0)
+    xs = linspace(0, 10, n)
+    ys = 2 + 0.5 * xs + rng.normal(0, 0.1, n)
+    yserr = rng.uniform(0.05, 0.2, n)
+    return xs, ys, yserr
+
+
+def tray_data(n=12):
+    rng = random.default_rng(1)
+    x, y = rng.uniform(-10, 10, (2, n))
+    zs = 0.01 + 1e-4 * x - 2e-4 * y + rng.normal(0, 1e-6, n)
+    zserr = rng.uniform(1e-6, 5e-6, n)
+    return column_stack((x, y)), zs, zserr
+
+
+class BatchPredictTestCase(unittest.TestCase):
+    def _compare(self, reg, pts):
+        rng = random.default_rng(2)
+        ys = reg.clean_ys
+        endogs = ys + reg.clean_yserr * rng.standard_normal((25, len(ys)))
+        exog = reg.get_exog(pts)
+        self.assertTrue(
+            allclose(reg.fast_predict_batch(endogs, exog), loop_predict(reg, endogs, exog))
+        )
+
+        pexog = array([reg.get_exog(pts + rng.normal(0, 0.1, pts.shape)) for _ in endogs])
+        self.assertTrue(
+            allclose(reg.fast_predict_batch(endogs, pexog), loop_predict(reg, endogs, pexog))
+        )
+
+    def test_ols(self):
+        xs, ys, yserr = linear_data()
+        reg = OLSRegressor(xs=xs, ys=ys, yserr=yserr, fit="parabolic")
+        reg.calculate()
+        self._compare(reg, linspace(0, 12, 7))
+
+    def test_wls(self):
+        xs, ys, yserr = linear_data()
+        reg = WeightedPolynomialRegressor(xs=xs, ys=ys, yserr=yserr, fit="linear")
+        reg.calculate()
+        self._compare(reg, linspace(0, 12, 7))
+
+    def test_plane(self):
+        xy, zs, zserr = tray_data()
+        for weighted in (False, True):
+            reg = PlaneFluxRegressor(xs=xy, ys=zs, yserr=zserr, use_weighted_fit=weighted)
+            reg.calculate()
+            self._compare(reg, xy[:5])
+
+    def test_mean(self):
+        xs, ys, yserr = linear_data()
+        for klass in (MeanRegressor, WeightedMeanRegressor):
+            reg = klass(xs=xs, ys=ys, yserr=yserr)
+            reg.calculate()
+            self._compare(reg, linspace(0, 12, 7))
+
+    def test_rbf(self):
+        xy, zs, zserr = tray_data()
+        reg = RBFRegressor(xs=xy, ys=zs, yserr=zserr)
+        reg.calculate()
+        self._compare(reg, xy[:5] + 0.5)
+
+
+class MonteCarloEstimatorTestCase(unittest.TestCase):
+    def setUp(self):
+        xs, ys, yserr = linear_data()
+        reg = WeightedPolynomialRegressor(xs=xs, ys=ys, yserr=yserr, fit="linear")
+        reg.calculate()
+        self.reg = reg
+        self.pts = linspace(0, 12, 7)
+
+    def test_reproducible(self):
+        a = RegressionEstimator(5000, self.reg, seed=7, chunk_size=512)
+        b = RegressionEstimator(5000, self.reg, seed=7, chunk_size=512, nworkers=3)
+        _, ea = a.estimate(self.pts)
+        _, eb = b.estimate(self.pts)
+        self.assertTrue((ea == eb).all())
+
+    def test_matches_analytic(self):
+        est = RegressionEstimator(20000, self.reg, seed=3)
+        _, es = est.estimate(self.pts)
+
+        # propagated error of a weighted linear fit
+        X = column_stack((ones(len(self.reg.xs)), self.reg.xs))
+        cov = inv(dot(X.T / self.reg.yserr**2, X))
+        P = column_stack((ones(len(self.pts)), self.pts))
+        expected = einsum("ij,jk,ik->i", P, cov, P) ** 0.5
+        self.assertTrue(allclose(es, expected, rtol=0.05))
+
+    def test_position_error(self):
+        xy, zs, zserr = tray_data()
+        reg = PlaneFluxRegressor(xs=xy, ys=zs, yserr=zserr)
+        reg.calculate()
+        est = FluxEstimator(2000, reg, seed=1, chunk_size=300)
+        _, es = est.estimate_position_err(xy, 0.1)
+        self.assertEqual(es.shape, (len(xy),))
+        self.assertTrue((es > 0).all())
+
+
+if __name__ == "__main__":
+    unittest.main()
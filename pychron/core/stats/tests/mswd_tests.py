@@ -1,4 +1,13 @@
+from numpy import random
+
 from pychron.core.stats import calculate_mswd_probability
+from pychron.core.stats.core import (
+    calculate_mswd,
+    calculate_weighted_mean,
+    get_mswd_limits,
+    validate_mswd,
+    weighted_mean_stats,
+)
 
 __author__ = "ross"
 
@@ -18,5 +27,35 @@ class MSWDTestCase(unittest.TestCase):
         self.assertAlmostEqual(p, 0.443263278, places=9)
 
 
+class WeightedMeanStatsTestCase(unittest.TestCase):
+    def _compare(self, xs, es):
+        stats = weighted_mean_stats(xs, es)
+        wm, we = calculate_weighted_mean(xs, es)
+        mswd = calculate_mswd(xs, es, wm=wm)
+
+        self.assertAlmostEqual(stats.mean, wm, places=10)
+        self.assertAlmostEqual(stats.error, we, places=10)
+        self.assertAlmostEqual(stats.mswd, mswd, places=10)
+        self.assertEqual(stats.valid_mswd, validate_mswd(mswd, len(xs)))
+        self.assertEqual(stats.n, len(xs))
+
+    def test_random(self):
+        rng = random.default_rng(0)
+        for n in (2, 3, 10, 100):
+            xs = rng.normal(10, 1, n)
+            es = rng.uniform(0.5, 1.5, n)
+            self._compare(xs, es)
+
+    def test_single(self):
+        stats = weighted_mean_stats([10.0], [1.0])
+        self.assertEqual((stats.mean, stats.error), (10, 1))
+        self.assertEqual(stats.mswd, 0)
+        self.assertFalse(stats.valid_mswd)
+
+    def test_limits_cached(self):
+        self.assertIs(get_mswd_limits(10), get_mswd_limits(10))
+        self.assertIs(get_mswd_limits(11, 2), get_mswd_limits(10))
+
+
 if __name__ == "__main__":
     unittest.main()
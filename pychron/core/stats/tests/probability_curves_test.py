@@ -0,0 +1,93 @@
+import unittest
+
+from numpy import allclose, exp, isnan, linspace, nan, pi, random, zeros
+from scipy.stats import gaussian_kde
+
+from pychron.core.stats.probability_curves import (
+    IncrementalProbabilityCurve,
+    cumulative_probability,
+    kernel_density,
+)
+
+
+def loop_cumulative_probability(ages, errors, xmi, xma, n=100):
+    x = linspace(xmi, xma, n)
+    probs = zeros(n)
+    for ai, ei in zip(ages, errors):
+        if abs(ai) < 1e-10 or abs(ei) < 1e-10:
+            continue
+        es2 = 2 * ei * ei
+        probs += (es2 * pi) ** -0.5 * exp(-((x - ai) ** 2) / es2)
+    return x, probs
+
+
+class ProbabilityCurvesTestCase(unittest.TestCase):
+    def setUp(self):
+        rng = random.default_rng(0)
+        self.ages = rng.normal(100, 10, 300)
+        self.errors = rng.uniform(0.5, 3, 300)
+        self.ages[5] = 0
+        self.errors[7] = 0
+
+    def test_cumulative_probability(self):
+        x, ys = loop_cumulative_probability(self.ages, self.errors, 50, 150, 500)
+        for chunk_size in (None, 1, 1000):
+            cx, cys = cumulative_probability(
+                self.ages, self.errors, 50, 150, 500, chunk_size=chunk_size
+            )
+            self.assertTrue(allclose(cx, x))
+            self.assertTrue(allclose(cys, ys))
+
+    def test_kernel_density(self):
+        x, ys = kernel_density(self.ages, self.errors, 50, 150, 500, chunk_size=700)
+        self.assertTrue(allclose(ys, gaussian_kde(self.ages)(x)))
+
+    def test_incremental(self):
+        curve = IncrementalProbabilityCurve(self.ages, self.errors, 50, 150, 500)
+        rng = random.default_rng(1)
+        excluded = set()
+        for i in rng.integers(0, 300, 600):
+            curve.toggle(int(i))
+            excluded ^= {int(i)}
+
+            keep = [j for j in range(300) if j not in excluded]
+            _, ys = loop_cumulative_probability(self.ages[keep], self.errors[keep], 50, 150, 500)
+            self.assertTrue(allclose(curve.probs, ys, atol=1e-12))
+
+        curve.set_excluded(range(300))
+        self.assertTrue(allclose(curve.probs, 0))
+        curve.set_excluded([])
+        self.assertTrue(allclose(curve.probs, curve.full))
+
+    def test_nan(self):
+        """
+        a NaN age makes the curve NaN, as it did before the vectorized sum
+        """
+        self.ages[3] = nan
+        _, ys = cumulative_probability(self.ages, self.errors, 50, 150, 500)
+        self.assertTrue(isnan(ys).all())
+
+        curve = IncrementalProbabilityCurve(self.ages, self.errors, 50, 150, 500)
+        self.assertTrue(isnan(curve.probs).all())
+
+        curve.exclude(3)
+        keep = [j for j in range(300) if j != 3]
+        _, ys = loop_cumulative_probability(self.ages[keep], self.errors[keep], 50, 150, 500)
+        self.assertTrue(allclose(curve.probs, ys))
+
+        curve.include(3)
+        self.assertTrue(isnan(curve.probs).all())
+
+        # the original curve ignores the exclusions and keeps the NaN age
+        curve.exclude(3)
+        self.assertTrue(isnan(curve.original).all())
+
+    def test_matches(self):
+        curve = IncrementalProbabilityCurve(self.ages, self.errors, 50, 150, 500)
+        self.assertTrue(curve.matches(self.ages.copy(), self.errors, 50, 150, 500))
+        self.assertFalse(curve.matches(self.ages, self.errors, 50, 151, 500))
+        self.assertFalse(curve.matches(self.ages[:-1], self.errors[:-1], 50, 150, 500))
+
+
+if __name__ == "__main__":
+    unittest.main()
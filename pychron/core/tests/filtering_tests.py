@@ -1,13 +1,49 @@
 from __future__ import absolute_import
-from numpy import ma
+import re
 
-from pychron.core.filtering import filter_items, filter_ufloats, sigma_filter
+from numpy import ma, vstack
+
+from pychron.core.filtering import (
+    compile_predicate,
+    filter_items,
+    filter_ufloats,
+    sigma_filter,
+    validate_filter_predicate,
+)
 
 __author__ = "ross"
 
 import unittest
 
 
+def eval_filter_items(items, predicate_str):
+    """
+    filter_items before predicates were compiled
+    """
+    variable_name = re.search(r"(?P<name>[A-Za-z])", predicate_str).group("name")
+    return [i for i, yi in enumerate(items) if eval(predicate_str, {variable_name: yi})]
+
+
+def eval_filter_ufloats(items, predicate_str):
+    """
+    filter_ufloats before predicates were compiled
+    """
+    attrs = re.findall(r"error|percent_error|(?! and| or)[A-Za-z]+", predicate_str)
+
+    def make_ctx(v, e):
+        ctx = {}
+        for ai in attrs:
+            if ai == "error":
+                ctx[ai] = e
+            elif ai == "percent_error":
+                ctx[ai] = e / v * 100 if v else 0
+            else:
+                ctx[ai] = v
+        return ctx
+
+    return [i for i, uf in enumerate(items) if eval(predicate_str, make_ctx(*uf))]
+
+
 class FilteringTestCase(unittest.TestCase):
     def test_or_indices(self):
         o = filter_items([1, 10, 20], "10<x or x<5")
@@ -37,6 +73,106 @@ class FilteringTestCase(unittest.TestCase):
         o = filter_ufloats([(1, 1), (10, 1), (20, 11)], "age>10 or percent_error>50")
         self.assertListEqual(o, [0, 2])
 
+    def test_chained(self):
+        o = filter_items([1, 10, 20, 5], "5<=x<20")
+        self.assertListEqual(o, [1, 3])
+
+    def test_not_ufloats(self):
+        o = filter_ufloats([(1, 1), (10, 1), (20, 11)], "not (x>5 and error<5)")
+        self.assertListEqual(o, [0, 2])
+
+    def test_arithmetic_ufloats(self):
+        o = filter_ufloats([(1, 1), (10, 1), (20, 11)], "error*2 > x/2 + 1")
+        self.assertListEqual(o, [0, 2])
+
+    def test_negative_power(self):
+        o = filter_ufloats([(1, 0.01), (10, 0.0001), (20, 1)], "error > 10**-3")
+        self.assertListEqual(o, [0, 2])
+        self.assertTrue(validate_filter_predicate("error > 10**-3"))
+
+    def test_abs(self):
+        self.assertListEqual(filter_items([1, -5, 2, 4], "x>1 or abs(x)>3"), [1, 2, 3])
+        self.assertListEqual(filter_items([1, -5, 2, 4], "abs(x)>3"), [1, 3])
+        o = filter_ufloats([(1, 1), (10, 1), (20, 11)], "abs(x-10)>5 or abs(-error)>5")
+        self.assertListEqual(o, [0, 2])
+
+    def test_percent_error_zero_value(self):
+        o = filter_ufloats([(0, 1), (10, 1), (-2, 2)], "percent_error<-50 or x>5")
+        self.assertListEqual(o, [1, 2])
+
+    def test_ufloats_array(self):
+        ufs = vstack(([1, 10, 20], [1, 1, 11])).T
+        o = filter_ufloats(ufs, "x>10 or error>10", return_indices=False)
+        self.assertListEqual([tuple(r) for r in o], [(20, 11)])
+
+    def test_empty(self):
+        self.assertListEqual(filter_items([], "x>1"), [])
+        self.assertListEqual(filter_ufloats([], "x>1"), [])
+
+    def test_compiled_once(self):
+        self.assertIs(compile_predicate("x>1"), compile_predicate("x>1"))
+        self.assertEqual(compile_predicate("x>1 or error>1").names, {"value", "error"})
+
+    def test_eval_equivalence(self):
+        """
+        compiled and item by item predicates give the results of the eval filters
+        """
+        items = [1, -5, 2, 4, 10, 17, 20, 3.5]
+        for p in (
+            "x>1",
+            "10<x or x<5",
+            "5<=x<20",
+            "x % 2 == 0",
+            "x*2 > 10 and not x > 15",
+            "x.real>3",
+            "x > max(3, 5)",
+            "x >= min([4, 10])",
+            "x > round(3.6)",
+            "[x, 0][0] > 3",
+            "x > 2 or 'a' == 'b'",
+        ):
+            with self.subTest(predicate=p):
+                self.assertListEqual(filter_items(items, p), eval_filter_items(items, p))
+                self.assertTrue(validate_filter_predicate(p))
+
+        ufs = [(1, 1), (10, 11), (20, 1), (-2, 2), (0, 3), (7, 0.5)]
+        for p in (
+            "x>10",
+            "x>10 or error>10",
+            "age>10 or percent_error>50",
+            "not (x>5 and error<5)",
+            "error*2 > x/2 + 1",
+            "x.real > 5",
+            "age.imag == 0 and error > 1",
+            "[x, error][1] > 1",
+            "x > 5 and 'a' < 'b'",
+        ):
+            with self.subTest(predicate=p):
+                self.assertListEqual(filter_ufloats(ufs, p), eval_filter_ufloats(ufs, p))
+                self.assertTrue(validate_filter_predicate(p))
+
+    def test_builtins(self):
+        ufs = [(1, 1), (10, 11), (20, 1)]
+        self.assertListEqual(filter_ufloats(ufs, "max(x, error) > 10"), [1, 2])
+        self.assertListEqual(filter_ufloats(ufs, "round(error / 10) >= 1"), [1])
+
+    def test_validate(self):
+        self.assertTrue(validate_filter_predicate("age>10 or percent_error>50"))
+        for p in (
+            "x>",
+            "'a'<x",
+            "__import__('os')",
+            "x.__class__",
+            "abs(x, 1)>1",
+        ):
+            self.assertFalse(validate_filter_predicate(p))
+
+    def test_unsafe_rejected(self):
+        with self.assertRaises(ValueError):
+            filter_ufloats([(1, 1)], "__import__('os').getcwd()")
+        with self.assertRaises(ValueError):
+            filter_items([1], "x.__class__")
+
     def test_sigma_filter_masked(self):
         x = ma.array([1, 1, 1, 1, 1, 10], mask=False)
         x.mask[5] = True
@@ -26,6 +26,7 @@ from pychron import json
 from pychron.core.helpers.logger_setup import new_logger
 from pychron.core.helpers.filetools import subdirize, add_extension
 from pychron.core.helpers.strtools import camel_case
+from pychron.dvc.json_cache import get_json_cache, invalidate_json_cache
 from pychron.paths import paths
 from pychron.wisc_ar_constants import WISCAR_ID_RE
 
@@ -104,6 +105,8 @@ def dvc_dump(obj, path):
         except TypeError as e:
             logger.warning("dvc dump exception. error:%s, %s", e, pformat(obj))
 
+    invalidate_json_cache(path)
+
 
 def dvc_load(path, default=None):
     if default is None:
@@ -119,6 +122,17 @@ def dvc_load(path, default=None):
     return ret
 
 
+def dvc_load_cached(path, default=None):
+    """
+    same as ``dvc_load`` but consults the json parse cache if it is enabled.
+    use only for files that are rewritten through ``dvc_dump`` or by git
+    """
+    cache = get_json_cache()
+    if cache is None:
+        return dvc_load(path, default)
+    return cache.load(path, default)
+
+
 MASSES = None
 
 
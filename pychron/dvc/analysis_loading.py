@@ -1,12 +1,16 @@
 from __future__ import annotations
 
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import Any, Iterable, Optional
 
 from git import NoSuchPathError
 
-from pychron.core.progress import progress_iterator
+from pychron.core.progress import CancelLoadingError, open_progress, progress_iterator
 from pychron.dvc import repository_path
+from pychron.dvc.analysis_record import DVCAnalysisRecord
 from pychron.dvc.meta_repo import get_frozen_flux, get_frozen_productions
 from pychron.git_archive.repo_manager import get_repository_branch
 from pychron.pychron_constants import DATE_FORMAT
@@ -164,3 +168,152 @@ def finalize_loaded_analyses(
         dvc._cache.clean()
         analyses = cached_records + analyses
     return analyses
+
+
+def get_loading_workers(n: int = 0) -> int:
+    if n and n > 0:
+        return n
+    return min(32, (os.cpu_count() or 1) + 4)
+
+
+def build_analyses_parallel(
+    dvc: Any,
+    records: list[Any],
+    context: AnalysisLoadContext,
+    max_workers: int = 0,
+    calculate_f_only: bool = False,
+    reload: bool = False,
+    quick: bool = False,
+    warn: bool = True,
+    use_progress: bool = True,
+    step: int = 25,
+    lazy: bool = False,
+) -> list[Any]:
+    """
+    parallel version of the make_analyses build phase.
+
+    only DVCAnalysis construction (file io and json parsing) runs in the worker
+    threads. Resolving records, database access, applying the load context and
+    age calculation all happen on the calling thread, in record order, so no
+    traits notifications are fired from the workers. At most ``4 * max_workers``
+    analyses are in flight at any time.
+
+    missing analyses are reported with a single warning once the build is done.
+    returns the analyses in record order. Canceling returns an empty list,
+    accepting returns the analyses built so far
+    """
+    n = len(records)
+    max_workers = get_loading_workers(max_workers)
+    window = 4 * max_workers
+
+    progress = None
+    if use_progress and n:
+        progress = open_progress(n / step)
+
+    missing = []
+    ret = []
+
+    def resolve(record):
+        try:
+            return record, dvc._resolve_record(record, reload=reload)
+        except BaseException:
+            report_exception(record)
+            return record, None
+
+    def report_exception(record):
+        dvc.warning(
+            "make analysis exception: repo={}, record_id={}".format(
+                record.repository_identifier, record.record_id
+            )
+        )
+        dvc.debug_exception()
+
+    def finish(record, resolved, future):
+        if resolved is None:
+            return
+
+        record, expid, a = resolved
+        if a is None:
+            a, msg = future.result()
+            if a is None:
+                missing.append(msg)
+                return
+
+            dvc._finish_analysis(
+                a,
+                record,
+                expid,
+                context,
+                calculate_f_only=calculate_f_only,
+                quick=quick,
+            )
+
+        if dvc._cache and not isinstance(a, DVCAnalysisRecord):
+            dvc._cache.update(record.uuid, a)
+        return a
+
+    pending = deque()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        try:
+            records = iter(records)
+            i = 0
+            while True:
+                while len(pending) < window:
+                    record = next(records, None)
+                    if record is None:
+                        break
+
+                    record, resolved = resolve(record)
+                    future = None
+                    if resolved is not None and resolved[2] is None:
+                        r = resolved[0]
+                        future = executor.submit(
+                            dvc._construct_analysis,
+                            r.uuid,
+                            r.record_id,
+                            resolved[1],
+                            quick=quick,
+                            lazy=lazy,
+                        )
+                    pending.append((record, resolved, future))
+
+                if not pending:
+                    break
+
+                record, resolved, future = pending.popleft()
+                if progress:
+                    if progress.canceled:
+                        raise CancelLoadingError
+                    elif progress.accepted:
+                        break
+
+                    if i == 0 or i == n - 1 or not i % step:
+                        progress.change_message(
+                            "Loading analysis {}. {}/{}".format(record.record_id, i, n)
+                        )
+                try:
+                    a = finish(record, resolved, future)
+                except BaseException:
+                    report_exception(record)
+                    a = None
+
+                if a is not None:
+                    ret.append(a)
+                i += 1
+
+        except CancelLoadingError:
+            ret = []
+        finally:
+            for _, _, future in pending:
+                if future is not None:
+                    future.cancel()
+            if progress:
+                progress.close()
+
+    if missing and warn:
+        msg = "\n\n".join(missing[:10])
+        if len(missing) > 10:
+            msg = "{}\n\n... and {} more".format(msg, len(missing) - 10)
+        dvc.warning_dialog(msg)
+
+    return ret
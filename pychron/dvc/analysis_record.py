@@ -0,0 +1,259 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+"""
+lightweight, read only stand in for a quick loaded DVCAnalysis.
+
+A ``DVCAnalysisRecord`` is built from the analysis meta file only. No extraction
+file, modifier files, traits objects or isotopes are created. Identity, run and
+sample metadata are answered from ``__slots__``; everything else (ages, isotopes,
+raw data, extraction parameters, ...) materializes the full ``DVCAnalysis`` on
+first access and is delegated to it from then on.
+
+Only the bookkeeping attributes that ``DVC`` sets after loading (tags, group id,
+sample notes) can be assigned without materializing.
+
+Records are returned by ``DVC.make_analyses(quick=True, lazy=True)``, which is used by
+consumers that only need identifiers and paths (the data reduction logbook). The
+browser tables show database records and recall builds full analysis views, so
+neither loads records.
+"""
+
+# ============= enthought library imports =======================
+# ============= standard library imports ========================
+import datetime
+import os
+
+# ============= local library imports  ==========================
+from pychron.core.helpers.datetime_tools import make_timef
+from pychron.core.helpers.isotope_utils import sort_isotopes
+from pychron.dvc import (
+    INTERCEPTS,
+    BASELINES,
+    BLANKS,
+    ICFACTORS,
+    COSMOGENIC,
+    analysis_path,
+    dvc_load,
+    AnalysisNotAnvailableError,
+)
+from pychron.dvc.dvc_analysis import DVCAnalysis
+from pychron.experiment.utilities.runid import make_aliquot_step, make_step
+from pychron.pychron_constants import META_ATTRS, NULL_STR, DATE_FORMAT, AR_AR
+
+QUICK_LOAD_MODIFIERS = (INTERCEPTS, BASELINES, BLANKS, ICFACTORS, COSMOGENIC)
+
+# defaults match the class level defaults of Analysis
+_META_DEFAULTS = {
+    "aliquot": 0,
+    "increment": None,
+    "uuid": None,
+    "acquisition_software": None,
+    "data_reduction_software": None,
+    "experiment_type": AR_AR,
+    "latitude": 0,
+    "longitude": 0,
+    "irradiation": None,
+    "irradiation_level": None,
+    "irradiation_position": None,
+}
+
+_META_SLOTS = tuple(a for a in META_ATTRS if a != "repository_identifier")
+_DERIVED_SLOTS = (
+    "record_id",
+    "repository_identifier",
+    "step",
+    "rundate",
+    "timestamp",
+    "timestampf",
+    "aliquot_step_str",
+    "measurement_script_name",
+    "extraction_script_name",
+    "isotope_detectors",
+)
+
+# attributes that may be set without materializing the full analysis
+MUTABLE_ATTRS = (
+    "group_id",
+    "graph_id",
+    "tag",
+    "tag_note",
+    "subgroup",
+    "temp_status",
+    "sample_note",
+    "sample_prep_comment",
+    "is_reduced",
+)
+
+
+def _parse_rundate(ts):
+    for fmt in ("%Y-%m-%dT%H:%M:%S", "%Y-%m-%dT%H:%M:%S.%f", DATE_FORMAT):
+        try:
+            return datetime.datetime.strptime(ts, fmt)
+        except ValueError:
+            continue
+    return datetime.datetime.now()
+
+
+class DVCAnalysisRecord(object):
+    __slots__ = ("_analysis", "_load_modifiers") + _META_SLOTS + _DERIVED_SLOTS + MUTABLE_ATTRS
+
+    def __init__(self, uuid, record_id, repository_identifier, load_modifiers=None, jd=None):
+        """
+        @param jd: the already parsed meta file. loaded from the repository if None
+        """
+        sa = object.__setattr__
+        sa(self, "_analysis", None)
+        sa(self, "_load_modifiers", load_modifiers or QUICK_LOAD_MODIFIERS)
+
+        if jd is None:
+            path = analysis_path((uuid, record_id), repository_identifier)
+            if path is None or not os.path.isfile(path):
+                raise AnalysisNotAnvailableError(repository_identifier, record_id)
+            jd = dvc_load(path)
+
+        for attr in _META_SLOTS:
+            v = jd.get(attr)
+            if v is None:
+                v = _META_DEFAULTS.get(attr, "")
+            sa(self, attr, v)
+
+        if not self.uuid:
+            sa(self, "uuid", uuid)
+
+        at = self.analysis_type
+        if not at or at.lower() == "sample":
+            sa(self, "analysis_type", "unknown")
+
+        step = make_step(self.increment) if self.increment is not None else ""
+        rundate = _parse_rundate(jd.get("timestamp", ""))
+        timestamp = make_timef(rundate)
+
+        isos = jd.get("isotopes") or {}
+
+        for attr, v in (
+            ("record_id", record_id),
+            ("repository_identifier", repository_identifier),
+            ("step", step),
+            ("rundate", rundate),
+            ("timestamp", timestamp),
+            ("timestampf", timestamp),
+            ("aliquot_step_str", make_aliquot_step(self.aliquot, step)),
+            ("measurement_script_name", jd.get("measurement", NULL_STR)),
+            ("extraction_script_name", jd.get("extraction", NULL_STR)),
+            ("isotope_detectors", {k: v.get("detector") for k, v in isos.items()}),
+            ("group_id", 0),
+            ("graph_id", 0),
+            ("tag", "ok"),
+            ("tag_note", ""),
+            ("subgroup", ""),
+            ("temp_status", "ok"),
+            ("sample_note", ""),
+            ("sample_prep_comment", ""),
+            ("is_reduced", False),
+        ):
+            sa(self, attr, v)
+
+    def __repr__(self):
+        return "{}<{}>".format(self.__class__.__name__, self.record_id)
+
+    def __getattr__(self, attr):
+        # only called for attributes that are not held by the record
+        if attr.startswith("__") or attr in ("_analysis", "_load_modifiers"):
+            raise AttributeError(attr)
+        return getattr(self.materialize(), attr)
+
+    def __setattr__(self, attr, value):
+        a = self._analysis
+        if a is not None:
+            setattr(a, attr, value)
+        elif attr in MUTABLE_ATTRS:
+            object.__setattr__(self, attr, value)
+        else:
+            setattr(self.materialize(), attr, value)
+
+    @property
+    def is_materialized(self):
+        return self._analysis is not None
+
+    @property
+    def labnumber(self):
+        return self.identifier
+
+    @property
+    def isotope_keys(self):
+        a = self._analysis
+        if a is not None:
+            return a.isotope_keys
+        return sort_isotopes(list(self.isotope_detectors))
+
+    @property
+    def display_uuid(self):
+        return (self.uuid or "")[:8]
+
+    @property
+    def status_text(self):
+        return self.temp_status.lower()
+
+    def set_tag(self, tag):
+        a = self._analysis
+        if a is not None:
+            a.set_tag(tag)
+            return
+
+        if isinstance(tag, dict):
+            self.tag_note = tag.get("note", "")
+            self.tag = tag.get("name", "")
+            self.subgroup = tag.get("subgroup", "")
+        else:
+            self.tag = tag
+
+        self.temp_status = self.tag
+
+    def make_path(self, modifier):
+        a = self._analysis
+        if a is not None:
+            return a.make_path(modifier)
+        return analysis_path(
+            (self.uuid, self.record_id), self.repository_identifier, modifier=modifier
+        )
+
+    def materialize(self):
+        """
+        return the full DVCAnalysis, constructing it on first call.
+
+        the bookkeeping attributes set on the record are copied onto the analysis and
+        the record becomes a transparent proxy for it
+        """
+        a = self._analysis
+        if a is None:
+            a = DVCAnalysis(
+                self.uuid,
+                self.record_id,
+                self.repository_identifier,
+                load_modifiers=self._load_modifiers,
+            )
+            for attr in MUTABLE_ATTRS:
+                setattr(a, attr, object.__getattribute__(self, attr))
+
+            object.__setattr__(self, "_analysis", a)
+
+            # clear the slots so every lookup falls through to the analysis
+            for attr in _META_SLOTS + _DERIVED_SLOTS + MUTABLE_ATTRS:
+                object.__delattr__(self, attr)
+        return a
+
+
+# ============= EOF =============================================
@@ -13,65 +13,288 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ===============================================================================
-from datetime import datetime
+import os
+import pickle
+import shutil
+import tempfile
+import time
+from collections import OrderedDict
+
+from pychron.core.helpers.logger_setup import new_logger
+
+logger = new_logger("DVCCache")
+
+# rough fixed cost of the traits object graph. only used for budgeting
+ANALYSIS_OVERHEAD = 64 * 1024
+ISOTOPE_OVERHEAD = 8 * 1024
+
+DEFAULT_TTL = 60 * 15  # 15 minutes
+
+
+def estimate_nbytes(obj):
+    """
+    approximate memory footprint of a cached analysis.
+
+    the numpy arrays of the isotopes, baselines, sniffs and blanks dominate. analyses
+    with raw data loaded are therefore much more expensive than analyses without.
+    """
+    n = ANALYSIS_OVERHEAD
+    isotopes = getattr(obj, "isotopes", None)
+    if not isotopes:
+        return n
+
+    for iso in isotopes.values():
+        n += ISOTOPE_OVERHEAD
+        for m in (
+            iso,
+            getattr(iso, "baseline", None),
+            getattr(iso, "sniff", None),
+            getattr(iso, "blank", None),
+        ):
+            if m is None:
+                continue
+            n += getattr(getattr(m, "xs", None), "nbytes", 0)
+            n += getattr(getattr(m, "ys", None), "nbytes", 0)
+    return n
+
+
+class CacheEntry(object):
+    __slots__ = ("value", "nbytes", "date_accessed")
+
+    def __init__(self, value, nbytes):
+        self.value = value
+        self.nbytes = nbytes
+        self.date_accessed = time.monotonic()
 
 
 class DVCCache(object):
-    def __init__(self, max_size=1000):
-        self._cache = {}
+    """
+    LRU cache of analyses keyed by uuid.
+
+    entries are bounded by count (``max_size``) and by approximate memory
+    (``max_memory`` bytes, None for unbounded). Evicted entries are discarded or,
+    if ``use_disk`` is set, pickled into a session local disk tier and promoted
+    back on the next ``get``. Values of a type that fails to pickle are logged
+    once and then discarded without trying the disk tier again.
+    """
+
+    def __init__(
+        self,
+        max_size=1000,
+        max_memory=None,
+        use_disk=False,
+        disk_root=None,
+        max_disk_size=None,
+        ttl=DEFAULT_TTL,
+        sizeof=estimate_nbytes,
+    ):
+        self._cache = OrderedDict()
+        self._disk = OrderedDict()
+        self._disk_root = None
+        self._unpicklable = set()
+        self._sizeof = sizeof
+
         self.max_size = max_size
+        self.max_memory = max_memory
+        self.max_disk_size = max_disk_size
+        self.ttl = ttl
+        self.nbytes = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.demotions = 0
+        self.disk_hits = 0
+
+        self.use_disk = use_disk
+        if use_disk:
+            self._init_disk(disk_root)
+
+    def __contains__(self, key):
+        return key in self._cache or key in self._disk
 
     def clear(self):
         self._cache.clear()
+        self.nbytes = 0
+        self._clear_disk()
 
     def remove(self, key):
-        try:
-            self._cache.pop(key)
-        except KeyError:
-            pass
+        entry = self._cache.pop(key, None)
+        if entry is not None:
+            self.nbytes -= entry.nbytes
+        self._remove_disk(key)
 
     def clean(self):
-        t = 60 * 15  # 15 minutes
-        now = datetime.now()
-        remove = (
-            k
-            for k, v in self._cache.items()
-            if (now - v["date_accessed"]).total_seconds() > t
-        )
+        """
+        drop entries that have not been accessed within ``ttl`` seconds
+        """
+        if not self.ttl:
+            return
 
-        for k in remove:
-            del self._cache[k]
+        cutoff = time.monotonic() - self.ttl
+        cache = self._cache
+        # entries are kept in access order so only the expired head is visited
+        while cache:
+            key, entry = next(iter(cache.items()))
+            if entry.date_accessed >= cutoff:
+                break
+            self._evict(key)
+
+    def enforce_limits(self):
+        """
+        evict least recently used entries until the cache is within ``max_size``
+        and ``max_memory`` e.g. after lowering either limit
+        """
+        self._enforce_limits()
 
     def report(self):
         return len(self._cache)
 
+    def stats(self):
+        return {
+            "size": len(self._cache),
+            "disk_size": len(self._disk),
+            "nbytes": self.nbytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "disk_hits": self.disk_hits,
+            "evictions": self.evictions,
+            "demotions": self.demotions,
+        }
+
     def get(self, item):
-        obj = self._cache.get(item)
-        if obj:
-            obj["date_accessed"] = datetime.now()
-            return obj["value"]
+        entry = self._cache.get(item)
+        if entry is not None:
+            self.hits += 1
+            self._cache.move_to_end(item)
+            entry.date_accessed = time.monotonic()
+
+            # raw data may have been loaded since the analysis was cached
+            nbytes = self._sizeof(entry.value)
+            self.nbytes += nbytes - entry.nbytes
+            entry.nbytes = nbytes
+            self._enforce_limits(keep=item)
+            return entry.value
+
+        value = self._load_disk(item)
+        if value is not None:
+            self.disk_hits += 1
+            self.update(item, value)
+            return value
+
+        self.misses += 1
 
     def update(self, key, value):
-        if key not in self._cache and len(self._cache) > self.max_size:
-            self.remove_oldest()
+        old = self._cache.pop(key, None)
+        if old is not None:
+            self.nbytes -= old.nbytes
+        self._remove_disk(key)
 
-        self._cache[key] = {"date_accessed": datetime.now(), "value": value}
+        entry = CacheEntry(value, self._sizeof(value))
+        self._cache[key] = entry
+        self.nbytes += entry.nbytes
+        self._enforce_limits(keep=key)
 
     def remove_oldest(self):
         """
-        Remove the entry that has the oldest accessed date
+        Remove the least recently used entry
         """
-        oldest_entry = None
-        for key in self._cache:
-            if oldest_entry is None:
-                oldest_entry = key
-            elif (
-                self._cache[key]["date_accessed"]
-                < self._cache[oldest_entry]["date_accessed"]
-            ):
-                oldest_entry = key
-
-        self._cache.pop(oldest_entry)
+        if self._cache:
+            self._evict(next(iter(self._cache)))
+
+    # private
+    def _enforce_limits(self, keep=None):
+        cache = self._cache
+        while len(cache) > 1:
+            over_size = self.max_size and len(cache) > self.max_size
+            over_memory = self.max_memory and self.nbytes > self.max_memory
+            if not (over_size or over_memory):
+                break
+
+            key = next(iter(cache))
+            if key == keep:
+                break
+            self._evict(key)
+
+    def _evict(self, key):
+        entry = self._cache.pop(key)
+        self.nbytes -= entry.nbytes
+        self.evictions += 1
+        if self.use_disk:
+            self._dump_disk(key, entry.value)
+
+    def _init_disk(self, root):
+        if root:
+            root = os.path.join(root, "session_{}".format(os.getpid()))
+            try:
+                os.makedirs(root, exist_ok=True)
+            except OSError as e:
+                logger.warning("failed to make disk cache root %s: %s", root, e)
+                root = None
+
+        if not root:
+            root = tempfile.mkdtemp(prefix="dvccache")
+
+        self._disk_root = root
+
+    def _disk_path(self, key):
+        return os.path.join(self._disk_root, "{}.pkl".format(key))
+
+    def _dump_disk(self, key, value):
+        kind = type(value)
+        if kind in self._unpicklable:
+            return
+
+        p = self._disk_path(key)
+        try:
+            with open(p, "wb") as wfile:
+                pickle.dump(value, wfile, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError, OSError) as e:
+            if os.path.isfile(p):
+                os.remove(p)
+
+            if isinstance(e, OSError):
+                logger.warning("failed to demote %s: %s", key, e)
+            else:
+                self._unpicklable.add(kind)
+                logger.warning(
+                    "failed to demote %s: %s. %s objects will not be written to the " "disk cache",
+                    key,
+                    e,
+                    kind.__name__,
+                )
+            return
+
+        self.demotions += 1
+        self._disk[key] = p
+        if self.max_disk_size:
+            while len(self._disk) > self.max_disk_size:
+                self._remove_disk(next(iter(self._disk)))
+
+    def _load_disk(self, key):
+        p = self._disk.pop(key, None)
+        if p is None:
+            return
+
+        try:
+            with open(p, "rb") as rfile:
+                return pickle.load(rfile)
+        except (pickle.UnpicklingError, EOFError, AttributeError, OSError) as e:
+            logger.warning("failed to promote %s: %s", key, e)
+        finally:
+            if os.path.isfile(p):
+                os.remove(p)
+
+    def _remove_disk(self, key):
+        p = self._disk.pop(key, None)
+        if p and os.path.isfile(p):
+            os.remove(p)
+
+    def _clear_disk(self):
+        self._disk.clear()
+        if self._disk_root and os.path.isdir(self._disk_root):
+            shutil.rmtree(self._disk_root, ignore_errors=True)
+            os.makedirs(self._disk_root, exist_ok=True)
 
 
 # ============= EOF =============================================
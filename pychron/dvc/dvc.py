@@ -40,6 +40,7 @@ from pychron.core.i_datastore import IDatastore
 from pychron.core.progress import progress_loader, open_progress
 from pychron.dvc.analysis_loading import (
     AnalysisLoadContext,
+    build_analyses_parallel,
     build_analysis_load_context as build_analysis_load_context_impl,
     filter_records_with_repository as filter_records_with_repository_impl,
     finalize_loaded_analyses as finalize_loaded_analyses_impl,
@@ -47,17 +48,13 @@ from pychron.dvc.analysis_loading import (
     prepare_repository_branches as prepare_repository_branches_impl,
     sync_analysis_repositories as sync_analysis_repositories_impl,
 )
+from pychron.dvc.analysis_record import DVCAnalysisRecord, QUICK_LOAD_MODIFIERS
 from pychron.dvc import (
     DATA_COLLECTION_BRANCH,
     REDUCTION_IA,
     REDUCTION_ROOT,
     REDUCTION_TAGS,
-    INTERCEPTS,
-    BASELINES,
     BLANKS,
-    ICFACTORS,
-    PEAKCENTER,
-    COSMOGENIC,
     dvc_dump,
     dvc_load,
     analysis_path,
@@ -68,6 +65,7 @@ from pychron.dvc import (
     USE_GIT_TAGGING,
 )
 from pychron.dvc.cache import DVCCache
+from pychron.dvc.json_cache import configure_json_cache, invalidate_json_cache
 from pychron.dvc.defaults import TRIGA, HOLDER_24_SPOKES, LASER221, LASER65
 from pychron.dvc.dvc_analysis import DVCAnalysis
 from pychron.dvc.dvc_database import DVCDatabase
@@ -146,6 +144,11 @@ class DVC(Loggable):
     use_cocktail_irradiation = Str
     use_cache = Bool
     max_cache_size = Int
+    max_cache_memory = Int
+    use_disk_cache = Bool
+    use_parallel_loading = Bool
+    parallel_loading_workers = Int
+    use_json_cache = Bool
     irradiation_prefix = Str
     irradiation_project_prefix = Str
     repository_root = Str
@@ -870,6 +873,9 @@ class DVC(Loggable):
                 for x in ais
                 for modifier in modifiers
             ]
+            for p in ps:
+                invalidate_json_cache(p)
+
             if self.repository_add_paths(expid, ps):
                 if self.repository_commit(expid, msg, author):
                     mod_repositories.append(expid)
@@ -896,7 +902,7 @@ class DVC(Loggable):
             self.info("Delete existing icfactors for {}".format(ai))
             ai.delete_icfactors(dets)
             if self._cache:
-                self._cache.remove(ai.uiid)
+                self._cache.remove(ai.uuid)
 
             self._update_current_age(ai)
 
@@ -928,7 +934,7 @@ class DVC(Loggable):
                 )
 
         if self._cache:
-            self._cache.remove(ai.uiid)
+            self._cache.remove(ai.uuid)
         self._update_current_age(ai)
 
     def save_blanks(self, ai, keys, refs):
@@ -936,7 +942,7 @@ class DVC(Loggable):
             self.info("Saving blanks for {}".format(ai))
             ai.dump_blanks(keys, refs, reviewed=True)
             if self._cache:
-                self._cache.remove(ai.uiid)
+                self._cache.remove(ai.uuid)
 
             self._update_current_blanks(ai, keys)
 
@@ -944,7 +950,7 @@ class DVC(Loggable):
         if keys:
             self.info("Saving equilibration for {}".format(ai))
             if self._cache:
-                self._cache.remove(ai.uiid)
+                self._cache.remove(ai.uuid)
 
             self._update_current(ai, keys)
             return ai.dump_equilibration(keys, reviewed=True)
@@ -954,7 +960,7 @@ class DVC(Loggable):
             self.info("Saving fits for {}".format(ai))
             ai.dump_fits(keys, reviewed=True)
             if self._cache:
-                self._cache.remove(ai.uiid)
+                self._cache.remove(ai.uuid)
 
             self._update_current(ai, keys)
 
@@ -1176,11 +1182,18 @@ class DVC(Loggable):
         sync_repo: bool = True,
         use_flux_histories: bool = True,
         warn: bool = True,
+        lazy: bool = False,
     ) -> Optional[list[DVCAnalysis]]:
+        """
+        @param lazy: with ``quick``, return DVCAnalysisRecords that only read the
+        analysis meta file and materialize the full DVCAnalysis on demand
+        """
         records = list(records)
         if not records:
             return []
 
+        lazy = lazy and quick
+
         globalv.active_analyses = records
 
         st = time.perf_counter()
@@ -1220,6 +1233,7 @@ class DVC(Loggable):
                     quick=quick,
                     reload=reload,
                     warn=warn,
+                    lazy=lazy,
                     *args,
                 )
             except BaseException:
@@ -1231,7 +1245,20 @@ class DVC(Loggable):
                 )
                 self.debug_exception()
 
-        if use_progress:
+        if self.use_parallel_loading and len(records) > 1:
+            ret = build_analyses_parallel(
+                self,
+                records,
+                context,
+                max_workers=self.parallel_loading_workers,
+                calculate_f_only=calculate_f_only,
+                reload=reload,
+                quick=quick,
+                warn=warn,
+                use_progress=use_progress,
+                lazy=lazy,
+            )
+        elif use_progress:
             ret = progress_loader(records, func, threshold=1, step=25)
         else:
             ret = [func(r, None, 0, 0) for r in records]
@@ -1255,6 +1282,8 @@ class DVC(Loggable):
                     make_et - context_et,
                 )
             )
+            if self._cache:
+                self.debug("Analysis cache: {}".format(self._cache.stats()))
 
         nn = len(records)
         if len(records) != n:
@@ -2196,17 +2225,50 @@ class DVC(Loggable):
         reload=False,
         quick=False,
         warn=True,
+        lazy=False,
     ):
         if context is None:
             context = AnalysisLoadContext()
 
-        meta_repo = self.meta_repo
         if prog:
             # this accounts for ~85% of the time!!!
             prog.change_message(
                 "Loading analysis {}. {}/{}".format(record.record_id, i, n)
             )
 
+        record, expid, a = self._resolve_record(record, reload=reload)
+        if a is None:
+            a, msg = self._construct_analysis(
+                record.uuid, record.record_id, expid, quick=quick, lazy=lazy
+            )
+            if a is None:
+                if warn:
+                    self.warning_dialog(msg)
+                return
+
+            self._finish_analysis(
+                a,
+                record,
+                expid,
+                context,
+                calculate_f_only=calculate_f_only,
+                quick=quick,
+            )
+
+        # lazy records are cheap to rebuild and sizing one would materialize it
+        if self._cache and not isinstance(a, DVCAnalysisRecord):
+            self._cache.update(record.uuid, a)
+        return a
+
+    def _resolve_record(self, record, reload=False):
+        """
+        resolve the repository of ``record``.
+
+        returns (record, expid, analysis). analysis is not None if ``record`` is an
+        already constructed analysis that does not need to be reloaded.
+
+        touches the database so must be called from the main thread
+        """
         expid = record.repository_identifier
         if not expid:
             exps = record.repository_ids
@@ -2226,182 +2288,183 @@ class DVC(Loggable):
             if expid is None:
                 expid = self._get_requested_experiment_id(exps)
 
-        if isinstance(record, DVCAnalysis) and not reload:
-            a = record
-        else:
-            if isinstance(record, DVCAnalysis):
-                record = self.db.get_analysis_uuid(record.uuid)
-
-            # self.debug('use_repo_suffix={} record_id={}'.format(record.use_repository_suffix, record.record_id))
-            rid = record.record_id
-            uuid = record.uuid
-
-            load_modifiers = None
-            if quick:
-                load_modifiers = tuple(
-                    modifier
-                    for modifier in (
-                        INTERCEPTS,
-                        BASELINES,
-                        BLANKS,
-                        ICFACTORS,
-                        COSMOGENIC,
-                    )
-                    if modifier != PEAKCENTER
-                )
+        if isinstance(record, (DVCAnalysis, DVCAnalysisRecord)):
+            if not reload:
+                return record, expid, record
+            record = self.db.get_analysis_uuid(record.uuid)
 
-            try:
-                a = DVCAnalysis(
-                    uuid, rid, expid, load_modifiers=load_modifiers
+        return record, expid, None
+
+    def _construct_analysis(self, uuid, rid, expid, quick=False, lazy=False):
+        """
+        construct a DVCAnalysis from the local repository. if ``quick`` and
+        ``lazy`` a DVCAnalysisRecord is returned instead.
+
+        only file io and json parsing, no database or ui access, so this is safe to
+        call from a worker thread.
+
+        returns (analysis, None) or (None, warning message)
+        """
+        load_modifiers = None
+        if quick:
+            load_modifiers = QUICK_LOAD_MODIFIERS
+
+        try:
+            if quick and lazy:
+                return DVCAnalysisRecord(uuid, rid, expid), None
+            return DVCAnalysis(uuid, rid, expid, load_modifiers=load_modifiers), None
+        except AnalysisNotAnvailableError:
+            self.debug("uuid={}, rid={}, expid={}".format(uuid, rid, expid))
+            return None, (
+                "Analysis {} not in local repository {}. "
+                "You may need to pull changes. If local repository is up to date you may "
+                "need to push changes from the data collection computer".format(
+                    rid, expid
                 )
-            except AnalysisNotAnvailableError:
-                self.debug("uuid={}, rid={}, expid={}".format(uuid, rid, expid))
-                if warn:
-                    self.warning_dialog(
-                        "Analysis {} not in local repository {}. "
-                        "You may need to pull changes. If local repository is up to date you may "
-                        "need to push changes from the data collection computer".format(
-                            rid, expid
-                        )
-                    )
-                return
+            )
+
+    def _finish_analysis(
+        self, a, record, expid, context, calculate_f_only=False, quick=False
+    ):
+        """
+        apply the record and load context to a newly constructed analysis.
 
-            a.group_id = record.group_id
-            a.set_tag(record.tag)
+        must be called from the main thread
+        """
+        meta_repo = self.meta_repo
+        a.group_id = record.group_id
+        a.set_tag(record.tag)
 
-            if context.sample_prep:
-                a.sample_prep_comment = context.sample_prep.get(
-                    record.irradiation_position.sample.id
+        if context.sample_prep:
+            a.sample_prep_comment = context.sample_prep.get(
+                record.irradiation_position.sample.id
+            )
+        try:
+            a.sample_note = record.irradiation_position.sample.note or ""
+        except AttributeError as e:
+            self.debug("unable to set sample note. Error={}".format(e))
+
+        if not quick:
+            a.load_name = record.load_name
+            a.load_holder = record.load_holder
+            # get repository branch
+            a.branch = context.branches.get(expid, "")
+
+            # load sample_prep
+
+            # load irradiation
+            if context.sensitivities:
+                sensitivity = context.sensitivities.get(
+                    a.mass_spectrometer.lower(), []
                 )
-            try:
-                a.sample_note = record.irradiation_position.sample.note or ""
-            except AttributeError as e:
-                self.debug("unable to set sample note. Error={}".format(e))
-
-            if not quick:
-                a.load_name = record.load_name
-                a.load_holder = record.load_holder
-                # get repository branch
-                a.branch = context.branches.get(expid, "")
-
-                # load sample_prep
-
-                # load irradiation
-                if context.sensitivities:
-                    sensitivity = context.sensitivities.get(
-                        a.mass_spectrometer.lower(), []
-                    )
-                    a.set_sensitivity(sensitivity)
+                a.set_sensitivity(sensitivity)
 
-                if (
-                    a.analysis_type == "cocktail"
-                    and "cocktail" in context.chronos
-                ):
-                    a.set_chronology(context.chronos["cocktail"])
-                    a.j = context.fluxes["cocktail"]
+            if (
+                a.analysis_type == "cocktail"
+                and "cocktail" in context.chronos
+            ):
+                a.set_chronology(context.chronos["cocktail"])
+                a.j = context.fluxes["cocktail"]
 
-                elif a.irradiation:  # and a.irradiation not in ('NoIrradiation',):
-                    if context.chronos:
-                        chronology = context.chronos.get(a.irradiation, None)
-                    else:
-                        chronology = meta_repo.get_chronology(a.irradiation)
+            elif a.irradiation:  # and a.irradiation not in ('NoIrradiation',):
+                if context.chronos:
+                    chronology = context.chronos.get(a.irradiation, None)
+                else:
+                    chronology = meta_repo.get_chronology(a.irradiation)
 
-                    if chronology:
-                        a.set_chronology(chronology)
+                if chronology:
+                    a.set_chronology(chronology)
 
-                    pname, prod = None, None
+                pname, prod = None, None
 
-                    if context.frozen_productions:
+                if context.frozen_productions:
+                    try:
+                        prod = context.frozen_productions[
+                            "{}.{}".format(a.irradiation, a.irradiation_level)
+                        ]
+                        pname = prod.name
+                    except KeyError:
+                        pass
+
+                if not prod:
+                    if a.irradiation != "NoIrradiation":
                         try:
-                            prod = context.frozen_productions[
-                                "{}.{}".format(a.irradiation, a.irradiation_level)
+                            pname, prod = context.productions[a.irradiation][
+                                a.irradiation_level
                             ]
-                            pname = prod.name
                         except KeyError:
-                            pass
-
-                    if not prod:
-                        if a.irradiation != "NoIrradiation":
-                            try:
-                                pname, prod = context.productions[a.irradiation][
-                                    a.irradiation_level
-                                ]
-                            except KeyError:
-                                pname, prod = meta_repo.get_production(
-                                    a.irradiation, a.irradiation_level
-                                )
-                                self.warning(
-                                    "production key error name={} "
-                                    "irrad={}, level={}, productions={}".format(
-                                        pname,
-                                        a.irradiation,
-                                        a.irradiation_level,
-                                        context.productions,
-                                    )
+                            pname, prod = meta_repo.get_production(
+                                a.irradiation, a.irradiation_level
+                            )
+                            self.warning(
+                                "production key error name={} "
+                                "irrad={}, level={}, productions={}".format(
+                                    pname,
+                                    a.irradiation,
+                                    a.irradiation_level,
+                                    context.productions,
                                 )
-                    if prod is not None:
-                        a.set_production(pname, prod)
-
-                    fd = None
-                    if context.frozen_fluxes:
+                            )
+                if prod is not None:
+                    a.set_production(pname, prod)
+
+                fd = None
+                if context.frozen_fluxes:
+                    try:
+                        fd = context.frozen_fluxes[a.irradiation][a.identifier]
+                    except KeyError:
+                        pass
+
+                if not fd:
+                    if context.fluxes:
                         try:
-                            fd = context.frozen_fluxes[a.irradiation][a.identifier]
-                        except KeyError:
-                            pass
-
-                    if not fd:
-                        if context.fluxes:
-                            try:
-                                level_flux = context.fluxes[a.irradiation][
-                                    a.irradiation_level
-                                ]
-                                fd = meta_repo.get_flux_from_positions(
-                                    a.irradiation_position, level_flux
-                                )
-                            except KeyError:
-                                fd = {"j": ufloat(0, 0)}
-                        else:
-                            fd = meta_repo.get_flux(
-                                a.irradiation,
-                                a.irradiation_level,
-                                a.irradiation_position_position,
+                            level_flux = context.fluxes[a.irradiation][
+                                a.irradiation_level
+                            ]
+                            fd = meta_repo.get_flux_from_positions(
+                                a.irradiation_position, level_flux
                             )
-
-                    if context.flux_histories:
-                        a.flux_history = context.flux_histories.get(
-                            "{}{}".format(a.irradiation, a.irradiation_level), ""
+                        except KeyError:
+                            fd = {"j": ufloat(0, 0)}
+                    else:
+                        fd = meta_repo.get_flux(
+                            a.irradiation,
+                            a.irradiation_level,
+                            a.irradiation_position_position,
                         )
 
-                    a.j = fd.get("j", ufloat(0, 0))
-                    a.position_jerr = fd.get("position_jerr", 0)
+                if context.flux_histories:
+                    a.flux_history = context.flux_histories.get(
+                        "{}{}".format(a.irradiation, a.irradiation_level), ""
+                    )
+
+                a.j = fd.get("j", ufloat(0, 0))
+                a.position_jerr = fd.get("position_jerr", 0)
 
-                    j_options = fd.get("options")
-                    if j_options:
-                        a.model_j_kind = fd.get("model_kind")
+                j_options = fd.get("options")
+                if j_options:
+                    a.model_j_kind = fd.get("model_kind")
 
-                    lk = fd.get("lambda_k")
-                    if lk:
-                        a.arar_constants.lambda_k = lk
+                lk = fd.get("lambda_k")
+                if lk:
+                    a.arar_constants.lambda_k = lk
 
-                    for attr in ("age", "name", "material", "reference"):
-                        skey = "monitor_{}".format(attr)
+                for attr in ("age", "name", "material", "reference"):
+                    skey = "monitor_{}".format(attr)
+                    try:
+                        setattr(a, skey, fd[skey])
+                    except KeyError as e:
                         try:
-                            setattr(a, skey, fd[skey])
-                        except KeyError as e:
-                            try:
-                                key = "standard_{}".format(attr)
-                                setattr(a, skey, fd[key])
-                            except KeyError:
-                                pass
-
-                if calculate_f_only:
-                    a.calculate_f()
-                else:
-                    a.calculate_age()
+                            key = "standard_{}".format(attr)
+                            setattr(a, skey, fd[key])
+                        except KeyError:
+                            pass
+
+            if calculate_f_only:
+                a.calculate_f()
+            else:
+                a.calculate_age()
 
-        if self._cache:
-            self._cache.update(record.uuid, a)
-        return a
 
     def _get_repository(self, repository_identifier, as_current=True):
         if isinstance(repository_identifier, GitRepoManager):
@@ -2438,6 +2501,19 @@ class DVC(Loggable):
         )
         bind_preference(self, "use_cache", "{}.use_cache".format(prefid))
         bind_preference(self, "max_cache_size", "{}.max_cache_size".format(prefid))
+        bind_preference(
+            self, "max_cache_memory", "{}.max_cache_memory".format(prefid)
+        )
+        bind_preference(self, "use_disk_cache", "{}.use_disk_cache".format(prefid))
+        bind_preference(
+            self, "use_parallel_loading", "{}.use_parallel_loading".format(prefid)
+        )
+        bind_preference(self, "use_json_cache", "{}.use_json_cache".format(prefid))
+        bind_preference(
+            self,
+            "parallel_loading_workers",
+            "{}.parallel_loading_workers".format(prefid),
+        )
         bind_preference(
             self, "update_currents_enabled", "{}.update_currents_enabled".format(prefid)
         )
@@ -2466,14 +2542,44 @@ class DVC(Loggable):
         if new:
             if self._cache:
                 self._cache.max_size = self.max_cache_size
+                self._cache.enforce_limits()
             else:
                 self._use_cache_changed()
         else:
             self.use_cache = False
 
+    def _max_cache_memory_changed(self, new):
+        if self._cache:
+            self._cache.max_memory = new * 1024**2 if new else None
+            self._cache.enforce_limits()
+
+    def _use_disk_cache_changed(self):
+        if self.use_cache:
+            self._use_cache_changed()
+
+    def _use_json_cache_changed(self, new):
+        path = None
+        if new and paths.default_cache:
+            path = os.path.join(paths.default_cache, "dvc_json_cache.sqlite")
+        configure_json_cache(new, path)
+
     def _use_cache_changed(self):
+        if self._cache:
+            self._cache.clear()
+
         if self.use_cache:
-            self._cache = DVCCache(max_size=self.max_cache_size)
+            disk_root = None
+            if paths.default_cache:
+                disk_root = os.path.join(paths.default_cache, "analyses")
+
+            self._cache = DVCCache(
+                max_size=self.max_cache_size,
+                max_memory=(
+                    self.max_cache_memory * 1024**2 if self.max_cache_memory else None
+                ),
+                use_disk=self.use_disk_cache,
+                disk_root=disk_root,
+            )
         else:
             self._cache = None
 
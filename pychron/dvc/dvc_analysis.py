@@ -41,6 +41,7 @@ from pychron.dvc import (
 from pychron.dvc import (
     dvc_dump,
     dvc_load,
+    dvc_load_cached,
     analysis_path,
     REDUCTION_TAGS,
     make_ref_list,
@@ -50,6 +51,8 @@ from pychron.dvc import (
     repository_path,
     AnalysisNotAnvailableError,
 )
+from pychron.dvc.json_cache import is_cached_modifier
+from pychron.dvc.raw_sidecar import RawDataSidecar, sidecar_path, write_sidecar
 from pychron.experiment.utilities.environmentals import set_environmentals
 from pychron.experiment.utilities.runid import make_aliquot_step, make_step
 from pychron.processing.analyses.analysis import Analysis
@@ -248,7 +251,7 @@ class DVCAnalysis(Analysis):
             path = self._analysis_path(modifier=modifier)
             if path:
                 if os.path.isfile(path):
-                    jd = dvc_load(path)
+                    jd = self._load_json(path, modifier)
                     if jd:
                         func = getattr(self, "_load_{}".format(modifier))
                         try:
@@ -296,11 +299,48 @@ class DVCAnalysis(Analysis):
 
         path = self._analysis_path(modifier=".data")
 
-        jd = dvc_load(path)
+        sidecar = None
+        if path and os.path.isfile(path):
+            sidecar = RawDataSidecar.open(path)
+
+        if sidecar is not None:
+            with sidecar:
+                self._load_raw_records(
+                    sidecar.records("signals"),
+                    sidecar.records("baselines"),
+                    sidecar.records("sniffs"),
+                    keys,
+                    n_only,
+                    use_name_pairs,
+                )
+        else:
+            jd = dvc_load(path)
+            self._load_raw_records(
+                jd.get("signals", []),
+                jd.get("baselines", []),
+                jd.get("sniffs", []),
+                keys,
+                n_only,
+                use_name_pairs,
+                decode=format_blob,
+            )
+
+        if not n_only and not keys:
+            self.has_raw_data = True
 
-        signals = jd.get("signals", [])
-        baselines = jd.get("baselines", [])
-        sniffs = jd.get("sniffs", [])
+    def _load_raw_records(
+        self, signals, baselines, sniffs, keys, n_only, use_name_pairs, decode=None
+    ):
+        def get_data(r):
+            blob = r.get("blob")
+            if blob and decode:
+                blob = decode(blob)
+            return blob
+
+        # first baseline per detector. same as a linear scan of ``baselines``
+        baselines_by_det = {}
+        for b in baselines:
+            baselines_by_det.setdefault(b.get("detector"), b)
 
         for sd in signals:
             isok = sd.get("isotope")
@@ -320,33 +360,30 @@ class DVCAnalysis(Analysis):
             if not iso:
                 continue
 
-            blob = sd.get("blob")
-            if blob:
-                iso.unpack_data(format_blob(blob), n_only)
+            data = get_data(sd)
+            if data:
+                iso.unpack_data(data, n_only)
 
-            # det = sd['detector']
-            bd = next((b for b in baselines if b.get("detector") == det), None)
+            bd = baselines_by_det.get(det)
             if bd:
-                blob = bd.get("blob")
-                if blob:
-                    iso.baseline.unpack_data(format_blob(blob), n_only)
+                data = get_data(bd)
+                if data:
+                    iso.baseline.unpack_data(data, n_only)
 
         # loop thru keys to make sure none were missed this can happen when only loading baseline
         if keys:
             for k in keys:
-                bd = next((b for b in baselines if b.get("detector") == k), None)
+                bd = baselines_by_det.get(k)
                 if bd:
                     for iso in self.itervalues():
                         if iso.detector == k:
-                            blob = bd.get("blob")
-                            if blob:
-                                iso.baseline.unpack_data(format_blob(blob), n_only)
+                            data = get_data(bd)
+                            if data:
+                                iso.baseline.unpack_data(data, n_only)
 
         for sn in sniffs:
             isok = sn.get("isotope")
             det = sn.get("detector")
-            # if use_name_pairs:
-            #     isok = '{}{}'.format(isok, det)
 
             key = isok
             if use_name_pairs:
@@ -355,18 +392,11 @@ class DVCAnalysis(Analysis):
             if keys and key not in keys and isok not in keys:
                 continue
 
-            data = None
-            blob = sn.get("blob")
-            if blob:
-                data = format_blob(blob)
-
+            data = get_data(sn) or None
             for iso in self.itervalues():
                 if iso.detector == det:
                     iso.sniff.unpack_data(data, n_only)
 
-        if not n_only and not keys:
-            self.has_raw_data = True
-
     def set_production(self, prod, r):
         self.production_obj = r
         self.production_name = prod
@@ -466,6 +496,8 @@ class DVCAnalysis(Analysis):
         jd["signals"] = nsignals
         jd["sniffs"] = nsniffs
         dvc_dump(jd, path)
+        if os.path.isfile(sidecar_path(path)):
+            write_sidecar(path, jd)
 
         return path
 
@@ -772,9 +804,15 @@ class DVCAnalysis(Analysis):
 
     def _get_json(self, modifier):
         path = self._analysis_path(modifier=modifier)
-        jd = dvc_load(path)
+        jd = self._load_json(path, modifier)
         return jd, path
 
+    @staticmethod
+    def _load_json(path, modifier):
+        if is_cached_modifier(modifier):
+            return dvc_load_cached(path)
+        return dvc_load(path)
+
     def _set_isotopes(self, jd):
         time_zero_offset = jd.get("time_zero_offset", 0)
 
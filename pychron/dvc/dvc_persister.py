@@ -43,6 +43,7 @@ from pychron.dvc import (
     BASELINES,
     ICFACTORS,
 )
+from pychron.dvc.raw_sidecar import SIDECAR_IGNORE, write_sidecar
 from pychron.experiment.automated_run.persistence import BasePersister
 from pychron.experiment.automated_run.persistence_spec import PersistenceSpec
 from pychron.experiment.automated_run.spec import AutomatedRunSpec
@@ -91,6 +92,7 @@ class DVCPersister(BasePersister):
     default_principal_investigator = Str
     _positions = None
     use_data_collection_branch = Bool(False)
+    use_raw_data_sidecar = Bool(False)
 
     save_log_enabled = Bool(False)
     arar_mapping = None
@@ -107,6 +109,11 @@ class DVCPersister(BasePersister):
                 "use_data_collection_branch",
                 "pychron.experiment.use_data_collection_branch",
             )
+            bind_preference(
+                self,
+                "use_raw_data_sidecar",
+                "pychron.experiment.use_raw_data_sidecar",
+            )
 
         if load_mapping:
             self._load_arar_mapping()
@@ -357,6 +364,10 @@ class DVCPersister(BasePersister):
                 ] + [self._make_path(modifier=m) for m in NPATH_MODIFIERS]
 
                 self._start_save_timing()
+                if self.use_raw_data_sidecar:
+                    # sidecars are a local cache and are never committed
+                    ar.add_ignore(SIDECAR_IGNORE)
+
                 for p in paths:
                     if os.path.isfile(p):
                         ar.add(p, commit=False)
@@ -905,6 +916,8 @@ class DVCPersister(BasePersister):
             "sniffs": sniffs,
         }
         dvc_dump(data, p)
+        if self.use_raw_data_sidecar:
+            write_sidecar(p, data)
 
     def _save_macrochron(self, obj):
         pass
@@ -0,0 +1,238 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+"""
+persistent parse cache for the small, mostly immutable DVC modifier files
+(intercepts, baselines, blanks, icfactors and tags).
+
+entries are keyed by path and validated against the file's (mtime_ns, size,
+inode) so a file rewritten by git or another process is re-parsed. Writes made
+through ``dvc_dump`` invalidate their path explicitly.
+
+parsed objects are stored pickled, both in a bounded in-memory tier and in a
+sqlite database, and every lookup returns a fresh copy so callers are free to
+modify the result before dumping it back.
+
+This module must not import from ``pychron.dvc`` at module level;
+``pychron.dvc`` imports it.
+"""
+
+# ============= enthought library imports =======================
+# ============= standard library imports ========================
+import os
+import pickle
+import sqlite3
+import threading
+from collections import OrderedDict
+
+# ============= local library imports  ==========================
+from pychron import json
+from pychron.core.helpers.logger_setup import new_logger
+
+logger = new_logger("DVCJSONCache")
+
+CACHED_MODIFIERS = ("intercepts", "baselines", "blanks", "icfactors", "tags")
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS entries ("
+    "path TEXT PRIMARY KEY, mtime_ns INTEGER, size INTEGER, ino INTEGER, data BLOB)"
+)
+
+
+def _stamp(path):
+    st = os.stat(path)
+    return st.st_mtime_ns, st.st_size, st.st_ino
+
+
+class DVCJSONCache(object):
+    def __init__(self, path=None, max_memory_entries=10000):
+        """
+        @param path: sqlite database path. None for an in-memory only cache
+        @param max_memory_entries: size of the in-memory tier
+        """
+        self.path = path
+        self.max_memory_entries = max_memory_entries
+        self.hits = 0
+        self.misses = 0
+
+        self._memory = OrderedDict()
+        self._lock = threading.RLock()
+        self._db = None
+        if path:
+            self._open_db(path)
+
+    def load(self, path, default=None):
+        """
+        equivalent to ``dvc_load(path, default)``
+        """
+        try:
+            stamp = _stamp(path)
+        except (OSError, TypeError):
+            return {} if default is None else default
+
+        with self._lock:
+            blob = self._get(path, stamp)
+
+        if blob is not None:
+            self.hits += 1
+            return pickle.loads(blob)
+
+        self.misses += 1
+        try:
+            with open(path, "r") as rfile:
+                obj = json.load(rfile)
+        except ValueError as e:
+            logger.warning("dvc load exception. error: %s, %s", e, path)
+            return {} if default is None else default
+
+        blob = pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            self._put(path, stamp, blob)
+        return obj
+
+    def invalidate(self, path):
+        path = os.path.abspath(path)
+        with self._lock:
+            self._memory.pop(path, None)
+            if self._db is not None:
+                try:
+                    self._db.execute("DELETE FROM entries WHERE path=?", (path,))
+                except sqlite3.Error as e:
+                    self._db_failed(e)
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+            if self._db is not None:
+                try:
+                    self._db.execute("DELETE FROM entries")
+                except sqlite3.Error as e:
+                    self._db_failed(e)
+
+    def close(self):
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def stats(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "memory_entries": len(self._memory),
+        }
+
+    # private
+    def _get(self, path, stamp):
+        path = os.path.abspath(path)
+        item = self._memory.get(path)
+        if item is not None:
+            if item[0] == stamp:
+                self._memory.move_to_end(path)
+                return item[1]
+            del self._memory[path]
+
+        if self._db is not None:
+            try:
+                row = self._db.execute(
+                    "SELECT mtime_ns, size, ino, data FROM entries WHERE path=?",
+                    (path,),
+                ).fetchone()
+            except sqlite3.Error as e:
+                self._db_failed(e)
+                return
+
+            if row is not None and tuple(row[:3]) == stamp:
+                self._remember(path, stamp, row[3])
+                return row[3]
+
+    def _put(self, path, stamp, blob):
+        path = os.path.abspath(path)
+        self._remember(path, stamp, blob)
+        if self._db is not None:
+            try:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO entries VALUES (?,?,?,?,?)",
+                    (path,) + stamp + (blob,),
+                )
+            except sqlite3.Error as e:
+                self._db_failed(e)
+
+    def _remember(self, path, stamp, blob):
+        self._memory[path] = (stamp, blob)
+        self._memory.move_to_end(path)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+
+    def _open_db(self, path):
+        try:
+            d = os.path.dirname(path)
+            if d and not os.path.isdir(d):
+                os.makedirs(d)
+
+            db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+            # this is a cache. durability is not required
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=OFF")
+            db.execute(_SCHEMA)
+        except (sqlite3.Error, OSError) as e:
+            logger.warning("failed to open json cache %s: %s", path, e)
+            return
+
+        self._db = db
+
+    def _db_failed(self, e):
+        logger.warning("json cache database error, disabling persistence: %s", e)
+        try:
+            self._db.close()
+        except sqlite3.Error:
+            pass
+        self._db = None
+
+
+_cache = None
+
+
+def configure_json_cache(enabled=True, path=None):
+    """
+    enable or disable the module level cache
+
+    @param enabled:
+    @param path: sqlite database path. None for an in-memory only cache
+    """
+    global _cache
+    if _cache is not None:
+        _cache.close()
+        _cache = None
+
+    if enabled:
+        _cache = DVCJSONCache(path)
+    return _cache
+
+
+def get_json_cache():
+    return _cache
+
+
+def invalidate_json_cache(path):
+    if _cache is not None and path:
+        _cache.invalidate(path)
+
+
+def is_cached_modifier(modifier):
+    return modifier in CACHED_MODIFIERS
+
+
+# ============= EOF =============================================
@@ -0,0 +1,296 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+"""
+binary sidecar for the DVC raw data file (``<runid>.dat.json``).
+
+The sidecar is written next to the json file and holds the already decoded
+signal, baseline and sniff blobs back to back, preceded by a small header index::
+
+    MAGIC | uint32 header length | json header | record bytes
+
+The header stores the size and mtime of the json file it was built from. The json
+file is always the source of truth; a sidecar whose header does not match the
+current json file is treated as stale and ignored. Sidecars are only written when
+the json file is written, or by ``backfill_sidecars``, never when it is read.
+"""
+
+# ============= enthought library imports =======================
+# ============= standard library imports ========================
+import mmap
+import os
+import struct
+import tempfile
+
+# ============= local library imports  ==========================
+from pychron import json
+from pychron.core.helpers.binpack import format_blob
+from pychron.core.helpers.logger_setup import new_logger
+from pychron.dvc import dvc_load
+
+logger = new_logger("RawDataSidecar")
+
+MAGIC = b"PYCRAW01"
+SIDECAR_VERSION = 1
+SIDECAR_EXTENSION = ".rawdata"
+SIDECAR_IGNORE = "*{}".format(SIDECAR_EXTENSION)
+RAW_KINDS = ("signals", "baselines", "sniffs")
+
+_LEN_FMT = "<I"
+_PREFIX_LEN = len(MAGIC) + struct.calcsize(_LEN_FMT)
+
+
+def sidecar_path(path):
+    """
+    return the sidecar path for a ``.data`` json path
+    """
+    return "{}{}".format(os.path.splitext(path)[0], SIDECAR_EXTENSION)
+
+
+def _source_stamp(path):
+    st = os.stat(path)
+    return st.st_size, st.st_mtime_ns
+
+
+def write_sidecar(path, jd=None):
+    """
+    write the sidecar for the ``.data`` json file at ``path``.
+
+    @param path: path to the json file
+    @param jd: the already parsed json. loaded from ``path`` if None
+    @return: the sidecar path or None if nothing was written
+    """
+    if not os.path.isfile(path):
+        return
+
+    if jd is None:
+        jd = dvc_load(path)
+
+    entries = []
+    chunks = []
+    offset = 0
+    for kind in RAW_KINDS:
+        for d in jd.get(kind, []):
+            blob = d.get("blob")
+            raw = format_blob(blob) if blob else b""
+            entries.append(
+                {
+                    "kind": kind,
+                    "isotope": d.get("isotope"),
+                    "detector": d.get("detector"),
+                    "offset": offset,
+                    "nbytes": len(raw),
+                }
+            )
+            chunks.append(raw)
+            offset += len(raw)
+
+    size, mtime = _source_stamp(path)
+    header = json.dumps(
+        {
+            "version": SIDECAR_VERSION,
+            "format": jd.get("format", ">ff"),
+            "source_size": size,
+            "source_mtime_ns": mtime,
+            "entries": entries,
+        }
+    ).encode("utf-8")
+
+    spath = sidecar_path(path)
+    # unique temporary file so concurrent writers never share a partial file
+    root, name = os.path.split(spath)
+    fd, tmp = tempfile.mkstemp(
+        dir=root,
+        prefix="{}.".format(os.path.splitext(name)[0]),
+        suffix=".tmp{}".format(SIDECAR_EXTENSION),
+    )
+    try:
+        with os.fdopen(fd, "wb") as wfile:
+            wfile.write(MAGIC)
+            wfile.write(struct.pack(_LEN_FMT, len(header)))
+            wfile.write(header)
+            for c in chunks:
+                wfile.write(c)
+
+        os.replace(tmp, spath)
+    except BaseException:
+        os.remove(tmp)
+        raise
+
+    return spath
+
+
+class RawDataSidecar(object):
+    """
+    read only view of a sidecar. blobs are returned as memoryviews into a
+    memory mapped file so no data is copied until it is unpacked.
+
+    use as a context manager::
+
+        with RawDataSidecar.open(path) as sc:
+            if sc:
+                signals = sc.records("signals")
+    """
+
+    def __init__(self, path, buf, header, data_offset):
+        self.path = path
+        self.format = header.get("format", ">ff")
+        self._buf = buf
+        self._view = memoryview(buf)
+        self._entries = header.get("entries", [])
+        self._data_offset = data_offset
+
+    @classmethod
+    def open(cls, path):
+        """
+        open the sidecar for the json file at ``path``.
+
+        @return: RawDataSidecar or None if the sidecar is missing, corrupt or stale
+        """
+        if not path:
+            return
+
+        spath = sidecar_path(path)
+        if not os.path.isfile(spath) or not os.path.isfile(path):
+            return
+
+        try:
+            with open(spath, "rb") as rfile:
+                buf = mmap.mmap(rfile.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError) as e:
+            logger.debug("failed to map sidecar %s: %s", spath, e)
+            return
+
+        try:
+            if buf[: len(MAGIC)] != MAGIC:
+                raise ValueError("bad magic")
+
+            (n,) = struct.unpack(_LEN_FMT, buf[len(MAGIC) : _PREFIX_LEN])
+            header = json.loads(buf[_PREFIX_LEN : _PREFIX_LEN + n].decode("utf-8"))
+            if header.get("version") != SIDECAR_VERSION:
+                raise ValueError("unsupported version {}".format(header.get("version")))
+        except (ValueError, struct.error) as e:
+            logger.debug("invalid sidecar %s: %s", spath, e)
+            buf.close()
+            return
+
+        if (header.get("source_size"), header.get("source_mtime_ns")) != _source_stamp(path):
+            logger.debug("stale sidecar %s", spath)
+            buf.close()
+            return
+
+        return cls(spath, buf, header, _PREFIX_LEN + n)
+
+    def records(self, kind):
+        """
+        return a list of dicts ``{isotope, detector, blob}`` for ``kind``
+        (signals, baselines or sniffs), in the same order as the json file.
+        ``blob`` is a memoryview of the decoded blob
+        """
+        off = self._data_offset
+        view = self._view
+        return [
+            {
+                "isotope": e["isotope"],
+                "detector": e["detector"],
+                "blob": view[off + e["offset"] : off + e["offset"] + e["nbytes"]],
+            }
+            for e in self._entries
+            if e["kind"] == kind
+        ]
+
+    def close(self):
+        try:
+            self._view.release()
+            self._buf.close()
+        except BufferError:
+            # arrays still reference the mapping. it is released when they are
+            # garbage collected
+            pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def ignore_sidecars(root):
+    """
+    add ``SIDECAR_IGNORE`` to the ``.gitignore`` of the work tree at ``root`` so
+    sidecars are never committed. the ``.gitignore`` is not staged
+    """
+    p = os.path.join(root, ".gitignore")
+    lines = []
+    if os.path.isfile(p):
+        with open(p, "r") as rfile:
+            lines = rfile.read().splitlines()
+
+    if SIDECAR_IGNORE not in (line.strip() for line in lines):
+        with open(p, "a") as afile:
+            if lines and lines[-1]:
+                afile.write("\n")
+            afile.write("{}\n".format(SIDECAR_IGNORE))
+
+
+def backfill_sidecars(root, overwrite=False):
+    """
+    write sidecars for every ``.data`` json file below ``root``.
+
+    ``SIDECAR_IGNORE`` is added to the ``.gitignore`` of each git work tree a sidecar
+    is written to, or of ``root`` if it is not in a work tree found below ``root``
+
+    @param root: repository path
+    @param overwrite: rewrite sidecars that are already up to date
+    @return: (written, skipped) counts
+    """
+    written = skipped = 0
+    worktrees = []
+    ignored = set()
+    for r, ds, fs in os.walk(root):
+        if ".git" in ds:
+            ds.remove(".git")
+            worktrees.append(r)
+
+        if os.path.basename(r) != ".data":
+            continue
+
+        for fi in fs:
+            if not fi.endswith(".json"):
+                continue
+
+            p = os.path.join(r, fi)
+            if not overwrite:
+                sc = RawDataSidecar.open(p)
+                if sc is not None:
+                    sc.close()
+                    skipped += 1
+                    continue
+
+            if write_sidecar(p):
+                written += 1
+                wt = max(
+                    (w for w in worktrees if r.startswith(os.path.join(w, ""))),
+                    key=len,
+                    default=root,
+                )
+                if wt not in ignored:
+                    ignore_sidecars(wt)
+                    ignored.add(wt)
+
+    return written, skipped
+
+
+# ============= EOF =============================================
@@ -157,6 +157,11 @@ class DVCPreferences(BasePreferencesHelper):
     use_cocktail_irradiation = Bool
     use_cache = Bool
     max_cache_size = Int
+    max_cache_memory = Int
+    use_disk_cache = Bool
+    use_parallel_loading = Bool
+    parallel_loading_workers = Int
+    use_json_cache = Bool
     update_currents_enabled = Bool
     use_auto_pull = Bool(True)
     use_auto_push = Bool(False)
@@ -209,9 +214,49 @@ class DVCPreferencesPane(PreferencesPane):
                     HGroup(
                         Item("use_cache", label="Enabled"),
                         Item("max_cache_size", label="Max Size"),
+                        Item(
+                            "max_cache_memory",
+                            label="Max Memory (MB)",
+                            tooltip="Approximate memory budget for cached analyses. "
+                            "0 for no limit",
+                        ),
+                        Item(
+                            "use_disk_cache",
+                            label="Use Disk",
+                            tooltip="Move evicted analyses to a temporary disk cache "
+                            "instead of discarding them",
+                        ),
                     ),
                     label="Cache",
                 ),
+                BorderVGroup(
+                    HGroup(
+                        Item(
+                            "use_parallel_loading",
+                            label="Enabled",
+                            tooltip="Read analysis files from the local repositories "
+                            "with a pool of worker threads",
+                        ),
+                        Item(
+                            "parallel_loading_workers",
+                            label="Workers",
+                            tooltip="Number of worker threads. 0 to choose based on the "
+                            "number of cores",
+                            enabled_when="use_parallel_loading",
+                        ),
+                    ),
+                    label="Parallel Loading",
+                ),
+                BorderVGroup(
+                    Item(
+                        "use_json_cache",
+                        label="Enabled",
+                        tooltip="Keep a local cache of parsed intercepts, baselines, "
+                        "blanks, icfactors and tags files. Entries are invalidated "
+                        "when a file changes",
+                    ),
+                    label="Parse Cache",
+                ),
             )
         )
         return v
@@ -0,0 +1,141 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from pychron.dvc import (
+    dvc_dump,
+    analysis_path,
+    INTERCEPTS,
+    BASELINES,
+    BLANKS,
+    ICFACTORS,
+    AnalysisNotAnvailableError,
+)
+from pychron.dvc.analysis_record import DVCAnalysisRecord
+from pychron.dvc.dvc_analysis import DVCAnalysis
+from pychron.paths import paths
+
+REPO = "RecordRepo"
+UUID = "a1b2c3d4-0000-4000-8000-000000000001"
+RUNID = "12345-01A"
+ISOTOPES = (("Ar40", "H1"), ("Ar39", "AX"), ("Ar36", "CDD"))
+
+
+class DVCAnalysisRecordTestCase(unittest.TestCase):
+    def setUp(self):
+        self._paths = paths.repository_dataset_dir, paths.meta_root
+        self.root = tempfile.mkdtemp()
+        paths.repository_dataset_dir = os.path.join(self.root, "repositories")
+        paths.meta_root = os.path.join(self.root, "MetaData")
+        os.makedirs(os.path.join(paths.repository_dataset_dir, REPO))
+        os.makedirs(paths.meta_root)
+        dvc_dump(
+            {k: float(k[2:]) for k, _ in ISOTOPES},
+            os.path.join(paths.meta_root, "molecular_weights.json"),
+        )
+
+        def path(modifier=None):
+            return analysis_path((UUID, RUNID), REPO, modifier, mode="w", force_sublen=2)
+
+        dvc_dump(
+            {
+                "uuid": UUID,
+                "identifier": "12345",
+                "aliquot": 1,
+                "increment": 0,
+                "analysis_type": "sample",
+                "sample": "FC-2",
+                "mass_spectrometer": "jan",
+                "timestamp": "2026-01-01T12:00:00",
+                "isotopes": {k: {"name": k, "detector": d, "units": "fA"} for k, d in ISOTOPES},
+            },
+            path(),
+        )
+        dvc_dump({"extract_value": 1.5, "extract_units": "W"}, path("extraction"))
+        value = {"fit": "linear", "error_type": "SEM", "value": 10.0, "error": 0.1}
+        dvc_dump({k: dict(value) for k, _ in ISOTOPES}, path(INTERCEPTS))
+        dvc_dump({d: dict(value) for _, d in ISOTOPES}, path(BASELINES))
+        dvc_dump(
+            {k: dict(value, fit="previous", references=[]) for k, _ in ISOTOPES},
+            path(BLANKS),
+        )
+        dvc_dump(
+            {d: {"value": 1.0, "error": 0.001, "fit": "default"} for _, d in ISOTOPES},
+            path(ICFACTORS),
+        )
+
+    def tearDown(self):
+        paths.repository_dataset_dir, paths.meta_root = self._paths
+        shutil.rmtree(self.root)
+
+    def test_metadata_matches_analysis(self):
+        r = DVCAnalysisRecord(UUID, RUNID, REPO)
+        a = DVCAnalysis(UUID, RUNID, REPO)
+        for attr in (
+            "uuid",
+            "record_id",
+            "repository_identifier",
+            "identifier",
+            "labnumber",
+            "aliquot",
+            "step",
+            "aliquot_step_str",
+            "analysis_type",
+            "sample",
+            "mass_spectrometer",
+            "rundate",
+            "timestamp",
+            "isotope_keys",
+        ):
+            self.assertEqual(getattr(r, attr), getattr(a, attr), attr)
+
+        self.assertEqual(r.make_path(INTERCEPTS), a.make_path(INTERCEPTS))
+        self.assertFalse(r.is_materialized)
+
+    def test_bookkeeping_does_not_materialize(self):
+        r = DVCAnalysisRecord(UUID, RUNID, REPO)
+        r.group_id = 2
+        r.is_reduced = True
+        r.set_tag({"name": "invalid", "note": "bad"})
+        self.assertEqual(r.temp_status, "invalid")
+        self.assertEqual(r.tag_note, "bad")
+        self.assertFalse(r.is_materialized)
+
+    def test_materialize_on_read(self):
+        r = DVCAnalysisRecord(UUID, RUNID, REPO)
+        r.set_tag("invalid")
+        self.assertEqual(r.extract_value, 1.5)
+        self.assertTrue(r.is_materialized)
+        self.assertAlmostEqual(r.isotopes["Ar40"].value, 10.0)
+
+        a = r.materialize()
+        self.assertIsInstance(a, DVCAnalysis)
+        self.assertEqual(a.tag, "invalid")
+        self.assertEqual(a.temp_status, "invalid")
+
+        # the record now proxies the analysis
+        r.set_tag("ok")
+        self.assertEqual(a.tag, "ok")
+        self.assertEqual(r.tag, "ok")
+
+    def test_materialize_on_write(self):
+        r = DVCAnalysisRecord(UUID, RUNID, REPO)
+        r.comment = "foo"
+        self.assertTrue(r.is_materialized)
+        self.assertEqual(r.materialize().comment, "foo")
+        self.assertEqual(r.comment, "foo")
+
+    def test_load_raw_data_without_data_file(self):
+        a = DVCAnalysis(UUID, RUNID, REPO)
+        a.load_raw_data()
+        self.assertTrue(a.has_raw_data)
+        self.assertEqual(len(a.isotopes["Ar40"].xs), 0)
+
+    def test_missing(self):
+        with self.assertRaises(AnalysisNotAnvailableError):
+            DVCAnalysisRecord("missing", "missing-01", REPO)
+
+
+if __name__ == "__main__":
+    unittest.main()
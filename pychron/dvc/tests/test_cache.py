@@ -0,0 +1,139 @@
+import time
+import unittest
+
+from numpy import zeros
+
+from pychron.dvc.cache import ANALYSIS_OVERHEAD, DVCCache, estimate_nbytes, logger
+
+
+class Measurement:
+    def __init__(self, n=0):
+        self.xs = zeros(n)
+        self.ys = zeros(n)
+
+
+class Isotope(Measurement):
+    def __init__(self, n=0):
+        super().__init__(n)
+        self.baseline = Measurement(n)
+        self.sniff = Measurement()
+        self.blank = Measurement()
+
+
+class Analysis:
+    def __init__(self, uuid, n=0):
+        self.uuid = uuid
+        self.isotopes = {"Ar40": Isotope(n), "Ar39": Isotope(n)}
+
+
+class Unpicklable:
+    def __init__(self):
+        self.func = lambda: None
+
+
+class DVCCacheTestCase(unittest.TestCase):
+    def test_lru_eviction(self):
+        c = DVCCache(max_size=2)
+        c.update("a", Analysis("a"))
+        c.update("b", Analysis("b"))
+        c.get("a")
+        c.update("c", Analysis("c"))
+        self.assertIsNotNone(c.get("a"))
+        self.assertIsNone(c.get("b"))
+        self.assertIsNotNone(c.get("c"))
+        self.assertEqual(c.evictions, 1)
+
+    def test_counters(self):
+        c = DVCCache()
+        c.update("a", Analysis("a"))
+        c.get("a")
+        c.get("a")
+        c.get("b")
+        st = c.stats()
+        self.assertEqual(st["hits"], 2)
+        self.assertEqual(st["misses"], 1)
+
+    def test_memory_budget(self):
+        small = estimate_nbytes(Analysis("a"))
+        c = DVCCache(max_size=100, max_memory=small * 3)
+        for k in "abc":
+            c.update(k, Analysis(k))
+        self.assertEqual(c.report(), 3)
+
+        c.update("big", Analysis("big", n=10000))
+        self.assertIsNotNone(c.get("big"))
+        self.assertIsNone(c.get("a"))
+
+    def test_memory_tracks_raw_data(self):
+        c = DVCCache(max_size=100)
+        a = Analysis("a")
+        c.update("a", a)
+        n = c.nbytes
+        a.isotopes["Ar40"].xs = zeros(1000)
+        c.get("a")
+        self.assertEqual(c.nbytes, n + 8000)
+
+    def test_estimate(self):
+        self.assertEqual(estimate_nbytes(object()), ANALYSIS_OVERHEAD)
+        self.assertGreater(estimate_nbytes(Analysis("a", 100)), estimate_nbytes(Analysis("a")))
+
+    def test_remove(self):
+        c = DVCCache()
+        c.update("a", Analysis("a"))
+        c.remove("a")
+        c.remove("a")
+        self.assertEqual(c.nbytes, 0)
+        self.assertIsNone(c.get("a"))
+
+    def test_clean(self):
+        c = DVCCache(ttl=0.05)
+        c.update("a", Analysis("a"))
+        time.sleep(0.1)
+        c.update("b", Analysis("b"))
+        c.clean()
+        self.assertNotIn("a", c)
+        self.assertIn("b", c)
+
+    def test_disk_tier(self):
+        c = DVCCache(max_size=1, use_disk=True)
+        c.update("a", Analysis("a", 10))
+        c.update("b", Analysis("b"))
+        self.assertEqual(c.demotions, 1)
+        a = c.get("a")
+        self.assertEqual(a.uuid, "a")
+        self.assertEqual(c.disk_hits, 1)
+        self.assertEqual(a.isotopes["Ar40"].xs.shape[0], 10)
+        c.clear()
+        self.assertNotIn("b", c)
+
+    def test_lower_limits(self):
+        c = DVCCache(max_size=10)
+        for k in "abcd":
+            c.update(k, Analysis(k, 100))
+
+        c.max_memory = 2 * estimate_nbytes(Analysis("x", 100))
+        c.enforce_limits()
+        self.assertEqual(c.report(), 2)
+        self.assertNotIn("a", c)
+
+        c.max_size = 1
+        c.enforce_limits()
+        self.assertEqual(c.report(), 1)
+        self.assertIn("d", c)
+
+    def test_disk_tier_unpicklable(self):
+        c = DVCCache(max_size=1, use_disk=True)
+        with self.assertLogs(logger, "WARNING") as cm:
+            c.update("a", Unpicklable())
+            c.update("b", Unpicklable())
+            c.update("c", Unpicklable())
+
+        # logged once, then the disk tier is skipped for the type
+        self.assertEqual(len(cm.output), 1)
+        self.assertIn("Unpicklable", cm.output[0])
+        self.assertEqual(c.demotions, 0)
+        self.assertNotIn("a", c)
+
+
+if __name__ == "__main__":
+    unittest.main()
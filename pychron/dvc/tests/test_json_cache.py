@@ -0,0 +1,66 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from pychron.dvc import dvc_dump, dvc_load_cached
+from pychron.dvc.json_cache import DVCJSONCache, configure_json_cache
+
+
+class DVCJSONCacheTestCase(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.path = os.path.join(self.root, "a.intercepts.json")
+        self.db = os.path.join(self.root, "cache", "json.sqlite")
+        dvc_dump({"Ar40": {"value": 1.0}}, self.path)
+
+    def tearDown(self):
+        configure_json_cache(False)
+        shutil.rmtree(self.root)
+
+    def test_hit(self):
+        c = DVCJSONCache(self.db)
+        self.assertEqual(c.load(self.path), {"Ar40": {"value": 1.0}})
+        self.assertEqual(c.load(self.path), {"Ar40": {"value": 1.0}})
+        self.assertEqual((c.hits, c.misses), (1, 1))
+
+    def test_returns_copy(self):
+        c = DVCJSONCache()
+        c.load(self.path)["Ar40"]["value"] = 2
+        self.assertEqual(c.load(self.path)["Ar40"]["value"], 1.0)
+
+    def test_persistent(self):
+        c = DVCJSONCache(self.db)
+        c.load(self.path)
+        c.close()
+
+        c = DVCJSONCache(self.db)
+        self.assertEqual(c.load(self.path), {"Ar40": {"value": 1.0}})
+        self.assertEqual(c.hits, 1)
+
+    def test_external_change(self):
+        c = DVCJSONCache(self.db)
+        c.load(self.path)
+        with open(self.path, "w") as wfile:
+            wfile.write('{"Ar40": {"value": 3.0, "error": 0.1}}')
+        self.assertEqual(c.load(self.path)["Ar40"]["value"], 3.0)
+
+    def test_dvc_dump_invalidates(self):
+        c = configure_json_cache(True, self.db)
+        dvc_load_cached(self.path)
+        # same size and potentially the same mtime tick
+        dvc_dump({"Ar40": {"value": 2.0}}, self.path)
+        self.assertEqual(dvc_load_cached(self.path)["Ar40"]["value"], 2.0)
+        self.assertEqual(c.misses, 2)
+
+    def test_missing(self):
+        c = DVCJSONCache()
+        self.assertEqual(c.load(os.path.join(self.root, "nope.json")), {})
+
+    def test_disabled(self):
+        configure_json_cache(False)
+        self.assertEqual(dvc_load_cached(self.path), {"Ar40": {"value": 1.0}})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+import threading
+import time
+import unittest
+
+from pychron.dvc.analysis_loading import AnalysisLoadContext, build_analyses_parallel
+
+
+class Record:
+    repository_identifier = "Repo"
+
+    def __init__(self, i):
+        self.uuid = "uuid{}".format(i)
+        self.record_id = "rec{}".format(i)
+        self.i = i
+
+
+class Analysis:
+    def __init__(self, uuid):
+        self.uuid = uuid
+        self.finished_on = None
+
+
+class FakeDVC:
+    _cache = None
+
+    def __init__(self, missing=()):
+        self.missing = missing
+        self.warnings = []
+        self.construct_threads = set()
+
+    def _resolve_record(self, record, reload=False):
+        return record, record.repository_identifier, None
+
+    def _construct_analysis(self, uuid, rid, expid, quick=False, lazy=False):
+        self.construct_threads.add(threading.current_thread())
+        # finish out of order
+        time.sleep(0.001 * (int(uuid[4:]) % 3))
+        if rid in self.missing:
+            return None, "missing {}".format(rid)
+        return Analysis(uuid), None
+
+    def _finish_analysis(self, a, record, expid, context, **kw):
+        a.finished_on = threading.current_thread()
+
+    def warning_dialog(self, msg):
+        self.warnings.append(msg)
+
+    def warning(self, msg):
+        pass
+
+    def debug_exception(self):
+        pass
+
+
+class ParallelLoadingTestCase(unittest.TestCase):
+    def test_order(self):
+        dvc = FakeDVC()
+        records = [Record(i) for i in range(50)]
+        ans = build_analyses_parallel(
+            dvc, records, AnalysisLoadContext(), max_workers=4, use_progress=False
+        )
+        self.assertListEqual([a.uuid for a in ans], [r.uuid for r in records])
+
+    def test_finish_on_calling_thread(self):
+        dvc = FakeDVC()
+        ans = build_analyses_parallel(
+            dvc,
+            [Record(i) for i in range(20)],
+            AnalysisLoadContext(),
+            max_workers=4,
+            use_progress=False,
+        )
+        main = threading.current_thread()
+        self.assertTrue(all(a.finished_on is main for a in ans))
+        self.assertNotIn(main, dvc.construct_threads)
+
+    def test_missing_warnings_merged(self):
+        dvc = FakeDVC(missing=("rec3", "rec7"))
+        ans = build_analyses_parallel(
+            dvc,
+            [Record(i) for i in range(10)],
+            AnalysisLoadContext(),
+            max_workers=2,
+            use_progress=False,
+        )
+        self.assertEqual(len(ans), 8)
+        self.assertEqual(len(dvc.warnings), 1)
+        self.assertIn("rec3", dvc.warnings[0])
+        self.assertIn("rec7", dvc.warnings[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
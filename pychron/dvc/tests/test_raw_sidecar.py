@@ -0,0 +1,104 @@
+import os
+import shutil
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from numpy import linspace
+
+from pychron.core.helpers.binpack import encode_blob, pack_columns, unpack_arrays
+from pychron.dvc import dvc_dump, dvc_load
+from pychron.dvc.raw_sidecar import (
+    RawDataSidecar,
+    SIDECAR_IGNORE,
+    backfill_sidecars,
+    sidecar_path,
+    write_sidecar,
+)
+
+
+def make_blob(n, offset=0):
+    return encode_blob(pack_columns(">ff", linspace(0, n, n), linspace(0, n, n) + offset))
+
+
+class RawDataSidecarTestCase(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        d = os.path.join(self.root, "abc", ".data")
+        os.makedirs(d)
+        self.path = os.path.join(d, "abc1234.dat.json")
+        self.jd = {
+            "format": ">ff",
+            "signals": [
+                {"isotope": "Ar40", "detector": "H1", "blob": make_blob(100)},
+                {"isotope": "Ar39", "detector": "AX", "blob": make_blob(50, 1)},
+            ],
+            "baselines": [{"detector": "H1", "blob": make_blob(10, 2)}],
+            "sniffs": [{"isotope": "Ar40", "detector": "H1", "blob": ""}],
+        }
+        dvc_dump(self.jd, self.path)
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def test_round_trip(self):
+        write_sidecar(self.path)
+        with RawDataSidecar.open(self.path) as sc:
+            for kind in ("signals", "baselines", "sniffs"):
+                recs = sc.records(kind)
+                self.assertEqual(len(recs), len(self.jd[kind]))
+                for r, j in zip(recs, self.jd[kind]):
+                    self.assertEqual(r["detector"], j["detector"])
+                    expected = unpack_arrays(j["blob"], ">ff", decode=True)
+                    for a, b in zip(unpack_arrays(r["blob"], ">ff"), expected):
+                        self.assertListEqual(a.tolist(), b.tolist())
+
+    def test_missing(self):
+        self.assertIsNone(RawDataSidecar.open(self.path))
+
+    def test_stale(self):
+        write_sidecar(self.path)
+        jd = dvc_load(self.path)
+        jd["signals"].pop(0)
+        dvc_dump(jd, self.path)
+        self.assertIsNone(RawDataSidecar.open(self.path))
+
+    def test_corrupt(self):
+        with open(sidecar_path(self.path), "wb") as wfile:
+            wfile.write(b"garbage")
+        self.assertIsNone(RawDataSidecar.open(self.path))
+
+    def test_no_path(self):
+        self.assertIsNone(RawDataSidecar.open(None))
+
+    def test_concurrent_writes(self):
+        with ThreadPoolExecutor(4) as pool:
+            list(pool.map(lambda i: write_sidecar(self.path, self.jd), range(16)))
+
+        self.assertEqual(
+            sorted(os.listdir(os.path.dirname(self.path))),
+            [os.path.basename(self.path), os.path.basename(sidecar_path(self.path))],
+        )
+        with RawDataSidecar.open(self.path) as sc:
+            self.assertEqual(len(sc.records("signals")), 2)
+
+    def test_backfill(self):
+        self.assertEqual(backfill_sidecars(self.root), (1, 0))
+        self.assertEqual(backfill_sidecars(self.root), (0, 1))
+        self.assertTrue(os.path.isfile(sidecar_path(self.path)))
+
+    def test_backfill_ignored(self):
+        repo = os.path.join(self.root, "abc")
+        os.makedirs(os.path.join(repo, ".git"))
+        with open(os.path.join(repo, ".gitignore"), "w") as wfile:
+            wfile.write(".DS_Store")
+
+        backfill_sidecars(self.root, overwrite=True)
+        backfill_sidecars(self.root, overwrite=True)
+        with open(os.path.join(repo, ".gitignore")) as rfile:
+            self.assertEqual(rfile.read().splitlines(), [".DS_Store", SIDECAR_IGNORE])
+        self.assertFalse(os.path.isfile(os.path.join(self.root, ".gitignore")))
+
+
+if __name__ == "__main__":
+    unittest.main()
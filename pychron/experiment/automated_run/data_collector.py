@@ -22,11 +22,75 @@ from math import isfinite
 # ============= enthought library imports =======================
 from apptools.preferences.preference_binding import bind_preference
 from traits.api import Any, List, CInt, Int, Bool, Enum, Str, Instance, Float
+from traits.api import on_trait_change
 
 from pychron.core.ui.gui import invoke_in_main_thread
 from pychron.envisage.consoleable import Consoleable
 from pychron.pychron_constants import AR_AR, SIGNAL, BASELINE, WHIFF, SNIFF, FAILED
 
+# seconds spent saving, updating isotopes and queuing plot data for one count
+ITERATION_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.1)
+
+
+def bind_iteration_histogram(kind):
+    """
+    bound histogram of the per count dispatch time of a collection ``kind``.
+    returns None if the metrics backend is not available
+    """
+    try:
+        from pychron.observability import metrics
+    except ImportError:
+        return
+
+    return metrics.histogram(
+        "data_collector_iteration_seconds",
+        "Time spent saving, updating isotopes and plotting one count",
+        ["kind"],
+        buckets=ITERATION_BUCKETS,
+    ).bind(kind=kind)
+
+
+class DetectorRoutes(object):
+    """
+    routing table of one key order, the detector names returned by the
+    spectrometer for a count, to the collector's detectors.
+
+    ``detectors`` are the detectors measured in the count and ``indices`` the
+    positions of their signals in ``keys``
+    """
+
+    __slots__ = ("keys", "indices", "detectors", "_index")
+
+    def __init__(self, keys, detectors):
+        byname = {}
+        for d in detectors:
+            byname.setdefault(d.name, d)
+
+        self.keys = tuple(keys)
+        self._index = {}
+        for i, k in enumerate(self.keys):
+            self._index.setdefault(k, i)
+
+        self.indices = []
+        self.detectors = []
+        for k, i in self._index.items():
+            d = byname.get(k)
+            if d is not None:
+                self.indices.append(i)
+                self.detectors.append(d)
+
+    def select(self, signals):
+        """
+        the signals of ``detectors``
+        """
+        return [signals[i] for i in self.indices]
+
+    def index(self, key):
+        """
+        position of ``key`` in ``keys`` or None
+        """
+        return self._index.get(key)
+
 
 class DataCollector(Consoleable):
     """
@@ -78,6 +142,10 @@ class DataCollector(Consoleable):
     plot_panel_update_period = Int(1)
     plot_panel_update_min_period = Float(0.25)
 
+    _routes = None
+    _iteration_histogram = None
+    _iteration_stats = None
+
     def __init__(self, *args, **kw):
         super(DataCollector, self).__init__(*args, **kw)
         bind_preference(
@@ -120,6 +188,9 @@ class DataCollector(Consoleable):
         self._plot_data_buffers = {}
         self._live_plot_limits = {}
         self._last_plot_panel_update = 0
+        self._routes = {}
+        self._iteration_stats = [0, 0, 0]
+        self._iteration_histogram = bind_iteration_histogram(self.collection_kind)
 
         if self.starttime is None:
             self.starttime = time.time()
@@ -133,11 +204,19 @@ class DataCollector(Consoleable):
 
         tt = time.time() - self.starttime
         self.debug("estimated time: {:0.3f} actual time: :{:0.3f}".format(et, tt))
+        self._report_iteration_stats()
 
     # def plot_data(self, *args, **kw):
     #     from pychron.core.ui.gui import invoke_in_main_thread
     #     invoke_in_main_thread(self._plot_data, *args, **kw)
 
+    def get_iteration_stats(self):
+        """
+        number of counts, mean and max seconds spent dispatching one count
+        """
+        n, total, mx = self._iteration_stats or (0, 0, 0)
+        return n, total / n if n else 0, mx
+
     def set_temporary_conditionals(self, cd):
         self._temp_conds = cd
 
@@ -242,12 +321,73 @@ class DataCollector(Consoleable):
             return
 
         if k is not None and s is not None:
+            st = time.perf_counter()
             x = self._get_time(t)
-            self._save_data(x, k, s)
-            self._plot_data(i, x, k, s)
+            self._dispatch(i, x, self._get_routes(k), s)
+            self._record_iteration_time(time.perf_counter() - st)
 
         return inc
 
+    def _dispatch(self, cnt, x, routes, signals):
+        """
+        save, update the isotopes and queue the plot data of one count
+        """
+        dets = routes.detectors
+        sigs = routes.select(signals)
+
+        self.data_writer(dets, x, routes.keys, signals)
+
+        # update arar_age
+        if self.is_baseline and self.for_peak_hop:
+            self._update_baseline_peak_hop(x, routes, signals)
+        else:
+            self._update_isotopes(x, dets, sigs)
+
+        for det, signal in zip(dets, sigs):
+            self._set_plot_data(cnt, det, x, signal)
+
+    def _get_routes(self, keys):
+        """
+        routing table of ``keys``. tables are built once per key order and
+        discarded when the detectors change
+        """
+        routes = self._routes
+        if routes is None:
+            routes = self._routes = {}
+
+        key = tuple(keys)
+        try:
+            return routes[key]
+        except KeyError:
+            r = routes[key] = DetectorRoutes(key, self.detectors)
+            return r
+
+    @on_trait_change("detectors, detectors_items")
+    def _clear_routes(self):
+        self._routes = None
+
+    def _record_iteration_time(self, dt):
+        stats = self._iteration_stats
+        if stats is not None:
+            stats[0] += 1
+            stats[1] += dt
+            if dt > stats[2]:
+                stats[2] = dt
+
+        if self._iteration_histogram is not None:
+            self._iteration_histogram.observe(dt)
+
+    def _report_iteration_stats(self):
+        n, mean, mx = self.get_iteration_stats()
+        if n:
+            period = self.period_ms * 0.001
+            self.debug(
+                "{} counts dispatched. mean {:0.3f} ms, max {:0.3f} ms per count "
+                "({:0.2%} of measurement period)".format(
+                    n, mean * 1000, mx * 1000, mean / period if period else 0
+                )
+            )
+
     def _handle_iteration_exception(self, exc: Exception) -> None:
         message = "Measurement failed getting data: {}".format(exc)
         self.err_message = message
@@ -299,20 +439,10 @@ class DataCollector(Consoleable):
                 self._data = ds
             return data
 
-    def _save_data(self, x, keys, signals):
-        # self._queue.put((x, keys, signals))
-        self.data_writer(self.detectors, x, keys, signals)
-
-        # update arar_age
-        if self.is_baseline and self.for_peak_hop:
-            self._update_baseline_peak_hop(x, keys, signals)
-        else:
-            self._update_isotopes(x, keys, signals)
-
-    def _update_baseline_peak_hop(self, x, keys, signals):
+    def _update_baseline_peak_hop(self, x, routes, signals):
         ig = self.isotope_group
         for iso in ig.itervalues():
-            signal = self._get_signal(keys, signals, iso.detector)
+            signal = self._get_signal(routes, signals, iso.detector)
             if signal is not None:
                 if not ig.append_data(iso.name, iso.detector, x, signal, "baseline"):
                     self.debug(
@@ -320,44 +450,30 @@ class DataCollector(Consoleable):
                         "not a current isotope {}".format(iso, ig.isotope_keys)
                     )
 
-    def _update_isotopes(self, x, keys, signals):
+    def _update_isotopes(self, x, dets, signals):
         a = self.isotope_group
         kind = self.collection_kind
 
-        for dn in keys:
-            dn = self._get_detector(dn)
-            if dn:
-                iso = dn.isotope
-                if iso:
-                    signal = self._get_signal(keys, signals, dn.name)
-                    if signal is not None:
-                        if not a.append_data(iso, dn.name, x, signal, kind):
-                            self.debug(
-                                "{} - failed appending data for {}. not a current isotope {}".format(
-                                    kind, iso, a.isotope_keys
-                                )
-                            )
-
-    def _get_signal(self, keys, signals, det):
-        try:
-            return signals[keys.index(det)]
-        except ValueError:
-            if det not in self._warned_no_det:
-                self.warning("Detector {} is not available".format(det))
-                self._warned_no_det.append(det)
-                self.canceled = True
-                self.stop()
-
-    def _get_detector(self, d):
-        if isinstance(d, str):
-            d = next((di for di in self.detectors if di.name == d), None)
-        return d
-
-    def _plot_data(self, cnt, x, keys, signals):
-        for dn, signal in zip(keys, signals):
-            det = self._get_detector(dn)
-            if det:
-                self._set_plot_data(cnt, det, x, signal)
+        for det, signal in zip(dets, signals):
+            iso = det.isotope
+            if iso and signal is not None:
+                if not a.append_data(iso, det.name, x, signal, kind):
+                    self.debug(
+                        "{} - failed appending data for {}. not a current isotope {}".format(
+                            kind, iso, a.isotope_keys
+                        )
+                    )
+
+    def _get_signal(self, routes, signals, det):
+        idx = routes.index(det)
+        if idx is not None:
+            return signals[idx]
+
+        if det not in self._warned_no_det:
+            self.warning("Detector {} is not available".format(det))
+            self._warned_no_det.append(det)
+            self.canceled = True
+            self.stop()
 
     def _set_plot_data(self, cnt, det, x, signal):
         iso = det.isotope
@@ -18,7 +18,9 @@
 import binascii
 import math
 import os
+import threading
 import time
+from contextlib import contextmanager
 
 from traits.api import Instance, Bool, Interface, provides, Str, Float, Int
 from xlwt import Workbook, struct
@@ -40,6 +42,113 @@ from pychron.pychron_constants import NULL_STR, DETECTOR_IC
 DEBUG = False
 
 
+class BufferedDataWriter(object):
+    """
+    data writer for one measurement phase e.g. "signal" or "baseline".
+
+    ``write_data(dets, x, keys, signals)`` buffers one row per detector in memory.
+    the rows are appended to the hdf5 tables, and the tables flushed, every
+    ``flush_count`` counts, every ``flush_interval`` seconds, or when ``flush`` is
+    called. The table of each detector is looked up once, and the key index once
+    per key order if ``keys`` is a tuple.
+    """
+
+    def __init__(self, data_manager, grpname, flush_count=50, flush_interval=10):
+        self.data_manager = data_manager
+        self.grpname = grpname
+        self.flush_count = flush_count
+        self.flush_interval = flush_interval
+
+        self._lock = threading.Lock()
+        self._paths = {}
+        self._tables = {}
+        self._rows = {}
+        self._keys = None
+        self._key_index = None
+        self._ncounts = 0
+        self._last_flush = time.time()
+
+    def __call__(self, dets, x, keys, signals):
+        self.write_data(dets, x, keys, signals)
+
+    def write_data(self, dets, x, keys, signals):
+        with self._lock:
+            idx = self._key_index
+            if keys is not self._keys:
+                idx = {k: i for i, k in enumerate(keys)}
+                # only an immutable key order can be reused
+                if isinstance(keys, tuple):
+                    self._keys, self._key_index = keys, idx
+
+            for det in dets:
+                k = det.name
+                i = idx.get(k)
+                if i is None:
+                    continue
+
+                path = self._get_path(k, det.isotope)
+                try:
+                    rows = self._rows[path]
+                except KeyError:
+                    rows = self._rows[path] = []
+                rows.append((x, signals[i]))
+
+            self._ncounts += 1
+            if (
+                self._ncounts >= self.flush_count
+                or time.time() - self._last_flush >= self.flush_interval
+            ):
+                self._flush()
+
+    def flush(self):
+        """
+        write the buffered rows
+        """
+        with self._lock:
+            self._flush()
+
+    def close(self):
+        """
+        write the buffered rows and release the tables of the closed file
+        """
+        with self._lock:
+            self._flush()
+            self._tables = {}
+
+    def _get_path(self, k, iso):
+        key = (k, iso)
+        try:
+            return self._paths[key]
+        except KeyError:
+            if self.grpname == "baseline":
+                grp = "/{}".format(self.grpname)
+            else:
+                grp = "/{}/{}".format(self.grpname, iso)
+            path = self._paths[key] = (grp, k)
+            return path
+
+    def _flush(self):
+        rows, self._rows = self._rows, {}
+        self._ncounts = 0
+        self._last_flush = time.time()
+
+        for (grp, k), rs in rows.items():
+            try:
+                t = self._tables[(grp, k)]
+            except KeyError:
+                t = self._tables[(grp, k)] = self.data_manager.get_table(k, grp)
+
+            if t is None:
+                continue
+
+            nrow = t.row
+            for x, v in rs:
+                nrow["time"] = x
+                nrow["value"] = v
+                nrow.append()
+            t.flush()
+
+
 class IPersister(Interface):
     def post_extraction_save(self):
         pass
@@ -231,6 +340,11 @@ class AutomatedRunPersister(BasePersister):
     grouping_threshold = Float
     grouping_suffix = Str
 
+    # counts and seconds between writes of the buffered measurement data
+    data_writer_flush_count = Int(50)
+    data_writer_flush_interval = Float(10)
+
+    _data_writer = None
     _db_extraction_id = None
     _temp_analysis_buffer = None
     _current_data_frame = None
@@ -302,50 +416,19 @@ class AutomatedRunPersister(BasePersister):
     def get_data_writer(self, grpname):
         """
         grpname should be a str such as "signal", "baseline",etc
-        return a closure for writing the data
+        return a buffered writer for the data. Rows are written in batches and
+        when the ``writer_ctx`` of the measurement exits
 
         :param grpname: str
-        :return: function
+        :return: BufferedDataWriter
         """
-        tables = {}
-
-        def write_data(dets, x, keys, signals):
-            # todo: test whether saving data to h5 in real time is expansive
-
-            # disable H5 data writer
-            # self.unique_warning('NOT Writing data to H5 in real time')
-            # return
-
-            dm = self.data_manager
-            for det in dets:
-                k = det.name
-                try:
-                    if k in keys:
-                        if grpname == "baseline":
-                            grp = "/{}".format(grpname)
-                        else:
-                            grp = "/{}/{}".format(grpname, det.isotope)
-
-                        tag = "{}/{}".format(grp, k)
-                        if tag in tables:
-                            t = tables["tag"]
-                        else:
-                            t = dm.get_table(k, grp)
-
-                        nrow = t.row
-                        nrow["time"] = x
-                        nrow["value"] = signals[keys.index(k)]
-                        nrow.append()
-                        t.flush()
-                except AttributeError as e:
-                    if det.isotope and grpname and k:
-                        self.debug(
-                            "error: {} group:{} det:{} iso:{}".format(
-                                e, grpname, k, det.isotope
-                            )
-                        )
-
-        return write_data
+        self._data_writer = BufferedDataWriter(
+            self.data_manager,
+            grpname,
+            flush_count=self.data_writer_flush_count,
+            flush_interval=self.data_writer_flush_interval,
+        )
+        return self._data_writer
 
     def build_tables(self, grpname, detectors, n):
         """
@@ -393,8 +476,19 @@ class AutomatedRunPersister(BasePersister):
     def get_last_aliquot(self, identifier):
         return self.datahub.get_greatest_aliquot(identifier)
 
+    @contextmanager
     def writer_ctx(self):
-        return self.data_manager.open_file(self._current_data_frame)
+        """
+        open the data file for a measurement. The rows buffered by the data
+        writer are written before the file is closed, also if the measurement is
+        canceled or raises
+        """
+        with self.data_manager.open_file(self._current_data_frame):
+            try:
+                yield
+            finally:
+                if self._data_writer is not None:
+                    self._data_writer.close()
 
     # def pre_extraction_save(self):
     #     """
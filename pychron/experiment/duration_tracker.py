@@ -13,55 +13,76 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ===============================================================================
+"""
+measured run durations keyed by script hash.
 
+every finished run is appended to a sqlite database (``paths.duration_tracker_db``)
+together with whether it was truncated. The database is opened in WAL mode so
+several pychron instances can read it while one writes. ``load`` only reads the
+rows added since the last load, so updates and refreshes cost O(1) regardless of
+the length of the history.
+
+the duration of a script hash is estimated from a rolling window of its last
+``window`` durations. The text files used by older versions are imported the
+first time the database is created.
+"""
 # ============= standard library imports ========================
 import os
+import sqlite3
+import threading
+import time
+from collections import deque
 
 # ============= enthought library imports =======================
-from traits.api import Dict
+from numpy import array, median, percentile
+from traits.api import Dict, Enum, Int
 
 # ============= local library imports  ==========================
-from pychron.core.helpers.strtools import to_csv_str
 from pychron.loggable import Loggable
 from pychron.paths import paths
 
+SCHEMA_VERSION = 1
 
-def write_txt_file(p, out):
-    with open(p, "w") as wfile:
-        for line in out:
-            wfile.write("{}\n".format(to_csv_str(line)))
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS durations ("
+    "id INTEGER PRIMARY KEY AUTOINCREMENT, script_hash TEXT NOT NULL, "
+    "duration REAL NOT NULL, truncated INTEGER NOT NULL DEFAULT 0, timestamp REAL)",
+    "CREATE INDEX IF NOT EXISTS durations_script_hash ON durations (script_hash, id)",
+    "CREATE TABLE IF NOT EXISTS frequencies ("
+    "script_hash TEXT PRIMARY KEY, total INTEGER NOT NULL, truncated INTEGER NOT NULL)",
+)
 
 
 class AutomatedRunDurationTracker(Loggable):
     _items = Dict
     _frequencies = Dict
 
+    # number of durations per script hash used for the estimate and statistics
+    window = Int(10)
+    estimator = Enum("mean", "median")
+
+    _db = None
+    _last_id = 0
+
     def __init__(self, *args, **kw):
         super(AutomatedRunDurationTracker, self).__init__(*args, **kw)
+        self._lock = threading.Lock()
+        self._windows = {}
+        self._counts = {}
         self.load()
 
     def load(self):
-        items = {}
-        if os.path.isfile(paths.duration_tracker):
-            with open(paths.duration_tracker, "r") as rfile:
-                for line in rfile:
-                    line = line.strip()
-                    if line:
-                        args = line.split(",")
-                        items[args[0]] = float(args[1])
+        """
+        read the durations added since the last load, including those written by
+        other processes
+        """
+        with self._lock:
+            if self._db is None:
+                self._open_db()
 
-        self._items = items
+            changed = self._read()
 
-        # load frequencies
-        freq = {}
-        if os.path.isfile(paths.duration_tracker_frequencies):
-            with open(paths.duration_tracker_frequencies, "r") as rfile:
-                for line in rfile:
-                    if line:
-                        h, total, truncated = line.split(",")
-
-                    freq[h] = float(truncated) / float(total)
-        self._frequencies = freq
+        self._refresh(changed)
 
     def update(self, run, t):
         rh = run.spec.script_hash
@@ -71,65 +92,53 @@ class AutomatedRunDurationTracker(Loggable):
             )
         )
 
-        p = paths.duration_tracker
-
-        out = []
-        exists = False
-
-        if os.path.isfile(p):
-            with open(p, "r") as rfile:
-                for line in rfile:
-                    line = line.strip()
-                    if line:
-                        args = line.split(",")
-
-                        h, ct, ds = args[0], args[1], args[2:]
-                        # update the runs duration by taking running average of last 10
-                        if h == rh:
-                            exists = True
+        ist = int(bool(run.spec.is_truncated()))
+        with self._lock:
+            if self._db is not None:
+                try:
+                    self._insert(rh, t, ist)
+                except sqlite3.Error as e:
+                    self._db_failed(e)
 
-                            ds = list(map(float, ds))
-                            ds.append(t)
-                            ds = ds[-10:]
-                            if len(ds):
-                                args = [h, sum(ds) / len(ds)]
-                                args.extend(ds)
+            if self._db is None:
+                total, truncated = self._counts.get(rh, (0, 0))
+                self._counts[rh] = (total + 1, truncated + ist)
+                self._add(rh, t)
+                changed = {rh}
+            else:
+                changed = self._read()
 
-                        out.append(args)
+        self._refresh(changed)
 
-        if not exists:
-            self.debug("adding {} {} to durations".format(run.spec.runid, rh[:8]))
-            out.append((rh, t))
+    def get_statistics(self, h, percentiles=(10, 50, 90)):
+        """
+        rolling window statistics of the durations of script hash ``h``.
+        the truncation rate uses every run of ``h``
 
-        write_txt_file(p, out)
+        @return: dict or None if ``h`` was never run
+        """
+        ds = self._windows.get(h)
+        if not ds:
+            return
 
-        # update frequencies
-        rh = run.spec.script_hash
-        out = []
-        exists = False
-        p = paths.duration_tracker_frequencies
+        ds = array(ds)
+        total, truncated = self._counts.get(h, (0, 0))
+        return {
+            "n": len(ds),
+            "mean": ds.mean(),
+            "median": median(ds),
+            "min": ds.min(),
+            "max": ds.max(),
+            "percentiles": {p: percentile(ds, p) for p in percentiles},
+            "total": total,
+            "truncation_rate": float(truncated) / total if total else 0,
+        }
 
-        ist = run.spec.is_truncated()
-        if os.path.isfile(p):
-            with open(p, "r") as rfile:
-                for line in rfile:
-                    line = line.strip()
-                    if line:
-                        h, total, truncated = line.split(",")
-                        if h == rh:
-                            exists = True
-                            total = int(total) + 1
-                            if ist:
-                                truncated = int(truncated) + 1
-
-                        out.append((h, total, truncated))
-
-        if not exists:
-            self.debug("adding {} {} to frequencies".format(run.spec.runid, rh[:8]))
-            out.append((rh, 1, 1 if ist else 0))
-
-        write_txt_file(p, out)
-        self.load()
+    def close(self):
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
 
     # def probability_model(self, h, ht):
     #     self.debug('using probability model')
@@ -150,5 +159,160 @@ class AutomatedRunDurationTracker(Loggable):
     def __getitem__(self, k):
         return self._items[k]
 
+    # private
+    def _read(self):
+        """
+        @return: the script hashes with new durations
+        """
+        db = self._db
+        if db is None:
+            return set()
+
+        try:
+            rows = db.execute(
+                "SELECT id, script_hash, duration FROM durations WHERE id>? ORDER BY id",
+                (self._last_id,),
+            ).fetchall()
+            counts = db.execute(
+                "SELECT script_hash, total, truncated FROM frequencies"
+            ).fetchall()
+        except sqlite3.Error as e:
+            self._db_failed(e)
+            return set()
+
+        changed = set()
+        for rid, h, d in rows:
+            self._add(h, d)
+            changed.add(h)
+            self._last_id = rid
+
+        self._counts = {h: (total, truncated) for h, total, truncated in counts}
+        return changed
+
+    def _refresh(self, changed):
+        if changed:
+            items = dict(self._items)
+            for h in changed:
+                items[h] = self._estimate(self._windows[h])
+            self._items = items
+
+        self._frequencies = {
+            h: float(truncated) / total
+            for h, (total, truncated) in self._counts.items()
+            if total
+        }
+
+    def _add(self, h, d):
+        try:
+            w = self._windows[h]
+        except KeyError:
+            w = self._windows[h] = deque(maxlen=self.window)
+        w.append(d)
+
+    def _estimate(self, ds):
+        if self.estimator == "median":
+            return float(median(ds))
+        return sum(ds) / len(ds)
+
+    def _insert(self, h, t, truncated):
+        db = self._db
+        db.execute("BEGIN")
+        try:
+            db.execute(
+                "INSERT INTO durations (script_hash, duration, truncated, timestamp) "
+                "VALUES (?,?,?,?)",
+                (h, t, truncated, time.time()),
+            )
+            db.execute(
+                "INSERT INTO frequencies VALUES (?,1,?) ON CONFLICT(script_hash) "
+                "DO UPDATE SET total=total+1, truncated=truncated+excluded.truncated",
+                (h, truncated),
+            )
+        except sqlite3.Error:
+            db.execute("ROLLBACK")
+            raise
+        db.execute("COMMIT")
+
+    def _open_db(self):
+        p = paths.duration_tracker_db
+        if not p:
+            return
+
+        try:
+            d = os.path.dirname(p)
+            if d and not os.path.isdir(d):
+                os.makedirs(d)
+
+            db = sqlite3.connect(
+                p, check_same_thread=False, isolation_level=None, timeout=10
+            )
+            db.execute("PRAGMA journal_mode=WAL")
+            for s in _SCHEMA:
+                db.execute(s)
+
+            if db.execute("PRAGMA user_version").fetchone()[0] < SCHEMA_VERSION:
+                self._migrate(db)
+        except (sqlite3.Error, OSError) as e:
+            self.warning("failed to open duration tracker {}: {}".format(p, e))
+            return
+
+        self._db = db
+
+    def _migrate(self, db):
+        """
+        import the text files written by older versions. the durations file holds
+        the running average followed by the last (up to 10) durations
+        """
+        durations = []
+        if paths.duration_tracker and os.path.isfile(paths.duration_tracker):
+            with open(paths.duration_tracker, "r") as rfile:
+                for line in rfile:
+                    args = line.strip().split(",")
+                    if len(args) < 2:
+                        continue
+
+                    h, ds = args[0], args[2:] or args[1:2]
+                    durations.extend((h, float(di)) for di in ds)
+
+        frequencies = []
+        p = paths.duration_tracker_frequencies
+        if p and os.path.isfile(p):
+            with open(p, "r") as rfile:
+                for line in rfile:
+                    args = line.strip().split(",")
+                    if len(args) == 3:
+                        frequencies.append((args[0], int(args[1]), int(args[2])))
+
+        db.execute("BEGIN IMMEDIATE")
+        try:
+            # another process may have migrated while this one waited for the lock
+            if db.execute("PRAGMA user_version").fetchone()[0] < SCHEMA_VERSION:
+                if durations or frequencies:
+                    self.info(
+                        "importing {} durations, {} frequencies".format(
+                            len(durations), len(frequencies)
+                        )
+                    )
+                db.executemany(
+                    "INSERT INTO durations (script_hash, duration) VALUES (?,?)",
+                    durations,
+                )
+                db.executemany(
+                    "INSERT OR REPLACE INTO frequencies VALUES (?,?,?)", frequencies
+                )
+                db.execute("PRAGMA user_version={}".format(SCHEMA_VERSION))
+        except sqlite3.Error:
+            db.execute("ROLLBACK")
+            raise
+        db.execute("COMMIT")
+
+    def _db_failed(self, e):
+        self.warning("duration tracker database error, using memory only: {}".format(e))
+        try:
+            self._db.close()
+        except sqlite3.Error:
+            pass
+        self._db = None
+
 
 # ============= EOF =============================================
@@ -618,9 +618,12 @@ class BaseExperimentQueue(RunBlock):
         "automated_runs:[measurement_script,post_measurement_script,post_equilibration_script,"
         "extraction_script,syn_extraction_script,script_options,position,duration,cleanup,"
         "pre_cleanup,post_cleanup,extract_value,extract_units,light_value,beam_diameter,"
-        "ramp_duration,ramp_rate,pattern,delay_after,skip,end_after,state]"
+        "ramp_duration,ramp_rate,pattern,delay_after,skip,end_after,state,"
+        "disable_between_positions,labnumber]"
     )
     def _handle_automated_run_updates(self, obj, name, old, new):
+        if name not in ("skip", "end_after", "state"):
+            self.stats.mark_dirty(obj)
         self.invalidate_stats()
 
     # ===============================================================================
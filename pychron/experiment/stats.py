@@ -18,13 +18,139 @@
 import time
 from datetime import datetime, timedelta
 
-from traits.api import Property, String, Float, Any, Int, List, Instance
+from itertools import accumulate
+
+from traits.api import Property, String, Float, Any, Int, List, Instance, Dict
 
 from pychron.core.helpers.timer import Timer
 from pychron.core.ui.gui import invoke_in_main_thread
 from pychron.experiment.duration_tracker import AutomatedRunDurationTracker
 from pychron.loggable import Loggable
-from pychron.pychron_constants import NULL_STR
+from pychron.pychron_constants import (
+    NULL_STR,
+    DISABLE_BETWEEN_POSITIONS,
+    DURATION,
+    CLEANUP,
+    PRECLEANUP,
+    POSTCLEANUP,
+    RAMP_RATE,
+    PATTERN,
+    RAMP_DURATION,
+)
+
+# run attributes that change the script hash. see AutomatedRunSpec._base_script_hash
+DURATION_ATTRS = (
+    "measurement_script",
+    "extraction_script",
+    "position",
+    DISABLE_BETWEEN_POSITIONS,
+    DURATION,
+    CLEANUP,
+    PRECLEANUP,
+    POSTCLEANUP,
+    RAMP_RATE,
+    PATTERN,
+    RAMP_DURATION,
+)
+
+
+class RunTimeline(object):
+    """
+    per run durations and delays of a run list with prefix sums.
+
+    a row is only recomputed when it is new or was marked dirty, e.g. by the
+    queue when a duration attribute of the run changed, so editing a few runs of
+    a large queue only rehashes those runs. The prefix sums are rebuilt from the
+    first new, moved or dirty run
+    """
+
+    def __init__(self):
+        self.runs = []
+        self._rows = {}
+        self._index = {}
+        self._dirty = set()
+        self._delays = []
+        self._prefix = [0]
+        self._delay_args = None
+
+    def mark_dirty(self, run):
+        """
+        recompute ``run`` on the next update
+        """
+        self._dirty.add(id(run))
+
+    def update(self, runs, get_duration, delay_args):
+        """
+        get_duration: callable(run, script_hash) -> run duration
+        delay_args: delay between, after blank, after air. see get_delay_after
+        """
+        rows = self._rows
+        dirty = self._dirty
+        if runs == self.runs and delay_args == self._delay_args:
+            if not dirty:
+                return
+            first = len(runs)
+        else:
+            # index of the first run inserted, removed or moved
+            end = min(len(runs), len(self.runs))
+            first = next((i for i in range(end) if runs[i] is not self.runs[i]), end)
+            if delay_args != self._delay_args:
+                first = 0
+
+            rows = {id(r): rows[id(r)] for r in runs if id(r) in rows}
+            self._index = {id(r): i for i, r in enumerate(runs)}
+
+        index = self._index
+        first = min([first] + [index[k] for k in dirty if k in index])
+
+        tail = runs[first:]
+        for r in tail:
+            row = rows.get(id(r))
+            if row is None or row[0] is not r or id(r) in dirty:
+                sh = r.script_hash
+                rows[id(r)] = (r, sh, get_duration(r, sh))
+
+        self._rows = rows
+        self._dirty = set()
+        self._delay_args = delay_args
+        self.runs = list(runs)
+
+        # the prefix sums up to ``first`` are still valid
+        delays = [r.get_delay_after(*delay_args) for r in tail]
+        self._delays = self._delays[:first] + delays
+        self._prefix = self._prefix[:first] + list(
+            accumulate(
+                (rows[id(r)][2] + d for r, d in zip(tail, delays)),
+                initial=self._prefix[first],
+            )
+        )
+
+    def discard(self, script_hash):
+        """
+        recompute the runs with ``script_hash`` on the next update
+        """
+        self._dirty.update(k for k, v in self._rows.items() if v[1] == script_hash)
+
+    def clear(self):
+        self._rows = {}
+        self._dirty = set()
+        self._delay_args = None
+
+    def duration(self, n=None, delay_before=0, last_delay=False):
+        """
+        duration of the first ``n`` runs. no delay after the last run, because
+        the experiment doesn't delay after the last analysis, unless
+        ``last_delay`` is True
+        """
+        if n is None:
+            n = len(self.runs)
+        if not n:
+            return 0
+
+        dur = self._prefix[n] + delay_before
+        if not last_delay:
+            dur -= self._delays[n - 1]
+        return dur
 
 
 class ExperimentStats(Loggable):
@@ -37,34 +163,74 @@ class ExperimentStats(Loggable):
     _duration_tracker_loaded = False
     _dirty = True
 
+    # (script hash, duration attributes) -> estimated duration of runs without a
+    # tracked duration
+    _estimated_durations = Dict
+    # queued and executed runs
+    _timeline = Instance(RunTimeline, ())
+    _executed_timeline = Instance(RunTimeline, ())
+
     def update_run_duration(self, run, t):
         a = self.duration_tracker
         a.update(run, t)
+        for timeline in (self._timeline, self._executed_timeline):
+            timeline.discard(run.spec.script_hash)
         self._dirty = True
 
     def invalidate(self):
         self._dirty = True
 
+    def mark_dirty(self, run):
+        """
+        recompute the duration and the delay of ``run`` e.g. after it was edited
+        """
+        for timeline in (self._timeline, self._executed_timeline):
+            timeline.mark_dirty(run)
+        self._dirty = True
+
+    def reset_cache(self):
+        """
+        forget the estimated durations e.g. after the scripts were edited
+        """
+        self._estimated_durations = {}
+        for timeline in (self._timeline, self._executed_timeline):
+            timeline.clear()
+        self._dirty = True
+
     def load_duration_tracker(self):
         if not self._duration_tracker_loaded:
             self.duration_tracker.load()
             self._duration_tracker_loaded = True
 
-    def calculate_duration(self, runs=None):
+    def calculate_duration(self, runs=None, n=None):
+        """
+        duration of ``runs`` or of the first ``n`` of them
+        """
         self.load_duration_tracker()
-        dur = self._calculate_duration(runs)
+        dur = self._calculate_duration(runs, n)
         return dur
 
-        # self._total_time = dur
-        # return self._total_time
+    def calculate_start(self, executed, runs, n):
+        """
+        duration of the ``executed`` runs and the first ``n`` of ``runs``. The two
+        lists have separate timelines so neither is rebuilt when the other changes
+        """
+        self.load_duration_tracker()
+        dur = 0
+        if executed:
+            timeline = self._executed_timeline
+            self._update_timeline(timeline, executed)
+            if not n:
+                return timeline.duration(delay_before=self.delay_before_analyses)
+            dur = timeline.duration(last_delay=True)
+
+        return dur + self._calculate_duration(runs, n)
 
     def get_run_duration(self, run, as_str=False):
         sh = run.script_hash
         if sh in self.duration_tracker:
             self.debug("using duration tracker value")
-            rd = self.duration_tracker[sh]
-        else:
-            rd = run.get_estimated_duration(force=True)
+        rd = self._get_duration(run, sh)
         rd = round(rd)
         if as_str:
             rd = str(timedelta(seconds=rd))
@@ -73,38 +239,42 @@ class ExperimentStats(Loggable):
         return rd
 
     # private
-    def _calculate_duration(self, runs):
+    def _get_duration(self, run, sh, script_ctx=None, warned=None):
+        if sh in self.duration_tracker:
+            return self.duration_tracker[sh]
+
+        key = (sh, tuple(getattr(run, a) for a in DURATION_ATTRS))
+        try:
+            return self._estimated_durations[key]
+        except KeyError:
+            d = run.get_estimated_duration(script_ctx, warned, True)
+            self._estimated_durations[key] = d
+            return d
+
+    def _update_timeline(self, timeline, runs):
+        script_ctx = dict()
+        warned = []
+        timeline.update(
+            runs,
+            lambda r, sh: self._get_duration(r, sh, script_ctx, warned),
+            (
+                self.delay_between_analyses,
+                self.delay_after_blank,
+                self.delay_after_air,
+            ),
+        )
+
+    def _calculate_duration(self, runs, n=None):
         dur = 0
         if runs:
-            script_ctx = dict()
-            warned = []
-            ni = len(runs)
-
-            btw = 0
-            run_dur = 0
-            d = 0
-            for a in runs:
-                sh = a.script_hash
-
-                if sh in self.duration_tracker:
-                    run_dur += self.duration_tracker[sh]
-                else:
-                    run_dur += a.get_estimated_duration(script_ctx, warned, True)
-                d = a.get_delay_after(
-                    self.delay_between_analyses,
-                    self.delay_after_blank,
-                    self.delay_after_air,
-                )
-                btw += d
-
-            # subtract the last delay_after because experiment doesn't delay after last analysis
-            btw -= d
+            timeline = self._timeline
+            self._update_timeline(timeline, runs)
+            if n is None:
+                n = len(runs)
 
-            dur = run_dur + self.delay_before_analyses + btw
+            dur = timeline.duration(n, self.delay_before_analyses)
             self.debug(
-                "nruns={} before={}, run_dur={}, btw={}".format(
-                    ni, self.delay_before_analyses, run_dur, btw
-                )
+                "nruns={} before={}, dur={}".format(n, self.delay_before_analyses, dur)
             )
 
         return dur
@@ -198,6 +368,8 @@ class StatsGroup(Loggable):
             self._timer.stop()
 
     def reset(self):
+        for ei in self.experiment_queues:
+            ei.stats.reset_cache()
         self.calculate(force=True)
 
         self._post = None
@@ -322,8 +494,8 @@ class StatsGroup(Loggable):
                 si = ei.cleaned_automated_runs.index(sel)
 
                 st += (
-                    stats.calculate_duration(
-                        ei.executed_runs + ei.cleaned_automated_runs[:si]
+                    stats.calculate_start(
+                        ei.executed_runs, ei.cleaned_automated_runs, si
                     )
                     + ei.delay_between_analyses
                 )
@@ -110,6 +110,7 @@ class ExperimentPreferences(BasePreferencesHelper):
     save_all_runs = Bool
 
     use_data_collection_branch = Bool(False)
+    use_raw_data_sidecar = Bool(False)
 
     def _get_memory_threshold(self):
         return self._memory_threshold
@@ -283,6 +284,12 @@ class ExperimentPreferencesPane(PreferencesPane):
             Item("use_db_persistence", label="Save analyses to Database"),
             Item("use_uuid_path_name", label="Use UUID Path Names"),
             Item("use_data_collection_branch", label="Use data_collection branch"),
+            Item(
+                "use_raw_data_sidecar",
+                label="Write raw data sidecar",
+                tooltip="Write a binary copy of the raw data next to the .data json file "
+                "for faster loading. The sidecar is never committed",
+            ),
             Item(
                 "save_all_runs",
                 label="Save All analyses",
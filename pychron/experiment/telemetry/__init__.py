@@ -2,20 +2,23 @@
 
 This package provides machine-readable observability for experiment execution,
 hardware I/O, persistence, and monitor/interlock activity. Telemetry is emitted
-as JSON Lines and can be replayed for deterministic incident analysis.
+as JSON Lines, or as a compressed chunked binary log indexed by run and time,
+and can be replayed for deterministic incident analysis.
 
 Key exports:
   - TelemetryEvent: Core event schema
-  - TelemetryRecorder: JSONL writer with buffering
+  - TelemetryRecorder: JSONL or binary writer with buffering
   - TelemetryContext: Thread-local correlation ID propagation
   - Span: Context manager for timed operations
   - TelemetryLevel: Event severity levels
   - EventType: Enumeration of event types
   - StateMachineListener: Callback for state machine transitions
-  - load_telemetry_log: Load events from JSONL file
+  - load_telemetry_log: Stream events from a JSONL or binary file
+  - convert_telemetry_log: Convert a log between the JSONL and binary formats
   - replay_queue_telemetry: Generate incident report from telemetry log
 """
 
+from .binlog import convert_telemetry_log
 from .event import EventType, TelemetryEvent, TelemetryLevel
 from .context import TelemetryContext
 from .recorder import TelemetryRecorder
@@ -33,6 +36,7 @@ __all__ = [
     "set_global_recorder",
     "StateMachineListener",
     "load_telemetry_log",
+    "convert_telemetry_log",
     "replay_queue_telemetry",
     "ReplayReport",
 ]
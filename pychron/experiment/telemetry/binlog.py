@@ -0,0 +1,250 @@
+"""Chunked, compressed binary telemetry log format.
+
+A binary log (``.tlog``) starts with ``MAGIC`` followed by chunks. Each chunk is
+written by one recorder flush and holds:
+
+  - a fixed header: event count, index and payload sizes, min and max timestamp
+  - an index: JSON list of the run IDs in the chunk
+  - a payload: zlib compressed JSON object mapping each TelemetryEvent field to
+    the column of its values
+
+Readers scan the chunk headers and indexes without decompressing anything, then
+only decompress the chunks that can hold a requested run or time window. Chunks
+are self-contained, so the log can be appended to by later flushes. A chunk
+truncated by a crash is ignored by readers and cut off by the next append.
+"""
+
+import json
+import struct
+import zlib
+from dataclasses import dataclass, fields
+from pathlib import Path
+from typing import BinaryIO, FrozenSet, Iterator, List, Optional, Sequence
+
+from .event import TelemetryEvent
+
+MAGIC = b"PYTLOG01"
+BINARY_SUFFIX = ".tlog"
+
+# nevents, index size, payload size, ts_min, ts_max
+_HEADER = struct.Struct("<IIIdd")
+
+_FIELDS = [f.name for f in fields(TelemetryEvent)]
+
+
+@dataclass(frozen=True)
+class ChunkInfo:
+    """Index entry of one chunk.
+
+    Attributes:
+        offset: File offset of the compressed payload
+        size: Size of the compressed payload in bytes
+        count: Number of events
+        ts_min: Earliest event timestamp
+        ts_max: Latest event timestamp
+        run_ids: Run IDs of the events
+    """
+
+    offset: int
+    size: int
+    count: int
+    ts_min: float
+    ts_max: float
+    run_ids: FrozenSet[str]
+
+    def matches(
+        self,
+        run_id: Optional[str] = None,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+    ) -> bool:
+        """Whether the chunk can contain events of ``run_id`` between ``start`` and ``end``."""
+        if run_id is not None and run_id not in self.run_ids:
+            return False
+        if start is not None and self.ts_max < start:
+            return False
+        if end is not None and self.ts_min > end:
+            return False
+        return True
+
+
+def is_binary_log(path: Path) -> bool:
+    """Whether ``path`` is a binary telemetry log."""
+    with open(path, "rb") as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+def event_matches(
+    event: TelemetryEvent,
+    run_id: Optional[str] = None,
+    start: Optional[float] = None,
+    end: Optional[float] = None,
+) -> bool:
+    """Whether ``event`` belongs to ``run_id`` and lies between ``start`` and ``end``."""
+    if run_id is not None and event.run_id != run_id:
+        return False
+    if start is not None and event.ts < start:
+        return False
+    if end is not None and event.ts > end:
+        return False
+    return True
+
+
+def write_chunk(f: BinaryIO, events: Sequence[TelemetryEvent]) -> None:
+    """Append ``events`` as one chunk to a file opened in binary append mode.
+
+    The magic header is written first if the file is empty.
+
+    Args:
+        f: File object positioned at the end of the log
+        events: Events to write
+    """
+    if not events:
+        return
+
+    dicts = [e.to_dict() for e in events]
+    columns = {name: [d[name] for d in dicts] for name in _FIELDS}
+    payload = zlib.compress(json.dumps(columns, default=str).encode("utf-8"))
+
+    run_ids = sorted({e.run_id for e in events if e.run_id is not None})
+    index = json.dumps(run_ids).encode("utf-8")
+
+    ts = columns["ts"]
+    header = _HEADER.pack(len(events), len(index), len(payload), min(ts), max(ts))
+    if f.tell() == 0:
+        f.write(MAGIC)
+    f.write(header + index + payload)
+
+
+def append_chunk(path: Path, events: Sequence[TelemetryEvent]) -> None:
+    """Append ``events`` as one chunk to the binary log at ``path``.
+
+    Anything after the last complete chunk, i.e. a chunk cut short by an
+    interrupted write, is truncated first so the new chunk stays readable.
+
+    Args:
+        path: Path to the binary log; created if missing
+        events: Events to write
+
+    Raises:
+        ValueError: If ``path`` exists and is not a binary telemetry log
+    """
+    if not events:
+        return
+
+    path = Path(path)
+    end = 0
+    if path.exists() and path.stat().st_size >= len(MAGIC):
+        chunks = read_index(path)
+        end = chunks[-1].offset + chunks[-1].size if chunks else len(MAGIC)
+
+    with open(path, "r+b" if path.exists() else "wb") as f:
+        f.truncate(end)
+        f.seek(end)
+        write_chunk(f, events)
+
+
+def read_index(path: Path) -> List[ChunkInfo]:
+    """Read the chunk index of a binary log without decompressing any events.
+
+    Args:
+        path: Path to the binary log
+
+    Returns:
+        ChunkInfo of every complete chunk, in file order
+
+    Raises:
+        ValueError: If the file is not a binary telemetry log
+    """
+    chunks = []
+    with open(path, "rb") as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"Not a binary telemetry log: {path}")
+
+        f.seek(0, 2)
+        file_size = f.tell()
+        offset = len(MAGIC)
+        while offset + _HEADER.size <= file_size:
+            f.seek(offset)
+            count, index_size, size, ts_min, ts_max = _HEADER.unpack(f.read(_HEADER.size))
+            payload_offset = offset + _HEADER.size + index_size
+            if payload_offset + size > file_size:
+                # chunk truncated by an interrupted write
+                break
+
+            run_ids = frozenset(json.loads(f.read(index_size).decode("utf-8")))
+            chunks.append(ChunkInfo(payload_offset, size, count, ts_min, ts_max, run_ids))
+            offset = payload_offset + size
+
+    return chunks
+
+
+def iter_binary_log(
+    path: Path,
+    run_id: Optional[str] = None,
+    start: Optional[float] = None,
+    end: Optional[float] = None,
+) -> Iterator[TelemetryEvent]:
+    """Stream the events of a binary log, one chunk at a time.
+
+    Only chunks whose index matches ``run_id`` and overlaps ``start``-``end`` are
+    read and decompressed.
+
+    Args:
+        path: Path to the binary log
+        run_id: Only yield events of this run
+        start: Only yield events at or after this unix timestamp
+        end: Only yield events at or before this unix timestamp
+
+    Yields:
+        TelemetryEvent objects in file order
+    """
+    chunks = [c for c in read_index(path) if c.matches(run_id, start, end)]
+    with open(path, "rb") as f:
+        for chunk in chunks:
+            f.seek(chunk.offset)
+            columns = json.loads(zlib.decompress(f.read(chunk.size)).decode("utf-8"))
+            names = list(columns)
+            for values in zip(*(columns[n] for n in names)):
+                event = TelemetryEvent(**dict(zip(names, values)))
+                if event_matches(event, run_id, start, end):
+                    yield event
+
+
+def convert_telemetry_log(src: Path, dst: Path, chunk_size: int = 1000) -> int:
+    """Convert a telemetry log between the JSONL and binary formats.
+
+    The format of ``src`` is detected from its content and the format of ``dst``
+    from its suffix (``BINARY_SUFFIX`` for binary, anything else for JSONL).
+
+    Args:
+        src: Log to read
+        dst: Log to write; it is overwritten
+        chunk_size: Events per chunk of a binary ``dst``
+
+    Returns:
+        Number of events converted
+    """
+    from .replay import load_telemetry_log
+
+    dst = Path(dst)
+    dst.parent.mkdir(parents=True, exist_ok=True)
+
+    n = 0
+    if dst.suffix == BINARY_SUFFIX:
+        with open(dst, "wb") as f:
+            chunk = []
+            for event in load_telemetry_log(src):
+                chunk.append(event)
+                if len(chunk) >= chunk_size:
+                    write_chunk(f, chunk)
+                    n += len(chunk)
+                    chunk = []
+            write_chunk(f, chunk)
+            n += len(chunk)
+    else:
+        with open(dst, "w") as f:
+            for event in load_telemetry_log(src):
+                f.write(json.dumps(event.to_dict(), default=str) + "\n")
+                n += 1
+    return n
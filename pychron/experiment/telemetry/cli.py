@@ -8,6 +8,9 @@ inspect  -- Pretty-print events from a JSONL telemetry file.
 timeline -- Render an ASCII span timeline for a JSONL file.
 stats    -- Print aggregate metrics (counts, durations, failure rates).
 replay   -- Reconstruct and display the incident report for a JSONL file.
+convert  -- Convert a log between the JSONL and the binary (.tlog) formats.
+
+Every subcommand reads both JSONL and binary logs.
 """
 
 from __future__ import annotations
@@ -20,6 +23,11 @@ from typing import Optional
 
 import typer
 
+from pychron.experiment.telemetry.binlog import (
+    BINARY_SUFFIX,
+    convert_telemetry_log,
+    read_index,
+)
 from pychron.experiment.telemetry.event import TelemetryEvent
 from pychron.experiment.telemetry.replay import (
     load_telemetry_log,
@@ -147,7 +155,7 @@ def inspect(
         pychron-telemetry inspect run.jsonl --run sample-001-00-00 -n 20
     """
     try:
-        events = list(load_telemetry_log(log_file))
+        events = list(load_telemetry_log(log_file, run_id=run_id or None))
     except FileNotFoundError as exc:
         typer.echo(f"Error: {exc}", err=True)
         raise typer.Exit(1)
@@ -157,8 +165,6 @@ def inspect(
         events = [e for e in events if e.event_type == event_type]
     if component:
         events = [e for e in events if (e.component or "") == component]
-    if run_id:
-        events = [e for e in events if e.run_id == run_id]
     if limit is not None:
         events = events[:limit]
 
@@ -251,14 +257,11 @@ def timeline(
         pychron-telemetry timeline run.jsonl --width 100
     """
     try:
-        events = list(load_telemetry_log(log_file))
+        events = list(load_telemetry_log(log_file, run_id=run_id or None))
     except FileNotFoundError as exc:
         typer.echo(f"Error: {exc}", err=True)
         raise typer.Exit(1)
 
-    if run_id:
-        events = [e for e in events if e.run_id == run_id]
-
     spans, ordered = _build_span_tree(events)
 
     if not spans:
@@ -581,6 +584,50 @@ def replay(
         typer.echo(text)
 
 
+# ---------------------------------------------------------------------------
+# convert
+# ---------------------------------------------------------------------------
+
+
+@app.command()
+def convert(
+    log_file: Path = typer.Argument(..., help="Path to JSONL or binary telemetry log file."),
+    output: Path = typer.Argument(
+        ..., help=f"Output file. Binary if it ends with {BINARY_SUFFIX}, JSONL otherwise."
+    ),
+    chunk_size: int = typer.Option(
+        1000, "--chunk-size", "-s", min=1, help="Events per chunk of a binary output."
+    ),
+) -> None:
+    """Convert a telemetry log between the JSONL and binary formats.
+
+    Binary logs are compressed in chunks indexed by run ID and time, so
+    inspect, timeline and replay only decompress the chunks they need.
+
+    Examples::
+
+        pychron-telemetry convert queue_exp001_20260101_120000.jsonl queue_exp001.tlog
+        pychron-telemetry convert queue_exp001.tlog queue_exp001.jsonl
+    """
+    if output.resolve() == log_file.resolve():
+        typer.echo("Error: output must differ from the input log", err=True)
+        raise typer.Exit(1)
+
+    try:
+        n = convert_telemetry_log(log_file, output, chunk_size=chunk_size)
+    except FileNotFoundError as exc:
+        typer.echo(f"Error: {exc}", err=True)
+        raise typer.Exit(1)
+
+    src_size = log_file.stat().st_size
+    dst_size = output.stat().st_size
+    typer.echo(
+        f"Converted {n} event(s): {log_file} ({src_size} bytes) -> {output} ({dst_size} bytes)"
+    )
+    if output.suffix == BINARY_SUFFIX:
+        typer.echo(f"{len(read_index(output)) if n else 0} chunk(s) written.")
+
+
 # ---------------------------------------------------------------------------
 # Entry point
 # ---------------------------------------------------------------------------
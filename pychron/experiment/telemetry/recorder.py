@@ -1,4 +1,4 @@
-"""JSONL-based telemetry recorder with buffering."""
+"""JSONL and binary telemetry recorder with buffering."""
 
 import json
 import threading
@@ -7,6 +7,7 @@ from pathlib import Path
 from typing import Optional
 import os
 
+from .binlog import BINARY_SUFFIX, append_chunk
 from .event import TelemetryEvent
 from .context import TelemetryContext
 
@@ -16,6 +17,9 @@ class TelemetryRecorder:
 
     Buffers events in memory and writes them in batches to reduce I/O overhead.
     Automatically creates log directory if it doesn't exist.
+
+    If ``log_path`` has the binary suffix (``.tlog``) every flush is written as one
+    compressed, indexed chunk (see ``binlog``) instead of JSON lines.
     """
 
     def __init__(
@@ -27,13 +31,14 @@ class TelemetryRecorder:
         """Initialize recorder.
 
         Args:
-            log_path: Path to JSONL file to write
+            log_path: Path to JSONL or binary (.tlog) file to write
             max_buffer_size: Number of events to buffer before flushing
             auto_flush_interval: If set, flush periodically (not implemented yet)
         """
         self.log_path = Path(log_path)
         self.max_buffer_size = max_buffer_size
         self.auto_flush_interval = auto_flush_interval
+        self.binary = self.log_path.suffix == BINARY_SUFFIX
 
         # Ensure directory exists
         self.log_path.parent.mkdir(parents=True, exist_ok=True)
@@ -68,12 +73,15 @@ class TelemetryRecorder:
             return
 
         try:
-            with open(self.log_path, "a") as f:
-                for event in self._buffer:
-                    json_str = json.dumps(event.to_dict(), default=str)
-                    f.write(json_str + "\n")
+            if self.binary:
+                append_chunk(self.log_path, self._buffer)
+            else:
+                with open(self.log_path, "a") as f:
+                    for event in self._buffer:
+                        json_str = json.dumps(event.to_dict(), default=str)
+                        f.write(json_str + "\n")
             self._buffer.clear()
-        except IOError as e:
+        except (IOError, ValueError) as e:
             print(f"Error writing telemetry to {self.log_path}: {e}")
 
     def close(self) -> None:
@@ -93,17 +101,22 @@ class TelemetryRecorder:
 
     @classmethod
     def for_queue(
-        cls, queue_id: str, log_root: Optional[Path] = None, timestamp: Optional[datetime] = None
+        cls,
+        queue_id: str,
+        log_root: Optional[Path] = None,
+        timestamp: Optional[datetime] = None,
+        binary: bool = False,
     ) -> "TelemetryRecorder":
         """Factory method to create recorder for a queue execution.
 
         Creates a log file in {log_root}/telemetry/ with name:
-            queue_{queue_id}_{timestamp}.jsonl
+            queue_{queue_id}_{timestamp}.jsonl (or .tlog if binary)
 
         Args:
             queue_id: Experiment/queue name (e.g., "experiment_001")
             log_root: Root directory for logs (defaults to ~/.pychron.APP_ID/logs/)
             timestamp: Timestamp for filename (defaults to now)
+            binary: Write the chunked binary format
 
         Returns:
             TelemetryRecorder instance
@@ -125,7 +138,8 @@ class TelemetryRecorder:
 
         # Format timestamp for filename
         ts_str = timestamp.strftime("%Y%m%d_%H%M%S")
-        filename = f"queue_{queue_id}_{ts_str}.jsonl"
+        suffix = BINARY_SUFFIX if binary else ".jsonl"
+        filename = f"queue_{queue_id}_{ts_str}{suffix}"
         log_path = telemetry_dir / filename
 
         return cls(log_path)
@@ -137,17 +151,19 @@ class TelemetryRecorder:
         queue_id: str,
         log_root: Optional[Path] = None,
         timestamp: Optional[datetime] = None,
+        binary: bool = False,
     ) -> "TelemetryRecorder":
         """Factory method to create recorder for a single run.
 
         Creates a log file in {log_root}/telemetry/ with name:
-            run_{run_id}_{timestamp}.jsonl
+            run_{run_id}_{timestamp}.jsonl (or .tlog if binary)
 
         Args:
             run_id: Run ID
             queue_id: Parent queue ID
             log_root: Root directory for logs (defaults to ~/.pychron.APP_ID/logs/)
             timestamp: Timestamp for filename (defaults to now)
+            binary: Write the chunked binary format
 
         Returns:
             TelemetryRecorder instance
@@ -166,7 +182,8 @@ class TelemetryRecorder:
         telemetry_dir.mkdir(parents=True, exist_ok=True)
 
         ts_str = timestamp.strftime("%Y%m%d_%H%M%S")
-        filename = f"run_{run_id}_{ts_str}.jsonl"
+        suffix = BINARY_SUFFIX if binary else ".jsonl"
+        filename = f"run_{run_id}_{ts_str}{suffix}"
         log_path = telemetry_dir / filename
 
         return cls(log_path)
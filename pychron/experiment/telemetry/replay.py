@@ -6,6 +6,7 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Iterable, Dict, List, Any, Optional
 
+from .binlog import event_matches, is_binary_log, iter_binary_log
 from .event import TelemetryEvent, EventType
 
 
@@ -77,14 +78,25 @@ class ReplayReport:
     summary: str = ""
 
 
-def load_telemetry_log(path: Path) -> Iterable[TelemetryEvent]:
-    """Load telemetry events from a JSONL file.
+def load_telemetry_log(
+    path: Path,
+    run_id: Optional[str] = None,
+    start: Optional[float] = None,
+    end: Optional[float] = None,
+) -> Iterable[TelemetryEvent]:
+    """Load telemetry events from a JSONL or binary log file.
+
+    Events are streamed lazily. For binary logs only the chunks indexed as
+    containing ``run_id`` or overlapping ``start``-``end`` are decompressed.
 
     Args:
-        path: Path to JSONL telemetry file
+        path: Path to JSONL or binary telemetry file
+        run_id: Only yield events of this run
+        start: Only yield events at or after this unix timestamp
+        end: Only yield events at or before this unix timestamp
 
     Yields:
-        TelemetryEvent objects parsed from JSON lines
+        TelemetryEvent objects in file order
 
     Raises:
         FileNotFoundError: If file does not exist
@@ -94,6 +106,10 @@ def load_telemetry_log(path: Path) -> Iterable[TelemetryEvent]:
     if not path.exists():
         raise FileNotFoundError(f"Telemetry log not found: {path}")
 
+    if is_binary_log(path):
+        yield from iter_binary_log(path, run_id, start, end)
+        return
+
     with open(path, "r") as f:
         for line_num, line in enumerate(f, 1):
             line = line.strip()
@@ -102,39 +118,48 @@ def load_telemetry_log(path: Path) -> Iterable[TelemetryEvent]:
 
             try:
                 data = json.loads(line)
-                yield TelemetryEvent(**data)
             except json.JSONDecodeError as e:
                 raise json.JSONDecodeError(
                     f"Invalid JSON at line {line_num}: {str(e)}", doc=line, pos=e.pos
                 )
 
+            event = TelemetryEvent(**data)
+            if event_matches(event, run_id, start, end):
+                yield event
+
 
-def replay_queue_telemetry(path: Path) -> ReplayReport:
+def replay_queue_telemetry(
+    path: Path,
+    run_id: Optional[str] = None,
+    start: Optional[float] = None,
+    end: Optional[float] = None,
+) -> ReplayReport:
     """Generate incident report from queue telemetry log.
 
     Reconstructs the execution timeline, state machine history, device commands,
-    and monitor decisions from a telemetry JSONL file.
+    and monitor decisions from a JSONL or binary telemetry file. Events are
+    processed as they are streamed from the log.
 
     Args:
-        path: Path to queue-level telemetry JSONL file
+        path: Path to queue-level telemetry file
+        run_id: Only replay the events of this run
+        start: Only replay events at or after this unix timestamp
+        end: Only replay events at or before this unix timestamp
 
     Returns:
         ReplayReport with reconstructed timeline and state history
     """
-    events = list(load_telemetry_log(path))
-
-    if not events:
-        raise ValueError(f"No events in telemetry log: {path}")
-
-    # Initialize report from first event
-    first_event = events[0]
-    report = ReplayReport(
-        queue_id=first_event.queue_id or "unknown",
-        trace_id=first_event.trace_id or "unknown",
-    )
+    report = None
 
     # Process all events
-    for event in events:
+    for event in load_telemetry_log(path, run_id, start, end):
+        if report is None:
+            # Initialize report from first event
+            report = ReplayReport(
+                queue_id=event.queue_id or "unknown",
+                trace_id=event.trace_id or "unknown",
+            )
+
         # Build timeline
         if event.event_type in ("span_start", "span_end", "state_transition", "command"):
             timeline_event = TimelineEvent(
@@ -204,6 +229,9 @@ def replay_queue_telemetry(path: Path) -> ReplayReport:
                 }
             )
 
+    if report is None:
+        raise ValueError(f"No events in telemetry log: {path}")
+
     # Generate summary
     report.summary = _generate_incident_summary(report)
 
@@ -241,16 +269,16 @@ def _generate_incident_summary(report: ReplayReport) -> str:
     return "\n".join(lines)
 
 
-def replay_run_telemetry(path: Path) -> ReplayReport:
+def replay_run_telemetry(path: Path, run_id: Optional[str] = None) -> ReplayReport:
     """Generate incident report from run-level telemetry log.
 
     Similar to replay_queue_telemetry but for a single run.
 
     Args:
-        path: Path to run-level telemetry JSONL file
+        path: Path to run-level telemetry file
+        run_id: Replay only this run of a queue-level log
 
     Returns:
         ReplayReport with reconstructed run timeline
     """
-    # For now, same as queue replay
-    return replay_queue_telemetry(path)
+    return replay_queue_telemetry(path, run_id=run_id)
@@ -0,0 +1,171 @@
+"""Tests for the chunked binary telemetry log format."""
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from pychron.experiment.telemetry import binlog
+from pychron.experiment.telemetry.binlog import (
+    convert_telemetry_log,
+    is_binary_log,
+    read_index,
+)
+from pychron.experiment.telemetry.event import TelemetryEvent
+from pychron.experiment.telemetry.recorder import TelemetryRecorder
+from pychron.experiment.telemetry.replay import load_telemetry_log, replay_queue_telemetry
+
+
+def _make_events(nruns=5, per_run=40, t0=1000.0):
+    """Events of ``nruns`` consecutive runs, one second apart."""
+    events = []
+    for r in range(nruns):
+        for i in range(per_run):
+            events.append(
+                TelemetryEvent(
+                    event_type="span_end" if i % 2 else "device_io",
+                    ts=t0 + r * per_run + i,
+                    level="info",
+                    queue_id="queue_a",
+                    trace_id="trace_a",
+                    run_id=f"run-{r:03d}",
+                    component="spectrometer",
+                    action="read",
+                    duration_ms=1.5 * i,
+                    success=i % 7 != 0,
+                    payload={"i": i, "values": [r, i]},
+                )
+            )
+    return events
+
+
+class TestBinaryTelemetryLog(unittest.TestCase):
+    """Test writing, indexing and reading binary telemetry logs."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.temp_path = Path(self.temp_dir.name)
+        self.events = _make_events()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _record(self, name="queue.tlog", buffer_size=20):
+        path = self.temp_path / name
+        with TelemetryRecorder(path, max_buffer_size=buffer_size) as recorder:
+            for event in self.events:
+                recorder.record_event(event)
+        return path
+
+    def test_recorder_round_trip(self):
+        """Test the recorder writes one chunk per flush and events round trip."""
+        path = self._record()
+        self.assertTrue(is_binary_log(path))
+
+        index = read_index(path)
+        self.assertEqual(len(index), 10)
+        self.assertEqual(sum(c.count for c in index), len(self.events))
+        self.assertEqual(list(load_telemetry_log(path)), self.events)
+
+    def test_smaller_than_jsonl(self):
+        """Test the binary log is smaller than the JSONL log."""
+        path = self._record()
+        jsonl = self._record("queue.jsonl")
+        self.assertFalse(is_binary_log(jsonl))
+        self.assertLess(path.stat().st_size, jsonl.stat().st_size / 3)
+
+    def test_seek_to_run(self):
+        """Test only the chunks of the requested run are decompressed."""
+        path = self._record()
+        expected = [e for e in self.events if e.run_id == "run-002"]
+
+        with mock.patch.object(
+            binlog.zlib, "decompress", wraps=binlog.zlib.decompress
+        ) as decompress:
+            events = list(load_telemetry_log(path, run_id="run-002"))
+
+        self.assertEqual(events, expected)
+        self.assertEqual(decompress.call_count, 2)
+
+    def test_time_window(self):
+        """Test streaming a time window from binary and JSONL logs."""
+        path = self._record()
+        jsonl = self._record("queue.jsonl")
+        start, end = 1050.0, 1085.0
+        expected = [e for e in self.events if start <= e.ts <= end]
+
+        self.assertEqual(list(load_telemetry_log(path, start=start, end=end)), expected)
+        self.assertEqual(list(load_telemetry_log(jsonl, start=start, end=end)), expected)
+        self.assertEqual(list(load_telemetry_log(path, start=5000.0)), [])
+
+    def test_truncated_chunk_ignored(self):
+        """Test a chunk cut short by an interrupted write is skipped."""
+        path = self._record()
+        data = path.read_bytes()
+        path.write_bytes(data[:-10])
+
+        self.assertEqual(len(read_index(path)), 9)
+        self.assertEqual(list(load_telemetry_log(path)), self.events[:180])
+
+    def test_append(self):
+        """Test a second recorder appends chunks to an existing log."""
+        path = self._record(buffer_size=100)
+        with TelemetryRecorder(path) as recorder:
+            recorder.record_event(self.events[0])
+
+        self.assertEqual(len(read_index(path)), 3)
+        self.assertEqual(list(load_telemetry_log(path)), self.events + self.events[:1])
+
+    def test_append_after_truncated_chunk(self):
+        """Test appending after an interrupted write drops the partial chunk."""
+        path = self._record()
+        data = path.read_bytes()
+        path.write_bytes(data[:-10])
+
+        with TelemetryRecorder(path) as recorder:
+            recorder.record_event(self.events[0])
+
+        self.assertEqual(len(read_index(path)), 10)
+        self.assertEqual(list(load_telemetry_log(path)), self.events[:180] + self.events[:1])
+
+    def test_append_after_truncated_magic(self):
+        """Test a log cut short inside the magic header is rewritten."""
+        path = self.temp_path / "queue.tlog"
+        path.write_bytes(binlog.MAGIC[:3])
+
+        binlog.append_chunk(path, self.events[:5])
+        self.assertEqual(list(load_telemetry_log(path)), self.events[:5])
+
+    def test_convert(self):
+        """Test converting JSONL to binary and back."""
+        jsonl = self._record("queue.jsonl")
+        path = self.temp_path / "converted.tlog"
+        self.assertEqual(convert_telemetry_log(jsonl, path, chunk_size=64), 200)
+        self.assertEqual([c.count for c in read_index(path)], [64, 64, 64, 8])
+
+        back = self.temp_path / "back.jsonl"
+        self.assertEqual(convert_telemetry_log(path, back), 200)
+        with open(back) as f:
+            self.assertEqual([json.loads(line) for line in f], [e.to_dict() for e in self.events])
+
+    def test_replay_run(self):
+        """Test replaying one run of a binary log."""
+        path = self._record()
+        report = replay_queue_telemetry(path, run_id="run-004")
+        self.assertEqual(report.queue_id, "queue_a")
+        self.assertEqual(len(report.timeline), 20)
+        self.assertEqual(len(report.device_commands), 20)
+
+        with self.assertRaises(ValueError):
+            replay_queue_telemetry(path, run_id="missing")
+
+    def test_for_queue_binary(self):
+        """Test the factory creates a binary log."""
+        recorder = TelemetryRecorder.for_queue("exp", log_root=self.temp_path, binary=True)
+        self.assertTrue(recorder.binary)
+        self.assertEqual(recorder.log_path.suffix, ".tlog")
+
+
+if __name__ == "__main__":
+    unittest.main()
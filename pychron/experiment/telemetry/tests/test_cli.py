@@ -353,6 +353,52 @@ class TestReplayCommand(unittest.TestCase):
         self.assertNotEqual(result.exit_code, 0)
 
 
+# ---------------------------------------------------------------------------
+# convert
+# ---------------------------------------------------------------------------
+
+
+class TestConvertCommand(unittest.TestCase):
+    """Tests for the convert subcommand."""
+
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.temp_path = Path(self.temp_dir.name)
+        self.log_file = self.temp_path / "test.jsonl"
+        _write_log(self.log_file, _make_session_events())
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def test_convert_to_binary(self) -> None:
+        out = self.temp_path / "test.tlog"
+        result = runner.invoke(app, ["convert", str(self.log_file), str(out), "-s", "3"])
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertIn("Converted 7 event(s)", result.output)
+        self.assertIn("3 chunk(s)", result.output)
+
+    def test_commands_read_binary(self) -> None:
+        out = self.temp_path / "test.tlog"
+        runner.invoke(app, ["convert", str(self.log_file), str(out)])
+
+        result = runner.invoke(app, ["inspect", str(out), "--run", "sample-001-00-00"])
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertIn("5 event(s) shown", result.output)
+
+        result = runner.invoke(app, ["replay", str(out)])
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertIn("test_queue", result.output)
+
+    def test_convert_same_file(self) -> None:
+        result = runner.invoke(app, ["convert", str(self.log_file), str(self.log_file)])
+        self.assertNotEqual(result.exit_code, 0)
+
+    def test_convert_missing_file(self) -> None:
+        out = self.temp_path / "test.tlog"
+        result = runner.invoke(app, ["convert", "/nonexistent/path.jsonl", str(out)])
+        self.assertNotEqual(result.exit_code, 0)
+
+
 # ---------------------------------------------------------------------------
 # Entry point smoke test
 # ---------------------------------------------------------------------------
@@ -386,6 +432,10 @@ class TestCliHelp(unittest.TestCase):
         result = runner.invoke(app, ["replay", "--help"])
         self.assertEqual(result.exit_code, 0, result.output)
 
+    def test_convert_help(self) -> None:
+        result = runner.invoke(app, ["convert", "--help"])
+        self.assertEqual(result.exit_code, 0, result.output)
+
 
 if __name__ == "__main__":
     unittest.main()
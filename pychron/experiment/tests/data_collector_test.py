@@ -0,0 +1,145 @@
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from numpy.testing import assert_array_equal
+
+from pychron.experiment.automated_run.data_collector import (
+    DataCollector,
+    DetectorRoutes,
+)
+from pychron.paths import paths
+from pychron.processing.isotope_group import IsotopeGroup
+
+
+class _Detector:
+    def __init__(self, name, isotope):
+        self.name = name
+        self.isotope = isotope
+        self.ypadding = "0.1"
+
+
+class _Graph:
+    def get_plotid_by_ytitle(self, name):
+        return name
+
+    def get_plot_ytitles(self):
+        return []
+
+
+class _PlotPanel:
+    ncounts = 0
+
+    def __init__(self):
+        self.isotope_graph = _Graph()
+        self.sniff_graph = _Graph()
+        self.baseline_graph = _Graph()
+
+
+class _Collector(DataCollector):
+    _isotope_group = None
+    _plot_panel = None
+
+    @property
+    def isotope_group(self):
+        return self._isotope_group
+
+    @property
+    def plot_panel(self):
+        return self._plot_panel
+
+
+class DetectorRoutesTestCase(unittest.TestCase):
+    def test_routes(self):
+        dets = [_Detector("H1", "Ar40"), _Detector("AX", "Ar39")]
+        routes = DetectorRoutes(["L2", "AX", "H1"], dets)
+
+        self.assertEqual(routes.keys, ("L2", "AX", "H1"))
+        self.assertEqual(routes.detectors, [dets[1], dets[0]])
+        self.assertEqual(routes.select([1, 2, 3]), [2, 3])
+        self.assertEqual(routes.index("L2"), 0)
+        self.assertIsNone(routes.index("CDD"))
+
+
+class DataCollectorIterationTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.root = tempfile.mkdtemp()
+        paths.build(cls.root)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.root)
+
+    def setUp(self):
+        self.dets = [_Detector("H1", "Ar40"), _Detector("AX", "Ar39")]
+        self.group = IsotopeGroup()
+        for det in self.dets:
+            self.group.set_isotope_detector(det)
+
+        self.written = []
+        # no preferences service outside of the application
+        with mock.patch("pychron.experiment.automated_run.data_collector.bind_preference"):
+            c = _Collector(
+                _isotope_group=self.group,
+                _plot_panel=_PlotPanel(),
+                detectors=self.dets,
+                collection_kind="signal",
+                period_ms=1000,
+            )
+        self.collector = c
+        c.trait_set(
+            data_writer=lambda *args: self.written.append(args),
+            starttime=0,
+        )
+        c.measure()
+
+    def _collect(self, data):
+        self.collector.data_generator = iter(data)
+        for i in range(len(data)):
+            self.collector._iteration(i + 1)
+
+    def test_iteration(self):
+        keys = ["H1", "AX", "L2"]
+        self._collect([(keys, [i, 10 * i, -1], None, True) for i in range(5)])
+
+        assert_array_equal(self.group.isotopes["Ar40"].ys, range(5))
+        assert_array_equal(self.group.isotopes["Ar39"].ys, [10 * i for i in range(5)])
+
+        dets, x, wkeys, signals = self.written[-1]
+        self.assertEqual(dets, self.dets)
+        self.assertEqual(wkeys, ("H1", "AX", "L2"))
+        self.assertEqual(signals, [4, 40, -1])
+
+        # one routing table for the key order
+        self.assertEqual(len(self.collector._routes), 1)
+        self.assertEqual(len(self.collector._plot_data_buffers), 2)
+        self.assertEqual(self.collector.get_iteration_stats()[0], 5)
+
+    def test_detectors_changed(self):
+        keys = ["H1", "AX"]
+        self._collect([(keys, [1, 2], None, True)])
+
+        self.collector.detectors = self.dets[:1]
+        self._collect([(keys, [3, 4], None, True)])
+
+        assert_array_equal(self.group.isotopes["Ar40"].ys, [1, 3])
+        assert_array_equal(self.group.isotopes["Ar39"].ys, [2])
+
+    def test_isotope_changed(self):
+        """
+        the isotope of a detector is read for every count e.g. after a peak hop
+        """
+        self.group.set_isotope_detector(_Detector("H1", "Ar39"))
+        self._collect([(["H1"], [1], None, True)])
+
+        self.dets[0].isotope = "Ar39"
+        self._collect([(["H1"], [2], None, True)])
+
+        assert_array_equal(self.group.isotopes["Ar40"].ys, [1])
+        assert_array_equal(self.group.isotopes["Ar39"].ys, [2])
+
+
+if __name__ == "__main__":
+    unittest.main()
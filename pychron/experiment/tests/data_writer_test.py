@@ -0,0 +1,95 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from pychron.experiment.automated_run.persistence import AutomatedRunPersister
+from pychron.paths import paths
+
+
+class _Detector:
+    def __init__(self, name, isotope):
+        self.name = name
+        self.isotope = isotope
+
+
+class DataWriterTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.root = tempfile.mkdtemp()
+        paths.build(cls.root)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.root)
+
+    def setUp(self):
+        self.path = os.path.join(self.root, "run.h5")
+
+        self.persister = AutomatedRunPersister(
+            data_writer_flush_count=5, data_writer_flush_interval=1000
+        )
+        self.persister._current_data_frame = self.path
+        self.dets = [_Detector("H1", "Ar40"), _Detector("AX", "Ar39")]
+
+        dm = self.persister.data_manager
+        dm.new_frame(self.path)
+        dm.close_file()
+        self.persister.build_tables("signal", self.dets, 10)
+        self.persister.build_tables("baseline", self.dets, 10)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def _write(self, writer, n, start=0):
+        for i in range(start, start + n):
+            writer(self.dets, i, ["H1", "AX", "L2"], [i, 10 * i, -1])
+
+    def _read(self, table, group):
+        with self.persister.data_manager.open_table(self.path, table, group) as t:
+            return [(r["time"], r["value"]) for r in t.iterrows()]
+
+    def test_write(self):
+        writer = self.persister.get_data_writer("signal")
+        with self.persister.writer_ctx():
+            self._write(writer, 12)
+
+        self.assertEqual(self._read("H1", "signal/Ar40"), [(i, i) for i in range(12)])
+        self.assertEqual(self._read("AX", "signal/Ar39"), [(i, 10 * i) for i in range(12)])
+
+    def test_batches(self):
+        writer = self.persister.get_data_writer("baseline")
+        with self.persister.writer_ctx():
+            dm = self.persister.data_manager
+            with mock.patch.object(dm, "get_table", wraps=dm.get_table) as get_table:
+                self._write(writer, 4)
+                self.assertEqual(get_table.call_count, 0)
+                self._write(writer, 8, start=4)
+
+            # one lookup per table, rows written every 5 counts
+            self.assertEqual(get_table.call_count, 2)
+            self.assertEqual(dm.get_table("H1", "/baseline").nrows, 10)
+
+        self.assertEqual(len(self._read("H1", "baseline")), 12)
+
+    def test_flush_interval(self):
+        writer = self.persister.get_data_writer("signal")
+        writer.flush_interval = 0
+        with self.persister.writer_ctx():
+            self._write(writer, 1)
+            t = self.persister.data_manager.get_table("H1", "/signal/Ar40")
+            self.assertEqual(t.nrows, 1)
+
+    def test_flush_on_exception(self):
+        writer = self.persister.get_data_writer("signal")
+        with self.assertRaises(ValueError):
+            with self.persister.writer_ctx():
+                self._write(writer, 3)
+                raise ValueError
+
+        self.assertEqual(len(self._read("H1", "signal/Ar40")), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
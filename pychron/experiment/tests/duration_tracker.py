@@ -31,8 +31,16 @@ class DurationTrackerTestCase(unittest.TestCase):
         self.dt = AutomatedRunDurationTracker()
 
     def tearDown(self):
-        os.remove(paths.duration_tracker)
-        os.remove(paths.duration_tracker_frequencies)
+        self.dt.close()
+        for p in (
+            paths.duration_tracker,
+            paths.duration_tracker_frequencies,
+            paths.duration_tracker_db,
+            "{}-wal".format(paths.duration_tracker_db),
+            "{}-shm".format(paths.duration_tracker_db),
+        ):
+            if os.path.isfile(p):
+                os.remove(p)
 
     def test_prob(self):
         run = MockRun("1000-01", "a", "a")
@@ -55,6 +63,55 @@ class DurationTrackerTestCase(unittest.TestCase):
         prob = self.dt._frequencies["a"]
         self.assertEqual(prob, 3 / 4.0)
 
+    def test_rolling_window(self):
+        for i in range(15):
+            self.dt.update(MockRun("1000-01", "a", "a"), i)
+
+        self.assertEqual(self.dt["a"], sum(range(5, 15)) / 10.0)
+        st = self.dt.get_statistics("a")
+        self.assertEqual(st["n"], 10)
+        self.assertEqual(st["median"], 9.5)
+        self.assertEqual(st["total"], 15)
+        self.assertEqual(st["truncation_rate"], 0)
+        self.assertIsNone(self.dt.get_statistics("b"))
+
+        self.dt.estimator = "median"
+        self.dt.update(MockRun("1000-01", "a", "a"), 1000)
+        self.assertEqual(self.dt["a"], 10.5)
+
+    def test_concurrent_reader(self):
+        self.dt.update(MockRun("1000-01", "a", "a"), 10)
+
+        reader = AutomatedRunDurationTracker()
+        self.assertEqual(reader["a"], 10)
+
+        self.dt.update(MockRun("1000-01", "a", "b"), 20)
+        self.assertEqual(reader["a"], 10)
+        reader.load()
+        self.assertEqual(reader["a"], 15)
+        self.assertEqual(reader._frequencies["a"], 0.5)
+        reader.close()
+
+    def test_migrate(self):
+        self.dt.close()
+        os.remove(paths.duration_tracker_db)
+
+        with open(paths.duration_tracker, "w") as wfile:
+            wfile.write("a,15.0,10.0,20.0\n")
+            wfile.write("b,7.0\n")
+        with open(paths.duration_tracker_frequencies, "w") as wfile:
+            wfile.write("a,4,1\n")
+
+        self.dt = AutomatedRunDurationTracker()
+        self.assertEqual(self.dt["a"], 15)
+        self.assertEqual(self.dt["b"], 7)
+        self.assertEqual(self.dt._frequencies["a"], 0.25)
+
+        # only imported once
+        self.dt.close()
+        self.dt = AutomatedRunDurationTracker()
+        self.assertEqual(self.dt.get_statistics("a")["n"], 2)
+
     # def test_pm(self):
     #     run = MockRun('1000-01', 'a', 'a')
     #     self.dt.update(run, 10)
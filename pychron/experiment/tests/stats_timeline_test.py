@@ -0,0 +1,213 @@
+import shutil
+import tempfile
+import unittest
+
+from pychron.experiment.stats import DURATION_ATTRS, ExperimentStats, StatsGroup
+from pychron.paths import paths
+
+
+class _FakeRun:
+    def __init__(self, runid, measurement_script="m", analysis_type="unknown"):
+        self.runid = runid
+        for a in DURATION_ATTRS:
+            setattr(self, a, "")
+        self.measurement_script = measurement_script
+        self.analysis_type = analysis_type
+        self.delay_after = 0
+        self.state = "not run"
+        self.skip = False
+        self.executable = True
+        self.nestimates = 0
+        self.nhashes = 0
+
+    @property
+    def script_hash(self):
+        self.nhashes += 1
+        return "{}{}".format(self.measurement_script, self.duration)
+
+    def get_estimated_duration(self, script_context=None, warned=None, force=False):
+        self.nestimates += 1
+        return 100 + len(self.measurement_script) + (self.duration or 0)
+
+    def get_delay_after(self, du, db, da):
+        d = self.delay_after
+        if not d:
+            d = du
+            if self.analysis_type == "air":
+                d = da
+            elif self.analysis_type.startswith("blank"):
+                d = db
+        return d
+
+
+class _FakeQueue:
+    def __init__(self, runs):
+        self.stats = ExperimentStats(
+            delay_before_analyses=5,
+            delay_between_analyses=10,
+            delay_after_blank=20,
+            delay_after_air=30,
+        )
+        self.automated_runs = runs
+        self.cleaned_automated_runs = runs
+        self.executed_runs = []
+        self.delay_before_analyses = 5
+        self.delay_between_analyses = 10
+        self.delay_after_blank = 20
+        self.delay_after_air = 30
+
+
+def brute_force(runs, stats):
+    if not runs:
+        return 0
+    dur = sum(r.get_estimated_duration() for r in runs)
+    delays = [
+        r.get_delay_after(
+            stats.delay_between_analyses,
+            stats.delay_after_blank,
+            stats.delay_after_air,
+        )
+        for r in runs
+    ]
+    return dur + stats.delay_before_analyses + sum(delays[:-1])
+
+
+class StatsTimelineTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.root = tempfile.mkdtemp()
+        paths.build(cls.root)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.root)
+
+    def setUp(self):
+        types = ("unknown", "blank_unknown", "air", "unknown")
+        self.runs = [
+            _FakeRun("a{}".format(i), "m{}".format(i % 3), types[i % 4]) for i in range(40)
+        ]
+        self.queue = _FakeQueue(self.runs)
+        self.stats = self.queue.stats
+
+    def test_duration(self):
+        for n in (0, 1, 2, 17, 40):
+            with self.subTest(n=n):
+                self.assertEqual(
+                    self.stats.calculate_duration(self.runs, n=n),
+                    brute_force(self.runs[:n], self.stats),
+                )
+        self.assertEqual(self.stats.calculate_duration(), 0)
+
+    def test_memoized_by_script_hash(self):
+        self.stats.calculate_duration(self.runs)
+        # three distinct scripts
+        self.assertEqual(sum(r.nestimates for r in self.runs), 3)
+
+        # unchanged rows are neither estimated nor rehashed
+        nhashes = sum(r.nhashes for r in self.runs)
+        self.stats.calculate_duration(self.runs)
+        self.assertEqual(sum(r.nhashes for r in self.runs), nhashes)
+
+    def test_edited_rows(self):
+        self.stats.calculate_duration(self.runs)
+        nhashes = [r.nhashes for r in self.runs]
+
+        edited = self.runs[7]
+        edited.duration = 15
+        edited.delay_after = 3
+        self.runs[9].analysis_type = "air"
+        # what the queue does when a run trait changes
+        self.stats.mark_dirty(edited)
+        self.stats.mark_dirty(self.runs[9])
+
+        self.assertEqual(
+            self.stats.calculate_duration(self.runs),
+            brute_force(self.runs, self.stats),
+        )
+        rehashed = [i for i, r in enumerate(self.runs) if r.nhashes != nhashes[i]]
+        self.assertEqual(rehashed, [7, 9])
+
+    def test_unmarked_rows_not_rescanned(self):
+        dur = self.stats.calculate_duration(self.runs)
+        nhashes = sum(r.nhashes for r in self.runs)
+
+        self.runs[7].duration = 15
+        self.assertEqual(self.stats.calculate_duration(self.runs), dur)
+        self.assertEqual(sum(r.nhashes for r in self.runs), nhashes)
+
+    def test_estimated_duration_key(self):
+        # same script hash, different duration attributes
+        self.runs[0].position = "1"
+        self.runs[3].position = "2"
+        self.stats.calculate_duration(self.runs)
+        self.assertEqual(sum(r.nestimates for r in self.runs), 5)
+
+    def test_queue_edits(self):
+        self.stats.calculate_duration(self.runs)
+        runs = self.runs[:5] + self.runs[6:] + [_FakeRun("b", "new")]
+        runs[1], runs[2] = runs[2], runs[1]
+        self.assertEqual(self.stats.calculate_duration(runs), brute_force(runs, self.stats))
+
+        self.stats.delay_between_analyses = 60
+        self.assertEqual(self.stats.calculate_duration(runs), brute_force(runs, self.stats))
+
+    def test_prefix_from_edited_row(self):
+        self.stats.calculate_duration(self.runs)
+        timeline = self.stats._timeline
+        prefix = timeline._prefix[:]
+
+        self.runs[30].duration = 15
+        self.stats.mark_dirty(self.runs[30])
+        self.stats.calculate_duration(self.runs)
+        self.assertEqual(timeline._prefix[:31], prefix[:31])
+        self.assertNotEqual(timeline._prefix[31:], prefix[31:])
+        for n in range(41):
+            self.assertEqual(timeline.duration(n, 5), brute_force(self.runs[:n], self.stats))
+
+        runs = self.runs[:20] + self.runs[21:]
+        self.stats.calculate_duration(runs)
+        for n in range(40):
+            self.assertEqual(timeline.duration(n, 5), brute_force(runs[:n], self.stats))
+
+    def test_calculate_at(self):
+        group = StatsGroup(experiment_queues=[self.queue], active_queue=self.queue)
+        group.calculate(force=True)
+        self.assertEqual(group._total_time, brute_force(self.runs, self.stats))
+
+        sel = self.runs[12]
+        st, et = group._calculate_at(sel)
+        self.assertEqual(st, brute_force(self.runs[:12], self.stats) + 10)
+        self.assertEqual(et, st + round(sel.get_estimated_duration()))
+
+    def test_calculate_at_executed(self):
+        executed = [_FakeRun("e{}".format(i), "m{}".format(i % 2)) for i in range(5)]
+        self.queue.executed_runs = executed
+        group = StatsGroup(experiment_queues=[self.queue], active_queue=self.queue)
+        group.calculate(force=True)
+
+        timeline = self.stats._timeline
+        prefix = timeline._prefix
+        for i in (0, 12, 39):
+            st, et = group._calculate_at(self.runs[i])
+            self.assertEqual(st, brute_force(executed + self.runs[:i], self.stats) + 10)
+
+        # the queued runs timeline is shared with the total duration, not rebuilt
+        group.calculate(force=True)
+        self.assertIs(timeline._prefix, prefix)
+
+    def test_tracked_duration(self):
+        self.stats.calculate_duration(self.runs)
+        # what update_run_duration does without writing the tracker files
+        self.stats.duration_tracker._items["m1"] = 500
+        self.stats._timeline.discard("m1")
+        dur = self.stats.calculate_duration(self.runs)
+        self.assertEqual(
+            dur,
+            brute_force(self.runs, self.stats)
+            + sum(500 - r.get_estimated_duration() for r in self.runs[1::3]),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
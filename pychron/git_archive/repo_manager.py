@@ -56,6 +56,16 @@ def get_repository_branch(path):
     return b.name
 
 
+def get_repository_head(path):
+    """
+    return the hexsha of HEAD or None if ``path`` is not a repository or has no commits
+    """
+    try:
+        return Repo(path).head.commit.hexsha
+    except (git.InvalidGitRepositoryError, git.NoSuchPathError, ValueError):
+        return
+
+
 def grep(arg, name):
     process = subprocess.Popen(["grep", "-lr", arg, name], stdout=subprocess.PIPE)
     stdout, stderr = process.communicate()
@@ -2,8 +2,12 @@
 
 from .config import MetricsConfig
 from .metrics import (
+    MetricHandle,
     configure,
+    counter,
+    gauge,
     get_config,
+    histogram,
     inc_counter,
     is_enabled,
     observe_duration,
@@ -20,4 +24,8 @@ __all__ = [
     "set_gauge",
     "observe_histogram",
     "observe_duration",
+    "MetricHandle",
+    "counter",
+    "gauge",
+    "histogram",
 ]
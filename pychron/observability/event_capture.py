@@ -2,13 +2,18 @@
 
 This module intercepts metrics operations and logs them for UI display and export.
 Designed to be low-overhead with async event capture.
+
+Every registered callback is run by its own dispatcher thread fed by a bounded
+queue, so a slow callback only delays its own events. When a queue is full, events
+are dropped or coalesced according to the dispatch policy and counted, so a burst
+of events can never create threads or block the caller.
 """
 
 import logging
 import threading
 import time
 from collections import deque
-from typing import Callable, Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 
 from .tasks.event import PrometheusEvent
 
@@ -20,7 +25,17 @@ _queue_lock = threading.Lock()
 
 # Registered callbacks for event notifications
 _event_callbacks: List[Callable[[PrometheusEvent], None]] = []
+# Callbacks that receive micro-batches (lists) of events
+_batch_callbacks: List[Callable[[List[PrometheusEvent]], None]] = []
 _callbacks_lock = threading.Lock()
+# (callback, batch) -> EventDispatcher delivering to that callback
+_dispatchers: Dict[Tuple[Callable, bool], "EventDispatcher"] = {}
+
+# What to do with a new event when the dispatch queue is full
+DROP_NEWEST = "drop_newest"
+DROP_OLDEST = "drop_oldest"
+COALESCE = "coalesce"
+DISPATCH_POLICIES = (DROP_NEWEST, DROP_OLDEST, COALESCE)
 
 # Whether event capture is enabled
 _capture_enabled = True
@@ -98,9 +113,11 @@ def get_event_count() -> int:
 
 
 def clear_events() -> None:
-    """Clear all events from the queue."""
+    """Clear all events from the queue, including those not yet dispatched."""
     with _queue_lock:
         _event_queue.clear()
+    for dispatcher in _get_dispatchers():
+        dispatcher.clear()
 
 
 def set_capture_enabled(enabled: bool) -> None:
@@ -120,50 +137,354 @@ def _is_capture_enabled() -> bool:
         return _capture_enabled
 
 
-def register_callback(callback: Callable[[PrometheusEvent], None]) -> None:
+def register_callback(callback: Callable, batch: bool = False) -> None:
     """Register a callback to be called when events occur.
 
-    Callbacks are called asynchronously (in thread pool).
-    Callbacks should be fast and non-blocking.
+    Callbacks are called asynchronously by a dispatcher thread per callback.
+    A slow callback only delays its own events, but events queued for it are
+    dropped or coalesced once its queue is full.
 
     Args:
-        callback: Function taking PrometheusEvent as argument.
+        callback: Function taking PrometheusEvent as argument, or a list of
+            PrometheusEvents if batch is True.
+        batch: Deliver the events queued since the last dispatch as one list.
     """
+    callbacks = _batch_callbacks if batch else _event_callbacks
     with _callbacks_lock:
-        if callback not in _event_callbacks:
-            _event_callbacks.append(callback)
+        if callback not in callbacks:
+            callbacks.append(callback)
+        _sync_dispatchers()
 
 
-def unregister_callback(callback: Callable[[PrometheusEvent], None]) -> None:
+def unregister_callback(callback: Callable) -> None:
     """Unregister an event callback."""
     with _callbacks_lock:
-        if callback in _event_callbacks:
-            _event_callbacks.remove(callback)
+        for callbacks in (_event_callbacks, _batch_callbacks):
+            if callback in callbacks:
+                callbacks.remove(callback)
+        _sync_dispatchers()
+
+
+class EventDispatcher:
+    """Bounded queue and single worker thread that runs event callbacks.
+
+    Attributes:
+        callback: The callback events are delivered to. None delivers to every
+            registered callback.
+        batch: Deliver lists of events to ``callback``.
+        maxsize: Maximum number of queued events.
+        policy: DROP_NEWEST, DROP_OLDEST or COALESCE. COALESCE replaces a queued
+            event with the same type, metric name and labels and otherwise drops
+            the oldest event.
+        max_batch: Maximum number of events per dispatch.
+        dispatched: Number of events delivered to the callbacks.
+        dropped: Number of events discarded because the queue was full.
+        coalesced: Number of queued events replaced by a newer one.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1000,
+        policy: str = DROP_OLDEST,
+        max_batch: int = 100,
+        callback: Optional[Callable] = None,
+        batch: bool = False,
+    ):
+        """Initialize the dispatcher. The worker thread starts on the first event.
+
+        Args:
+            maxsize: Maximum number of queued events.
+            policy: One of DISPATCH_POLICIES.
+            max_batch: Maximum number of events per dispatch.
+            callback: Only deliver to this callback.
+            batch: ``callback`` takes a list of events.
+        """
+        if policy not in DISPATCH_POLICIES:
+            raise ValueError(f"Invalid dispatch policy {policy}. Use one of {DISPATCH_POLICIES}")
+
+        self.maxsize = maxsize
+        self.policy = policy
+        self.max_batch = max_batch
+        self.callback = callback
+        self.batch = batch
+        self.dispatched = 0
+        self.dropped = 0
+        self.coalesced = 0
+
+        self._queue: deque = deque()
+        self._keys: Dict[Tuple, PrometheusEvent] = {}
+        self._cond = threading.Condition()
+        self._busy = False
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+
+    def put(self, event: PrometheusEvent) -> bool:
+        """Queue an event without blocking.
+
+        Args:
+            event: The event to dispatch.
+
+        Returns:
+            False if the event was dropped.
+        """
+        dropped = 0
+        with self._cond:
+            if self._closed:
+                return False
+
+            if self.policy == COALESCE:
+                key = _event_key(event)
+                queued = self._keys.get(key)
+                if queued is not None:
+                    # replace in place to keep the queue order
+                    self._queue[self._queue.index(queued)] = event
+                    self._keys[key] = event
+                    self.coalesced += 1
+                    return True
+
+            accepted = True
+            if len(self._queue) >= self.maxsize:
+                dropped = 1
+                if self.policy == DROP_NEWEST:
+                    accepted = False
+                else:
+                    old = self._queue.popleft()
+                    if self.policy == COALESCE:
+                        self._keys.pop(_event_key(old), None)
+
+            if accepted:
+                self._queue.append(event)
+                if self.policy == COALESCE:
+                    self._keys[_event_key(event)] = event
+                self._ensure_worker()
+                self._cond.notify()
+            self.dropped += dropped
+
+        if dropped:
+            _count_dropped()
+        return accepted
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every queued event has been dispatched.
+
+        Args:
+            timeout: Maximum time to wait in seconds.
+
+        Returns:
+            True if the queue was drained.
+        """
+        with self._cond:
+            return self._cond.wait_for(lambda: not self._queue and not self._busy, timeout)
+
+    def clear(self) -> None:
+        """Discard the queued events without dispatching them."""
+        with self._cond:
+            self._queue.clear()
+            self._keys.clear()
+            self._cond.notify_all()
+
+    def close(self) -> None:
+        """Discard the queued events and stop the worker thread."""
+        with self._cond:
+            self._closed = True
+            self._queue.clear()
+            self._keys.clear()
+            self._cond.notify_all()
+
+    def configure(
+        self,
+        maxsize: Optional[int] = None,
+        policy: Optional[str] = None,
+        max_batch: Optional[int] = None,
+    ) -> None:
+        """Change the queue size, full-queue policy or batch size.
+
+        Args:
+            maxsize: Maximum number of queued events.
+            policy: One of DISPATCH_POLICIES.
+            max_batch: Maximum number of events per dispatch.
+        """
+        if policy is not None and policy not in DISPATCH_POLICIES:
+            raise ValueError(f"Invalid dispatch policy {policy}. Use one of {DISPATCH_POLICIES}")
+
+        with self._cond:
+            if maxsize is not None:
+                self.maxsize = maxsize
+            if max_batch is not None:
+                self.max_batch = max_batch
+            if policy is not None and policy != self.policy:
+                self.policy = policy
+                self._keys = {_event_key(e): e for e in self._queue} if policy == COALESCE else {}
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get the dispatch counters and current queue size."""
+        with self._cond:
+            return {
+                "queued": len(self._queue),
+                "dispatched": self.dispatched,
+                "dropped": self.dropped,
+                "coalesced": self.coalesced,
+            }
+
+    def _ensure_worker(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="EventDispatcher", daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                self._busy = False
+                self._cond.notify_all()
+                self._cond.wait_for(lambda: self._queue or self._closed)
+                if self._closed:
+                    return
+
+                n = min(len(self._queue), self.max_batch)
+                events = [self._queue.popleft() for _ in range(n)]
+                if self.policy == COALESCE:
+                    for e in events:
+                        self._keys.pop(_event_key(e), None)
+                self._busy = True
+
+            self._dispatch(events)
+            with self._cond:
+                self.dispatched += len(events)
+
+    def _dispatch(self, events: List[PrometheusEvent]) -> None:
+        if self.callback is not None:
+            callbacks, batch_callbacks = [], []
+            (batch_callbacks if self.batch else callbacks).append(self.callback)
+        else:
+            with _callbacks_lock:
+                callbacks = _event_callbacks.copy()
+                batch_callbacks = _batch_callbacks.copy()
+
+        for callback in callbacks:
+            for event in events:
+                try:
+                    callback(event)
+                except Exception as e:
+                    logger.warning(f"Error calling event callback: {e}")
+
+        for callback in batch_callbacks:
+            try:
+                callback(events)
+            except Exception as e:
+                logger.warning(f"Error calling event batch callback: {e}")
+
+
+# settings for the per callback dispatchers. see configure_dispatcher
+_dispatch_config = {"maxsize": 1000, "policy": DROP_OLDEST, "max_batch": 100}
+
+
+def _sync_dispatchers() -> List[EventDispatcher]:
+    """Create a dispatcher for every registered callback and close the others.
+
+    Must be called with _callbacks_lock held.
+    """
+    dispatchers = {}
+    for batch, callbacks in ((False, _event_callbacks), (True, _batch_callbacks)):
+        for callback in callbacks:
+            key = (callback, batch)
+            dispatcher = _dispatchers.pop(key, None)
+            if dispatcher is None:
+                dispatcher = EventDispatcher(callback=callback, batch=batch, **_dispatch_config)
+            dispatchers[key] = dispatcher
+
+    for dispatcher in _dispatchers.values():
+        dispatcher.close()
+    _dispatchers.clear()
+    _dispatchers.update(dispatchers)
+    return list(dispatchers.values())
+
+
+def _get_dispatchers() -> List[EventDispatcher]:
+    with _callbacks_lock:
+        if len(_dispatchers) != len(_event_callbacks) + len(_batch_callbacks):
+            return _sync_dispatchers()
+        return list(_dispatchers.values())
+
+
+def configure_dispatcher(
+    maxsize: Optional[int] = None,
+    policy: Optional[str] = None,
+    max_batch: Optional[int] = None,
+) -> None:
+    """Change the dispatch queue size, full-queue policy or batch size of every callback.
+
+    Args:
+        maxsize: Maximum number of queued events per callback.
+        policy: One of DISPATCH_POLICIES.
+        max_batch: Maximum number of events per dispatch.
+    """
+    if policy is not None and policy not in DISPATCH_POLICIES:
+        raise ValueError(f"Invalid dispatch policy {policy}. Use one of {DISPATCH_POLICIES}")
+
+    with _callbacks_lock:
+        for k, v in (("maxsize", maxsize), ("policy", policy), ("max_batch", max_batch)):
+            if v is not None:
+                _dispatch_config[k] = v
+        dispatchers = list(_dispatchers.values())
+
+    for dispatcher in dispatchers:
+        dispatcher.configure(maxsize, policy, max_batch)
+
+
+def get_dispatch_stats() -> Dict[str, int]:
+    """Get the dispatcher counters (queued, dispatched, dropped, coalesced) summed
+    over every callback."""
+    stats = {"queued": 0, "dispatched": 0, "dropped": 0, "coalesced": 0}
+    for dispatcher in _get_dispatchers():
+        for k, v in dispatcher.get_stats().items():
+            stats[k] += v
+    return stats
+
+
+def flush_callbacks(timeout: Optional[float] = None) -> bool:
+    """Wait until every captured event has been passed to the callbacks.
+
+    Args:
+        timeout: Maximum time to wait in seconds.
+
+    Returns:
+        True if all events were dispatched.
+    """
+    deadline = None if timeout is None else time.monotonic() + timeout
+    for dispatcher in _get_dispatchers():
+        remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+        if not dispatcher.flush(remaining):
+            return False
+    return True
+
+
+def _event_key(event: PrometheusEvent) -> Tuple:
+    return event.event_type, event.metric_name, tuple(sorted(event.labels.items()))
+
+
+_dropped_counter = None
+
+
+def _count_dropped() -> None:
+    """Count a dropped event in the Prometheus registry."""
+    global _dropped_counter
+    if _dropped_counter is None:
+        from . import metrics
+
+        _dropped_counter = metrics.counter(
+            "event_dispatch_dropped", "Captured events dropped by the callback dispatcher"
+        ).bind()
+    _dropped_counter.inc()
 
 
 def _notify_callbacks(event: PrometheusEvent) -> None:
     """Notify all registered callbacks of an event.
 
-    Callbacks are called in a background thread pool to avoid blocking
-    the metrics operation.
+    The event is queued for the dispatcher thread of every callback so the
+    metrics operation is never blocked.
     """
-    with _callbacks_lock:
-        callbacks = _event_callbacks.copy()
-
-    logger.debug(f"Notifying {len(callbacks)} callbacks for event: {event.metric_name}")
-
-    # Call callbacks in background to avoid blocking
-    for callback in callbacks:
-        try:
-            # Try to call in background thread if available
-            # Otherwise call synchronously
-            def _call_callback():
-                logger.debug(f"Calling callback from thread: {threading.current_thread().name}")
-                callback(event)
-
-            threading.Thread(target=_call_callback, daemon=True).start()
-        except Exception as e:
-            logger.warning(f"Error calling event callback: {e}")
+    for dispatcher in _get_dispatchers():
+        dispatcher.put(event)
 
 
 def _update_prometheus_metrics(event: PrometheusEvent) -> None:
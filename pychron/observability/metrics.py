@@ -3,8 +3,9 @@
 import logging
 import threading
 import time
+import weakref
 from contextlib import contextmanager
-from typing import Any, Generator
+from typing import Any, Callable, Generator
 
 from . import registry
 from .config import MetricsConfig
@@ -15,6 +16,8 @@ _config: MetricsConfig | None = None
 _config_lock = threading.Lock()
 _init_errors_logged: set[str] = set()
 _errors_lock = threading.Lock()
+_bound_metrics: "weakref.WeakSet[BoundMetric]" = weakref.WeakSet()
+_bound_lock = threading.Lock()
 
 
 def configure(config: MetricsConfig) -> None:
@@ -29,6 +32,11 @@ def configure(config: MetricsConfig) -> None:
     with _config_lock:
         _config = config
 
+    with _bound_lock:
+        bound = list(_bound_metrics)
+    for b in bound:
+        b._resolve(config)
+
 
 def get_config() -> MetricsConfig:
     """Get the current metrics configuration.
@@ -251,3 +259,216 @@ def observe_duration(
             labelvalues=labelvalues,
             buckets=buckets,
         )
+
+
+def _noop(*args: Any, **kwargs: Any) -> None:
+    """Operation of a bound metric that is disabled or could not be resolved."""
+
+
+class BoundMetric:
+    """A metric with its label values resolved to a prometheus_client child.
+
+    The operations (``inc``, ``set``, ``observe``...) are instance attributes
+    that point either directly at the prometheus_client child's methods or at a
+    no-op. Calling them does no config check, label validation, name formatting
+    or registry lookup. ``configure`` re-resolves every live bound metric, so
+    handles created at import time follow later configuration changes.
+
+    Values are passed to prometheus_client unchecked, e.g. a negative counter
+    increment raises ValueError.
+    """
+
+    __slots__ = ("metric", "labelvalues", "__weakref__")
+    _operations: tuple[str, ...] = ()
+
+    def __init__(self, metric: "MetricHandle", labelvalues: dict[str, str]) -> None:
+        self.metric = metric
+        self.labelvalues = labelvalues
+        for op in self._operations:
+            setattr(self, op, _noop)
+
+    def _resolve(self, config: MetricsConfig) -> None:
+        """Point the operations at the prometheus child or at the no-op.
+
+        Args:
+            config: The current MetricsConfig.
+        """
+        child = None
+        if config.enabled:
+            child = self.metric._child(config, self.labelvalues)
+
+        for op in self._operations:
+            setattr(self, op, _noop if child is None else getattr(child, op))
+
+
+class BoundCounter(BoundMetric):
+    """Bound counter. ``inc(amount=1)``."""
+
+    __slots__ = ("inc",)
+    _operations = ("inc",)
+
+
+class BoundGauge(BoundMetric):
+    """Bound gauge. ``set(value)``, ``inc(amount=1)``, ``dec(amount=1)``."""
+
+    __slots__ = ("set", "inc", "dec")
+    _operations = ("set", "inc", "dec")
+
+
+class BoundHistogram(BoundMetric):
+    """Bound histogram. ``observe(value)`` and the ``time()`` context manager."""
+
+    __slots__ = ("observe",)
+    _operations = ("observe",)
+
+    @contextmanager
+    def time(self) -> Generator[None, None, None]:
+        """Observe the duration of the context in seconds.
+
+        Yields:
+            Control to the context.
+        """
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self.observe(time.monotonic() - start)
+
+
+class MetricHandle:
+    """A metric definition that is bound to label values once, up front.
+
+    Example::
+
+        reads = metrics.counter("device_reads", "Device reads", ["device"])
+        laser_reads = reads.bind(device="laser")
+        ...
+        laser_reads.inc()
+    """
+
+    def __init__(
+        self,
+        kind: str,
+        name: str,
+        description: str,
+        labels: list[str] | None = None,
+        buckets: tuple[float, ...] | None = None,
+    ) -> None:
+        """Initialize the metric definition.
+
+        Args:
+            kind: counter, gauge or histogram.
+            name: Metric name (without namespace prefix).
+            description: Metric description.
+            labels: List of label names.
+            buckets: Optional custom histogram bucket boundaries.
+        """
+        self.kind = kind
+        self.name = name
+        self.description = description
+        self.labels = list(labels or [])
+        self.buckets = buckets
+
+    def bind(self, **labelvalues: str) -> Any:
+        """Bind label values.
+
+        Args:
+            **labelvalues: Values for every label of the metric.
+
+        Returns:
+            A BoundCounter, BoundGauge or BoundHistogram.
+        """
+        bound = _BOUND_CLASSES[self.kind](self, labelvalues)
+        with _bound_lock:
+            _bound_metrics.add(bound)
+        bound._resolve(get_config())
+        return bound
+
+    def _child(self, config: MetricsConfig, labelvalues: dict[str, str]) -> Any:
+        """Get the prometheus_client metric or labelled child.
+
+        Args:
+            config: The current MetricsConfig.
+            labelvalues: Dict mapping label names to values.
+
+        Returns:
+            The child, or None if the labels are invalid or creation failed.
+        """
+        name = self.name
+        if bool(self.labels) != bool(labelvalues):
+            _log_once(
+                f"bind_{self.kind}_{name}",
+                f"Metric {name}: cannot bind {labelvalues} to labels {self.labels}",
+            )
+            return None
+        if not _validate_labels(self.labels, labelvalues, name):
+            return None
+
+        try:
+            factory: Callable[..., Any] = getattr(registry, self.kind)
+            kw = {"buckets": self.buckets} if self.kind == "histogram" else {}
+            metric = factory(
+                f"{config.namespace}_{name}",
+                self.description,
+                labelnames=self.labels,
+                **kw,
+            )
+            return metric.labels(**labelvalues) if labelvalues else metric
+        except Exception as e:
+            _log_once(f"bind_{self.kind}_{name}", f"Failed to bind {self.kind} {name}: {e}")
+            return None
+
+
+_BOUND_CLASSES: dict[str, type[BoundMetric]] = {
+    "counter": BoundCounter,
+    "gauge": BoundGauge,
+    "histogram": BoundHistogram,
+}
+
+
+def counter(name: str, description: str, labels: list[str] | None = None) -> MetricHandle:
+    """Define a counter for pre-bound, low overhead updates.
+
+    Args:
+        name: Metric name (without namespace prefix).
+        description: Metric description.
+        labels: List of label names.
+
+    Returns:
+        A MetricHandle. Use ``bind(**labelvalues)`` to get a BoundCounter.
+    """
+    return MetricHandle("counter", name, description, labels)
+
+
+def gauge(name: str, description: str, labels: list[str] | None = None) -> MetricHandle:
+    """Define a gauge for pre-bound, low overhead updates.
+
+    Args:
+        name: Metric name (without namespace prefix).
+        description: Metric description.
+        labels: List of label names.
+
+    Returns:
+        A MetricHandle. Use ``bind(**labelvalues)`` to get a BoundGauge.
+    """
+    return MetricHandle("gauge", name, description, labels)
+
+
+def histogram(
+    name: str,
+    description: str,
+    labels: list[str] | None = None,
+    buckets: tuple[float, ...] | None = None,
+) -> MetricHandle:
+    """Define a histogram for pre-bound, low overhead observations.
+
+    Args:
+        name: Metric name (without namespace prefix).
+        description: Metric description.
+        labels: List of label names.
+        buckets: Optional custom bucket boundaries.
+
+    Returns:
+        A MetricHandle. Use ``bind(**labelvalues)`` to get a BoundHistogram.
+    """
+    return MetricHandle("histogram", name, description, labels, buckets)
@@ -117,7 +117,8 @@ class PrometheusStatusPane(TraitsTaskPane):
         # The Traits observer doesn't work reliably from background threads
         from pychron.observability import event_capture
 
-        event_capture.register_callback(self._on_event_capture_event)
+        # one preview update per batch of events
+        event_capture.register_callback(self._on_event_capture_event, batch=True)
 
     def trait_context(self):
         """Provide pane traits to the view context.
@@ -312,8 +313,8 @@ class PrometheusStatusPane(TraitsTaskPane):
         """Handle model events change - update metrics preview."""
         self._update_metrics_preview()
 
-    def _on_event_capture_event(self, event) -> None:
-        """Handle events from event_capture system directly.
+    def _on_event_capture_event(self, events) -> None:
+        """Handle a batch of events from event_capture system directly.
 
         Called from background thread when events are captured.
         Updates metrics preview to display real-time events.
@@ -239,6 +239,7 @@ class IsoEvoMainOptions(MainOptions):
             checkbox_column(name="use_iqr_filtering", label="Use IQR"),
             object_column(name="truncate", label="Trunc."),
             checkbox_column(name="include_baseline_error", label="Inc. BsErr"),
+            checkbox_column(name="use_closed_form", label="Closed Form"),
         ]
         return cols
 
@@ -269,6 +269,7 @@ class Paths(object):
 
     duration_tracker = None
     duration_tracker_frequencies = None
+    duration_tracker_db = None
     experiment_launch_history = None
     notification_triggers = None
     furnace_firmware = None
@@ -499,6 +500,7 @@ class Paths(object):
         self.duration_tracker_frequencies = join(
             self.appdata_dir, "duration_tracker_frequencies.txt"
         )
+        self.duration_tracker_db = join(self.appdata_dir, "duration_tracker.sqlite")
         self.experiment_launch_history = join(self.appdata_dir, "experiment_launch_history.txt")
         self.notification_triggers = join(self.setup_dir, "notification_triggers.yaml")
 
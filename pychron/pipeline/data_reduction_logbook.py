@@ -500,7 +500,7 @@ class DataReductionLogbook(Loggable, ColumnSorterMixin):
                 anss.append(m.analysis)
 
             anns = self.dvc.make_analyses(
-                anss, warn=False, quick=True, use_progress=False
+                anss, warn=False, quick=True, lazy=True, use_progress=False
             )
             for rname, gs in groupby_key(anns, key=lambda x: x.repository_identifier):
                 repo = self.dvc.get_repository(rname)
@@ -46,6 +46,7 @@ from pychron.globals import globalv
 from pychron.loggable import Loggable
 from pychron.paths import paths
 from pychron.pipeline.grouping import group_analyses_by_key
+from pychron.pipeline.node_cache import NodeResultCache
 from pychron.pipeline.nodes import FindReferencesNode, AuditNode
 from pychron.pipeline.nodes import PushNode
 from pychron.pipeline.nodes import ReviewNode
@@ -332,13 +333,16 @@ class PipelineEngine(Loggable):
 
     pipeline_template_root = Instance(PipelineTemplateRoot)
     use_arar_calculations = Bool
+    use_node_cache = Bool(True)
 
     def __init__(self, *args, **kw):
         super(PipelineEngine, self).__init__(*args, **kw)
         self._confirmation_cache = {}
+        self._node_cache = NodeResultCache()
         bind_preference(
             self, "use_arar_calculations", "pychron.pipeline.use_arar_calculations"
         )
+        bind_preference(self, "use_node_cache", "pychron.pipeline.use_node_cache")
 
     def drop_factory(self, items):
         return self.dvc.make_analyses(items)
@@ -347,6 +351,7 @@ class PipelineEngine(Loggable):
         if self.state:
             self.state.canceled = False
 
+        self._node_cache.clear()
         self.pipeline.reset(clear_data=True)
         self.update_needed = True
 
@@ -552,6 +557,7 @@ class PipelineEngine(Loggable):
         self.pipeline.add_after(node, newnode)
 
     def clear(self):
+        self._node_cache.clear()
         for ni in self.pipeline.nodes:
             ni.clear_data()
 
@@ -859,6 +865,9 @@ class PipelineEngine(Loggable):
         if globalv.skip_configure:
             configure = False
 
+        # results are only memoized for complete runs
+        cache_run = self._node_cache.new_run(self.use_node_cache and not start_node)
+
         for idx, node in enumerate(pipeline.iternodes(start_node)):
             if node.enabled:
                 # node.editor = None
@@ -869,8 +878,12 @@ class PipelineEngine(Loggable):
                         return True
 
                     st = time.time()
+                    entry = cache_run.lookup(node)
                     try:
-                        node.run(state)
+                        if entry:
+                            cache_run.restore(entry, state)
+                        else:
+                            node.run(state)
                         node.visited = True
                         self.selected = node
                         # self.update_detectors()
@@ -878,11 +891,18 @@ class PipelineEngine(Loggable):
                         self.information_dialog("No Analyses in Pipeline!")
                         pipeline.reset()
                         return True
-                    self.debug(
-                        "{:02n}: {} Runtime: {:0.4f}".format(
-                            idx, node, time.time() - st
+
+                    et = time.time() - st
+                    if entry:
+                        self.debug(
+                            "{:02n}: {} Cached Runtime: {:0.4f}, saved: {:0.4f}".format(
+                                idx, node, et, entry.runtime
+                            )
                         )
-                    )
+                    else:
+                        self.debug("{:02n}: {} Runtime: {:0.4f}".format(idx, node, et))
+                        if not (state.veto or state.canceled):
+                            cache_run.store(state, et)
 
                     if state.veto:
                         if state.veto_message:
@@ -900,6 +920,8 @@ class PipelineEngine(Loggable):
         else:
             self.debug("pipeline run finished")
             self.debug("pipeline runtime {}".format(time.time() - ost))
+            if self.use_node_cache:
+                self.debug("pipeline node cache {}".format(self._node_cache.stats()))
             if post_run:
                 self.post_run(state)
 
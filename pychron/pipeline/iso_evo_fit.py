@@ -0,0 +1,258 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+"""
+isotope evolution refits used by FitIsotopeEvolutionNode.
+
+``fit_analysis`` loads the raw data of one analysis, applies the fits and
+regresses every fitted isotope. It only touches the isotopes of that analysis,
+which are plain python objects, and the regressors created for them. ``set_fit``
+invalidates the previous regressor so the regressors are new objects without
+listeners. No traits attribute is assigned, so several analyses can be refit in
+worker threads. Classifying the isotopes and building the ``IsoEvoResult`` rows is
+left to the calling thread.
+"""
+
+# ============= enthought library imports =======================
+# ============= standard library imports ========================
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from numpy import inf
+
+# ============= local library imports  ==========================
+from pychron.core.helpers.logger_setup import new_logger
+from pychron.core.progress import CancelLoadingError, open_progress
+from pychron.dvc.analysis_loading import get_loading_workers
+
+logger = new_logger("IsoEvoFit")
+
+
+def get_fit_isotope(analysis, name):
+    isotopes = analysis.isotopes
+    if name in isotopes:
+        return isotopes[name]
+    return analysis.get_isotope(detector=name, kind="baseline")
+
+
+def isotope_evolution_values(f, iso):
+    """
+    regress ``iso`` and evaluate the goodness tests of the fit ``f``.
+
+    returns a dict of IsoEvoResult keyword arguments
+    """
+    i, e = iso.value, iso.error
+    try:
+        pe = abs(e / i * 100)
+    except ZeroDivisionError:
+        pe = inf
+
+    smart_filter_coefficients = f.get_filter_coefficients()
+    smart_filter_goodness = None
+    smart_filter_threshold = None
+    smart_filter = e
+    if smart_filter_coefficients:
+        smart_filter_threshold = f.smart_filter_values(i)
+        smart_filter_goodness = smart_filter < f.smart_filter_values(i)
+
+    goodness_threshold = f.goodness_threshold
+    int_err_goodness = None
+    if goodness_threshold:
+        int_err_goodness = bool(pe < goodness_threshold)
+
+    signal_to_baseline_threshold = f.signal_to_baseline_goodness
+    signal_to_baseline_percent_threshold = f.signal_to_baseline_percent_goodness
+    signal_to_baseline_goodness = None
+    signal_to_baseline = 0
+    if hasattr(iso, "baseline"):
+        bs = iso.baseline.error
+        try:
+            signal_to_baseline = abs(bs / i * 100)
+        except ZeroDivisionError:
+            signal_to_baseline = 0
+
+        if signal_to_baseline_threshold and signal_to_baseline_percent_threshold:
+            if signal_to_baseline > signal_to_baseline_threshold:
+                signal_to_baseline_goodness = bool(pe < signal_to_baseline_percent_threshold)
+
+    slope = iso.get_slope()
+    slope_goodness = None
+    slope_threshold = None
+    if f.slope_goodness:
+        if f.slope_goodness_intensity < i:
+            slope_threshold = f.slope_goodness
+            slope_goodness = bool(slope < 0 or slope < slope_threshold)
+
+    outliers = iso.noutliers()
+    outliers_threshold = None
+    outlier_goodness = None
+    if f.outlier_goodness:
+        outliers_threshold = f.outlier_goodness
+        outlier_goodness = bool(outliers < f.outlier_goodness)
+
+    curvature_goodness = None
+    curvature = 0
+    curvature_threshold = None
+    if f.curvature_goodness:
+        curvature = iso.get_curvature(f.curvature_goodness_at)
+        curvature_threshold = f.curvature_goodness
+        curvature_goodness = curvature < curvature_threshold
+
+    nstr = str(iso.n)
+    if outliers:
+        nstr = "{}({})".format(iso.n - outliers, nstr)
+
+    rsquared = iso.rsquared_adj
+    rsquared_goodness = None
+    rsquared_threshold = 0
+    if f.rsquared_goodness:
+        rsquared_threshold = f.rsquared_goodness
+        rsquared_goodness = rsquared > rsquared_threshold
+
+    if hasattr(iso, "blank"):
+        try:
+            signal_to_blank = iso.blank.value / i * 100
+        except ZeroDivisionError:
+            signal_to_blank = 0
+    else:
+        signal_to_blank = 0
+
+    signal_to_blank_goodness = None
+    signal_to_blank_threshold = 0
+    if f.signal_to_blank_goodness:
+        signal_to_blank_threshold = f.signal_to_blank_goodness
+        signal_to_blank_goodness = signal_to_blank < signal_to_blank_threshold
+
+    return dict(
+        nstr=nstr,
+        intercept_value=i,
+        intercept_error=e,
+        normalized_error=e * iso.n**0.5,
+        percent_error=pe,
+        int_err=pe,
+        int_err_threshold=goodness_threshold,
+        int_err_goodness=int_err_goodness,
+        slope=slope,
+        slope_threshold=slope_threshold,
+        slope_goodness=slope_goodness,
+        outlier=outliers,
+        outlier_threshold=outliers_threshold,
+        outlier_goodness=outlier_goodness,
+        curvature=curvature,
+        curvature_threshold=curvature_threshold,
+        curvature_goodness=curvature_goodness,
+        rsquared=rsquared,
+        rsquared_threshold=rsquared_threshold,
+        rsquared_goodness=rsquared_goodness,
+        signal_to_blank=signal_to_blank,
+        signal_to_blank_threshold=signal_to_blank_threshold,
+        signal_to_blank_goodness=signal_to_blank_goodness,
+        signal_to_baseline=signal_to_baseline,
+        signal_to_baseline_goodness=signal_to_baseline_goodness,
+        signal_to_baseline_threshold=signal_to_baseline_threshold,
+        signal_to_baseline_percent_threshold=signal_to_baseline_percent_threshold,
+        smart_filter_goodness=smart_filter_goodness,
+        smart_filter_threshold=smart_filter_threshold,
+        smart_filter=smart_filter,
+        regression_str=iso.regressor.tostring(),
+        fit=iso.fit,
+        isotope=f.name,
+    )
+
+
+def fit_analysis(analysis, fits, keys):
+    """
+    load the raw data for ``keys``, apply ``fits`` and regress.
+
+    returns a list of (isotope, values) tuples in ``fits`` order. fits without a
+    matching isotope are skipped
+    """
+    analysis.load_raw_data(keys)
+    analysis.set_fits(fits)
+
+    ret = []
+    for f in fits:
+        iso = get_fit_isotope(analysis, f.name)
+        if iso:
+            ret.append((iso, isotope_evolution_values(f, iso)))
+    return ret
+
+
+def fit_analyses_parallel(
+    analyses,
+    fits,
+    keys,
+    max_workers=0,
+    use_progress=True,
+    step=10,
+):
+    """
+    refit ``analyses`` in a thread pool. At most ``4 * max_workers`` analyses are
+    in flight at any time.
+
+    yields (analysis, [(isotope, values), ...]) in ``analyses`` order on the calling
+    thread. An analysis that fails to refit is logged and skipped. Canceling yields
+    nothing more and raises CancelLoadingError, accepting stops after the analyses
+    refit so far
+    """
+    n = len(analyses)
+    max_workers = get_loading_workers(max_workers)
+    window = 4 * max_workers
+
+    progress = None
+    if use_progress and n:
+        progress = open_progress(n / step)
+
+    pending = deque()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        try:
+            it = iter(analyses)
+            i = 0
+            while True:
+                while len(pending) < window:
+                    a = next(it, None)
+                    if a is None:
+                        break
+                    pending.append((a, executor.submit(fit_analysis, a, fits, keys)))
+
+                if not pending:
+                    break
+
+                a, future = pending.popleft()
+                if progress:
+                    if progress.canceled:
+                        raise CancelLoadingError
+                    elif progress.accepted:
+                        break
+
+                    if i == 0 or i == n - 1 or not i % step:
+                        progress.change_message("Refit {}. {}/{}".format(a.record_id, i, n))
+                i += 1
+                try:
+                    result = future.result()
+                except BaseException:
+                    logger.exception("refit failed for {}".format(a.record_id))
+                    continue
+
+                yield a, result
+
+        finally:
+            for _, future in pending:
+                future.cancel()
+            if progress:
+                progress.close()
+
+
+# ============= EOF =============================================
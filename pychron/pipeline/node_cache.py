@@ -0,0 +1,240 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+"""
+memoization of pipeline node results.
+
+A node's key chains the key of the node before it with the node's own
+``get_cache_key()`` (its ``to_template()`` options plus any node specific inputs
+e.g. the analyses held by a data node). A node whose key is unchanged since the
+last run is skipped and the EngineState it produced is restored instead.
+
+Nodes mutate the analyses they are handed in place so the snapshot only copies
+the containers of the EngineState and the grouping of the analyses
+(``ANALYSIS_STATE_ATTRS``), which is re-applied when the entry is restored. Any
+other state a node changes on the analyses (e.g. isotope fits) is not captured,
+so a node that runs again on the same input evicts the results it replaces and
+everything cached downstream of them. Only nodes that set ``cacheable = True``
+are memoized; everything downstream of the first node that is not cacheable
+always runs.
+"""
+
+# ============= enthought library imports =======================
+# ============= standard library imports ========================
+import hashlib
+from collections import OrderedDict
+
+# ============= local library imports  ==========================
+from pychron import json
+from pychron.dvc import repository_path
+from pychron.git_archive.repo_manager import get_repository_head
+
+# per analysis state set by the grouping nodes
+ANALYSIS_STATE_ATTRS = (
+    "group_id",
+    "group_name",
+    "graph_id",
+    "graph_name",
+    "tab_id",
+    "tab_name",
+    "aux_id",
+    "aux_name",
+)
+
+
+def make_key(parent, obj):
+    """
+    chain ``parent`` with the json serialization of ``obj``
+    """
+    h = hashlib.sha1(parent.encode("utf-8"))
+    h.update(json.dumps(obj, sort_keys=True, default=str).encode("utf-8"))
+    return h.hexdigest()
+
+
+def analyses_fingerprint(ans):
+    """
+    fingerprint a list of analyses by identity, uuid, exclusion status and the HEAD
+    commit of each analysis repository. Saving any modifier (fits, blanks, ic
+    factors, tags) commits to the repository so the HEAD stands in for the modifier
+    shas.
+
+    identity is included because snapshots reference the analysis objects. The same
+    analyses loaded again, e.g. into a second pipeline, are not interchangeable
+    """
+    h = hashlib.sha1()
+    repos = set()
+    for ai in ans:
+        h.update(
+            "{}|{}|{}|{};".format(
+                id(ai),
+                getattr(ai, "uuid", None),
+                getattr(ai, "temp_status", None),
+                getattr(ai, "tag", None),
+            ).encode("utf-8")
+        )
+        repo = getattr(ai, "repository_identifier", None)
+        if repo:
+            repos.add(repo)
+
+    for repo in sorted(repos):
+        head = get_repository_head(repository_path(repo))
+        h.update("{}={};".format(repo, head).encode("utf-8"))
+
+    return h.hexdigest()
+
+
+def _copy(v):
+    if isinstance(v, list):
+        return list(v)
+    elif isinstance(v, dict):
+        return dict(v)
+    elif isinstance(v, set):
+        return set(v)
+    return v
+
+
+def snapshot_analyses(state):
+    """
+    return [(analysis, {attr: value}), ...] of the ``ANALYSIS_STATE_ATTRS`` of the
+    analyses held by ``state``
+    """
+    ret = []
+    seen = set()
+    for v in state.__dict__.values():
+        if not isinstance(v, list):
+            continue
+
+        for ai in v:
+            if id(ai) in seen or not hasattr(ai, "uuid"):
+                continue
+
+            seen.add(id(ai))
+            attrs = {a: getattr(ai, a) for a in ANALYSIS_STATE_ATTRS if hasattr(ai, a)}
+            if attrs:
+                ret.append((ai, attrs))
+    return ret
+
+
+class CacheEntry(object):
+    __slots__ = ("state", "runtime", "parent", "analyses")
+
+    def __init__(self, state, runtime, parent=None, analyses=None):
+        self.state = state
+        self.runtime = runtime
+        self.parent = parent
+        self.analyses = analyses or []
+
+
+class NodeCacheRun(object):
+    """
+    chains the keys of the enabled nodes of a single pipeline run
+    """
+
+    def __init__(self, cache, enabled=True):
+        self.enabled = enabled
+        self.key = ""
+        self._parent = None
+        self._cache = cache
+
+    def lookup(self, node):
+        """
+        return the cached result of ``node`` or None if it has to run
+        """
+        if self.enabled and node.cacheable:
+            self._parent = self.key
+            self.key = make_key(self.key, node.get_cache_key())
+            return self._cache.get(self.key)
+
+        # a node that is not memoized can change the state in ways the keys of the
+        # nodes after it do not capture
+        self.enabled = False
+
+    def restore(self, entry, state):
+        self._cache.restore(entry, state)
+
+    def store(self, state, runtime):
+        if self.enabled:
+            self._cache.put(self.key, state, runtime, parent=self._parent)
+
+
+class NodeResultCache(object):
+    def __init__(self, max_size=64):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.saved = 0
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def clear(self):
+        self._entries.clear()
+
+    def new_run(self, enabled=True):
+        return NodeCacheRun(self, enabled)
+
+    def stats(self):
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "saved": self.saved,
+        }
+
+    def get(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return
+
+        self.hits += 1
+        self.saved += entry.runtime
+        self._entries.move_to_end(key)
+        return entry
+
+    def put(self, key, state, runtime, parent=None):
+        """
+        snapshot ``state`` as the result of the node keyed by ``key``. ``parent`` is
+        the key of the node before it
+        """
+        if parent is not None:
+            # the node ran again on the same input and changed the analyses the
+            # results of its other runs reference
+            self._evict([k for k, e in self._entries.items() if e.parent == parent and k != key])
+
+        snapshot = {k: _copy(v) for k, v in state.__dict__.items()}
+        self._entries[key] = CacheEntry(snapshot, runtime, parent, snapshot_analyses(state))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def restore(self, entry, state):
+        for k, v in entry.state.items():
+            setattr(state, k, _copy(v))
+
+        for ai, attrs in entry.analyses:
+            for a, v in attrs.items():
+                setattr(ai, a, v)
+
+    def _evict(self, keys):
+        while keys:
+            for k in keys:
+                self._entries.pop(k, None)
+
+            keys = [k for k, e in self._entries.items() if e.parent in keys]
+
+
+# ============= EOF =============================================
@@ -49,6 +49,9 @@ class BaseNode(ColumnSorterMixin):
     use_state_unknowns = True
     use_state_references = True
 
+    # results may be memoized by the engine. see pychron.pipeline.node_cache
+    cacheable = False
+
     def __init__(self, *args, **kw):
         super(BaseNode, self).__init__(*args, **kw)
         self.bind_preferences()
@@ -157,6 +160,18 @@ class BaseNode(ColumnSorterMixin):
 
         return d
 
+    def get_cache_key(self):
+        """
+        everything, other than the upstream EngineState, that determines the result
+        of ``run``
+        """
+        d = self.to_template()
+        self._cache_key_hook(d)
+        return d
+
+    def _cache_key_hook(self, d):
+        pass
+
     def _options_factory(self):
         if self.options_klass:
             return self.options_klass()
@@ -36,6 +36,7 @@ from pychron.pipeline.csv_dataset_factory import (
     CSVIsochronDataSetFactory,
     CSVRegressionDataSetFactory,
 )
+from pychron.pipeline.node_cache import analyses_fingerprint
 from pychron.pipeline.nodes.base import BaseNode
 from pychron.pychron_constants import ANALYSIS_TYPES
 
@@ -125,6 +126,10 @@ class DataNode(DVCNode):
     name = "Data"
 
     analysis_kind = None
+    cacheable = True
+
+    def _cache_key_hook(self, d):
+        d["analyses"] = analyses_fingerprint(getattr(self, self.analysis_kind))
 
     def configure(self, pre_run=False, **kw):
         # print(self, pre_run, getattr(self, self.analysis_kind), self.index)
@@ -367,6 +372,9 @@ class FluxMonitorsNode(DataNode):
 
 
 class BaseAutoUnknownNode(UnknownNode):
+    # the analyses change between runs without the node being reconfigured
+    cacheable = False
+
     mode = Enum("Normal", "Window")
     hours = Int(12)
     mass_spectrometer = Str
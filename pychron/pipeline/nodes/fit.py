@@ -17,15 +17,16 @@ from __future__ import annotations
 
 from typing import Any, List, Optional
 
-from numpy import inf, hstack, invert
+from apptools.preferences.preference_binding import bind_preference
+from numpy import hstack, invert
 from pyface.confirmation_dialog import confirm
 from pyface.constant import YES
 
 # ============= enthought library imports =======================
-from traits.api import Bool, List, Instance
+from traits.api import Bool, List, Instance, Int
 
 from pychron.core.helpers.iterfuncs import groupby_group_id
-from pychron.core.progress import progress_loader
+from pychron.core.progress import CancelLoadingError, progress_loader
 from pychron.options.options_manager import (
     BlanksOptionsManager,
     ICFactorOptionsManager,
@@ -42,6 +43,7 @@ from pychron.pipeline.editors.flux_results_editor import (
     BracketingFluxResultsEditor,
 )
 from pychron.pipeline.editors.results_editor import IsoEvolutionResultsEditor
+from pychron.pipeline.iso_evo_fit import fit_analysis, fit_analyses_parallel
 from pychron.pipeline.nodes.figure import FigureNode
 from pychron.pipeline.results.define_equilibration import DefineEquilibrationResult
 from pychron.pipeline.results.iso_evo import IsoEvoResult
@@ -280,9 +282,19 @@ class FitIsotopeEvolutionNode(FitNode):
     plotter_options_manager_klass = IsotopeEvolutionOptionsManager
     name = "Fit IsoEvo"
     use_plotting = False
+    cacheable = True
     _refit_message = "The selected Isotope Evolutions have already been fit. Would you like to skip refitting?"
 
     classifier = Instance("pychron.classifier.isotope_classifier.IsotopeClassifier")
+    use_parallel_refit = Bool
+    refit_workers = Int
+
+    def bind_preferences(self):
+        super(FitIsotopeEvolutionNode, self).bind_preferences()
+        bind_preference(
+            self, "use_parallel_refit", "pychron.pipeline.use_parallel_refit"
+        )
+        bind_preference(self, "refit_workers", "pychron.pipeline.refit_workers")
 
     def _check_refit(self, analysis: Any) -> Optional[bool]:
         for k in self._keys:
@@ -301,6 +313,10 @@ class FitIsotopeEvolutionNode(FitNode):
     def _options_view_default(self):
         return view("Iso Evo Options")
 
+    def _cache_key_hook(self, d):
+        po = self.plotter_options_manager.selected_options
+        d["plotter_options"] = po.make_state() if po else None
+
     def _configure_hook(self):
         pom = self.plotter_options_manager
         if self.unknowns:
@@ -330,7 +346,10 @@ class FitIsotopeEvolutionNode(FitNode):
             if self.check_refit(unks):
                 return
 
-            fs = progress_loader(unks, self._assemble_result, threshold=1, step=10)
+            if self.use_parallel_refit and len(unks) > 1:
+                fs = self._assemble_results_parallel(unks)
+            else:
+                fs = progress_loader(unks, self._assemble_result, threshold=1, step=10)
 
             if self.editor:
                 self.editor.analysis_groups = [(ai,) for ai in unks]
@@ -344,151 +363,32 @@ class FitIsotopeEvolutionNode(FitNode):
         if prog:
             prog.change_message("Load raw data {}".format(xi.record_id))
 
-        fits = self._fits
-        xi.load_raw_data(self._keys)
+        return [
+            self._make_result(xi, iso, values)
+            for iso, values in fit_analysis(xi, self._fits, self._keys)
+        ]
 
-        xi.set_fits(fits)
-        isotopes = xi.isotopes
-        for f in fits:
-            k = f.name
-            if k in isotopes:
-                iso = isotopes[k]
-            else:
-                iso = xi.get_isotope(detector=k, kind="baseline")
-
-            if iso:
-                i, e = iso.value, iso.error
-                try:
-                    pe = abs(e / i * 100)
-                except ZeroDivisionError:
-                    pe = inf
-
-                smart_filter_coefficients = f.get_filter_coefficients()
-                smart_filter_goodness = None
-                smart_filter_threshold = None
-                smart_filter = e
-                if smart_filter_coefficients:
-                    smart_filter_threshold = f.smart_filter_values(i)
-                    smart_filter_goodness = smart_filter < f.smart_filter_values(i)
-
-                goodness_threshold = f.goodness_threshold
-                int_err_goodness = None
-                if goodness_threshold:
-                    int_err_goodness = bool(pe < goodness_threshold)
-
-                signal_to_baseline_threshold = f.signal_to_baseline_goodness
-                signal_to_baseline_percent_threshold = (
-                    f.signal_to_baseline_percent_goodness
-                )
-                signal_to_baseline_goodness = None
-                signal_to_baseline = 0
-                if hasattr(iso, "baseline"):
-                    bs = iso.baseline.error
-                    try:
-                        signal_to_baseline = abs(bs / i * 100)
-                    except ZeroDivisionError:
-                        signal_to_baseline = 0
-
-                    if (
-                        signal_to_baseline_threshold
-                        and signal_to_baseline_percent_threshold
-                    ):
-                        if signal_to_baseline > signal_to_baseline_threshold:
-                            signal_to_baseline_goodness = bool(
-                                pe < signal_to_baseline_percent_threshold
-                            )
-
-                slope = iso.get_slope()
-                slope_goodness = None
-                slope_threshold = None
-                if f.slope_goodness:
-                    if f.slope_goodness_intensity < i:
-                        slope_threshold = f.slope_goodness
-                        slope_goodness = bool(slope < 0 or slope < slope_threshold)
-
-                outliers = iso.noutliers()
-                outliers_threshold = None
-                outlier_goodness = None
-                if f.outlier_goodness:
-                    outliers_threshold = f.outlier_goodness
-                    outlier_goodness = bool(outliers < f.outlier_goodness)
-
-                curvature_goodness = None
-                curvature = 0
-                curvature_threshold = None
-                if f.curvature_goodness:
-                    curvature = iso.get_curvature(f.curvature_goodness_at)
-                    curvature_threshold = f.curvature_goodness
-                    curvature_goodness = curvature < curvature_threshold
-
-                nstr = str(iso.n)
-                if iso.noutliers():
-                    nstr = "{}({})".format(iso.n - iso.noutliers(), nstr)
-
-                rsquared = iso.rsquared_adj
-                rsquared_goodness = None
-                rsquared_threshold = 0
-                if f.rsquared_goodness:
-                    rsquared_threshold = f.rsquared_goodness
-                    rsquared_goodness = rsquared > rsquared_threshold
-
-                if hasattr(iso, "blank"):
-                    try:
-                        signal_to_blank = iso.blank.value / iso.value * 100
-                    except ZeroDivisionError:
-                        signal_to_blank = 0
-                else:
-                    signal_to_blank = 0
-
-                signal_to_blank_goodness = None
-                signal_to_blank_threshold = 0
-                if f.signal_to_blank_goodness:
-                    signal_to_blank_threshold = f.signal_to_blank_goodness
-                    signal_to_blank_goodness = (
-                        signal_to_blank < signal_to_blank_threshold
-                    )
-                klass = 1
-                if self.classifier:
-                    klass, prob = self.classifier.classify_isotope(iso)
-
-                yield IsoEvoResult(
-                    analysis=xi,
-                    isotope_obj=iso,
-                    klass=klass,
-                    nstr=nstr,
-                    intercept_value=i,
-                    intercept_error=e,
-                    normalized_error=e * iso.n**0.5,
-                    percent_error=pe,
-                    int_err=pe,
-                    int_err_threshold=goodness_threshold,
-                    int_err_goodness=int_err_goodness,
-                    slope=slope,
-                    slope_threshold=slope_threshold,
-                    slope_goodness=slope_goodness,
-                    outlier=outliers,
-                    outlier_threshold=outliers_threshold,
-                    outlier_goodness=outlier_goodness,
-                    curvature=curvature,
-                    curvature_threshold=curvature_threshold,
-                    curvature_goodness=curvature_goodness,
-                    rsquared=rsquared,
-                    rsquared_threshold=rsquared_threshold,
-                    rsquared_goodness=rsquared_goodness,
-                    signal_to_blank=signal_to_blank,
-                    signal_to_blank_threshold=signal_to_blank_threshold,
-                    signal_to_blank_goodness=signal_to_blank_goodness,
-                    signal_to_baseline=signal_to_baseline,
-                    signal_to_baseline_goodness=signal_to_baseline_goodness,
-                    signal_to_baseline_threshold=signal_to_baseline_threshold,
-                    signal_to_baseline_percent_threshold=signal_to_baseline_percent_threshold,
-                    smart_filter_goodness=smart_filter_goodness,
-                    smart_filter_threshold=smart_filter_threshold,
-                    smart_filter=smart_filter,
-                    regression_str=iso.regressor.tostring(),
-                    fit=iso.fit,
-                    isotope=k,
+    def _assemble_results_parallel(self, unks):
+        try:
+            return [
+                self._make_result(xi, iso, values)
+                for xi, results in fit_analyses_parallel(
+                    unks,
+                    self._fits,
+                    self._keys,
+                    max_workers=self.refit_workers,
                 )
+                for iso, values in results
+            ]
+        except CancelLoadingError:
+            return []
+
+    def _make_result(self, xi, iso, values):
+        klass = 1
+        if self.classifier:
+            klass, prob = self.classifier.classify_isotope(iso)
+
+        return IsoEvoResult(analysis=xi, isotope_obj=iso, klass=klass, **values)
 
 
 class DefineEquilibrationNode(FitNode):
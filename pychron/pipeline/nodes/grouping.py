@@ -56,6 +56,7 @@ class GroupingNode(BaseNode):
     analysis_kind = "unknowns"
     name = "Grouping"
     title = "Edit Grouping"
+    cacheable = True
 
     attribute = Enum("Group", "Graph", "Tab", "Aux", "SubGroup")
     # _attr = 'group_id'
@@ -75,6 +76,9 @@ class GroupingNode(BaseNode):
     def _to_template(self, d):
         d["key"] = self.by_key
 
+    def _cache_key_hook(self, d):
+        d["attribute"] = self.attribute
+
     def _generate_key(self):
         key = self.by_key
         if key != "No Grouping":
@@ -166,6 +170,9 @@ class SubGroupingNode(GroupingNode, Preferred):
     _sorting_enabled = False
     _parent_group = "group_id"
 
+    # regroups in pre_run and depends on the preferred values
+    cacheable = False
+
     def load(self, nodedict):
         self.by_key = nodedict.get("key", "Aliquot")
 
@@ -36,7 +36,11 @@ from pychron.core.helpers.formatting import floatfmt
 from pychron.core.helpers.iterfuncs import groupby_key
 from pychron.core.stats import calculate_weighted_mean
 from pychron.core.stats.peak_detection import fast_find_peaks
-from pychron.core.stats.probability_curves import cumulative_probability, kernel_density
+from pychron.core.stats.probability_curves import (
+    cumulative_probability,
+    kernel_density,
+    IncrementalProbabilityCurve,
+)
 from pychron.graph.explicit_legend import ExplicitLegend
 from pychron.graph.ticks import IntTickGenerator
 from pychron.pipeline.plot.overlays.correlation_ellipses_overlay import (
@@ -168,6 +172,7 @@ class Ideogram(BaseArArFigure):
     _labels = None
     _legend_plot = None
     _legend_plots = None
+    _probability_curve = None
 
     def plot(self, plots, legend=None):
         """
@@ -911,11 +916,12 @@ class Ideogram(BaseArArFigure):
         else:
             sel = []
 
-        fxs = [a for i, a in enumerate(self.xs) if i not in sel]
+        ssel = set(sel)
+        fxs = [a for i, a in enumerate(self.xs) if i not in ssel]
 
         if fxs:
-            fxes = [a for i, a in enumerate(self.xes) if i not in sel]
-            xs, ys = self._calculate_probability_curve(fxs, fxes)
+            fxes = [a for i, a in enumerate(self.xes) if i not in ssel]
+            xs, ys = self._calculate_selection_curve(fxs, fxes, ssel)
             wm, we, mswd, valid_mswd, n, pvalue = self._calculate_stats(xs, ys)
         else:
             n = 0
@@ -948,7 +954,7 @@ class Ideogram(BaseArArFigure):
 
             if sel:
                 dp.visible = True
-                xs, ys = self._calculate_probability_curve(self.xs, self.xes)
+                xs, ys = self._calculate_original_curve()
                 dp.value.set_data(ys)
                 dp.index.set_data(xs)
                 mi, ma = min(mi, min(ys)), max(mi, max(ys))
@@ -1052,9 +1058,7 @@ class Ideogram(BaseArArFigure):
         s.history_id = self.group_id
         return s
 
-    def _calculate_probability_curve(
-        self, ages, errors, calculate_limits=False, limits=None
-    ):
+    def _get_probability_curve_limits(self, limits=None):
         xmi, xma = None, None
         if limits:
             xmi, xma = limits
@@ -1063,6 +1067,47 @@ class Ideogram(BaseArArFigure):
             xmi, xma = self.graph.get_x_limits()
             if xmi == -Inf or xma == Inf:
                 xmi, xma = self.xmi, self.xma
+        return xmi, xma
+
+    def _get_incremental_curve(self):
+        """
+        return the incremental curve of all analyses for the current x limits or
+        None if the curve kind does not support incremental updates
+        """
+        if self.options.probability_curve_kind == "kernel":
+            # the bandwidth depends on every analysis
+            return
+
+        xmi, xma = self._get_probability_curve_limits()
+        curve = self._probability_curve
+        if curve is None or not curve.matches(self.xs, self.xes, xmi, xma, N):
+            curve = IncrementalProbabilityCurve(self.xs, self.xes, xmi, xma, n=N)
+            self._probability_curve = curve
+        return curve
+
+    def _calculate_selection_curve(self, ages, errors, sel):
+        """
+        probability curve of the analyses not in ``sel``. ``ages`` and ``errors``
+        are the unselected values
+        """
+        curve = self._get_incremental_curve()
+        if curve is None:
+            return self._calculate_probability_curve(ages, errors)
+
+        curve.set_excluded(sel)
+        return curve.x, curve.probs
+
+    def _calculate_original_curve(self):
+        curve = self._get_incremental_curve()
+        if curve is None:
+            return self._calculate_probability_curve(self.xs, self.xes)
+
+        return curve.x, curve.original
+
+    def _calculate_probability_curve(
+        self, ages, errors, calculate_limits=False, limits=None
+    ):
+        xmi, xma = self._get_probability_curve_limits(limits)
 
         opt = self.options
 
@@ -50,7 +50,10 @@ from pychron.pipeline.tables.util import (
     value,
 )
 from pychron.pipeline.tables.xlsx_table_options import XLSXAnalysisTableWriterOptions
-from pychron.processing.analyses.analysis_group import InterpretedAgeGroup
+from pychron.processing.analyses.analysis_group import (
+    InterpretedAgeGroup,
+    find_group_plateaus,
+)
 from pychron.pychron_constants import (
     PLUSMINUS_NSIGMA,
     NULL_STR,
@@ -176,6 +179,10 @@ class XLSXAnalysisTableWriter(BaseTableWriter):
         self._ital = self._workbook.add_format({"italic": True})
 
         unknowns = groups.get("unknowns")
+        # search the plateaus of all step heat groups at once
+        find_group_plateaus(
+            list(unknowns or []) + list(groups.get("machine_unknowns") or [])
+        )
         if unknowns:
             # make a human optimized table
             unknown_groups, subgroups = self._make_human_unknowns(unknowns)
@@ -17,7 +17,7 @@
 from envisage.ui.tasks.preferences_pane import PreferencesPane
 
 # ============= enthought library imports =======================
-from traits.api import Str, List, Bool
+from traits.api import Str, List, Bool, Int
 from traitsui.api import View, Item, UItem, VGroup
 
 # ============= standard library imports ========================
@@ -32,6 +32,9 @@ class PipelinePreferences(BasePreferencesHelper):
     preferences_path = "pychron.pipeline"
     skip_meaning = Str
     use_arar_calculations = Bool
+    use_node_cache = Bool(True)
+    use_parallel_refit = Bool
+    refit_workers = Int
 
     _skip_meaning = List
     _initialized = False
@@ -73,7 +76,25 @@ class PipelinePreferencesPane(PreferencesPane):
             label="Skip Tag Associations",
         )
         calcgrp = BorderVGroup(
-            Item("use_arar_calculations", label="ArAr Calculations Node")
+            Item("use_arar_calculations", label="ArAr Calculations Node"),
+            Item(
+                "use_node_cache",
+                label="Cache Node Results",
+                tooltip="Skip nodes whose options and input analyses have not "
+                "changed since the last run",
+            ),
+            Item(
+                "use_parallel_refit",
+                label="Parallel Iso Evo Refits",
+                tooltip="Load raw data and regress isotope evolutions in a "
+                "pool of worker threads",
+            ),
+            Item(
+                "refit_workers",
+                label="Refit Workers",
+                tooltip="Number of worker threads. 0 = automatic",
+                enabled_when="use_parallel_refit",
+            ),
         )
         v = View(VGroup(skipgrp, calcgrp))
         return v
@@ -0,0 +1,43 @@
+import unittest
+from unittest import mock
+
+from numpy import allclose, array, isnan, nan
+
+from pychron.pipeline.plot.plotter.ideogram import Ideogram
+
+
+class IdeogramCurveTestCase(unittest.TestCase):
+    def _ideogram(self, xs):
+        ideo = Ideogram(xs=array(xs), xes=array([1.0] * len(xs)), xmi=0, xma=20)
+        ideo.options = mock.Mock(probability_curve_kind="cumulative")
+        ideo.graph = mock.Mock()
+        ideo.graph.get_x_limits.return_value = (0, 20)
+        return ideo
+
+    def test_original_curve(self):
+        ideo = self._ideogram([9.0, 10.0, 12.0])
+        x, ys = ideo._calculate_original_curve()
+
+        ex, eys = ideo._calculate_probability_curve(ideo.xs, ideo.xes)
+        self.assertTrue(allclose(x, ex))
+        self.assertTrue(allclose(ys, eys))
+
+    def test_original_curve_nan(self):
+        """
+        the original curve is built from every analysis, like the main curve,
+        so a NaN age is not dropped from it
+        """
+        ideo = self._ideogram([9.0, 10.0, nan])
+
+        # an excluded NaN age leaves the selection curve finite
+        _, ys = ideo._calculate_selection_curve(ideo.xs[:2], ideo.xes[:2], [2])
+        self.assertFalse(isnan(ys).any())
+
+        _, ys = ideo._calculate_original_curve()
+        _, eys = ideo._calculate_probability_curve(ideo.xs, ideo.xes)
+        self.assertTrue(isnan(eys).all())
+        self.assertTrue(isnan(ys).all())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+import threading
+import unittest
+
+from numpy import linspace
+from numpy.random import RandomState
+from traits.api import HasTraits, Str
+
+from pychron.options.iso_evo import IsoFilterFitAuxPlot
+from pychron.pipeline.iso_evo_fit import fit_analysis, fit_analyses_parallel
+from pychron.processing.isotope import Isotope
+
+
+class StubAnalysis(HasTraits):
+    record_id = Str
+
+    def __init__(self, idx, fail=False):
+        super(StubAnalysis, self).__init__(record_id="12345-{:02d}".format(idx))
+        self.idx = idx
+        self.fail = fail
+        self.isotopes = {k: Isotope(k, d) for k, d in (("Ar40", "H1"), ("Ar39", "AX"))}
+        self.loaded_by = None
+        self.changed = []
+        self.on_trait_change(self._record_change)
+
+    def _record_change(self, obj, name, old, new):
+        self.changed.append((name, threading.current_thread()))
+
+    def load_raw_data(self, keys):
+        if self.fail:
+            raise ValueError("no raw data")
+
+        self.loaded_by = threading.current_thread()
+        rs = RandomState(self.idx)
+        xs = linspace(1, 100, 50)
+        for k in keys:
+            iso = self.isotopes[k]
+            iso.xs = xs
+            iso.ys = 100 + self.idx - 0.1 * xs + rs.normal(0, 0.5, 50)
+
+    def set_fits(self, fits):
+        for f in fits:
+            self.isotopes[f.name].set_fit(f)
+
+    def get_isotope(self, detector=None, kind=None):
+        pass
+
+
+class FitAnalysesParallelTestCase(unittest.TestCase):
+    def setUp(self):
+        self.fits = [
+            IsoFilterFitAuxPlot(name="Ar40", fit="linear"),
+            IsoFilterFitAuxPlot(name="Ar39", fit="parabolic"),
+        ]
+        self.keys = ["Ar40", "Ar39"]
+
+    def _parallel(self, ans, **kw):
+        return list(fit_analyses_parallel(ans, self.fits, self.keys, use_progress=False, **kw))
+
+    def test_matches_serial(self):
+        serial = [
+            fit_analysis(a, self.fits, self.keys) for a in [StubAnalysis(i) for i in range(20)]
+        ]
+        ans = [StubAnalysis(i) for i in range(20)]
+        parallel = self._parallel(ans, max_workers=4)
+
+        self.assertListEqual([a for a, _ in parallel], ans)
+        for sr, (a, pr) in zip(serial, parallel):
+            self.assertEqual(len(pr), 2)
+            for (_, sv), (iso, pv) in zip(sr, pr):
+                self.assertIs(iso, a.isotopes[pv["isotope"]])
+                self.assertEqual(sv["fit"], pv["fit"])
+                self.assertAlmostEqual(sv["intercept_value"], pv["intercept_value"])
+                self.assertAlmostEqual(sv["intercept_error"], pv["intercept_error"])
+
+    def test_regressed(self):
+        ((_, results),) = self._parallel([StubAnalysis(3)], max_workers=1)
+        (_, ar40), (_, ar39) = results
+        self.assertEqual(ar40["fit"], "linear")
+        self.assertEqual(ar39["fit"], "parabolic")
+        self.assertAlmostEqual(ar40["intercept_value"], 103, delta=1)
+        self.assertAlmostEqual(ar40["slope"], -0.1, delta=0.01)
+
+    def test_no_traits_changes_in_workers(self):
+        ans = [StubAnalysis(i) for i in range(8)]
+        self._parallel(ans, max_workers=4)
+        main = threading.current_thread()
+        for a in ans:
+            self.assertIsNot(a.loaded_by, main)
+            self.assertListEqual(a.changed, [])
+
+    def test_failure_skipped(self):
+        ans = [StubAnalysis(0), StubAnalysis(1, fail=True), StubAnalysis(2)]
+        ret = self._parallel(ans, max_workers=2)
+        self.assertListEqual([a for a, _ in ret], [ans[0], ans[2]])
+
+
+if __name__ == "__main__":
+    unittest.main()
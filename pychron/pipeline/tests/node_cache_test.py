@@ -0,0 +1,168 @@
+import unittest
+
+from pychron.pipeline.node_cache import NodeResultCache, analyses_fingerprint
+from pychron.pipeline.state import EngineState
+
+
+class StubAnalysis:
+    repository_identifier = None
+
+    def __init__(self, uuid):
+        self.uuid = uuid
+        self.temp_status = "ok"
+        self.tag = "ok"
+        self.group_id = 0
+
+
+class StubNode:
+    cacheable = True
+
+    def __init__(self, option="a"):
+        self.option = option
+        self.nruns = 0
+
+    def get_cache_key(self):
+        return {"klass": self.__class__.__name__, "option": self.option}
+
+    def run(self, state):
+        self.nruns += 1
+        self._run(state)
+
+
+class LoadNode(StubNode):
+    def __init__(self, analyses):
+        super(LoadNode, self).__init__()
+        self.unknowns = analyses
+
+    def get_cache_key(self):
+        d = super(LoadNode, self).get_cache_key()
+        d["analyses"] = analyses_fingerprint(self.unknowns)
+        return d
+
+    def _run(self, state):
+        state.unknowns.extend(self.unknowns)
+
+
+class GroupNode(StubNode):
+    def _run(self, state):
+        n = 2 if self.option == "a" else 3
+        for i, ai in enumerate(state.unknowns):
+            ai.group_id = i % n
+        state.grouped = True
+
+
+class FigureNode(StubNode):
+    cacheable = False
+
+    def _run(self, state):
+        state.editors.append(self.option)
+
+
+class NodeResultCacheTestCase(unittest.TestCase):
+    def setUp(self):
+        self.analyses = [StubAnalysis("u{}".format(i)) for i in range(4)]
+        self.load = LoadNode(self.analyses)
+        self.group = GroupNode()
+        self.figure = FigureNode()
+        self.nodes = [self.load, self.group, self.figure]
+        self.cache = NodeResultCache()
+
+    def _run(self, enabled=True):
+        # same sequence as PipelineEngine.run_pipeline
+        state = EngineState()
+        cache_run = self.cache.new_run(enabled)
+        for node in self.nodes:
+            entry = cache_run.lookup(node)
+            if entry:
+                cache_run.restore(entry, state)
+            else:
+                node.run(state)
+                cache_run.store(state, 0.1)
+        return state
+
+    def test_skip_unchanged(self):
+        self._run()
+        state = self._run()
+        self.assertEqual(self.load.nruns, 1)
+        self.assertEqual(self.group.nruns, 1)
+        self.assertEqual(self.figure.nruns, 2)
+        self.assertListEqual(state.unknowns, self.analyses)
+        self.assertTrue(state.grouped)
+        self.assertListEqual(state.editors, ["a"])
+        self.assertEqual(self.cache.hits, 2)
+        self.assertAlmostEqual(self.cache.saved, 0.2)
+
+    def test_option_change(self):
+        self._run()
+        self.group.option = "b"
+        self._run()
+        self.assertEqual(self.load.nruns, 1)
+        self.assertEqual(self.group.nruns, 2)
+
+    def test_upstream_change(self):
+        self._run()
+        self.analyses[0].temp_status = "omit"
+        self._run()
+        self.assertEqual(self.load.nruns, 2)
+        self.assertEqual(self.group.nruns, 2)
+
+    def test_reloaded_analyses(self):
+        self._run()
+        self.load.unknowns = [StubAnalysis(a.uuid) for a in self.analyses]
+        state = self._run()
+        self.assertEqual(self.load.nruns, 2)
+        self.assertListEqual(state.unknowns, self.load.unknowns)
+
+    def test_grouping_change(self):
+        self._run()
+        self.group.option = "b"
+        self._run()
+        self.assertListEqual([a.group_id for a in self.analyses], [0, 1, 2, 0])
+
+        self.group.option = "a"
+        self._run()
+        self.assertListEqual([a.group_id for a in self.analyses], [0, 1, 0, 1])
+        # the results of the first grouping were replaced by the second
+        self.assertEqual(self.group.nruns, 3)
+
+    def test_grouping_restored(self):
+        self._run()
+        # e.g. regrouped by a node after the cached nodes
+        for ai in self.analyses:
+            ai.group_id = 5
+
+        self._run()
+        self.assertEqual(self.group.nruns, 1)
+        self.assertListEqual([a.group_id for a in self.analyses], [0, 1, 0, 1])
+
+    def test_not_cacheable_breaks_chain(self):
+        self.nodes = [self.load, self.figure, self.group]
+        self._run()
+        self._run()
+        self.assertEqual(self.load.nruns, 1)
+        self.assertEqual(self.group.nruns, 2)
+
+    def test_snapshot_isolated(self):
+        self._run()
+        state = self._run()
+        state.unknowns.append(StubAnalysis("extra"))
+        state = self._run()
+        self.assertListEqual(state.unknowns, self.analyses)
+
+    def test_disabled(self):
+        self._run(enabled=False)
+        self._run(enabled=False)
+        self.assertEqual(self.load.nruns, 2)
+        self.assertEqual(len(self.cache), 0)
+
+    def test_lru(self):
+        cache = NodeResultCache(max_size=2)
+        state = EngineState()
+        for k in "abc":
+            cache.put(k, state, 0)
+        self.assertIsNone(cache.get("a"))
+        self.assertIsNotNone(cache.get("c"))
+
+
+if __name__ == "__main__":
+    unittest.main()
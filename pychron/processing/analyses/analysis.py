@@ -20,7 +20,7 @@ from math import ceil
 from operator import attrgetter
 
 from chaco.array_data_source import ArrayDataSource
-from numpy import inf, polyfit, polyval, arange, argmin
+from numpy import inf, polyfit, polyval, arange, argmin, array, asarray, tile, where
 from pyface.message_dialog import information
 from pyface.qt import QtCore
 from traits.api import Event, Dict, List, Str
@@ -32,7 +32,8 @@ from pychron.core.helpers.fits import convert_fit
 from pychron.core.helpers.formatting import format_percent_error, floatfmt
 from pychron.core.helpers.isotope_utils import sort_isotopes
 from pychron.core.helpers.logger_setup import new_logger
-from pychron.core.regression.ols_regressor import PolynomialRegressor
+from pychron.core.regression.batch_regressor import batch_regress
+from pychron.core.regression.tinv import tinv
 from pychron.envisage.view_util import open_view
 from pychron.experiment.utilities.runid import make_runid, make_aliquot_step
 from pychron.graph.error_bar_overlay import ErrorBarOverlay
@@ -77,21 +78,36 @@ class CloseHandler(Handler):
         return True
 
 
-def show_inspection_factory(record_id, isotopes):
-    from pychron.graph.stacked_graph import StackedGraph
+def truncation_curve(xs, ys, fit, step=10):
+    """
+    fit ``xs``, ``ys`` truncated after every ``step`` points, starting with the first
+    5 points. All truncations are fit in one ``batch_regress`` call.
+
+    returns the truncations, the intercept errors and the intercepts. The errors are
+    the 95% confidence intervals ``PolynomialRegressor.predict_error`` returns by
+    default
+    """
+    xs = asarray(xs, dtype=float)
+    ys = asarray(ys, dtype=float)
+    ts = arange(4, xs.shape[0], step)
+
+    X = tile(xs, (ts.shape[0], 1))
+    excluded = arange(xs.shape[0]) > ts[:, None]
+    result = batch_regress(X, tile(ys, (ts.shape[0], 1)), fit, excluded=excluded)
 
-    def calculate(dxs, dys, fit):
-        reg = PolynomialRegressor(xs=dxs, ys=dys)
-        reg.fit = fit
-        ts = arange(4, len(dxs), 10)
-        ys, iys = [], []
-        for ti in ts:
-            reg.set_truncate(str(ti))
-            reg.calculate()
-            ys.append(reg.predict_error(0))
-            iys.append(reg.predict(0))
+    # see BaseRegressor._calculate_confidence_interval
+    n = result.n
+    xm = where(excluded, 0, X).sum(axis=1) / n
+    ssx = where(excluded, 0, (X - xm[:, None]) ** 2).sum(axis=1)
+    syx = (result.ssr / (n - 2)) ** 0.5
+    ti = array([tinv(0.05, ni - 1) for ni in n])
+    es = ti * syx * (1 / n + xm**2 / ssx) ** 0.5 / 2.0
 
-        return ts, ys, iys
+    return ts, es, result.predict(0)
+
+
+def show_inspection_factory(record_id, isotopes):
+    from pychron.graph.stacked_graph import StackedGraph
 
     iso = isotopes[0]
     dxs, dys = iso.offset_xs, iso.ys
@@ -104,14 +120,14 @@ def show_inspection_factory(record_id, isotopes):
     g.set_y_title("Intercept Error %", plotid=0)
     g.set_y_title("T-zero Intensity", plotid=1)
 
-    xs, ys, iys = calculate(dxs, dys, "linear")
+    xs, ys, iys = truncation_curve(dxs, dys, "linear")
     lmin, lidx = min(ys), argmin(ys)
 
     g.new_series(xs, ys, plotid=0)
     g.new_series(xs, iys, plotid=1)
     g.set_series_label("Linear", plotid=0)
 
-    xs, ys, iys = calculate(dxs, dys, "parabolic")
+    xs, ys, iys = truncation_curve(dxs, dys, "parabolic")
     pmin, pidx = min(ys), argmin(ys)
 
     g.new_series(xs, ys, plotid=0)
@@ -441,6 +457,8 @@ class IdeogramPlotable(HasTraits):
     uage = None
     temp_status = Str("ok")
     otemp_status = None
+    # fired when the values of the analysis are recalculated
+    recalculated_event = Event
     _record_id = None
     temp_selected = False
     comment = ""
@@ -43,8 +43,8 @@ from pychron.core.pychron_traits import StepStr
 from pychron.core.stats import calculate_mswd_probability
 from pychron.core.stats.core import (
     calculate_mswd,
-    calculate_weighted_mean,
     validate_mswd,
+    weighted_mean_stats,
 )
 from pychron.core.utils import alphas
 from pychron.experiment.utilities.runid import make_aliquot
@@ -56,6 +56,7 @@ from pychron.processing.argon_calculations import (
     age_equation,
     calculate_isochron,
 )
+from pychron.processing.plateau import find_plateaus_batch
 from pychron.processing.sclf import (
     schaen_2020_1,
     schaen_2020_2,
@@ -113,6 +114,7 @@ class AnalysisGroup(IdeogramPlotable):
     shapiro_wilk_pvalue = AGProperty()
     skewness = AGProperty()
     outlier_options = Dict
+    _stats_cache = Dict
 
     weighted_age = AGProperty()
     arith_age = AGProperty()
@@ -191,6 +193,18 @@ class AnalysisGroup(IdeogramPlotable):
     def __init__(self, *args, **kw):
         super(AnalysisGroup, self).__init__(make_arar_constants=False, *args, **kw)
 
+    @on_trait_change(
+        "dirty, omit_by_tag, analyses, analyses_items, analyses:[temp_status, recalculated_event]"
+    )
+    def clear_stats_cache(self):
+        """
+        forget the cached values and statistics. called when the membership or
+        the exclusions of the group change, or when an analysis is recalculated
+        """
+        self._stats_cache.clear()
+        # groups holding this group cache its values too
+        self.recalculated_event = True
+
     def _analyses_changed(self, new):
         if new:
             a = new[0]
@@ -261,7 +275,7 @@ class AnalysisGroup(IdeogramPlotable):
         w, sd, sem, (vs, es) = self._calculate_weighted_mean(attr, error_kind="both")
         mi, ma, total_dev, mswd, valid_mswd = 0, 0, 0, 0, False
         if len(vs):
-            mswd = calculate_mswd(vs, es, wm=w)
+            mswd = self._get_stats(attr).mswd
             valid_mswd = validate_mswd(mswd, self.nanalyses)
             mi = min(vs)
             ma = max(vs)
@@ -325,6 +339,34 @@ class AnalysisGroup(IdeogramPlotable):
     def get_weighted_mean(self, *args, **kw):
         return self._get_weighted_mean(*args, **kw)
 
+    def plateau_spectrum(self):
+        """
+        (ages, errors, k39, excludes, options) searched for the plateau, or None
+        if the group has no analyses or holds other groups
+        """
+        ans = self.analyses
+        if not ans or any(isinstance(ai, InterpretedAgeGroup) for ai in ans):
+            return
+
+        ages = [ai.age for ai in ans]
+        errors = [ai.age_err for ai in ans]
+        k39 = [nominal_value(ai.k39) for ai in ans]
+        excludes = [i for i, ai in enumerate(ans) if self._is_omitted(ai)]
+        options = {
+            "nsteps": self.plateau_nsteps,
+            "gas_fraction": self.plateau_gas_fraction,
+            "overlap_sigma": self.plateau_overlap_sigma,
+            "method": self.plateau_method,
+        }
+        return ages, errors, k39, excludes, options
+
+    def set_batch_plateau(self, spectrum, plateau):
+        """
+        use ``plateau``, found by find_plateaus_batch, while the group's
+        ``plateau_spectrum`` equals ``spectrum``
+        """
+        self._batch_plateau = (spectrum, plateau)
+
     def plateau_analyses(self):
         return
 
@@ -561,8 +603,10 @@ class AnalysisGroup(IdeogramPlotable):
     def _calculate_mswd(self, attr, values=None):
         m = 0
         if values is None:
-            values = self._get_values(attr)
-        if values:
+            stats = self._get_stats(attr)
+            if stats:
+                m = stats.mswd
+        elif values:
             vs, es = values
             m = calculate_mswd(vs, es)
 
@@ -617,7 +661,44 @@ class AnalysisGroup(IdeogramPlotable):
         e = self._modify_error(v, e, kind, mswd)
         return ufloat(v, e)
 
+    def _get_stats(self, attr):
+        """
+        cached weighted mean statistics of ``attr`` or None if there are no values
+        """
+        key = ("stats", attr)
+        try:
+            return self._stats_cache[key]
+        except KeyError:
+            pass
+
+        stats = None
+        values = self._get_values(attr)
+        if values:
+            stats = weighted_mean_stats(*values)
+
+        self._stats_cache[key] = stats
+        return stats
+
     def _get_values(self, attr):
+        """
+        cached (values, errors) arrays of ``attr`` for the clean analyses. the
+        arrays are read only
+        """
+        key = ("values", attr)
+        try:
+            return self._stats_cache[key]
+        except KeyError:
+            pass
+
+        values = self._calculate_values(attr)
+        if values:
+            for a in values:
+                a.flags.writeable = False
+
+        self._stats_cache[key] = values
+        return values
+
+    def _calculate_values(self, attr):
         vs = (ai.get_value(attr) for ai in self.clean_analyses())
         ans = [vi for vi in vs if vi is not None]
         if ans:
@@ -649,7 +730,8 @@ class AnalysisGroup(IdeogramPlotable):
         if args:
             vs, es = args
             if use_weights and any(es):
-                av, werr = calculate_weighted_mean(vs, es)
+                stats = self._get_stats(attr)
+                av, werr = stats.mean, stats.error
 
                 if error_kind == "both":
                     sem = werr
@@ -807,6 +889,8 @@ class StepHeatAnalysisGroup(AnalysisGroup):
     plateau_mswd = Float
     plateau_mswd_valid = Bool
     plateau_method = Str(FLECK)
+    # (spectrum, plateau) set by find_group_plateaus
+    _batch_plateau = Any
 
     total_ar39 = AGProperty()
     total_k2o = AGProperty()
@@ -937,63 +1021,57 @@ class StepHeatAnalysisGroup(AnalysisGroup):
         self.plateau_mswd = 0
         self.plateau_mswd_valid = False
 
-        if all((not isinstance(ai, InterpretedAgeGroup) for ai in ans)):
-            if ans:
-                ages = [ai.age for ai in ans]
-                errors = [ai.age_err for ai in ans]
-
-                k39 = [nominal_value(ai.k39) for ai in ans]
-
-                options = {
-                    "nsteps": self.plateau_nsteps,
-                    "gas_fraction": self.plateau_gas_fraction,
-                    "overlap_sigma": self.plateau_overlap_sigma,
-                    "fixed_steps": self.fixed_steps,
-                }
-
-                excludes = [i for i, ai in enumerate(ans) if self._is_omitted(ai)]
-                steps = [a.step for a in ans if not self._is_omitted(a)]
-
-                args = calculate_plateau_age(
-                    ages,
-                    errors,
-                    k39,
-                    steps,
-                    method=self.plateau_method,
-                    options=options,
-                    excludes=excludes,
+        spectrum = self.plateau_spectrum()
+        if spectrum:
+            ages, errors, k39, excludes, options = spectrum
+            options = dict(options, fixed_steps=self.fixed_steps)
+            steps = [a.step for a in ans if not self._is_omitted(a)]
+
+            plateau_idx = None
+            if self._batch_plateau and self._batch_plateau[0] == spectrum:
+                plateau_idx = self._batch_plateau[1]
+
+            args = calculate_plateau_age(
+                ages,
+                errors,
+                k39,
+                steps,
+                method=self.plateau_method,
+                options=options,
+                excludes=excludes,
+                plateau_idx=plateau_idx,
+            )
+
+            if args:
+                v, e, pidx = args
+                if pidx[0] == pidx[1]:
+                    return
+                self.plateau_steps = pidx
+                self.plateau_steps_str = "{}-{}".format(
+                    alphas(pidx[0]), alphas(pidx[1])
                 )
 
-                if args:
-                    v, e, pidx = args
-                    if pidx[0] == pidx[1]:
-                        return
-                    self.plateau_steps = pidx
-                    self.plateau_steps_str = "{}-{}".format(
-                        alphas(pidx[0]), alphas(pidx[1])
+                step_idxs = [
+                    i
+                    for i in range(pidx[0], pidx[1] + 1)
+                    if not self._is_omitted(ans[i])
+                ]
+                self.nsteps = len(step_idxs)
+
+                pages = array([ages[i] for i in step_idxs])
+                perrs = array([errors[i] for i in step_idxs])
+
+                mswd = calculate_mswd(pages, perrs)
+                self.plateau_mswd_valid = validate_mswd(mswd, self.nsteps)
+                self.plateau_mswd = mswd
+                if self.plateau_age_error_kind == SD:
+                    e = array(pages).std()
+                else:
+                    e = self._modify_error(
+                        v, e, self.plateau_age_error_kind, mswd=mswd
                     )
-
-                    step_idxs = [
-                        i
-                        for i in range(pidx[0], pidx[1] + 1)
-                        if not self._is_omitted(ans[i])
-                    ]
-                    self.nsteps = len(step_idxs)
-
-                    pages = array([ages[i] for i in step_idxs])
-                    perrs = array([errors[i] for i in step_idxs])
-
-                    mswd = calculate_mswd(pages, perrs)
-                    self.plateau_mswd_valid = validate_mswd(mswd, self.nsteps)
-                    self.plateau_mswd = mswd
-                    if self.plateau_age_error_kind == SD:
-                        e = array(pages).std()
-                    else:
-                        e = self._modify_error(
-                            v, e, self.plateau_age_error_kind, mswd=mswd
-                        )
-                    if math.isnan(e):
-                        e = 0
+                if math.isnan(e):
+                    e = 0
 
         a = ufloat(v, max(0, e))
         self._apply_external_err(
@@ -1341,4 +1419,32 @@ class InterpretedAgeGroup(StepHeatAnalysisGroup, Preferred):
         return ""
 
 
+def find_group_plateaus(groups):
+    """
+    run the plateau search of every step heat group in ``groups``, and of the
+    groups they hold, in one find_plateaus_batch call e.g. before writing a table.
+
+    a group uses its result while its steps, exclusions and plateau options are
+    unchanged
+    """
+    found = []
+
+    def collect(g):
+        if isinstance(g, StepHeatAnalysisGroup):
+            spectrum = g.plateau_spectrum()
+            if spectrum:
+                found.append((g, spectrum))
+            else:
+                for a in g.analyses:
+                    collect(a)
+
+    for g in groups:
+        collect(g)
+
+    if found:
+        plateaus = find_plateaus_batch([spectrum for _, spectrum in found])
+        for (g, spectrum), plateau in zip(found, plateaus):
+            g.set_batch_plateau(spectrum, plateau)
+
+
 # ============= EOF =============================================
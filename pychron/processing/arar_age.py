@@ -25,6 +25,7 @@ from copy import copy
 from operator import itemgetter, attrgetter
 
 from numpy import polyval
+from traits.api import Event
 from uncertainties import ufloat, std_dev, nominal_value
 
 from pychron.core.codetools.simple_timeit import timethis
@@ -86,6 +87,9 @@ class ArArAge(IsotopeGroup):
     F_err = None
     F_err_wo_irrad = None
 
+    # fired when the values of the analysis are recalculated
+    recalculated_event = Event
+
     uage = None
     uage_w_j_err = None
     uage_w_position_err = None
@@ -452,6 +456,7 @@ class ArArAge(IsotopeGroup):
             self._calculate_f()
 
         self._set_age_values(self.uF)
+        self.recalculated_event = True
 
     def calculate_f(self):
         self.calculate_decay_factors()
@@ -471,6 +476,7 @@ class ArArAge(IsotopeGroup):
             self._calculate_age(**kw)
             self._calculate_kca()
             self._calculate_kcl()
+            self.recalculated_event = True
 
     def calculate_decay_factors(self):
         arc = self.arar_constants
@@ -160,12 +160,15 @@ def calculate_plateau_age(
     method=FLECK,
     options=None,
     excludes=None,
+    plateau_idx=None,
 ):
     """
     ages: list of ages
     errors: list of corresponding  1sigma errors
     k39: list of 39ArK signals
     steps: list of step labels
+    plateau_idx: result of the plateau search if it was already run e.g. by
+        find_plateaus_batch. used when no fixed steps apply
 
     return age, error
     """
@@ -182,7 +185,7 @@ def calculate_plateau_age(
         ages=ages,
         errors=errors,
         signals=k39,
-        excludes=excludes,
+        excludes=excludes or [],
         overlap_sigma=options.get("overlap_sigma", 2),
         nsteps=options.get("nsteps", 3),
         gas_fraction=options.get("gas_fraction", 50),
@@ -214,7 +217,10 @@ def calculate_plateau_age(
                 pidx = (sidx, eidx) if sidx < n else None
 
     if pidx is None:
-        pidx = p.find_plateaus(method)
+        if plateau_idx is not None:
+            pidx = plateau_idx
+        else:
+            pidx = p.find_plateaus(method)
 
     if pidx:
         sx = slice(pidx[0], pidx[1] + 1)
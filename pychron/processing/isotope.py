@@ -24,11 +24,22 @@ from binascii import hexlify
 from math import isnan, isinf
 
 import six
-from numpy import array, inf, polyfit, gradient, array_split, mean, isfinite
+from numpy import (
+    array,
+    asarray,
+    empty,
+    inf,
+    polyfit,
+    gradient,
+    array_split,
+    mean,
+    isfinite,
+    result_type,
+)
 from uncertainties import ufloat, nominal_value, std_dev
 
 from pychron.core.geometry.geometry import curvature_at
-from pychron.core.helpers.binpack import unpack
+from pychron.core.helpers.binpack import pack_columns, unpack_arrays
 from pychron.core.helpers.fits import natural_name_fit, fit_to_degree
 from pychron.core.helpers.logger_setup import new_logger
 from pychron.core.regression.least_squares_regressor import (
@@ -52,6 +63,58 @@ def fit_abbreviation(
     return f
 
 
+class SignalBuffer(object):
+    """
+    growable 1D array used for the xs and ys of a measurement.
+
+    ``append`` writes into spare capacity and doubles the capacity when it is
+    full, so collecting n points copies O(n) values instead of O(n**2).
+    ``values`` is a view of the filled part. Appends never modify the part of
+    the buffer seen by views returned earlier
+    """
+
+    __slots__ = ("_data", "_n")
+
+    min_capacity = 64
+
+    def __init__(self, values=None):
+        if values is None:
+            values = array([])
+        else:
+            values = asarray(values)
+
+        self._data = values
+        self._n = len(values)
+
+    def __len__(self):
+        return self._n
+
+    @property
+    def capacity(self):
+        return len(self._data)
+
+    @property
+    def values(self):
+        if self._n == len(self._data):
+            return self._data
+        return self._data[: self._n]
+
+    def append(self, v):
+        n = self._n
+        data = self._data
+        if n == len(data):
+            data = self._grow(max(self.min_capacity, 2 * n))
+        data[n] = v
+        self._n = n + 1
+
+    def _grow(self, capacity):
+        old = self._data
+        data = empty(capacity, dtype=result_type(old.dtype, float))
+        data[: self._n] = old[: self._n]
+        self._data = data
+        return data
+
+
 class BaseMeasurement(object):
     unpack_error = None
     endianness = ">"
@@ -76,6 +139,22 @@ class BaseMeasurement(object):
     def n(self, v):
         self._n = v
 
+    @property
+    def xs(self):
+        return self._xs.values
+
+    @xs.setter
+    def xs(self, v):
+        self._xs = SignalBuffer(v)
+
+    @property
+    def ys(self):
+        return self._ys.values
+
+    @ys.setter
+    def ys(self, v):
+        self._ys = SignalBuffer(v)
+
     @property
     def offset_xs(self):
         return self.xs - self.time_zero_offset
@@ -88,6 +167,13 @@ class BaseMeasurement(object):
         self.time_zero_offset = 0
         self._regression_state = None
 
+    def append_data(self, x, y):
+        """
+        add a point without copying the existing data
+        """
+        self._xs.append(x)
+        self._ys.append(y)
+
     def set_grouping(self, n):
         if self.group_data == n:
             return
@@ -111,7 +197,7 @@ class BaseMeasurement(object):
             endianness = self.endianness
 
         fmt = "{}ff".format(endianness)
-        txt = b"".join((struct.pack(fmt, x, y) for x, y in zip(self.xs, self.ys)))
+        txt = pack_columns(fmt, self.xs, self.ys)
         if as_hex:
             txt = hexlify(txt)
         return txt
@@ -129,8 +215,8 @@ class BaseMeasurement(object):
         if n_only:
             self.n = len(xs)
         else:
-            self.xs = array(xs)
-            self.ys = array(ys)
+            self.xs = asarray(xs)
+            self.ys = asarray(ys)
 
             # print self.name, self.xs.shape, self.ys.shape
             # print self.name, self.ys
@@ -140,8 +226,10 @@ class BaseMeasurement(object):
             endianness = self.endianness
 
         try:
-            x, y = unpack(blob, fmt="{}ff".format(endianness))
-            # x, y = zip(*[struct.unpack('{}ff'.format(endianness), blob[i:i + 8]) for i in range(0, len(blob), 8)])
+            x, y = unpack_arrays(blob, fmt="{}ff".format(endianness))
+            if not len(x):
+                raise ValueError("blob contains no complete records")
+
             if self.reverse_unpack:
                 return y, x
             else:
@@ -203,6 +291,7 @@ class IsotopicMeasurement(BaseMeasurement):
     _value = 0
     _error = 0
     truncate = None
+    use_closed_form = True
     _fit = None
 
     _oerror = None
@@ -390,6 +479,7 @@ class IsotopicMeasurement(BaseMeasurement):
                     time_zero_offset=fit.time_zero_offset or self.time_zero_offset,
                     error_type=fit.error_type or "SEM",
                     include_baseline_error=fit.include_baseline_error or False,
+                    use_closed_form=getattr(fit, "use_closed_form", True),
                 )
 
                 self.set_filter_outliers_dict(
@@ -511,6 +601,12 @@ class IsotopicMeasurement(BaseMeasurement):
             truncate=self.truncate,
         )
         reg.trait_setq(error_calc_type=self.error_type or "SEM", tag=self.name)
+        if (
+            isinstance(reg, PolynomialRegressor)
+            and reg.use_closed_form != self.use_closed_form
+        ):
+            reg.use_closed_form = self.use_closed_form
+            state_changed = True
 
         if self.truncate:
             reg.set_truncate(self.truncate)
@@ -540,6 +636,7 @@ class IsotopicMeasurement(BaseMeasurement):
             self.truncate,
             self.group_data,
             self.time_zero_offset,
+            self.use_closed_form,
         )
 
     # @cached_property
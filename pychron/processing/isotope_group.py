@@ -18,8 +18,7 @@
 import logging
 import os
 
-from numpy import append as npappend
-from traits.api import Property, Dict, Str
+from traits.api import Property, Dict, Str, on_trait_change
 from traits.has_traits import HasTraits
 from uncertainties import ufloat
 
@@ -38,6 +37,12 @@ class IsotopeGroup(HasTraits):
     conditional_modifier = None
     name = Str
 
+    _detector_index = None
+
+    @on_trait_change("isotopes, isotopes_items")
+    def _invalidate_detector_index(self):
+        self._detector_index = None
+
     def keys(self):
         return list(self.isotopes.keys())
 
@@ -269,28 +274,39 @@ class IsotopeGroup(HasTraits):
             if kind == "sniff":
                 isotope._value = signal
 
-            xs = npappend(isotope.xs, x)
-            ys = npappend(isotope.ys, signal)
-            isotope.xs = xs
-            isotope.ys = ys
+            isotope.append_data(x, signal)
             # isotope.dirty = True
 
-        isotopes = self.isotopes
         if kind == "baseline":
-            ret = False
             # get the isotopes that match detector
-            for i in self.itervalues():
-                if i.detector == det:
-                    _append(i)
-                    ret = True
-            return ret
+            isos = self.get_detector_isotopes(det)
+            for i in isos:
+                _append(i)
+            return bool(isos)
 
         else:
+            isotopes = self.isotopes
             for i in ("{}{}".format(iso, det), iso):
                 if i in isotopes:
                     _append(isotopes[i])
                     return True
 
+    def get_detector_isotopes(self, det):
+        """
+        the isotopes measured on detector ``det``.
+
+        the detector -> isotopes index is rebuilt after ``isotopes`` changes or an
+        isotope is moved with ``set_isotope_detector``
+        """
+        index = self._detector_index
+        if index is None:
+            index = {}
+            for i in self.isotopes.values():
+                index.setdefault(i.detector, []).append(i)
+            self._detector_index = index
+
+        return index.get(det, ())
+
     def clear_baselines(self):
         for k in self.isotopes:
             self.set_baseline(k, None, (0, 0))
@@ -331,6 +347,7 @@ class IsotopeGroup(HasTraits):
 
         iso.detector = det
         iso.ic_factor = self.get_ic_factor(det)
+        self._detector_index = None
 
     def get_baseline_corrected_value(self, iso, default=0):
         try:
@@ -17,13 +17,19 @@
 # ============= enthought library imports =======================
 from __future__ import absolute_import
 
-from numpy import argmax, array
+import math
+
+from numpy import argmax, array, asarray
 from six.moves import range
 from traits.api import HasTraits, List, Array
 
-from pychron.core.stats.core import validate_mswd, calculate_mswd
+from pychron.core.stats.core import validate_mswd, calculate_mswd, get_mswd_limits
 from pychron.pychron_constants import MAHON
 
+# relative tolerance used when deciding an incrementally calculated mswd. values
+# closer than this to a limit are recalculated with calculate_mswd
+MSWD_TOLERANCE = 1e-9
+
 
 def memoize(function):
     cache = {}
@@ -46,6 +52,224 @@ class Log:
 log = Log()
 
 
+def is_mahon(method):
+    return bool(method) and method.lower() == MAHON.lower()
+
+
+def find_plateau(
+    ages,
+    errors,
+    signals,
+    excludes=None,
+    nsteps=3,
+    overlap_sigma=2,
+    gas_fraction=50,
+    method="",
+):
+    """
+    find the longest plateau in a spectrum.
+
+    for every start step the end step is advanced once, updating running sums
+    of the released gas, the weighted sums for the mswd and the two largest
+    lower/smallest upper overlap bounds. A search is therefore O(n**2) instead
+    of the O(n**4) pairwise overlap search in ``Plateau.find_plateaus_legacy``,
+    and returns identical results.
+
+    ages, errors, signals: step ages, 1sigma errors and 39ArK signals
+    excludes: indices of omitted steps
+    method: str either fleck 1977 or mahon 1996
+
+    return (start, end) or an empty list if no plateau was found
+    """
+    ages = asarray(ages)
+    errors = asarray(errors)
+    excludes = set(excludes or ())
+
+    n = len(ages)
+    use_mswd = is_mahon(method)
+
+    sigs = asarray(signals).tolist()
+    total = float(sum([s for i, s in enumerate(sigs) if i not in excludes]))
+    frac = gas_fraction / 100.0
+
+    avs = ages.tolist()
+    evs = errors.tolist()
+    lows = []
+    highs = []
+    for a, e in zip(avs, evs):
+        e *= overlap_sigma
+        lows.append(a - e)
+        highs.append(a + e)
+
+    best = None
+    for start in range(n):
+        if start in excludes:
+            continue
+
+        if use_mswd:
+            end = _search_mswd(ages, errors, avs, evs, sigs, excludes, start, nsteps, total, frac)
+        else:
+            end = _search_overlap(lows, highs, sigs, excludes, start, nsteps, total, frac)
+
+        # a plateau ending at step 0 is not reported. matches the original search
+        if end:
+            if best is None or end - start > best[1] - best[0]:
+                best = (start, end)
+
+    return best if best else []
+
+
+def find_plateaus_batch(spectra, **kw):
+    """
+    find the plateaus of many spectra, e.g. the step heat groups of a table.
+
+    spectra: iterable of (ages, errors, signals, excludes) or (ages, errors,
+        signals, excludes, options) where options is a dict of find_plateau
+        keyword arguments that override ``kw``
+    kw: passed to find_plateau
+
+    identical spectra, e.g. a group listed on several sheets, are searched once
+
+    return list of (start, end) or empty list, one per spectrum
+    """
+    found = {}
+    ret = []
+    for spec in spectra:
+        ages, errors, signals, excludes = spec[:4]
+        options = dict(kw, **spec[4]) if len(spec) > 4 else kw
+        key = (
+            tuple(ages),
+            tuple(errors),
+            tuple(signals),
+            tuple(sorted(excludes or ())),
+            tuple(sorted(options.items())),
+        )
+        try:
+            pidx = found[key]
+        except KeyError:
+            pidx = found[key] = find_plateau(ages, errors, signals, excludes, **options)
+        ret.append(pidx)
+    return ret
+
+
+def _released(acc, total):
+    try:
+        return acc / total
+    except ZeroDivisionError:
+        # numpy semantics, as the original search divided numpy scalars
+        if acc:
+            return math.copysign(float("inf"), acc)
+        return float("nan")
+
+
+def _search_overlap(lows, highs, sigs, excludes, start, nsteps, total, frac):
+    """
+    fleck 1977. every pair of steps has to overlap at ``overlap_sigma``, i.e.
+    lows[i] < highs[j] for all i != j. Only the two largest lows and the two
+    smallest highs are needed to test that.
+    """
+    ninf = float("-inf")
+    inf = float("inf")
+
+    l1 = l2 = ninf
+    h1 = h2 = inf
+    il = ih = -1
+    has_nan = False
+
+    acc = 0
+    end = None
+    for i in range(start, len(lows)):
+        lo, hi = lows[i], highs[i]
+        if lo != lo or hi != hi:
+            has_nan = True
+        else:
+            if lo > l1:
+                l1, l2, il = lo, l1, i
+            elif lo > l2:
+                l2 = lo
+            if hi < h1:
+                h1, h2, ih = hi, h1, i
+            elif hi < h2:
+                h2 = hi
+
+        if i in excludes:
+            continue
+
+        acc += sigs[i]
+        if (i - start) + 1 < nsteps:
+            continue
+
+        if i > start:
+            if has_nan:
+                break
+            if il != ih:
+                if l1 >= h1:
+                    break
+            elif l1 >= h2 or l2 >= h1:
+                break
+
+        if _released(acc, total) >= frac:
+            end = i
+    return end
+
+
+def _search_mswd(ages, errors, avs, evs, sigs, excludes, start, nsteps, total, frac):
+    """
+    mahon 1996. the mswd of the steps has to be within the 95% confidence
+    interval. The mswd is calculated from running weighted sums, shifted by the
+    first age to limit cancellation. Ranges with zero or non-finite values, and
+    mswds within MSWD_TOLERANCE of a limit, are recalculated exactly
+    """
+    shift = avs[start]
+    sw = swd = swdd = 0.0
+    exact = False
+
+    acc = 0
+    end = None
+    for i in range(start, len(avs)):
+        a, e = avs[i], evs[i]
+        if not e or not math.isfinite(a) or not math.isfinite(e):
+            exact = True
+        else:
+            w = 1 / e**2
+            d = a - shift
+            sw += w
+            swd += w * d
+            swdd += w * d * d
+
+        if i in excludes:
+            continue
+
+        acc += sigs[i]
+        if (i - start) + 1 < nsteps:
+            continue
+
+        if not _valid_mswd(ages, errors, start, i, sw, swd, swdd, exact):
+            continue
+
+        if _released(acc, total) >= frac:
+            end = i
+    return end
+
+
+def _valid_mswd(ages, errors, start, end, sw, swd, swdd, exact):
+    m = end - start + 1
+    if m <= 1:
+        return False
+
+    if not exact:
+        mswd = (swdd - swd**2 / sw) / (m - 1)
+        low, high = get_mswd_limits(m)
+        tol = MSWD_TOLERANCE * (abs(mswd) + swdd / (m - 1))
+        if low + tol < mswd < high - tol:
+            return True
+        if mswd < low - tol or mswd > high + tol:
+            return False
+
+    sx = slice(start, end + 1)
+    return validate_mswd(calculate_mswd(ages[sx], errors[sx]), m)
+
+
 class Plateau(HasTraits):
     ages = Array
     errors = Array
@@ -64,7 +288,26 @@ class Plateau(HasTraits):
         """
         method: str either fleck 1977 or mahon 1996
         """
-        if method.lower() == MAHON:
+        ss = [s for i, s in enumerate(self.signals) if i not in self.excludes]
+        self.total_signal = float(sum(ss))
+
+        return find_plateau(
+            self.ages,
+            self.errors,
+            self.signals,
+            excludes=self.excludes,
+            nsteps=self.nsteps,
+            overlap_sigma=self.overlap_sigma,
+            gas_fraction=self.gas_fraction,
+            method=method,
+        )
+
+    def find_plateaus_legacy(self, method=""):
+        """
+        exhaustive pairwise search. kept as the reference implementation for
+        find_plateau
+        """
+        if is_mahon(method):
             self.use_mswd = True
             self.use_overlap = False
         else:
@@ -138,8 +381,8 @@ class Plateau(HasTraits):
         """
         return False if not valid
         """
-        ages = self.ages[start, end + 1]
-        errors = self.errors[start, end + 1]
+        ages = self.ages[start : end + 1]
+        errors = self.errors[start : end + 1]
         mswd = calculate_mswd(ages, errors)
         return validate_mswd(mswd, len(ages))
 
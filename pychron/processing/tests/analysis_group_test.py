@@ -0,0 +1,147 @@
+import unittest
+from unittest import mock
+
+from uncertainties import ufloat
+
+from pychron.core.stats.core import calculate_mswd, calculate_weighted_mean
+from pychron.processing.analyses.analysis import Analysis, IdeogramPlotable
+from pychron.processing.analyses.analysis_group import (
+    AnalysisGroup,
+    StepHeatAnalysisGroup,
+    find_group_plateaus,
+)
+from pychron.processing.plateau import Plateau, find_plateau
+
+
+class StubAnalysis(IdeogramPlotable):
+    def __init__(self, v, e, *args, **kw):
+        super(StubAnalysis, self).__init__(make_arar_constants=False, *args, **kw)
+        self.uF = ufloat(v, e)
+        self.nget = 0
+
+    def get_value(self, attr):
+        self.nget += 1
+        return getattr(self, attr)
+
+
+class AnalysisGroupStatsTestCase(unittest.TestCase):
+    def setUp(self):
+        self.analyses = [StubAnalysis(10 + i * 0.3, 0.2 + i * 0.01) for i in range(8)]
+        self.group = AnalysisGroup(analyses=self.analyses)
+
+    def _expected(self, ans):
+        vs = [a.uF.nominal_value for a in ans]
+        es = [a.uF.std_dev for a in ans]
+        wm, we = calculate_weighted_mean(vs, es)
+        return wm, we, calculate_mswd(vs, es)
+
+    def test_weighted_mean(self):
+        wm, we, mswd = self._expected(self.analyses)
+        v = self.group.get_weighted_mean("uF", kind="SD")
+        self.assertAlmostEqual(v.nominal_value, wm, places=10)
+        self.assertAlmostEqual(self.group._calculate_mswd("uF"), mswd, places=10)
+
+    def test_cached(self):
+        self.group.get_weighted_mean("uF", kind="SD")
+        self.group._calculate_mswd("uF")
+        self.group.attr_stats("uF")
+        self.assertEqual(self.analyses[0].nget, 1)
+
+    def test_invalidate_on_exclusion(self):
+        self.group.get_weighted_mean("uF", kind="SD")
+        self.analyses[-1].temp_status = "omit"
+
+        wm, we, mswd = self._expected(self.analyses[:-1])
+        v = self.group.get_weighted_mean("uF", kind="SD")
+        self.assertAlmostEqual(v.nominal_value, wm, places=10)
+        self.assertAlmostEqual(self.group._calculate_mswd("uF"), mswd, places=10)
+
+    def test_invalidate_on_membership(self):
+        self.group.get_weighted_mean("uF", kind="SD")
+        self.group.analyses = self.analyses[:4]
+
+        wm, we, mswd = self._expected(self.analyses[:4])
+        v = self.group.get_weighted_mean("uF", kind="SD")
+        self.assertAlmostEqual(v.nominal_value, wm, places=10)
+
+
+class RecalculatedAgeTestCase(unittest.TestCase):
+    def setUp(self):
+        self.analyses = []
+        for i in range(4):
+            a = Analysis()
+            a.j = ufloat(0.001, 1e-6)
+            a.uF = ufloat(10 + i * 0.3, 0.1)
+            a.recalculate_age()
+            self.analyses.append(a)
+        self.group = AnalysisGroup(analyses=self.analyses)
+
+    def test_invalidate_on_recalculated_age(self):
+        v = self.group.get_weighted_mean("uage", kind="SD")
+        a = self.analyses[0]
+        age = a.age
+
+        a.uF = ufloat(20, 0.1)
+        a.recalculate_age()
+        self.assertGreater(a.age, age)
+
+        nv = self.group.get_weighted_mean("uage", kind="SD")
+        self.assertGreater(nv.nominal_value, v.nominal_value)
+
+    def test_invalidate_nested(self):
+        parent = AnalysisGroup(analyses=[self.group])
+        parent.get_weighted_mean("uage", kind="SD")
+        self.assertTrue(parent._stats_cache)
+
+        self.analyses[0].recalculate_age()
+        self.assertFalse(parent._stats_cache)
+
+
+class StubStep(IdeogramPlotable):
+    def __init__(self, age, age_err, k39, *args, **kw):
+        super(StubStep, self).__init__(*args, **kw)
+        self.age = age
+        self.age_err = age_err
+        self.k39 = k39
+
+
+class BatchPlateauTestCase(unittest.TestCase):
+    def setUp(self):
+        ages = [12, 10.1, 10.0, 10.2, 9.9, 10.1, 14]
+        self.groups = [
+            StepHeatAnalysisGroup(
+                analyses=[
+                    StubStep(a + i * 0.01, 0.1, 1.0, step=chr(65 + j)) for j, a in enumerate(ages)
+                ]
+            )
+            for i in range(3)
+        ]
+
+    def _expected(self, group):
+        ans = group.analyses
+        excludes = [i for i, a in enumerate(ans) if a.is_omitted()]
+        return find_plateau(
+            [a.age for a in ans], [a.age_err for a in ans], [a.k39 for a in ans], excludes
+        )
+
+    def test_batch_used(self):
+        find_group_plateaus(self.groups)
+        with mock.patch.object(Plateau, "find_plateaus", side_effect=AssertionError):
+            for g in self.groups:
+                g.plateau_age
+                self.assertEqual(g.plateau_steps, self._expected(g))
+                self.assertEqual(g.plateau_steps, (1, 5))
+
+    def test_stale_batch_ignored(self):
+        group = self.groups[0]
+        find_group_plateaus([group])
+        group.analyses[1].tag = "omit"
+        group.dirty = True
+
+        group.plateau_age
+        self.assertEqual(group.plateau_steps, self._expected(group))
+        self.assertEqual(group.plateau_steps, (2, 5))
+
+
+if __name__ == "__main__":
+    unittest.main()
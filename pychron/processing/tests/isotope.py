@@ -6,6 +6,8 @@ import unittest
 
 from numpy import linspace
 
+from pychron.core.fits.fit import IsoFilterFit
+from pychron.core.regression.closed_form_ols import ClosedFormOLSResults
 from pychron.processing.isotope import Isotope
 
 
@@ -42,5 +44,24 @@ class IsotopeTestCase(unittest.TestCase):
         # self.assertEqual(v, 99)
 
 
+class ClosedFormFitTestCase(unittest.TestCase):
+    def setUp(self):
+        self.iso = Isotope("Ar40", "H1")
+        xs = linspace(10, 410, 400)
+        self.iso.xs = xs
+        self.iso.ys = 1000.0 - 2.0 * xs + 1e-4 * xs * xs
+
+    def test_closed_form_fit(self):
+        fit = IsoFilterFit(fit="parabolic", error_type="SEM")
+        self.iso.set_fit(fit)
+        v = self.iso.value
+        self.assertIsInstance(self.iso.regressor._result, ClosedFormOLSResults)
+
+        fit.use_closed_form = False
+        self.iso.set_fit(fit)
+        self.assertAlmostEqual(self.iso.value, v, places=6)
+        self.assertNotIsInstance(self.iso.regressor._result, ClosedFormOLSResults)
+
+
 if __name__ == "__main__":
     unittest.main()
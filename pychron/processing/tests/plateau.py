@@ -4,7 +4,10 @@ __author__ = "ross"
 
 import unittest
 
-from pychron.processing.plateau import Plateau
+from numpy import random
+
+from pychron.processing.plateau import Plateau, find_plateau, find_plateaus_batch
+from pychron.pychron_constants import FLECK, MAHON
 
 
 class PlateauTestCase(unittest.TestCase):
@@ -153,5 +156,57 @@ class PlateauTestCase(unittest.TestCase):
         return ages, errors, signals, exclude, idx
 
 
+class PlateauRegressionTestCase(unittest.TestCase):
+    """
+    compare the incremental search with the exhaustive pairwise search
+    """
+
+    def _spectra(self, n):
+        rng = random.default_rng(1)
+        for _ in range(n):
+            nsteps = int(rng.integers(1, 16))
+            ages = 10 + rng.normal(0, 1, nsteps)
+            # a step with a large offset occasionally breaks a plateau
+            ages[rng.random(nsteps) < 0.15] += rng.normal(0, 5)
+            errors = rng.uniform(0.05, 1.5, nsteps)
+            errors[rng.random(nsteps) < 0.05] = 0
+            signals = rng.uniform(0, 1, nsteps)
+            excludes = [i for i in range(nsteps) if rng.random() < 0.15]
+            options = dict(
+                nsteps=int(rng.integers(1, 5)),
+                overlap_sigma=int(rng.integers(1, 3)),
+                gas_fraction=float(rng.choice((0, 30, 50, 70))),
+            )
+            yield ages, errors, signals, excludes, options
+
+    def _compare(self, method):
+        for ages, errors, signals, excludes, options in self._spectra(400):
+            p = Plateau(ages=ages, errors=errors, signals=signals, excludes=excludes, **options)
+            self.assertEqual(p.find_plateaus(method), p.find_plateaus_legacy(method), options)
+
+    def test_fleck(self):
+        self._compare(FLECK)
+
+    def test_mahon(self):
+        self._compare(MAHON)
+
+    def test_mahon_differs(self):
+        ages = [10.0, 10.1, 9.9, 10.0, 10.05]
+        errors = [1.0] * 5
+        signals = [1] * 5
+        # overlapping, but the mswd is far too small to be a valid plateau
+        self.assertEqual(find_plateau(ages, errors, signals, method=FLECK), (0, 4))
+        self.assertEqual(find_plateau(ages, errors, signals, method=MAHON), [])
+
+    def test_batch(self):
+        spectra = [s[:4] for s in self._spectra(20)]
+        self.assertEqual(find_plateaus_batch(spectra), [find_plateau(*s) for s in spectra])
+
+    def test_batch_options(self):
+        spectra = list(self._spectra(20))
+        expected = [find_plateau(*s[:4], method=MAHON, **s[4]) for s in spectra]
+        self.assertEqual(find_plateaus_batch(spectra + spectra, method=MAHON), expected + expected)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,100 @@
+import shutil
+import tempfile
+import unittest
+
+from numpy import append, arange, array, float32
+from numpy.testing import assert_array_equal
+
+from pychron.paths import paths
+from pychron.processing.isotope import Isotope, SignalBuffer
+from pychron.processing.isotope_group import IsotopeGroup
+
+
+class _Detector:
+    def __init__(self, name, isotope):
+        self.name = name
+        self.isotope = isotope
+
+
+class SignalBufferTestCase(unittest.TestCase):
+    def test_append(self):
+        b = SignalBuffer()
+        expected = array([])
+        for i in range(1000):
+            b.append(i * 0.5)
+            expected = append(expected, i * 0.5)
+
+        assert_array_equal(b.values, expected)
+        self.assertEqual(len(b), 1000)
+        self.assertEqual(b.capacity, 1024)
+
+    def test_views(self):
+        b = SignalBuffer()
+        for i in range(10):
+            b.append(i)
+        v = b.values
+        self.assertIs(v.base, b.values.base)
+
+        # earlier views are unchanged by appends and growth
+        for i in range(100):
+            b.append(-1)
+        assert_array_equal(v, arange(10))
+
+    def test_set(self):
+        xs = arange(5)
+        iso = Isotope("Ar40", "H1")
+        iso.xs = xs
+        self.assertIs(iso.xs, xs)
+
+        # integer and float32 data are upcast, not truncated, and not modified
+        iso.append_data(5.5, 1)
+        assert_array_equal(iso.xs, [0, 1, 2, 3, 4, 5.5])
+        assert_array_equal(xs, arange(5))
+
+        ys = array([1.25], dtype=float32)
+        iso.ys = ys
+        iso.append_data(1, 1e-9)
+        self.assertEqual(iso.ys[-1], 1e-9)
+
+
+class IsotopeGroupAppendTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.root = tempfile.mkdtemp()
+        paths.build(cls.root)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.root)
+
+    def setUp(self):
+        self.group = IsotopeGroup()
+        for det, name in (("H1", "Ar40"), ("AX", "Ar39"), ("CDD", "Ar36")):
+            self.group.set_isotope_detector(_Detector(det, name))
+
+    def test_signal(self):
+        for i in range(300):
+            self.assertTrue(self.group.append_data("Ar40", "H1", i, 2 * i, "signal"))
+            self.group.append_data("Ar39", "AX", i, 3 * i, "sniff")
+
+        self.assertFalse(self.group.append_data("Ar38", "L1", 0, 0, "signal"))
+        assert_array_equal(self.group.isotopes["Ar40"].ys, 2 * arange(300))
+        assert_array_equal(self.group.isotopes["Ar39"].sniff.xs, arange(300))
+        self.assertEqual(self.group.isotopes["Ar39"].sniff._value, 897)
+
+    def test_baseline(self):
+        self.assertTrue(self.group.append_data(None, "CDD", 1, 0.1, "baseline"))
+        self.assertFalse(self.group.append_data(None, "L1", 1, 0.1, "baseline"))
+
+        # the detector index follows detector changes and new isotopes
+        self.group.set_isotope_detector(_Detector("L1", "Ar36"))
+        self.group.isotopes["Ar38"] = Isotope("Ar38", "L1")
+        self.assertTrue(self.group.append_data(None, "L1", 2, 0.2, "baseline"))
+        self.assertFalse(self.group.append_data(None, "CDD", 2, 0.2, "baseline"))
+
+        assert_array_equal(self.group.isotopes["Ar36"].baseline.ys, [0.1, 0.2])
+        assert_array_equal(self.group.isotopes["Ar38"].baseline.ys, [0.2])
+
+
+if __name__ == "__main__":
+    unittest.main()
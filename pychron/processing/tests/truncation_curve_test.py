@@ -0,0 +1,42 @@
+import unittest
+
+from numpy import linspace
+from numpy.random import RandomState
+from numpy.testing import assert_allclose
+
+from pychron.core.regression.ols_regressor import PolynomialRegressor
+from pychron.processing.analyses.analysis import truncation_curve
+
+
+def regressor_truncation_curve(xs, ys, fit):
+    reg = PolynomialRegressor(xs=xs, ys=ys)
+    reg.fit = fit
+    ts = list(range(4, len(xs), 10))
+    es, iys = [], []
+    for ti in ts:
+        reg.set_truncate(str(ti))
+        reg.calculate()
+        es.append(reg.predict_error(0))
+        iys.append(reg.predict(0))
+    return ts, es, iys
+
+
+class TruncationCurveTestCase(unittest.TestCase):
+    def setUp(self):
+        rs = RandomState(0)
+        self.xs = linspace(5, 200, 97)
+        self.ys = 100 - 0.2 * self.xs + 1e-4 * self.xs**2 + rs.normal(0, 0.5, 97)
+
+    def test_regressor_equivalence(self):
+        for fit in ("linear", "parabolic"):
+            with self.subTest(fit=fit):
+                ets, ees, eiys = regressor_truncation_curve(self.xs, self.ys, fit)
+                ts, es, iys = truncation_curve(self.xs, self.ys, fit)
+
+                self.assertListEqual(list(ts), ets)
+                assert_allclose(iys, eiys, rtol=1e-9)
+                assert_allclose(es, ees, rtol=1e-9)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -21,7 +21,7 @@ import os
 import shutil
 
 import six
-from numpy import asarray, array, nonzero, polyval
+from numpy import asarray, array, interp, linspace, nonzero, polyder, polyval, roots
 from scipy.optimize import leastsq, brentq
 from traits.api import HasTraits, List, Str, Dict, Bool, Property, CFloat
 
@@ -48,10 +48,133 @@ def least_squares(func, xs, ys, initial_guess):
     return ret
 
 
+def horner(c, x):
+    """
+    polyval for python scalars
+    """
+    v = 0
+    for ci in c:
+        v = v * x + ci
+    return v
+
+
 def format_dac(dac):
     return "{:0.5f}".format(dac) if dac != NULL_STR else ""
 
 
+class DetectorLookup(object):
+    """
+    lookup arrays and the inverse mass function of one detector column of the
+    mftable, built once per table load or update
+    """
+
+    # masses searched when mapping a dac to a mass
+    mass_range = (0, 200)
+    # points per monotonic segment of the tabulated inverse mass function
+    ngrid = 256
+    max_iterations = 20
+
+    def __init__(self, entry):
+        isos, mws, dacs, coeffs = entry
+        self.entry = entry
+        self.mws = asarray(mws, dtype=float)
+        self.dacs = dacs
+        self.coeffs = coeffs
+
+        self._dac_to_mass = {}
+        for m, d in zip(mws, dacs):
+            if d != NULL_STR:
+                self._dac_to_mass.setdefault(d, m)
+
+        self._segments = None
+        if coeffs is not None:
+            try:
+                self._segments = self._make_segments(coeffs)
+            except TypeError:
+                # fallback coefficients of a column that could not be fit
+                pass
+
+    def get_dac(self, mass, tol=0.15):
+        """
+        dac of the first isotope within ``tol`` of ``mass``
+        """
+        hits = nonzero(abs(self.mws - mass) < tol)[0]
+        if hits.size:
+            return self.dacs[hits[0]]
+
+    def get_mass(self, dac):
+        """
+        mass of the isotope at ``dac``
+        """
+        return self._dac_to_mass.get(dac)
+
+    def invert(self, dac):
+        """
+        solve the mass function for the mass at ``dac`` within ``mass_range``.
+
+        if only one monotonic segment of the mass function contains ``dac``, start
+        from the tabulated inverse of that segment and refine with newton steps,
+        otherwise use ``brentq``
+
+        raises ValueError if the mass function minus ``dac`` does not change sign
+        over ``mass_range``
+        """
+        c = self.coeffs
+        if self._segments is not None:
+            lo, hi = self._ends
+            if (lo - dac) * (hi - dac) > 0:
+                raise ValueError("dac {} does not map to a mass".format(dac))
+
+            hits = [seg for seg in self._segments if seg[0][0] <= dac <= seg[0][-1]]
+            if len(hits) == 1:
+                vs, ms, low, high = hits[0]
+                mass = self._newton(dac, float(interp(dac, vs, ms)), low, high)
+                if mass is not None:
+                    return mass
+
+        def func(x, *args):
+            cc = list(c)
+            cc[-1] -= dac
+            return polyval(cc, x)
+
+        return brentq(func, *self.mass_range)
+
+    def _make_segments(self, c):
+        low, high = self.mass_range
+        d = polyder(c)
+        self._c = [float(ci) for ci in c]
+        self._deriv = [float(di) for di in d]
+        self._ends = polyval(c, low), polyval(c, high)
+
+        crit = sorted(
+            r.real for r in roots(d) if abs(r.imag) < 1e-12 and low < r.real < high
+        )
+        edges = [low] + crit + [high]
+
+        segments = []
+        for a, b in zip(edges[:-1], edges[1:]):
+            ms = linspace(a, b, self.ngrid)
+            vs = polyval(c, ms)
+            if vs[-1] < vs[0]:
+                ms, vs = ms[::-1], vs[::-1]
+            segments.append((vs, ms, a, b))
+        return segments
+
+    def _newton(self, dac, mass, low, high):
+        c, d = self._c, self._deriv
+        for _ in range(self.max_iterations):
+            slope = horner(d, mass)
+            if not slope:
+                return
+
+            step = (horner(c, mass) - dac) / slope
+            mass -= step
+            if not low <= mass <= high:
+                return
+            if abs(step) < 1e-12 * max(1, abs(mass)):
+                return float(mass)
+
+
 class FieldItem(HasTraits):
     isotope = Str
 
@@ -83,6 +206,9 @@ class FieldTable(Loggable):
         self._mftable = None
         self._detectors = None
         self._test_path = None
+        self._lookups = {}
+        self._mftable_stat = None
+        self._mftable_hash = None
 
         if bind:
             self.bind_preferences()
@@ -114,19 +240,10 @@ class FieldTable(Loggable):
     def map_dac_to_mass(self, dac, detname):
         detname = get_detector_name(detname)
 
-        d = self._get_mftable()
-
-        _, xs, ys, p = d[detname]
+        lookup = self._get_lookup(detname)
         if self.polynominal_mass_func:
-
-            def func(x, *args):
-                c = list(p)
-                c[-1] -= dac
-                return polyval(c, x)
-
             try:
-                mass = brentq(func, 0, 200)
-                return mass
+                return lookup.invert(dac)
             except ValueError as e:
                 self.debug(
                     "DAC does not map to an isotope. DAC={}, Detector={}".format(
@@ -134,15 +251,14 @@ class FieldTable(Loggable):
                     )
                 )
         else:
-            try:
-                idx = ys.index(dac)
-                return xs[idx]
-            except IndexError:
+            mass = lookup.get_mass(dac)
+            if mass is None:
                 self.debug(
                     "DAC does not map to an isotope. DAC={}, Detector={}".format(
                         dac, detname
                     )
                 )
+            return mass
 
     def map_mass_to_dac(self, mass, detname):
         if isinstance(mass, str):
@@ -164,9 +280,7 @@ class FieldTable(Loggable):
 
     def get_dac(self, det, mass):
         det = get_detector_name(det)
-        d = self._get_mftable()
-        dac = next((d for i, m, d in zip(*d[det][:3]) if abs(m - mass) < 0.15), None)
-        return dac
+        return self._get_lookup(det).get_dac(mass)
 
         # isotope = next((i for i, m in self.molweights.iteritems() if abs(m-mass)<1e-5), None)
         # if isotope is not None:
@@ -445,26 +559,50 @@ class FieldTable(Loggable):
         self.debug("================================")
 
     def _get_mftable(self):
-        if not self._mftable or not self._check_mftable_hash():
+        if not self._mftable or self._check_mftable_hash():
             self.debug("using mftable at {}".format(self.path))
             self.load_table()
 
         return self._mftable
 
+    def _get_lookup(self, det):
+        entry = self._get_mftable()[det]
+        lookup = self._lookups.get(det)
+        if lookup is None or lookup.entry is not entry:
+            lookup = self._lookups[det] = DetectorLookup(entry)
+        return lookup
+
     def _check_mftable_hash(self):
         """
         return True if mftable externally modified
+
+        the file is only read and hashed if its mtime, size or inode changed
         """
-        # p = paths.mftable
-        current_hash = self._make_hash(self.path)
-        return self._mftable_hash != current_hash
+        p = self.path
+        st = self._make_stat(p)
+        if st == self._mftable_stat:
+            return False
+
+        current_hash = self._make_hash(p)
+        if current_hash == self._mftable_hash:
+            self._mftable_stat = st
+            return False
+        return True
+
+    def _make_stat(self, p):
+        try:
+            st = os.stat(p)
+        except (OSError, TypeError):
+            return
+        return st.st_mtime_ns, st.st_size, st.st_ino
 
     def _make_hash(self, p):
         if p and os.path.isfile(p):
             with open(p, "rb") as rfile:
-                return hashlib.md5(rfile.read())
+                return hashlib.md5(rfile.read()).hexdigest()
 
     def _set_mftable_hash(self, p):
+        self._mftable_stat = self._make_stat(p)
         self._mftable_hash = self._make_hash(p)
 
     def _add_to_archive(self, p, message):
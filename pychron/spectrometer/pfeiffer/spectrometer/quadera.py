@@ -17,7 +17,6 @@ import json
 import struct
 import time
 from datetime import datetime
-from numpy import append as npappend
 
 from traits.api import List
 
@@ -160,8 +159,7 @@ class QuaderaSpectrometer(BaseSpectrometer, PfeifferMixin):
                 else:
                     iso = isotopes[m]
 
-                iso.xs = npappend(iso.xs, ct - start_time)
-                iso.ys = npappend(iso.ys, si)
+                iso.append_data(ct - start_time, si)
 
             row = (
                 [
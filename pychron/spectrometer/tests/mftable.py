@@ -1,6 +1,12 @@
 from __future__ import absolute_import
 import os
+import shutil
+import tempfile
 import unittest
+from unittest import mock
+
+from numpy import polyval
+from scipy.optimize import brentq
 
 from pychron.spectrometer.field_table import FieldTable
 
@@ -93,5 +99,72 @@ class MFTableTestCase(unittest.TestCase):
         self.assertNotEqual(dac, 5.8955)
 
 
+class MFTableLookupTestCase(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        src = "./spectrometer/tests/data/mftable.csv"
+        if not os.path.isfile(src):
+            src = "pychron/spectrometer/tests/data/mftable.csv"
+        self.path = os.path.join(self.root, "mftable.csv")
+        shutil.copyfile(src, self.path)
+
+        self.mftable = FieldTable(bind=False)
+        self.mftable.molweights = {"Ar40": 40, "Ar39": 39, "Ar36": 36, "Foo": 1}
+        self.mftable._test_path = self.path
+        self.mftable.load_table()
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def test_dac_to_mass(self):
+        for det in ("H2", "H1", "AX", "CDD"):
+            p = self.mftable._mftable[det][3]
+            for dac in polyval(p, [0.5, 1, 20, 36, 39.5, 40, 60, 150]).tolist() + [1e6]:
+                try:
+                    expected = brentq(lambda x: polyval(p, x) - dac, 0, 200)
+                except ValueError:
+                    expected = None
+
+                mass = self.mftable.map_dac_to_mass(dac, det)
+                if expected is None:
+                    self.assertIsNone(mass)
+                else:
+                    self.assertAlmostEqual(mass, expected, 9)
+
+    def test_dac_to_mass_cached_inverse(self):
+        p = self.mftable._mftable["AX"][3]
+        with mock.patch("pychron.spectrometer.field_table.brentq") as solver:
+            mass = self.mftable.map_dac_to_mass(polyval(p, 40), "AX")
+        solver.assert_not_called()
+        self.assertAlmostEqual(mass, 40, 9)
+
+    def test_get_dac(self):
+        self.assertEqual(self.mftable.get_dac("H2", 39.1), 5.7882)
+        self.assertEqual(self.mftable.get_dac("H1", 1), "---")
+        self.assertIsNone(self.mftable.get_dac("H1", 20))
+
+    def test_unchanged_file_not_read(self):
+        with mock.patch.object(self.mftable, "_make_hash") as make_hash:
+            for _ in range(10):
+                self.mftable.map_mass_to_dac("Ar40", "H2")
+        make_hash.assert_not_called()
+
+    def test_external_modification(self):
+        dac = self.mftable.get_dac("H2", 40)
+        with open(self.path) as rfile:
+            txt = rfile.read()
+        with open(self.path, "w") as wfile:
+            wfile.write(txt.replace("5.8955", "5.9955"))
+
+        self.assertEqual(self.mftable.get_dac("H2", 40), dac + 0.1)
+
+    def test_touched_file_not_reloaded(self):
+        st = os.stat(self.path)
+        os.utime(self.path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+        with mock.patch.object(self.mftable, "load_table") as load_table:
+            self.mftable.get_dac("H2", 40)
+        load_table.assert_not_called()
+
+
 if __name__ == "__main__":
     unittest.main()
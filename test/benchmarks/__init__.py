@@ -0,0 +1,39 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+"""
+stand-alone performance benchmarks. run a module directly e.g.
+
+    python -m test.benchmarks.binpack
+"""
+import timeit
+
+
+def bench(label, func, number=10, repeat=5):
+    """
+    time ``func`` and print the best per-call time in milliseconds
+
+    @return: best time in seconds
+    """
+    t = min(timeit.repeat(func, number=number, repeat=repeat)) / number
+    print("{:<50s} {:10.3f} ms".format(label, t * 1000))
+    return t
+
+
+def speedup(label, slow, fast):
+    print("{:<50s} {:10.1f}x".format(label, slow / fast if fast else float("inf")))
+
+
+# ============= EOF =============================================
@@ -0,0 +1,68 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+"""
+compare quick loading full DVCAnalysis objects with lazy DVCAnalysisRecords on a
+synthetic repository
+
+    python -m test.benchmarks.analysis_record [n]
+"""
+import shutil
+import sys
+import tracemalloc
+
+from pychron.dvc.analysis_loading import AnalysisLoadContext
+from pychron.dvc.dvc import DVC
+from test.benchmarks import bench, speedup
+from test.benchmarks.synthetic_repo import build_repository
+
+
+def main(n=10000):
+    root, records = build_repository(n)
+    try:
+        dvc = DVC(bind=False)
+        context = AnalysisLoadContext()
+
+        def load(lazy):
+            return [
+                dvc._make_record(r, None, 0, 0, context=context, quick=True, lazy=lazy)
+                for r in records
+            ]
+
+        def memory(lazy):
+            tracemalloc.start()
+            ans = load(lazy)
+            size, _ = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            assert len(ans) == n
+            return size / 1024**2
+
+        print("{} analyses".format(n))
+        a = bench("quick DVCAnalysis", lambda: load(False), number=1, repeat=3)
+        b = bench("lazy DVCAnalysisRecord", lambda: load(True), number=1, repeat=3)
+        speedup("speedup", a, b)
+
+        ma = memory(False)
+        mb = memory(True)
+        print("{:<50s} {:10.1f} MB".format("quick DVCAnalysis memory", ma))
+        print("{:<50s} {:10.1f} MB".format("lazy DVCAnalysisRecord memory", mb))
+        speedup("memory reduction", ma, mb)
+    finally:
+        shutil.rmtree(root)
+
+
+if __name__ == "__main__":
+    main(*[int(a) for a in sys.argv[1:]])
+# ============= EOF =============================================
@@ -0,0 +1,60 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+"""
+compare fitting series one regressor at a time with batch_regress
+
+    python -m test.benchmarks.batch_regressor [nseries] [npts]
+"""
+import sys
+
+from numpy import linspace
+from numpy.random import RandomState
+
+from pychron.core.regression.batch_regressor import batch_regress
+from pychron.core.regression.ols_regressor import PolynomialRegressor
+from test.benchmarks import bench, speedup
+
+
+def main(ns=2000, n=100):
+    rs = RandomState(0)
+    xs = [linspace(5, 400, n) for _ in range(ns)]
+    ys = [1000 - 0.5 * x + 2e-4 * x**2 + rs.normal(0, 2, n) for x in xs]
+    es = [rs.uniform(1, 3, n) for _ in range(ns)]
+    fits = ["linear", "parabolic"] * (ns // 2)
+
+    def single():
+        for x, y, e, f in zip(xs, ys, es, fits):
+            reg = PolynomialRegressor(xs=x, ys=y, yserr=e)
+            reg.set_degree(f, refresh=False)
+            reg.calculate()
+            reg.predict(0)
+            reg.predict_error(0, error_calc="SEM")
+            reg.mswd
+
+    def batch():
+        r = batch_regress(xs, ys, fits, yserr=es)
+        r.predict(0)
+        r.predict_error(0)
+
+    print("{} series, {} points".format(ns, n))
+    a = bench("PolynomialRegressor per series", single, number=1, repeat=3)
+    b = bench("batch_regress", batch, number=1, repeat=3)
+    speedup("speedup", a, b)
+
+
+if __name__ == "__main__":
+    main(*[int(a) for a in sys.argv[1:]])
+# ============= EOF =============================================
@@ -0,0 +1,77 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+"""
+compare the struct and numpy signal blob codecs on a 1000 count multicollector
+analysis (signal, baseline and sniff blobs for 7 detectors)
+
+    python -m test.benchmarks.binpack
+"""
+import struct
+
+from numpy import arange, random
+
+from pychron.core.helpers.binpack import pack_columns, unpack, unpack_arrays
+from test.benchmarks import bench, speedup
+
+NDETECTORS = 7
+NCOUNTS = 1000
+NBASELINE = 100
+NSNIFF = 20
+
+
+def make_blobs():
+    rng = random.default_rng(0)
+    blobs = []
+    for n in (NCOUNTS, NBASELINE, NSNIFF):
+        for _ in range(NDETECTORS):
+            xs = arange(n) * 1.048576
+            ys = 1000 + rng.normal(0, 5, n)
+            blobs.append((xs, ys))
+    return blobs
+
+
+def main():
+    columns = make_blobs()
+    blobs = [pack_columns(">ff", xs, ys) for xs, ys in columns]
+
+    def struct_unpack():
+        for b in blobs:
+            unpack(b, ">ff")
+
+    def numpy_unpack():
+        for b in blobs:
+            unpack_arrays(b, ">ff")
+
+    def struct_pack():
+        for xs, ys in columns:
+            b"".join((struct.pack(">ff", x, y) for x, y in zip(xs, ys)))
+
+    def numpy_pack():
+        for xs, ys in columns:
+            pack_columns(">ff", xs, ys)
+
+    print("{} detectors x {} counts".format(NDETECTORS, NCOUNTS))
+    a = bench("unpack struct", struct_unpack)
+    b = bench("unpack numpy", numpy_unpack)
+    speedup("unpack speedup", a, b)
+    a = bench("pack struct", struct_pack)
+    b = bench("pack numpy", numpy_pack)
+    speedup("pack speedup", a, b)
+
+
+if __name__ == "__main__":
+    main()
+# ============= EOF =============================================
@@ -0,0 +1,57 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+"""
+compare statsmodels and closed form OLS isotope intercept fits
+
+    python -m test.benchmarks.closed_form_ols [n]
+"""
+import sys
+
+from numpy import linspace
+from numpy.random import RandomState
+
+from pychron.core.regression.ols_regressor import PolynomialRegressor
+from test.benchmarks import bench, speedup
+
+
+def main(n=300):
+    rs = RandomState(0)
+    xs = linspace(5, 400, n)
+    ys = 1000 - 0.5 * xs + 2e-4 * xs**2 + rs.normal(0, 2, n)
+    fod = dict(filter_outliers=True, iterations=2, std_devs=2)
+
+    def fit(fitname, closed_form):
+        reg = PolynomialRegressor(xs=xs, ys=ys, use_closed_form=closed_form)
+        reg.set_degree(fitname, refresh=False)
+        reg.filter_outliers_dict = fod
+
+        def func():
+            reg.calculate()
+            reg.predict(0)
+            reg.predict_error(0, error_calc="SEM")
+
+        return func
+
+    print("{} points, outlier filtering 2 iterations".format(n))
+    for fitname in ("linear", "parabolic", "cubic"):
+        a = bench("statsmodels {}".format(fitname), fit(fitname, False), number=100)
+        b = bench("closed form {}".format(fitname), fit(fitname, True), number=100)
+        speedup("speedup", a, b)
+
+
+if __name__ == "__main__":
+    main(*[int(a) for a in sys.argv[1:]])
+# ============= EOF =============================================
@@ -0,0 +1,108 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+"""
+filter_items and filter_ufloats with compiled predicates and the previous
+per-item eval version
+
+    python -m test.benchmarks.filtering [n]
+"""
+import re
+import sys
+
+from numpy import random, vstack
+
+from pychron.core.filtering import filter_items, filter_ufloats
+from test.benchmarks import bench, speedup
+
+regex = re.compile(r"error|percent_error|(?! and| or)[A-Za-z]+")
+
+
+def eval_filter_items(items, predicate_str):
+    """
+    filter_items before the predicate compiler
+    """
+    variable_name = re.search(r"(?P<name>[A-Za-z])", predicate_str).group("name")
+    omits = [
+        (eval(predicate_str, {variable_name: yi}), i) for i, yi in enumerate(items)
+    ]
+    return [idx for ti, idx in omits if ti]
+
+
+def eval_filter_ufloats(items, predicate_str):
+    """
+    filter_ufloats before the predicate compiler
+    """
+    attrs = regex.findall(predicate_str)
+
+    def make_ctx(v, e):
+        ctx = {}
+        for ai in attrs:
+            if ai == "error":
+                ctx[ai] = e
+            elif ai == "percent_error":
+                ctx[ai] = e / v * 100 if v else 0
+            else:
+                ctx[ai] = v
+        return ctx
+
+    omits = [(i, eval(predicate_str, make_ctx(*uf))) for i, uf in enumerate(items)]
+    return [idx for idx, ti in omits if ti]
+
+
+def main(n=100000):
+    rng = random.default_rng(0)
+    vs = rng.normal(10, 3, n)
+    es = abs(rng.normal(1, 0.5, n))
+    ufs = vstack((vs, es)).T
+    items = vs.tolist()
+
+    print("{} items".format(n))
+    for predicate in ("10<x or x<5", "5<=x<15 and not x>12"):
+        assert eval_filter_items(items, predicate) == filter_items(items, predicate)
+        a = bench(
+            "  filter_items eval {}".format(predicate),
+            lambda: eval_filter_items(items, predicate),
+            number=1,
+            repeat=3,
+        )
+        b = bench(
+            "  filter_items {}".format(predicate),
+            lambda: filter_items(items, predicate),
+            number=1,
+            repeat=3,
+        )
+        speedup("  compiled", a, b)
+
+    for predicate in ("x>10 or error>2", "age>15 or percent_error>20"):
+        assert eval_filter_ufloats(ufs, predicate) == filter_ufloats(ufs, predicate)
+        a = bench(
+            "  filter_ufloats eval {}".format(predicate),
+            lambda: eval_filter_ufloats(ufs, predicate),
+            number=1,
+            repeat=3,
+        )
+        b = bench(
+            "  filter_ufloats {}".format(predicate),
+            lambda: filter_ufloats(ufs, predicate),
+            number=1,
+            repeat=3,
+        )
+        speedup("  compiled", a, b)
+
+
+if __name__ == "__main__":
+    main(*[int(a) for a in sys.argv[1:]])
+# ============= EOF =============================================
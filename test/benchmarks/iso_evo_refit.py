@@ -0,0 +1,70 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+"""
+compare serial and threaded isotope evolution refits on a synthetic repository
+
+    python -m test.benchmarks.iso_evo_refit [n] [ncounts]
+"""
+import shutil
+import sys
+
+from pychron.dvc.analysis_loading import AnalysisLoadContext, get_loading_workers
+from pychron.dvc.dvc import DVC
+from pychron.options.iso_evo import IsoFilterFitAuxPlot
+from pychron.pipeline.iso_evo_fit import fit_analysis, fit_analyses_parallel
+from test.benchmarks import bench, speedup
+from test.benchmarks.synthetic_repo import ISOTOPES, build_repository
+
+
+def main(n=500, ncounts=200):
+    root, records = build_repository(n, ncounts=ncounts)
+    try:
+        dvc = DVC(bind=False)
+        context = AnalysisLoadContext()
+        ans = [
+            dvc._make_record(r, None, 0, 0, context=context, quick=True)
+            for r in records
+        ]
+
+        fits = [
+            IsoFilterFitAuxPlot(name=k, fit="parabolic", filter_outliers=True)
+            for k, _ in ISOTOPES
+        ]
+        keys = [f.name for f in fits]
+
+        def serial():
+            rs = [fit_analysis(a, fits, keys) for a in ans]
+            assert len(rs) == n
+
+        def parallel():
+            rs = list(fit_analyses_parallel(ans, fits, keys, use_progress=False))
+            assert len(rs) == n
+
+        print(
+            "{} analyses, {} counts, {} workers".format(
+                n, ncounts, get_loading_workers()
+            )
+        )
+        a = bench("serial refit", serial, number=1, repeat=3)
+        b = bench("threaded refit", parallel, number=1, repeat=3)
+        speedup("speedup", a, b)
+    finally:
+        shutil.rmtree(root)
+
+
+if __name__ == "__main__":
+    main(*[int(a) for a in sys.argv[1:]])
+# ============= EOF =============================================
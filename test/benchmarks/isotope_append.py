@@ -0,0 +1,100 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+"""
+live data collection into an IsotopeGroup. simulates a multicollector run with
+one isotope per detector, ``ncounts`` signal counts and ``ncounts // 4`` baseline
+counts, using IsotopeGroup.append_data and the previous numpy.append version
+
+    python -m test.benchmarks.isotope_append [ndetectors] [ncounts]
+"""
+import sys
+
+from numpy import append as npappend
+
+from pychron.processing.isotope import Isotope
+from pychron.processing.isotope_group import IsotopeGroup
+from test.benchmarks import bench, speedup
+
+
+def npappend_data(group, iso, det, x, signal, kind):
+    """
+    IsotopeGroup.append_data before the growable buffers
+    """
+
+    def _append(isotope):
+        if kind in ("sniff", "baseline", "whiff"):
+            isotope = getattr(isotope, kind)
+
+        isotope.xs = npappend(isotope.xs, x)
+        isotope.ys = npappend(isotope.ys, signal)
+
+    if kind == "baseline":
+        ret = False
+        for i in group.itervalues():
+            if i.detector == det:
+                _append(i)
+                ret = True
+        return ret
+    else:
+        for i in ("{}{}".format(iso, det), iso):
+            if i in group.isotopes:
+                _append(group.isotopes[i])
+                return True
+
+
+def make_group(ndetectors):
+    group = IsotopeGroup()
+    group.isotopes = {
+        "Ar{}".format(i): Isotope("Ar{}".format(i), "D{}".format(i))
+        for i in range(ndetectors)
+    }
+    return group
+
+
+def collect(append_data, ndetectors, ncounts):
+    group = make_group(ndetectors)
+    pairs = [(iso.name, iso.detector) for iso in group.itervalues()]
+    for i in range(ncounts):
+        for name, det in pairs:
+            append_data(group, name, det, i, 1.0 + i, "signal")
+
+    for i in range(ncounts // 4):
+        for _, det in pairs:
+            append_data(group, None, det, i, 0.01, "baseline")
+    return group
+
+
+def main(ndetectors=10, ncounts=1200):
+    print("{} detectors".format(ndetectors))
+    for n in (ncounts // 4, ncounts, ncounts * 4):
+        a = bench(
+            "  {} counts, numpy.append".format(n),
+            lambda: collect(npappend_data, ndetectors, n),
+            number=1,
+            repeat=3,
+        )
+        b = bench(
+            "  {} counts, append_data".format(n),
+            lambda: collect(IsotopeGroup.append_data, ndetectors, n),
+            number=1,
+            repeat=3,
+        )
+        speedup("  growable buffers", a, b)
+
+
+if __name__ == "__main__":
+    main(*[int(a) for a in sys.argv[1:]])
+# ============= EOF =============================================
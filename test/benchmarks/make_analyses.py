@@ -0,0 +1,64 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+"""
+compare the serial and threaded build phase of DVC.make_analyses on a
+synthetic repository
+
+    python -m test.benchmarks.make_analyses [n]
+"""
+import shutil
+import sys
+
+from pychron.dvc.analysis_loading import (
+    AnalysisLoadContext,
+    build_analyses_parallel,
+    get_loading_workers,
+)
+from pychron.dvc.dvc import DVC
+from test.benchmarks import bench, speedup
+from test.benchmarks.synthetic_repo import build_repository
+
+
+def main(n=5000):
+    root, records = build_repository(n)
+    try:
+        dvc = DVC(bind=False)
+        context = AnalysisLoadContext()
+
+        def serial():
+            ans = [
+                dvc._make_record(r, None, 0, 0, context=context, quick=True)
+                for r in records
+            ]
+            assert len(ans) == n
+
+        def parallel():
+            ans = build_analyses_parallel(
+                dvc, records, context, quick=True, use_progress=False
+            )
+            assert len(ans) == n
+
+        print("{} analyses, {} workers".format(n, get_loading_workers()))
+        a = bench("serial build", serial, number=1, repeat=3)
+        b = bench("threaded build", parallel, number=1, repeat=3)
+        speedup("speedup", a, b)
+    finally:
+        shutil.rmtree(root)
+
+
+if __name__ == "__main__":
+    main(*[int(a) for a in sys.argv[1:]])
+# ============= EOF =============================================
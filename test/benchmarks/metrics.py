@@ -0,0 +1,108 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+"""
+per call cost of the metrics facade and of pre-bound metric handles.
+
+the overhead of a bound handle is measured against calling the prometheus_client
+child directly when enabled, and against an empty function when disabled. exits
+with status 1 if an overhead is over budget
+
+    python -m test.benchmarks.metrics [ncalls]
+"""
+import sys
+import timeit
+
+from pychron.observability import metrics, registry
+from pychron.observability.config import MetricsConfig
+from test.benchmarks import speedup
+
+# per call overhead budget in nanoseconds. the facade calls cost several us
+BUDGET = 250
+
+
+def per_call(label, stmt, ncalls):
+    """
+    @return: best time per call in nanoseconds
+    """
+    t = min(timeit.repeat(stmt, number=ncalls, repeat=7)) / ncalls * 1e9
+    print("{:<50s} {:10.1f} ns".format(label, t))
+    return t
+
+
+def overhead(label, t, baseline):
+    o = t - baseline
+    print("{:<50s} {:10.1f} ns".format(label, o))
+    return o
+
+
+def empty():
+    pass
+
+
+def main(ncalls=200000):
+    labels = {"device": "laser"}
+    overheads = []
+
+    metrics.configure(MetricsConfig(enabled=True, namespace="bench"))
+    reads = metrics.counter("bench_reads", "bench reads", ["device"]).bind(**labels)
+    latency = metrics.histogram("bench_latency", "bench latency", ["device"]).bind(
+        **labels
+    )
+    child = registry.counter("bench_bench_reads", "").labels(**labels)
+    hchild = registry.histogram("bench_bench_latency", "").labels(**labels)
+
+    print("enabled")
+    a = per_call(
+        "  inc_counter",
+        lambda: metrics.inc_counter("bench_reads", "bench reads", ["device"], labels),
+        ncalls,
+    )
+    base = per_call("  prometheus child inc", child.inc, ncalls)
+    b = per_call("  bound counter inc", reads.inc, ncalls)
+    speedup("  bound vs inc_counter", a, b)
+    overheads.append(overhead("  bound counter overhead", b, base))
+
+    c = per_call(
+        "  observe_histogram",
+        lambda: metrics.observe_histogram(
+            "bench_latency", "bench latency", 0.1, ["device"], labels
+        ),
+        ncalls,
+    )
+    base = per_call("  prometheus child observe", lambda: hchild.observe(0.1), ncalls)
+    d = per_call("  bound histogram observe", lambda: latency.observe(0.1), ncalls)
+    speedup("  bound vs observe_histogram", c, d)
+    overheads.append(overhead("  bound histogram overhead", d, base))
+
+    metrics.configure(MetricsConfig(enabled=False))
+    print("disabled")
+    per_call(
+        "  inc_counter",
+        lambda: metrics.inc_counter("bench_reads", "bench reads", ["device"], labels),
+        ncalls,
+    )
+    base = per_call("  empty function", empty, ncalls)
+    b = per_call("  bound counter inc", reads.inc, ncalls)
+    overheads.append(overhead("  bound counter overhead", b, base))
+
+    ok = max(overheads) < BUDGET
+    print("overhead {} {} ns".format("within" if ok else "over", BUDGET))
+    return ok
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main(*[int(a) for a in sys.argv[1:]]) else 1)
+# ============= EOF =============================================
@@ -0,0 +1,68 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+"""
+compare trial by trial and batched monte carlo flux errors for a plane fit to
+a 100 position tray
+
+    python -m test.benchmarks.monte_carlo
+"""
+from numpy import column_stack, random
+
+from pychron.core.regression.flux_regressor import PlaneFluxRegressor
+from pychron.core.stats import monte_carlo
+from pychron.core.stats.monte_carlo import FluxEstimator
+from test.benchmarks import bench, speedup
+
+NPOSITIONS = 100
+NTRIALS = 10000
+
+
+def make_regressor():
+    rng = random.default_rng(0)
+    x, y = rng.uniform(-10, 10, (2, NPOSITIONS))
+    zs = 0.01 + 1e-4 * x - 2e-4 * y + rng.normal(0, 1e-6, NPOSITIONS)
+    zserr = rng.uniform(1e-6, 5e-6, NPOSITIONS)
+    reg = PlaneFluxRegressor(xs=column_stack((x, y)), ys=zs, yserr=zserr)
+    reg.calculate()
+    return reg
+
+
+def main():
+    reg = make_regressor()
+    pts = reg.clean_xs
+
+    def run():
+        fe = FluxEstimator(NTRIALS, reg, seed=1)
+        fe.estimate(pts)
+        fe.estimate_position_err(pts, 0.1)
+
+    def loop():
+        batch = monte_carlo.batch_predict
+        monte_carlo.batch_predict = monte_carlo.loop_predict
+        try:
+            run()
+        finally:
+            monte_carlo.batch_predict = batch
+
+    print("{} positions x {} trials".format(NPOSITIONS, NTRIALS))
+    a = bench("trial by trial", loop, number=1, repeat=1)
+    b = bench("batched", run, number=1, repeat=3)
+    speedup("speedup", a, b)
+
+
+if __name__ == "__main__":
+    main()
+# ============= EOF =============================================
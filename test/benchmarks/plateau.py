@@ -0,0 +1,64 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+"""
+compare the incremental and the pairwise plateau search on a table of step
+heating spectra
+
+    python -m test.benchmarks.plateau
+"""
+from numpy import random
+
+from pychron.processing.plateau import Plateau, find_plateau
+from test.benchmarks import bench, speedup
+
+NSPECTRA = 50
+NSTEPS = 25
+
+
+def make_spectra():
+    rng = random.default_rng(0)
+    spectra = []
+    for _ in range(NSPECTRA):
+        ages = 28 + rng.normal(0, 0.3, NSTEPS)
+        ages[:3] += rng.uniform(1, 5, 3)
+        errors = rng.uniform(0.2, 0.5, NSTEPS)
+        signals = rng.uniform(0.5, 1.5, NSTEPS)
+        spectra.append((ages, errors, signals, []))
+    return spectra
+
+
+def main():
+    spectra = make_spectra()
+
+    def legacy():
+        for ages, errors, signals, excludes in spectra:
+            Plateau(
+                ages=ages, errors=errors, signals=signals, excludes=excludes
+            ).find_plateaus_legacy()
+
+    def incremental():
+        for spectrum in spectra:
+            find_plateau(*spectrum)
+
+    print("{} spectra x {} steps".format(NSPECTRA, NSTEPS))
+    a = bench("pairwise", legacy)
+    b = bench("incremental", incremental)
+    speedup("speedup", a, b)
+
+
+if __name__ == "__main__":
+    main()
+# ============= EOF =============================================
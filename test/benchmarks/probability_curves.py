@@ -0,0 +1,65 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+"""
+ideogram probability curve of a 5000 grain detrital dataset: loop, vectorized
+and incremental (one grain toggled)
+
+    python -m test.benchmarks.probability_curves
+"""
+
+from numpy import exp, linspace, pi, random, zeros
+
+from pychron.core.stats.probability_curves import (
+    IncrementalProbabilityCurve,
+    cumulative_probability,
+)
+from test.benchmarks import bench, speedup
+
+NGRAINS = 5000
+NBINS = 500
+
+
+def loop_cumulative_probability(ages, errors, xmi, xma, n):
+    x = linspace(xmi, xma, n)
+    probs = zeros(n)
+    for ai, ei in zip(ages, errors):
+        es2 = 2 * ei * ei
+        probs += (es2 * pi) ** -0.5 * exp(-((x - ai) ** 2) / es2)
+    return x, probs
+
+
+def main():
+    rng = random.default_rng(0)
+    ages = rng.uniform(50, 3000, NGRAINS)
+    errors = ages * rng.uniform(0.005, 0.03, NGRAINS)
+    curve = IncrementalProbabilityCurve(ages, errors, 0, 3200, NBINS)
+
+    def toggle():
+        curve.toggle(17)
+
+    print("{} grains x {} bins".format(NGRAINS, NBINS))
+    a = bench("loop", lambda: loop_cumulative_probability(ages, errors, 0, 3200, NBINS))
+    b = bench(
+        "vectorized", lambda: cumulative_probability(ages, errors, 0, 3200, NBINS)
+    )
+    c = bench("incremental toggle", toggle, number=100)
+    speedup("vectorized speedup", a, b)
+    speedup("incremental speedup", a, c)
+
+
+if __name__ == "__main__":
+    main()
+# ============= EOF =============================================
@@ -0,0 +1,145 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+"""
+build a synthetic DVC repository on disk for benchmarking analysis loading
+"""
+import os
+import tempfile
+import uuid as uuidlib
+
+from numpy import arange, random
+
+from pychron.core.helpers.binpack import encode_blob, pack_columns
+from pychron.dvc import (
+    BASELINES,
+    BLANKS,
+    ICFACTORS,
+    INTERCEPTS,
+    analysis_path,
+    dvc_dump,
+)
+from pychron.paths import paths
+
+REPOSITORY = "BenchmarkRepo"
+ISOTOPES = (
+    ("Ar40", "H1"),
+    ("Ar39", "AX"),
+    ("Ar38", "L1"),
+    ("Ar37", "L2"),
+    ("Ar36", "CDD"),
+)
+
+
+class Record(object):
+    """
+    minimal stand in for a database analysis record
+    """
+
+    group_id = 0
+    tag = "ok"
+    irradiation_position = None
+    repository_identifier = REPOSITORY
+
+    def __init__(self, uuid, record_id):
+        self.uuid = uuid
+        self.record_id = record_id
+
+
+def build_repository(n, root=None, ncounts=0, seed=0):
+    """
+    write ``n`` analyses and point ``paths`` at the new repository
+
+    @return: (root, records)
+    """
+    if root is None:
+        root = tempfile.mkdtemp(prefix="pychron_bench")
+
+    paths.repository_dataset_dir = os.path.join(root, "repositories")
+    paths.meta_root = os.path.join(root, "MetaData")
+    os.makedirs(os.path.join(paths.repository_dataset_dir, REPOSITORY), exist_ok=True)
+    os.makedirs(paths.meta_root, exist_ok=True)
+    dvc_dump(
+        {k: float(k[2:]) for k, _ in ISOTOPES},
+        os.path.join(paths.meta_root, "molecular_weights.json"),
+    )
+
+    rng = random.default_rng(seed)
+    records = []
+    for i in range(n):
+        uuid = str(uuidlib.UUID(int=int(rng.integers(2**62)), version=4))
+        runid = "bench-{:05d}-01".format(i)
+        records.append(Record(uuid, runid))
+
+        def path(modifier=None):
+            return analysis_path(
+                (uuid, uuid), REPOSITORY, modifier, mode="w", force_sublen=2
+            )
+
+        isotopes = {k: {"name": k, "detector": d, "units": "fA"} for k, d in ISOTOPES}
+        dvc_dump(
+            {
+                "uuid": uuid,
+                "identifier": "bench",
+                "aliquot": i,
+                "increment": None,
+                "analysis_type": "unknown",
+                "timestamp": "2026-01-01T12:00:00",
+                "isotopes": isotopes,
+                "arar_mapping": {k: k for k, _ in ISOTOPES},
+            },
+            path(),
+        )
+        dvc_dump({"extract_value": 1.0, "extract_units": "W"}, path("extraction"))
+
+        value = lambda: {
+            "fit": "linear",
+            "error_type": "SEM",
+            "value": float(rng.uniform(1, 100)),
+            "error": float(rng.uniform(0, 1)),
+        }
+        dvc_dump({k: value() for k, _ in ISOTOPES}, path(INTERCEPTS))
+        dvc_dump({d: value() for _, d in ISOTOPES}, path(BASELINES))
+        dvc_dump(
+            {k: dict(value(), fit="previous", references=[]) for k, _ in ISOTOPES},
+            path(BLANKS),
+        )
+        dvc_dump(
+            {d: {"value": 1.0, "error": 0.001, "fit": "default"} for _, d in ISOTOPES},
+            path(ICFACTORS),
+        )
+
+        if ncounts:
+            xs = arange(ncounts) * 1.048
+
+            def blob():
+                return encode_blob(pack_columns(">ff", xs, rng.normal(100, 1, ncounts)))
+
+            dvc_dump(
+                {
+                    "format": ">ff",
+                    "signals": [
+                        {"isotope": k, "detector": d, "blob": blob()} for k, d in ISOTOPES
+                    ],
+                    "baselines": [{"detector": d, "blob": blob()} for _, d in ISOTOPES],
+                    "sniffs": [],
+                },
+                path(".data"),
+            )
+
+    return root, records
+
+
+# ============= EOF =============================================
@@ -0,0 +1,129 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+"""
+York solver on the Pearson (1901) data with the York (1966) weights and on
+synthetic isochrons
+
+    python -m test.benchmarks.york [nfits] [npts]
+"""
+import sys
+
+from numpy import array, full
+from numpy.random import RandomState
+
+from pychron.core.regression.new_york_regressor import NewYorkRegressor
+from pychron.core.regression.tests.standard_data import pearson
+from pychron.core.regression.tests.york_solver_test import (
+    kron_mahon_variances,
+    make_isochron,
+)
+from pychron.core.regression.york_solver import (
+    YorkData,
+    mahon_variances,
+    york_fit,
+    york_fit_batch,
+)
+from test.benchmarks import bench, speedup
+
+
+def pearson_data():
+    xs, ys, wxs, wys = pearson()
+    return array(xs), array(ys), 1 / wxs**0.5, 1 / wys**0.5
+
+
+def toggle(x, y, sx, sy, r=None, nfits=50):
+    """
+    refit after excluding each point in turn, as when points are toggled
+    """
+
+    def func(warm):
+        reg = NewYorkRegressor(xs=x, ys=y, xserr=sx, yserr=sy)
+        reg.warm_start = warm
+        reg.calculate()
+        for i in range(nfits):
+            reg.user_excluded = [i % len(x)]
+            reg.calculate()
+            reg.get_slope_error()
+
+    a = bench("  toggle cold", lambda: func(False), number=1, repeat=5)
+    b = bench("  toggle warm", lambda: func(True), number=1, repeat=5)
+    speedup("  warm start", a, b)
+
+    # the solver alone, without the OLS fit done by calculate
+    b0, _, _ = york_fit(x, y, sx, sy, r)
+    mask = full(x.shape, True)
+    mask[0] = False
+    data = YorkData(x, y, sx, sy, r, mask)
+    _, _, cold = york_fit(None, None, None, None, data=data)
+    _, _, warm = york_fit(None, None, None, None, b0=b0, data=data)
+    print("  iterations cold={} warm={}".format(cold[0], warm[0]))
+    a = bench("  solver cold", lambda: york_fit(None, None, None, None, data=data))
+    b = bench(
+        "  solver warm", lambda: york_fit(None, None, None, None, b0=b0, data=data)
+    )
+    speedup("  warm start", a, b)
+
+
+def variances(x, y, sx, sy, r):
+    data = YorkData(x, y, sx, sy, r)
+    b, _, _ = york_fit(None, None, None, None, data=data)
+    a = bench(
+        "  mahon variances, loop",
+        lambda: kron_mahon_variances(b[0], x, y, sx, sy, r),
+        number=1,
+        repeat=3,
+    )
+    c = bench("  mahon variances, vectorized", lambda: mahon_variances(b, data))
+    speedup("  vectorized", a, c)
+
+
+def batch(fits, npts):
+    cols = [full((len(fits), npts), 0.0) for _ in range(5)]
+    for j, f in enumerate(fits):
+        for c, v in zip(cols, f):
+            c[j] = v
+
+    def loop():
+        for f in fits:
+            data = YorkData(*f)
+            b, _, _ = york_fit(None, None, None, None, data=data)
+            mahon_variances(b, data)
+
+    a = bench("  {} fits, loop".format(len(fits)), loop, number=1, repeat=3)
+    b = bench("  {} fits, batch".format(len(fits)), lambda: york_fit_batch(*cols))
+    speedup("  batch", a, b)
+
+
+def main(nfits=500, npts=15):
+    print("Pearson/York")
+    x, y, sx, sy = pearson_data()
+    toggle(x, y, sx, sy)
+
+    rs = RandomState(0)
+    print("synthetic isochron, {} points".format(npts))
+    x, y, sx, sy, r = make_isochron(rs, npts)
+    toggle(x, y, sx, sy, r)
+
+    print("synthetic isochron, 200 points")
+    variances(*make_isochron(rs, 200))
+
+    print("synthetic isochrons, {} points".format(npts))
+    batch([make_isochron(rs, npts) for _ in range(nfits)], npts)
+
+
+if __name__ == "__main__":
+    main(*[int(a) for a in sys.argv[1:]])
+# ============= EOF =============================================
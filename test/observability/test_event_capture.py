@@ -433,5 +433,138 @@ class TestThreadSafety(unittest.TestCase):
         self.assertEqual(len(errors), 0)
 
 
+def _event(name: str, value: float = 1.0, event_type: str = "gauge") -> PrometheusEvent:
+    return PrometheusEvent(
+        timestamp=time.time(), event_type=event_type, metric_name=name, value=value
+    )
+
+
+class TestEventDispatcher(unittest.TestCase):
+    """Tests for the bounded callback dispatcher."""
+
+    def setUp(self) -> None:
+        """Register a callback that blocks until released."""
+        self.release = threading.Event()
+        self.received: list = []
+        self.batches: list = []
+
+        def blocking(event: PrometheusEvent) -> None:
+            self.release.wait(5)
+            self.received.append(event)
+
+        self.blocking = blocking
+        with event_capture._callbacks_lock:
+            event_capture._event_callbacks.clear()
+            event_capture._batch_callbacks.clear()
+        event_capture.register_callback(blocking)
+        event_capture.register_callback(self.batches.append, batch=True)
+
+    def tearDown(self) -> None:
+        """Clean up."""
+        self.release.set()
+        with event_capture._callbacks_lock:
+            event_capture._event_callbacks.clear()
+            event_capture._batch_callbacks.clear()
+
+    def _fill(self, dispatcher: event_capture.EventDispatcher, names: list) -> None:
+        # the first event occupies the worker, the rest stay queued
+        dispatcher.put(_event("busy"))
+        while dispatcher.get_stats()["queued"]:
+            time.sleep(0.001)
+        for name in names:
+            dispatcher.put(_event(name))
+
+    def test_single_worker_thread(self) -> None:
+        """Test that a burst of events does not start a thread per event."""
+        self.release.set()
+        dispatcher = event_capture.EventDispatcher(maxsize=10000)
+        nthreads = threading.active_count()
+        for i in range(500):
+            dispatcher.put(_event(f"e{i}"))
+        self.assertLessEqual(threading.active_count(), nthreads + 1)
+
+        self.assertTrue(dispatcher.flush(5))
+        self.assertEqual([e.metric_name for e in self.received], [f"e{i}" for i in range(500)])
+        self.assertEqual(sum(len(b) for b in self.batches), 500)
+        self.assertEqual(dispatcher.get_stats()["dispatched"], 500)
+
+    def test_drop_newest(self) -> None:
+        """Test that new events are rejected when the queue is full."""
+        dispatcher = event_capture.EventDispatcher(maxsize=3, policy=event_capture.DROP_NEWEST)
+        self._fill(dispatcher, ["a", "b", "c", "d", "e"])
+        self.assertEqual(dispatcher.get_stats()["dropped"], 2)
+
+        self.release.set()
+        dispatcher.flush(5)
+        self.assertEqual([e.metric_name for e in self.received], ["busy", "a", "b", "c"])
+
+    def test_drop_oldest(self) -> None:
+        """Test that the oldest queued events are discarded when the queue is full."""
+        dispatcher = event_capture.EventDispatcher(maxsize=3, policy=event_capture.DROP_OLDEST)
+        self._fill(dispatcher, ["a", "b", "c", "d", "e"])
+        self.assertEqual(dispatcher.get_stats()["dropped"], 2)
+
+        self.release.set()
+        dispatcher.flush(5)
+        self.assertEqual([e.metric_name for e in self.received], ["busy", "c", "d", "e"])
+
+    def test_coalesce(self) -> None:
+        """Test that queued events for the same metric are replaced by newer ones."""
+        dispatcher = event_capture.EventDispatcher(maxsize=3, policy=event_capture.COALESCE)
+        dispatcher.put(_event("busy"))
+        while dispatcher.get_stats()["queued"]:
+            time.sleep(0.001)
+        for name, value in (("a", 1), ("b", 1), ("a", 2), ("a", 3), ("c", 1), ("d", 1)):
+            dispatcher.put(_event(name, value))
+
+        stats = dispatcher.get_stats()
+        self.assertEqual(stats["coalesced"], 2)
+        self.assertEqual(stats["dropped"], 1)
+
+        self.release.set()
+        dispatcher.flush(5)
+        self.assertEqual(
+            [(e.metric_name, e.value) for e in self.received],
+            [("busy", 1), ("b", 1), ("c", 1), ("d", 1)],
+        )
+
+    def test_micro_batches(self) -> None:
+        """Test that batch callbacks receive the events queued since the last dispatch."""
+        dispatcher = event_capture.EventDispatcher(maxsize=100, max_batch=4)
+        self._fill(dispatcher, [f"e{i}" for i in range(10)])
+
+        self.release.set()
+        dispatcher.flush(5)
+        self.assertEqual([len(b) for b in self.batches], [1, 4, 4, 2])
+
+    def test_slow_callback(self) -> None:
+        """Test that a blocked callback does not delay the other callbacks."""
+        delivered = threading.Event()
+        event_capture.register_callback(lambda event: delivered.set())
+
+        event_capture.add_event(event_type="counter", metric_name="slow", value=1.0)
+        self.assertTrue(delivered.wait(5))
+        self.assertFalse(event_capture.flush_callbacks(0.1))
+        self.assertEqual(self.received, [])
+
+        self.release.set()
+        self.assertTrue(event_capture.flush_callbacks(5))
+        self.assertEqual([e.metric_name for e in self.received], ["slow"])
+        self.assertEqual([e.metric_name for b in self.batches for e in b], ["slow"])
+
+    def test_invalid_policy(self) -> None:
+        """Test that an unknown policy is rejected."""
+        with self.assertRaises(ValueError):
+            event_capture.EventDispatcher(policy="block")
+
+    def test_add_event_dispatch(self) -> None:
+        """Test that captured events reach the callbacks through the dispatcher."""
+        self.release.set()
+        event_capture.add_event(event_type="counter", metric_name="dispatched", value=1.0)
+        self.assertTrue(event_capture.flush_callbacks(5))
+        self.assertEqual(self.received[-1].metric_name, "dispatched")
+        self.assertIn("dropped", event_capture.get_dispatch_stats())
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -48,8 +48,8 @@ class TestLiveEventCapture(unittest.TestCase):
             status="success",
         )
 
-        # Give time for event to propagate through observer
-        time.sleep(0.1)
+        # Wait for the event to propagate through observer
+        self.assertTrue(event_capture.flush_callbacks(5))
 
         # Verify event was captured
         self.assertEqual(len(self.model.events), initial_count + 1)
@@ -75,7 +75,7 @@ class TestLiveEventCapture(unittest.TestCase):
             status="success",
         )
 
-        time.sleep(0.1)
+        self.assertTrue(event_capture.flush_callbacks(5))
 
         # Verify event was captured
         self.assertEqual(len(self.model.events), initial_count + 1)
@@ -93,14 +93,14 @@ class TestLiveEventCapture(unittest.TestCase):
 
         # Trigger multiple operations
         event_capture.add_event("counter", "counter_1", 1.0, labels=None, status="success")
-        time.sleep(0.05)
+        self.assertTrue(event_capture.flush_callbacks(5))
         event_capture.add_event("counter", "counter_2", 2.0, labels=None, status="success")
-        time.sleep(0.05)
+        self.assertTrue(event_capture.flush_callbacks(5))
         event_capture.add_event("gauge", "gauge_1", 100.0, labels=None, status="success")
-        time.sleep(0.05)
+        self.assertTrue(event_capture.flush_callbacks(5))
         event_capture.add_event("gauge", "gauge_2", 200.0, labels=None, status="success")
 
-        time.sleep(0.1)
+        self.assertTrue(event_capture.flush_callbacks(5))
 
         # Verify all events were captured
         self.assertEqual(len(self.model.events), initial_count + 4)
@@ -118,7 +118,7 @@ class TestLiveEventCapture(unittest.TestCase):
 
         event_capture.add_event("counter", "test_counter", 1.0, labels=None, status="success")
 
-        time.sleep(0.1)
+        self.assertTrue(event_capture.flush_callbacks(5))
 
         after = time.time()
 
@@ -132,7 +132,7 @@ class TestLiveEventCapture(unittest.TestCase):
 
         # Trigger an event
         event_capture.add_event("counter", "test_counter", 1.0, labels=None, status="success")
-        time.sleep(0.1)
+        self.assertTrue(event_capture.flush_callbacks(5))
 
         # Verify count increased
         self.assertEqual(self.model.event_count, initial_count + 1)
@@ -141,9 +141,9 @@ class TestLiveEventCapture(unittest.TestCase):
         """Test that metrics preview updates when events occur."""
         # Trigger events
         event_capture.add_event("counter", "test_counter", 42.0, labels=None, status="success")
-        time.sleep(0.1)
+        self.assertTrue(event_capture.flush_callbacks(5))
         event_capture.add_event("gauge", "test_gauge", 100.0, labels=None, status="success")
-        time.sleep(0.1)
+        self.assertTrue(event_capture.flush_callbacks(5))
 
         # Get metrics preview
         preview = self.model.get_metrics_preview()
@@ -158,9 +158,9 @@ class TestLiveEventCapture(unittest.TestCase):
         """Test that pane display traits update with events."""
         # Trigger counter and gauge events
         event_capture.add_event("counter", "test_counter", 1.0, labels=None, status="success")
-        time.sleep(0.05)
+        self.assertTrue(event_capture.flush_callbacks(5))
         event_capture.add_event("gauge", "test_gauge", 50.0, labels=None, status="success")
-        time.sleep(0.1)
+        self.assertTrue(event_capture.flush_callbacks(5))
 
         # Trigger metrics preview update
         self.pane._update_metrics_preview()
@@ -179,9 +179,9 @@ class TestLiveEventCapture(unittest.TestCase):
         """Test that events can be exported."""
         # Trigger multiple events
         event_capture.add_event("counter", "counter_1", 1.0, labels=None, status="success")
-        time.sleep(0.05)
+        self.assertTrue(event_capture.flush_callbacks(5))
         event_capture.add_event("gauge", "gauge_1", 100.0, labels=None, status="success")
-        time.sleep(0.1)
+        self.assertTrue(event_capture.flush_callbacks(5))
 
         # Export as JSON
         json_data = self.model.export_events("json")
@@ -206,11 +206,11 @@ class TestLiveEventCapture(unittest.TestCase):
         """Test that events can be filtered."""
         # Create mixed event types
         event_capture.add_event("counter", "my_counter", 1.0, labels=None, status="success")
-        time.sleep(0.05)
+        self.assertTrue(event_capture.flush_callbacks(5))
         event_capture.add_event("gauge", "my_gauge", 100.0, labels=None, status="success")
-        time.sleep(0.05)
+        self.assertTrue(event_capture.flush_callbacks(5))
         event_capture.add_event("counter", "my_counter", 2.0, labels=None, status="success")
-        time.sleep(0.1)
+        self.assertTrue(event_capture.flush_callbacks(5))
 
         # Filter by type
         counter_events = self.model.get_filtered_events("counter")
@@ -236,7 +236,7 @@ class TestLiveEventCapture(unittest.TestCase):
                 status="success",
             )
 
-        time.sleep(0.5)
+        self.assertTrue(event_capture.flush_callbacks(5))
 
         # Verify queue respects max size
         self.assertLessEqual(len(self.model.events), 1000)
@@ -262,9 +262,9 @@ class TestEventPaneFiltering(unittest.TestCase):
         """Test that event pane receives events."""
         # Trigger events
         event_capture.add_event("counter", "pane_test_counter", 1.0, labels=None, status="success")
-        time.sleep(0.05)
+        self.assertTrue(event_capture.flush_callbacks(5))
         event_capture.add_event("gauge", "pane_test_gauge", 50.0, labels=None, status="success")
-        time.sleep(0.1)
+        self.assertTrue(event_capture.flush_callbacks(5))
 
         # Trigger filter update
         self.pane._update_filtered_events()
@@ -276,11 +276,11 @@ class TestEventPaneFiltering(unittest.TestCase):
         """Test that event pane can filter by type."""
         # Create mixed events
         event_capture.add_event("counter", "counter_1", 1.0, labels=None, status="success")
-        time.sleep(0.05)
+        self.assertTrue(event_capture.flush_callbacks(5))
         event_capture.add_event("gauge", "gauge_1", 100.0, labels=None, status="success")
-        time.sleep(0.05)
+        self.assertTrue(event_capture.flush_callbacks(5))
         event_capture.add_event("counter", "counter_2", 2.0, labels=None, status="success")
-        time.sleep(0.1)
+        self.assertTrue(event_capture.flush_callbacks(5))
 
         # Filter by counter type
         self.pane.event_type_filter = "counter"
@@ -295,11 +295,11 @@ class TestEventPaneFiltering(unittest.TestCase):
         """Test that event pane search works with events."""
         # Create events with specific names
         event_capture.add_event("counter", "database_queries", 1.0, labels=None, status="success")
-        time.sleep(0.05)
+        self.assertTrue(event_capture.flush_callbacks(5))
         event_capture.add_event("counter", "cache_hits", 1.0, labels=None, status="success")
-        time.sleep(0.05)
+        self.assertTrue(event_capture.flush_callbacks(5))
         event_capture.add_event("gauge", "memory_usage", 500.0, labels=None, status="success")
-        time.sleep(0.1)
+        self.assertTrue(event_capture.flush_callbacks(5))
 
         # Search for "database"
         self.pane.search_text = "database"
@@ -3,10 +3,14 @@
 import unittest
 from unittest.mock import MagicMock, patch
 
+from pychron.observability import registry
 from pychron.observability.config import MetricsConfig
 from pychron.observability.metrics import (
     configure,
+    counter,
+    gauge,
     get_config,
+    histogram,
     inc_counter,
     is_enabled,
     observe_duration,
@@ -217,5 +221,63 @@ class TestErrorHandling(unittest.TestCase):
         inc_counter("test_counter", "Test counter", labels=["a"], labelvalues={"a": "1"})
 
 
+class TestBoundMetrics(unittest.TestCase):
+    """Test pre-bound metric handles."""
+
+    def setUp(self) -> None:
+        """Set up test with metrics enabled."""
+        configure(MetricsConfig(enabled=True, namespace="bound"))
+
+    def tearDown(self) -> None:
+        """Disable metrics again."""
+        configure(MetricsConfig(enabled=False))
+
+    def _value(self, name: str, labels: dict[str, str] | None = None) -> float | None:
+        return registry.get_registry().get_sample_value(name, labels or {})
+
+    def test_counter(self) -> None:
+        """Test a bound counter increments the labelled child."""
+        reads = counter("bound_reads", "Bound reads", labels=["device"])
+        laser = reads.bind(device="laser")
+        laser.inc()
+        laser.inc(2)
+        self.assertEqual(self._value("bound_bound_reads_total", {"device": "laser"}), 3)
+
+    def test_gauge_and_histogram(self) -> None:
+        """Test bound gauge and histogram operations."""
+        g = gauge("bound_level", "Bound level").bind()
+        g.set(4)
+        g.dec()
+        self.assertEqual(self._value("bound_bound_level"), 3)
+
+        h = histogram("bound_latency", "Bound latency", buckets=(0.1, 1.0)).bind()
+        h.observe(0.5)
+        with h.time():
+            pass
+        self.assertEqual(self._value("bound_bound_latency_count"), 2)
+
+    def test_disabled_is_noop(self) -> None:
+        """Test a handle bound while disabled follows later configuration."""
+        configure(MetricsConfig(enabled=False))
+        c = counter("bound_late", "Bound late").bind()
+        c.inc()
+        self.assertIsNone(self._value("bound_bound_late_total"))
+
+        configure(MetricsConfig(enabled=True, namespace="bound"))
+        c.inc()
+        self.assertEqual(self._value("bound_bound_late_total"), 1)
+
+        configure(MetricsConfig(enabled=False))
+        c.inc()
+        self.assertEqual(self._value("bound_bound_late_total"), 1)
+
+    def test_invalid_labels(self) -> None:
+        """Test that invalid label bindings are no-ops."""
+        handle = counter("bound_invalid", "Bound invalid", labels=["a"])
+        handle.bind(b="1").inc()
+        handle.bind().inc()
+        self.assertIsNone(self._value("bound_bound_invalid_total", {"a": "1"}))
+
+
 if __name__ == "__main__":
     unittest.main()